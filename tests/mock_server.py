@@ -0,0 +1,231 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+import json
+import os
+import socket
+import sys
+import threading
+import time
+
+if sys.version_info >= (3, 0, 0):
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+    import urllib.error as urllib_error
+    import urllib.parse as urlparse
+else:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+    import urllib2 as urllib_error
+    import urlparse
+
+from tune_reporting import (
+    SdkConfig
+)
+from tune_reporting.base.service import (
+    RateLimiter,
+    Transport
+)
+from tune_reporting.base.service.replay_transport import (
+    ReplayResponse
+)
+
+
+def json_payload(data):
+    """Body of a successful TUNE Reporting API response."""
+    return json.dumps({
+        "status_code": 200,
+        "response_size": 1,
+        "data": data,
+        "errors": []
+    }).encode("utf-8")
+
+
+def json_handler(data):
+    """MockServer handler answering every request with data, or with
+    data(request) if callable."""
+    def handler(request, body):
+        payload = json_payload(data(request) if callable(data) else data)
+        return 200, {"Content-Type": "application/json"}, payload
+    return handler
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    """Request handler delegating to the route table of its server."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.server.dispatch(self, None)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        self.server.dispatch(self, self.rfile.read(length))
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MockServer(ThreadingMixIn, HTTPServer):
+    """Local HTTP/1.1 server answering requests with a handler function.
+
+    The handler is called as handler(request, body) and returns
+    (status, headers, body bytes).
+    """
+
+    daemon_threads = True
+
+    def __init__(self, handler):
+        HTTPServer.__init__(self, ("127.0.0.1", 0), MockHandler)
+        self.handler = handler
+        self.requests = []
+        self.connections = set()
+        self.lock = threading.Lock()
+        self.thread = threading.Thread(target=self.serve_forever)
+        self.thread.daemon = True
+
+    @property
+    def url(self):
+        return "http://127.0.0.1:{}".format(self.server_address[1])
+
+    def dispatch(self, request, body):
+        with self.lock:
+            self.requests.append((request.path, dict(request.headers), body))
+            self.connections.add(request.client_address)
+        status, headers, payload = self.handler(request, body)
+        request.send_response(status)
+        for name, value in headers.items():
+            request.send_header(name, value)
+        if "Content-Length" not in headers and \
+           "Transfer-Encoding" not in headers:
+            request.send_header("Content-Length", str(len(payload)))
+        request.end_headers()
+        request.wfile.write(payload)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+        self.server_close()
+
+
+class FakeExportQueue(Transport):
+    """Transport emulating TUNE Reporting API export queue.
+
+    Export requests place jobs named by job_name(query, number), 'job-1',
+    'job-2', ... by default, after sleeping 'delay' seconds or timing out.
+    Status of a job is 'complete' on its poll number polls(job_id), 2 by
+    default; jobs whose identifier contains 'fail' fail, jobs prefixed
+    'slow' never complete, and the first status request of jobs prefixed
+    'stuck' is left unanswered until it times out.
+    """
+
+    def __init__(self, job_name=None, polls=2, delay=0):
+        self.lock = threading.Lock()
+        self.job_name = job_name or self.numbered
+        self.required = polls
+        self.delay = delay
+        self.jobs = 0
+        self.polls = {}
+        self.paths = []
+
+    @staticmethod
+    def numbered(query, number):
+        return "job-{}".format(number)
+
+    @staticmethod
+    def wait(seconds, timeout):
+        if timeout is not None and timeout < seconds:
+            time.sleep(timeout)
+            raise urllib_error.URLError(socket.timeout("timed out"))
+        time.sleep(seconds)
+
+    def urlopen(self, url, data=None, headers=None, timeout=None):
+        parsed = urlparse.urlparse(url)
+        query = urlparse.parse_qs(parsed.query)
+        with self.lock:
+            self.paths.append(parsed.path)
+        if parsed.path.endswith("/find_export_queue") or \
+           parsed.path.endswith("/export") and "job_id" not in query:
+            if self.delay:
+                self.wait(self.delay, timeout)
+            with self.lock:
+                self.jobs += 1
+                number = self.jobs
+            return ReplayResponse(
+                200, {}, json_payload(self.job_name(query, number)), url
+            )
+
+        job_id = query["job_id"][0]
+        with self.lock:
+            polls = self.polls[job_id] = self.polls.get(job_id, 0) + 1
+        if job_id.startswith("stuck") and polls == 1:
+            self.wait(5, timeout)
+        if "fail" in job_id:
+            status = "fail"
+        elif job_id.startswith("slow"):
+            status = "running"
+        else:
+            required = self.required(job_id) if callable(self.required) \
+                else self.required
+            status = "complete" if polls >= required else "running"
+        return ReplayResponse(200, {}, json_payload({
+            "status": status,
+            "data": {"url": "https://example.com/{}.csv".format(job_id)}
+        }), url)
+
+
+class ExportQueueFixture(object):
+    """Mixin of test cases running endpoints against FakeExportQueue,
+    created with 'queue_options', as self.queue."""
+
+    queue_options = {}
+
+    def setUp(self):
+        dirname = os.path.dirname(os.path.split(__file__)[0])
+        filepath = os.path.join(
+            dirname, "config", SdkConfig.SDK_CONFIG_FILENAME
+        )
+        SdkConfig(filepath=os.path.abspath(filepath)).set_api_key("API_KEY")
+        self.queue = FakeExportQueue(**self.queue_options)
+        Transport.configure(self.queue)
+        RateLimiter.configure({"status": None, "export": None})
+
+    def tearDown(self):
+        Transport.configure(None)
+        RateLimiter.configure()
@@ -0,0 +1,331 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 3.5 and above
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+import functools
+import gzip
+import json
+import os.path
+import sys
+import time
+import unittest
+
+if sys.version_info >= (3, 5, 0):
+    import asyncio
+    from unittest import mock
+
+try:
+    from tune_reporting import (
+        AdvertiserReportLogClicks,
+        SdkConfig,
+        TuneSdkException
+    )
+    from tune_reporting.base.endpoints.poll_schedule import (
+        CompletionHistory,
+        PollSchedule
+    )
+    if sys.version_info >= (3, 5, 0):
+        from tune_reporting.base.service import (
+            AsyncConnectionPool,
+            AsyncTuneServiceClient,
+            RetryPolicy
+        )
+except ImportError as exc:
+    sys.stderr.write("Error: failed to import module ({})".format(exc))
+    raise
+
+from .mock_server import (
+    MockServer,
+    json_handler
+)
+
+
+count_handler = json_handler(7)
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+@unittest.skipIf(sys.version_info < (3, 5, 0), "requires Python 3.5")
+class TestAsyncTuneServiceClient(unittest.TestCase):
+
+    def test_Call(self):
+        async def call(url):
+            client = AsyncTuneServiceClient(
+                "advertiser/stats/clicks",
+                "count",
+                "API_KEY",
+                "api_key",
+                {"start_date": "2015-01-01 00:00:00"},
+                api_url_endpoint=url
+            )
+            self.assertTrue(await client.call())
+            return client
+
+        with MockServer(count_handler) as server:
+            client = run(call(server.url))
+            self.assertEqual(client.response.http_code, 200)
+            self.assertEqual(client.response.data, 7)
+            path = server.requests[0][0]
+            self.assertTrue(path.startswith("/v2/advertiser/stats/clicks/count"))
+            self.assertIn("api_key=API_KEY", path)
+
+    def test_ConcurrentCalls(self):
+        pool = AsyncConnectionPool(max_size=4)
+
+        async def calls(url):
+            clients = [
+                AsyncTuneServiceClient(
+                    "advertiser/stats/clicks",
+                    "count",
+                    "API_KEY",
+                    "api_key",
+                    {"page": i},
+                    api_url_endpoint=url,
+                    pool=pool
+                )
+                for i in range(20)
+            ]
+            results = await asyncio.gather(*[c.call() for c in clients])
+            # Connections are reused by subsequent calls.
+            await clients[0].call()
+            self.assertLessEqual(pool.idle_count(), 4)
+            pool.clear()
+            return results
+
+        with MockServer(count_handler) as server:
+            results = run(calls(server.url))
+            self.assertEqual(results, [True] * 20)
+            self.assertEqual(len(server.requests), 21)
+            self.assertLessEqual(len(server.connections), 20)
+
+    def test_CompressedChunkedResponse(self):
+        def handler(request, body):
+            payload = gzip.compress(json.dumps({
+                "status_code": 200,
+                "data": ["x" * 1000],
+                "errors": []
+            }).encode("utf-8"))
+            chunked = b"".join(
+                b"%x\r\n%s\r\n" % (len(payload[i:i + 100]), payload[i:i + 100])
+                for i in range(0, len(payload), 100)
+            ) + b"0\r\n\r\n"
+            return 200, {
+                "Content-Encoding": "gzip",
+                "Transfer-Encoding": "chunked"
+            }, chunked
+
+        async def call(url):
+            client = AsyncTuneServiceClient(
+                "advertiser/stats/clicks", "find", "API_KEY", "api_key",
+                api_url_endpoint=url,
+                pool=AsyncConnectionPool()
+            )
+            await client.call()
+            return client.response
+
+        with MockServer(handler) as server:
+            response = run(call(server.url))
+            self.assertEqual(response.data, ["x" * 1000])
+            self.assertIn("gzip", server.requests[0][1]["Accept-Encoding"])
+
+    def test_HttpError(self):
+        def handler(request, body):
+            return 500, {}, b"internal error"
+
+        async def call(url):
+            client = AsyncTuneServiceClient(
+                "advertiser/stats/clicks", "count", "API_KEY", "api_key",
+                api_url_endpoint=url,
+                pool=AsyncConnectionPool(),
+                retry_policy=RetryPolicy(max_attempts=2, backoff_base=0)
+            )
+            await client.call()
+
+        with MockServer(handler) as server:
+            self.assertRaises(TuneSdkException, run, call(server.url))
+            # Resent once.
+            self.assertEqual(len(server.requests), 2)
+
+    def test_DefaultTimeout(self):
+        def handler(request, body):
+            time.sleep(1)
+            return count_handler(request, body)
+
+        async def call(url):
+            client = AsyncTuneServiceClient(
+                "advertiser/stats/clicks", "count", "API_KEY", "api_key",
+                api_url_endpoint=url,
+                pool=AsyncConnectionPool(),
+                retry_policy=RetryPolicy(max_attempts=1)
+            )
+            await client.call()
+
+        # Without deadline, request is bounded by default timeout.
+        with MockServer(handler) as server, mock.patch(
+            "tune_reporting.base.service.async_tune_service_client."
+            "__tune_management_api_timeout__", 0.2
+        ):
+            start = time.time()
+            self.assertRaises(TuneSdkException, run, call(server.url))
+            self.assertLess(time.time() - start, 0.9)
+
+
+@unittest.skipIf(sys.version_info < (3, 5, 0), "requires Python 3.5")
+class TestAdvertiserReportAsync(unittest.TestCase):
+
+    def setUp(self):
+        dirname = os.path.dirname(os.path.split(__file__)[0])
+        filepath = os.path.join(
+            dirname, "config", SdkConfig.SDK_CONFIG_FILENAME
+        )
+        SdkConfig(filepath=os.path.abspath(filepath)).set_api_key("API_KEY")
+
+    def patched(self, url):
+        return mock.patch(
+            "tune_reporting.base.endpoints.endpoint_async."
+            "AsyncTuneServiceClient",
+            functools.partial(
+                AsyncTuneServiceClient,
+                api_url_endpoint=url,
+                pool=AsyncConnectionPool()
+            )
+        )
+
+    def test_Count(self):
+        advertiser_report = AdvertiserReportLogClicks()
+
+        with MockServer(count_handler) as server, self.patched(server.url):
+            response = run(advertiser_report.acount({
+                "start_date": "2015-01-01 00:00:00",
+                "end_date": "2015-01-01 23:59:59",
+                "filter": "(publisher_id > 0)",
+                "response_timezone": "America/Los_Angeles"
+            }))
+            self.assertEqual(response.data, 7)
+            path = server.requests[0][0]
+            self.assertTrue(path.startswith("/v2/advertiser/stats/clicks/count"))
+            # SDK filters are applied as with count().
+            self.assertIn("debug_mode", path)
+
+    def test_CountInvalidParameters(self):
+        advertiser_report = AdvertiserReportLogClicks()
+        self.assertRaises(
+            ValueError,
+            run,
+            advertiser_report.acount({"start_date": "yesterday"})
+        )
+
+    def test_ExportFetch(self):
+        statuses = ["pending", "running", "complete"]
+
+        def handler(request, body):
+            if "find_export_queue" in request.path:
+                data = "job-1"
+            else:
+                data = {
+                    "status": statuses.pop(0),
+                    "data": {"url": "https://example.com/report.csv"}
+                }
+            payload = json.dumps({
+                "status_code": 200,
+                "data": data,
+                "errors": []
+            }).encode("utf-8")
+            return 200, {}, payload
+
+        advertiser_report = AdvertiserReportLogClicks()
+        advertiser_report._EndpointBase__status_sleep = 0
+
+        async def export_fetch():
+            response = await advertiser_report.aexport({
+                "start_date": "2015-01-01 00:00:00",
+                "end_date": "2015-01-01 23:59:59",
+                "fields": "id,created",
+                "format": "csv"
+            })
+            return await advertiser_report.afetch(response.data)
+
+        with MockServer(handler) as server, self.patched(server.url):
+            response = run(export_fetch())
+            self.assertEqual(response.data["status"], "complete")
+            paths = [request[0] for request in server.requests]
+            self.assertIn("/advertiser/stats/clicks/find_export_queue", paths[0])
+            self.assertIn("/export/download", paths[-1])
+            self.assertIn("job_id=job-1", paths[-1])
+            self.assertEqual(len(paths), 4)
+
+    def test_FetchSchedule(self):
+        statuses = ["pending", "running", "complete"]
+
+        def handler(request, body):
+            payload = json.dumps({
+                "status_code": 200,
+                "data": {
+                    "status": statuses.pop(0),
+                    "data": {"url": "https://example.com/report.csv"}
+                },
+                "errors": []
+            }).encode("utf-8")
+            return 200, {}, payload
+
+        advertiser_report = AdvertiserReportLogClicks()
+        history = CompletionHistory.configure()
+        self.addCleanup(CompletionHistory.configure)
+        delays = []
+
+        def delay(schedule, attempt, elapsed, response=None):
+            delays.append(attempt)
+            return 0
+
+        # Delays between polls are scheduled as by fetch(), and
+        # completion is recorded for later estimates.
+        with MockServer(handler) as server, self.patched(server.url), \
+                mock.patch.object(PollSchedule, "delay", delay):
+            response = run(advertiser_report.afetch("job-1"))
+            self.assertEqual(response.data["status"], "complete")
+            self.assertEqual(delays, [1, 2])
+            self.assertIsNotNone(
+                history.expected(advertiser_report.controller)
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
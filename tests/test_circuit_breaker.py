@@ -0,0 +1,203 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+
+import io
+import json
+import socket
+import sys
+import time
+import unittest
+
+if sys.version_info >= (3, 0, 0):
+    import urllib.error as urllib_error
+else:
+    import urllib2 as urllib_error
+
+try:
+    from tune_reporting import (
+        TuneSdkException,
+        TuneServiceException
+    )
+    from tune_reporting.base.service import (
+        Circuit,
+        CircuitBreaker,
+        ConnectionPool,
+        RetryPolicy,
+        TuneCircuitOpenException,
+        TuneServiceClient,
+        TUNE_CIRCUIT_CLOSED,
+        TUNE_CIRCUIT_OPEN,
+        TUNE_CIRCUIT_HALF_OPEN
+    )
+except ImportError as exc:
+    sys.stderr.write("Error: failed to import module ({})".format(exc))
+    raise
+
+from .mock_server import MockServer
+
+
+def http_error(code):
+    return TuneServiceException(
+        "HTTPError",
+        urllib_error.HTTPError("url", code, "", {}, io.BytesIO(b""))
+    )
+
+
+class TestCircuit(unittest.TestCase):
+
+    def test_Opens(self):
+        circuit = Circuit(failure_threshold=3, reset_timeout=60)
+        self.assertEqual(circuit.state, TUNE_CIRCUIT_CLOSED)
+        for _ in range(2):
+            self.assertTrue(circuit.acquire())
+            circuit.record_failure()
+        self.assertEqual(circuit.state, TUNE_CIRCUIT_CLOSED)
+
+        # Success resets consecutive failures.
+        circuit.record_success()
+        self.assertEqual(circuit.failures, 0)
+
+        for _ in range(3):
+            circuit.record_failure()
+        self.assertEqual(circuit.state, TUNE_CIRCUIT_OPEN)
+        self.assertFalse(circuit.acquire())
+        self.assertGreater(circuit.retry_in(), 59)
+
+    def test_HalfOpen(self):
+        circuit = Circuit(failure_threshold=1, reset_timeout=0.05)
+        circuit.record_failure()
+        self.assertFalse(circuit.acquire())
+
+        time.sleep(0.06)
+        self.assertEqual(circuit.state, TUNE_CIRCUIT_HALF_OPEN)
+        self.assertEqual(circuit.retry_in(), 0)
+        self.assertTrue(circuit.acquire())
+        # A single probe at a time.
+        self.assertFalse(circuit.acquire())
+
+        # Failed probe opens circuit again.
+        circuit.record_failure()
+        self.assertEqual(circuit.state, TUNE_CIRCUIT_OPEN)
+
+        time.sleep(0.06)
+        self.assertTrue(circuit.acquire())
+        # Probe not sent gives back its slot.
+        circuit.release()
+        self.assertTrue(circuit.acquire())
+        circuit.record_success()
+        self.assertEqual(circuit.state, TUNE_CIRCUIT_CLOSED)
+
+    def test_InvalidParameters(self):
+        self.assertRaises(ValueError, Circuit, 0)
+        self.assertRaises(ValueError, Circuit, 1, -1)
+        self.assertRaises(ValueError, CircuitBreaker, 1, 1, 0)
+
+
+class TestCircuitBreaker(unittest.TestCase):
+
+    def test_Record(self):
+        breaker = CircuitBreaker(failure_threshold=1)
+        failures = [
+            http_error(503),
+            TuneServiceException(
+                "URLError",
+                urllib_error.URLError(socket.timeout("timed out"))
+            )
+        ]
+        for error in failures:
+            circuit = breaker.acquire("advertiser/stats/clicks", "find")
+            breaker.record(circuit, error)
+            self.assertEqual(circuit.state, TUNE_CIRCUIT_OPEN)
+            circuit.record_success()
+
+        # Service answering, or request not sent.
+        for error in (http_error(400), http_error(429), TuneSdkException()):
+            circuit = breaker.acquire("advertiser/stats/clicks", "find")
+            breaker.record(circuit, error)
+            self.assertEqual(circuit.state, TUNE_CIRCUIT_CLOSED)
+
+    def test_Shared(self):
+        breaker = CircuitBreaker.configure(failure_threshold=2)
+        self.assertIs(CircuitBreaker.shared_breaker(), breaker)
+        CircuitBreaker.configure()
+
+    def test_ClientFailsFast(self):
+        def handler(request, body):
+            if "/count" in request.path:
+                return 503, {}, b"unavailable"
+            return 200, {}, json.dumps({
+                "status_code": 200, "data": [], "errors": []
+            }).encode("utf-8")
+
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+
+        def client(action):
+            return TuneServiceClient(
+                "advertiser/stats/retention/reduced", action,
+                "API_KEY", "api_key",
+                api_url_endpoint=server.url,
+                retry_policy=RetryPolicy(max_attempts=1),
+                transport=ConnectionPool(),
+                circuit_breaker=breaker
+            )
+
+        with MockServer(handler) as server:
+            for _ in range(2):
+                self.assertRaises(TuneSdkException, client("count").call)
+            self.assertEqual(len(server.requests), 2)
+            self.assertEqual(
+                breaker.state("advertiser/stats/retention/reduced", "count"),
+                TUNE_CIRCUIT_OPEN
+            )
+
+            with self.assertRaises(TuneCircuitOpenException) as context:
+                client("count").call()
+            self.assertGreater(context.exception.retry_in, 0)
+            self.assertEqual(len(server.requests), 2)
+
+            # Other actions of controller are unaffected.
+            self.assertTrue(client("find").call())
+            self.assertEqual(breaker.states(), {
+                ("advertiser/stats/retention/reduced", "count"):
+                    TUNE_CIRCUIT_OPEN,
+                ("advertiser/stats/retention/reduced", "find"):
+                    TUNE_CIRCUIT_CLOSED
+            })
+
+
+if __name__ == '__main__':
+    unittest.main()
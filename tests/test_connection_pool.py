@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+import sys
+import threading
+import time
+import unittest
+
+try:
+    from tune_reporting.base.service import (
+        ConnectionPool,
+        TuneServiceClient,
+        TuneServiceProxy
+    )
+    from tune_reporting.helpers import (
+        TuneServiceException
+    )
+except ImportError as exc:
+    sys.stderr.write("Error: failed to import module ({})".format(exc))
+    raise
+
+from .mock_server import (
+    MockServer,
+    json_handler
+)
+
+
+def request_path(request):
+    return [{"path": request.path}]
+
+
+path_handler = json_handler(request_path)
+
+
+class TestConnectionPool(unittest.TestCase):
+
+    def test_ReuseConnection(self):
+        pool = ConnectionPool(max_size=2, idle_timeout=60)
+        with MockServer(path_handler) as server:
+            for _ in range(5):
+                response = pool.urlopen(server.url + "/v2/a/b?x=1")
+                self.assertEqual(response.getcode(), 200)
+                self.assertIn(b"/v2/a/b?x=1", response.read())
+            self.assertEqual(len(server.requests), 5)
+            self.assertEqual(len(server.connections), 1)
+            self.assertEqual(pool.idle_count(server.url), 1)
+        pool.clear()
+
+    def test_ConcurrentRequests(self):
+        pool = ConnectionPool(max_size=3, idle_timeout=60)
+        errors = []
+
+        def worker(url):
+            try:
+                for _ in range(10):
+                    pool.urlopen(url).read()
+            except Exception as exc:
+                errors.append(exc)
+
+        with MockServer(path_handler) as server:
+            threads = [
+                threading.Thread(target=worker, args=(server.url + "/",))
+                for _ in range(6)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(errors, [])
+            self.assertEqual(len(server.requests), 60)
+            self.assertLessEqual(pool.idle_count(server.url), 3)
+        pool.clear()
+
+    def test_IdleEviction(self):
+        pool = ConnectionPool(max_size=2, idle_timeout=0.05)
+        with MockServer(path_handler) as server:
+            pool.urlopen(server.url + "/").read()
+            time.sleep(0.1)
+            pool.urlopen(server.url + "/").read()
+            self.assertEqual(len(server.connections), 2)
+        pool.clear()
+
+    def test_HttpError(self):
+        pool = ConnectionPool()
+
+        def handler(request, body):
+            return 502, {}, b"bad gateway"
+
+        with MockServer(handler) as server:
+            proxy = TuneServiceProxy(server.url + "/", transport=pool)
+            self.assertRaises(TuneServiceException, proxy.execute)
+            # Error body was read, connection is reusable.
+            self.assertEqual(pool.idle_count(server.url), 1)
+        pool.clear()
+
+    def test_ServiceClient(self):
+        pool = ConnectionPool.configure(max_size=2, idle_timeout=60)
+        with MockServer(path_handler) as server:
+            for _ in range(3):
+                client = TuneServiceClient(
+                    "advertiser/stats",
+                    "count",
+                    "API_KEY",
+                    "api_key",
+                    api_url_endpoint=server.url
+                )
+                self.assertTrue(client.call())
+                self.assertEqual(client.response.http_code, 200)
+            self.assertEqual(len(server.connections), 1)
+        pool.clear()
+
+
+if __name__ == '__main__':
+    unittest.main()
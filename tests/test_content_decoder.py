@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+import gzip
+import io
+import sys
+import unittest
+import zlib
+
+try:
+    from tune_reporting.base.service import (
+        ConnectionPool
+    )
+    from tune_reporting.helpers import (
+        ReportReaderCSV
+    )
+except ImportError as exc:
+    sys.stderr.write("Error: failed to import module ({})".format(exc))
+    raise
+
+from .mock_server import MockServer
+
+CSV_BODY = b"".join(
+    "{},site {},\"multi\nline\",{}\n".format(i, i % 7, i * 3).encode("utf-8")
+    for i in range(5000)
+)
+
+
+def gzip_bytes(data):
+    buf = io.BytesIO()
+    with gzip.GzipFile(fileobj=buf, mode="wb") as handle:
+        handle.write(data)
+    return buf.getvalue()
+
+
+def compressing_handler(request, body):
+    accept = request.headers.get("Accept-Encoding") or ""
+    if "gzip" in accept:
+        return 200, {"Content-Encoding": "gzip"}, gzip_bytes(CSV_BODY)
+    return 200, {}, CSV_BODY
+
+
+class TestContentDecoder(unittest.TestCase):
+
+    def test_GzipRead(self):
+        pool = ConnectionPool()
+        with MockServer(compressing_handler) as server:
+            response = pool.urlopen(server.url + "/report.csv")
+            self.assertEqual(response.read(), CSV_BODY)
+            self.assertEqual(
+                server.requests[0][1].get("Accept-Encoding"), "gzip, deflate"
+            )
+            self.assertEqual(pool.idle_count(server.url), 1)
+        pool.clear()
+
+    def test_GzipReadChunks(self):
+        pool = ConnectionPool()
+        with MockServer(compressing_handler) as server:
+            response = pool.urlopen(server.url + "/report.csv")
+            chunks = []
+            while True:
+                chunk = response.read(1000)
+                if not chunk:
+                    break
+                self.assertLessEqual(len(chunk), 1000)
+                chunks.append(chunk)
+            self.assertEqual(b"".join(chunks), CSV_BODY)
+        pool.clear()
+
+    def test_GzipReadLines(self):
+        pool = ConnectionPool()
+        with MockServer(compressing_handler) as server:
+            response = pool.urlopen(server.url + "/report.csv")
+            lines = list(response)
+            self.assertEqual(lines, CSV_BODY.splitlines(True))
+        pool.clear()
+
+    def test_RawDeflate(self):
+        compressor = zlib.compressobj(6, zlib.DEFLATED, -zlib.MAX_WBITS)
+        payload = compressor.compress(CSV_BODY) + compressor.flush()
+
+        def handler(request, body):
+            return 200, {"Content-Encoding": "deflate"}, payload
+
+        pool = ConnectionPool()
+        with MockServer(handler) as server:
+            self.assertEqual(pool.urlopen(server.url + "/").read(), CSV_BODY)
+        pool.clear()
+
+    def test_Uncompressed(self):
+        pool = ConnectionPool(compress=False)
+        with MockServer(compressing_handler) as server:
+            self.assertEqual(pool.urlopen(server.url + "/").read(), CSV_BODY)
+            self.assertNotIn(
+                "gzip", server.requests[0][1].get("Accept-Encoding") or ""
+            )
+        pool.clear()
+
+    def test_ReportReaderCSV(self):
+        pool = ConnectionPool.configure()
+        with MockServer(compressing_handler) as server:
+            reader = ReportReaderCSV(server.url + "/report.csv")
+            reader.read()
+            rows = list(reader.reader)
+            self.assertEqual(len(rows), 5000)
+            self.assertEqual(rows[1], ["1", "site 1", "multi\nline", "3"])
+        pool.clear()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+import csv
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+try:
+    from tune_reporting import (
+        ReportReaderCSV
+    )
+    from tune_reporting.helpers import (
+        CSVRecordCounter
+    )
+    from tune_reporting.base.service import (
+        Transport
+    )
+    from tune_reporting.base.service.replay_transport import (
+        ReplayResponse
+    )
+except ImportError as exc:
+    sys.stderr.write("Error: failed to import module ({})".format(exc))
+    raise
+
+REPORT_URL = "https://example.com/report.csv"
+
+REPORT = (
+    "id,name,note\r\n" + "".join(
+        "{0},\"Site \"\"{0}\"\"\",\"line\nbreak, {0}\"\r\n".format(i)
+        for i in range(500)
+    ) + "500,last,"
+).encode("utf-8")
+
+
+class FakeReportServer(Transport):
+
+    def __init__(self):
+        self.requests = 0
+
+    def urlopen(self, url, data=None, headers=None, timeout=None):
+        self.requests += 1
+        return ReplayResponse(200, {}, REPORT, url)
+
+
+class TestCSVRecordCounter(unittest.TestCase):
+
+    def records(self):
+        if sys.version_info >= (3, 0, 0):
+            return len(list(csv.reader(io.StringIO(
+                REPORT.decode("utf-8"), newline=""
+            ))))
+        return len(list(csv.reader(io.BytesIO(REPORT))))
+
+    def test_Count(self):
+        self.assertEqual(self.records(), 502)
+        for chunk_size in (1, 2, 7, 64, 4096, 1 << 20):
+            self.assertEqual(
+                CSVRecordCounter.count(io.BytesIO(REPORT),
+                                       chunk_size=chunk_size),
+                502
+            )
+        self.assertEqual(CSVRecordCounter.count(io.BytesIO(b"")), 0)
+        self.assertEqual(CSVRecordCounter.count(io.BytesIO(b"id\n")), 1)
+        # Record within unterminated quoted value is still counted.
+        self.assertEqual(CSVRecordCounter.count(io.BytesIO(b"id\n\"a\n")), 2)
+
+    def test_BlankLines(self):
+        report = b"id,name\n\n1,a\r\n\r\n\"\"\n2,\"b\n\nc\"\n\n\n"
+        self.assertEqual(
+            CSVRecordCounter.count(io.BytesIO(report), chunk_size=3), 4
+        )
+        dirname = tempfile.mkdtemp()
+        try:
+            filepath = os.path.join(dirname, "report.csv")
+            with open(filepath, "wb") as handle:
+                handle.write(report)
+            reader = ReportReaderCSV(REPORT_URL, filepath=filepath)
+            reader.read()
+            self.assertEqual(len(list(reader)), 4)
+            self.assertEqual(reader.count, reader.count_rows())
+        finally:
+            shutil.rmtree(dirname)
+
+    def test_ReaderCount(self):
+        dirname = tempfile.mkdtemp()
+        try:
+            filepath = os.path.join(dirname, "report.csv")
+            with open(filepath, "wb") as handle:
+                handle.write(REPORT)
+            for use_mmap in (False, True):
+                reader = ReportReaderCSV(
+                    REPORT_URL, filepath=filepath, use_mmap=use_mmap
+                )
+                reader.read()
+                # Spooled report is counted before rows are parsed.
+                self.assertEqual(reader.count, 501)
+                self.assertEqual(reader.count_rows(), 501)
+                # Rows being iterated are not consumed.
+                self.assertEqual(len(list(reader)), 502)
+                self.assertEqual(reader.count, 501)
+
+                # Rows kept by 'where' are only counted once read.
+                reader.read(where={"id": lambda value: value == "1"})
+                self.assertIsNone(reader.count)
+                self.assertEqual(len(list(reader)), 2)
+                self.assertEqual(reader.count, 1)
+                self.assertEqual(reader.count_rows(), 501)
+        finally:
+            shutil.rmtree(dirname)
+
+    def test_StreamedReaderCount(self):
+        server = FakeReportServer()
+        Transport.configure(server)
+        try:
+            reader = ReportReaderCSV(REPORT_URL)
+            reader.read()
+            # Reading count does not download report again.
+            self.assertIsNone(reader.count)
+            self.assertEqual(len(list(reader)), 502)
+            self.assertEqual(reader.count, 501)
+            self.assertEqual(server.requests, 1)
+            self.assertEqual(reader.count_rows(), 501)
+            self.assertEqual(server.requests, 2)
+        finally:
+            Transport.configure(None)
+
+
+if __name__ == '__main__':
+    unittest.main()
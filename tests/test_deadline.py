@@ -0,0 +1,257 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+
+import json
+import os
+import sys
+import threading
+import time
+import unittest
+
+try:
+    from tune_reporting import (
+        Deadline,
+        ReportReaderCSV,
+        SdkConfig,
+        TuneSdkException
+    )
+    from tune_reporting.base.endpoints.report_export_worker import (
+        ReportExportWorker
+    )
+    from tune_reporting.base.service import (
+        ConnectionPool,
+        RateLimiter,
+        RetryPolicy,
+        SingleFlight,
+        Transport,
+        TuneServiceClient
+    )
+    from tune_reporting.base.service.replay_transport import (
+        ReplayResponse
+    )
+except ImportError as exc:
+    sys.stderr.write("Error: failed to import module ({})".format(exc))
+    raise
+
+from .mock_server import MockServer
+
+REPORT_URL = "https://s3.amazonaws.com/reports/report.csv"
+
+
+def payload(data):
+    return json.dumps({
+        "status_code": 200,
+        "data": data,
+        "errors": []
+    }).encode("utf-8")
+
+
+class RunningExport(Transport):
+    """Transport answering every export status poll with 'running'."""
+
+    def __init__(self):
+        self.polls = 0
+
+    def urlopen(self, url, data=None, headers=None, timeout=None):
+        self.polls += 1
+        body = payload({"status": "running", "data": {}})
+        return ReplayResponse(200, {}, body, url)
+
+
+class TricklingReport(Transport):
+    """Transport serving report rows slowly."""
+
+    def __init__(self, rows, delay):
+        self.rows = rows
+        self.delay = delay
+        self.timeouts = []
+
+    def urlopen(self, url, data=None, headers=None, timeout=None):
+        self.timeouts.append(timeout)
+        return self
+
+    def __iter__(self):
+        yield b"id,created\n"
+        for i in range(self.rows):
+            time.sleep(self.delay)
+            yield "{},2015-01-01\n".format(i).encode("utf-8")
+
+
+class TestDeadline(unittest.TestCase):
+
+    def setUp(self):
+        dirname = os.path.dirname(os.path.split(__file__)[0])
+        filepath = os.path.join(
+            dirname, "config", SdkConfig.SDK_CONFIG_FILENAME
+        )
+        SdkConfig(filepath=os.path.abspath(filepath)).set_api_key("API_KEY")
+
+    def tearDown(self):
+        Transport.configure(None)
+
+    def test_Deadline(self):
+        deadline = Deadline(0.2)
+        self.assertFalse(deadline.expired)
+        self.assertLessEqual(deadline.remaining(), 0.2)
+        self.assertLessEqual(deadline.socket_timeout(0.05), 0.05)
+
+        start = time.time()
+        deadline.sleep(5)
+        self.assertLess(time.time() - start, 1)
+        self.assertTrue(deadline.expired)
+        self.assertEqual(deadline.remaining(), 0)
+        self.assertRaises(TuneSdkException, deadline.check)
+        self.assertRaises(TuneSdkException, deadline.socket_timeout)
+
+        self.assertRaises(ValueError, Deadline, 0)
+        self.assertRaises(ValueError, Deadline, "10")
+        self.assertIsNone(Deadline.create(None))
+        self.assertIs(Deadline.create(deadline), deadline)
+        self.assertEqual(Deadline.create(3).timeout, 3)
+
+        later = Deadline(60)
+        self.assertIs(Deadline.earliest(None, later, deadline), deadline)
+        self.assertIsNone(Deadline.earliest(None, None))
+
+    def test_CallSlowServer(self):
+        def handler(request, body):
+            time.sleep(1)
+            return 200, {}, payload(1)
+
+        with MockServer(handler) as server:
+            client = TuneServiceClient(
+                "advertiser/stats/clicks", "count", "API_KEY", "api_key",
+                api_url_endpoint=server.url,
+                retry_policy=RetryPolicy(backoff_base=0),
+                transport=ConnectionPool()
+            )
+            start = time.time()
+            self.assertRaises(TuneSdkException, client.call, 0.2)
+            self.assertLess(time.time() - start, 0.9)
+
+    def test_RetryWithinDeadline(self):
+        attempts = []
+
+        def send():
+            attempts.append(1)
+            raise IOError("connection reset")
+
+        policy = RetryPolicy(max_attempts=10, backoff_base=1, backoff_max=1)
+        policy.backoff = lambda action, error, attempt: 0.3
+        start = time.time()
+        self.assertRaises(
+            IOError, policy.execute, "count", send, Deadline(0.5)
+        )
+        self.assertLess(time.time() - start, 0.6)
+        self.assertEqual(len(attempts), 2)
+
+    def test_RateLimiterDeadline(self):
+        limiter = RateLimiter({"query": (1.0, 1)})
+        limiter.acquire("API_KEY", "advertiser/stats/clicks", "find")
+        self.assertRaises(
+            TuneSdkException,
+            limiter.acquire,
+            "API_KEY", "advertiser/stats/clicks", "find", Deadline(0.5)
+        )
+
+    def test_SingleFlightTimeout(self):
+        group = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow():
+            started.set()
+            release.wait()
+            return 1
+
+        thread = threading.Thread(target=group.do, args=("key", slow))
+        thread.start()
+        started.wait()
+        self.assertRaises(
+            TuneSdkException, group.do, "key", slow, 0.1
+        )
+        release.set()
+        thread.join()
+
+    def test_ExportWorkerStopsAtDeadline(self):
+        transport = RunningExport()
+        Transport.configure(transport)
+
+        worker = ReportExportWorker(
+            "export", "download", "API_KEY", "api_key", "job-1",
+            sleep=10, deadline=0.3
+        )
+        start = time.time()
+        self.assertRaises(TuneSdkException, worker.run)
+        self.assertLess(time.time() - start, 2)
+        self.assertEqual(transport.polls, 1)
+
+    def test_ExportWorkerTimeoutIsWallClock(self):
+        transport = RunningExport()
+        Transport.configure(transport)
+
+        worker = ReportExportWorker(
+            "export", "download", "API_KEY", "api_key", "job-1",
+            sleep=0.1, timeout=0.35
+        )
+        start = time.time()
+        self.assertRaises(TuneSdkException, worker.run)
+        self.assertLess(time.time() - start, 2)
+        self.assertGreaterEqual(transport.polls, 3)
+
+    def test_ReaderDeadline(self):
+        transport = TricklingReport(rows=50, delay=0.02)
+        Transport.configure(transport)
+
+        reader = ReportReaderCSV(REPORT_URL)
+        reader.read(deadline=0.2)
+        self.assertLessEqual(transport.timeouts[0], 0.2)
+        start = time.time()
+        with self.assertRaises(TuneSdkException):
+            for row in reader.reader:
+                pass
+        self.assertLess(time.time() - start, 0.6)
+
+        # Without deadline every row is read.
+        reader = ReportReaderCSV(REPORT_URL)
+        transport.delay = 0
+        reader.read()
+        self.assertEqual(len(list(reader.reader)), 51)
+
+
+if __name__ == '__main__':
+    unittest.main()
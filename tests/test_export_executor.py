@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+
+import sys
+import time
+import unittest
+
+from concurrent.futures import as_completed
+
+try:
+    from tune_reporting import (
+        AdvertiserReportLogClicks,
+        ExportExecutor,
+        ReportReaderCSV,
+        TuneSdkException,
+        TuneServiceException
+    )
+except ImportError as exc:
+    sys.stderr.write("Error: failed to import module ({})".format(exc))
+    raise
+
+from .mock_server import (
+    ExportQueueFixture
+)
+
+
+def fields_job_name(query, number):
+    """Job named after query's 'fields'."""
+    return "job-" + query["fields"][0]
+
+
+class TestExportExecutor(ExportQueueFixture, unittest.TestCase):
+
+    queue_options = {"job_name": fields_job_name}
+
+    def setUp(self):
+        ExportQueueFixture.setUp(self)
+        self.executor = ExportExecutor.configure(max_workers=8)
+
+    def tearDown(self):
+        self.executor.shutdown()
+        ExportQueueFixture.tearDown(self)
+
+    def export(self, fields, deadline=None):
+        endpoint = AdvertiserReportLogClicks()
+        endpoint._EndpointBase__status_sleep = 0.01
+        return endpoint.export_async({
+            "start_date": "2015-01-01 00:00:00",
+            "end_date": "2015-01-01 23:59:59",
+            "fields": fields,
+            "format": "csv"
+        }, deadline=deadline)
+
+    def test_AsCompleted(self):
+        self.queue.delay = 0.05
+        start = time.time()
+        futures = [self.export("f{}".format(i)) for i in range(50)]
+        # Submitting does not wait for export requests.
+        self.assertLess(time.time() - start, 0.5)
+
+        urls = set(future.result(10) for future in as_completed(futures, 10))
+        self.assertEqual(
+            urls,
+            set("https://example.com/job-f{}.csv".format(i)
+                for i in range(50))
+        )
+        self.assertEqual(self.executor.poller.pending, 0)
+
+    def test_Reader(self):
+        endpoint = AdvertiserReportLogClicks()
+        endpoint._EndpointBase__status_sleep = 0.01
+        future = endpoint.export_async({
+            "start_date": "2015-01-01 00:00:00",
+            "end_date": "2015-01-01 23:59:59",
+            "fields": "id",
+            "format": "csv"
+        }, reader=ReportReaderCSV)
+        reader = future.result(10)
+        self.assertIsInstance(reader, ReportReaderCSV)
+        self.assertEqual(reader.report_url, "https://example.com/job-id.csv")
+
+    def test_Failure(self):
+        future = self.export("fail")
+        self.assertRaises(TuneServiceException, future.result, 10)
+
+        endpoint = AdvertiserReportLogClicks()
+        future = endpoint.export_async({"start_date": "yesterday"})
+        self.assertRaises(ValueError, future.result, 10)
+
+    def test_Cancel(self):
+        self.executor = ExportExecutor.configure(max_workers=1)
+        self.queue.delay = 0.2
+        sent = self.export("sent")
+        queued = self.export("queued")
+        # Export not yet sent is cancelled.
+        self.assertTrue(queued.cancel())
+        self.assertEqual(sent.result(10),
+                         "https://example.com/job-sent.csv")
+        self.assertTrue(queued.cancelled())
+        self.assertNotIn("job-queued", self.queue.polls)
+
+    def test_ExportDeadline(self):
+        self.queue.delay = 5
+        start = time.time()
+        future = self.export("slow", deadline=0.2)
+        # Export request is bounded by deadline.
+        self.assertRaises(TuneSdkException, future.result, 10)
+        self.assertLess(time.time() - start, 2)
+
+    def test_ShutdownWithoutWait(self):
+        executor = ExportExecutor(max_workers=2)
+        endpoint = AdvertiserReportLogClicks()
+        endpoint._EndpointBase__status_sleep = 0.01
+        futures = [
+            executor.submit(endpoint, {
+                "start_date": "2015-01-01 00:00:00",
+                "end_date": "2015-01-01 23:59:59",
+                "fields": "f{}".format(i),
+                "format": "csv"
+            })
+            for i in range(3)
+        ]
+        executor.shutdown(wait=False)
+        # Submitted exports complete, then poller thread stops.
+        for future in futures:
+            self.assertTrue(future.result(10).endswith(".csv"))
+        for _ in range(100):
+            if executor.poller._ExportPoller__thread is None:
+                break
+            time.sleep(0.05)
+        self.assertIsNone(executor.poller._ExportPoller__thread)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,224 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+try:
+    from tune_reporting import (
+        AdvertiserReportLogClicks,
+        ExportJournal,
+        ExportPoller,
+        SdkConfig
+    )
+except ImportError as exc:
+    sys.stderr.write("Error: failed to import module ({})".format(exc))
+    raise
+
+from .mock_server import (
+    ExportQueueFixture
+)
+
+QUERY = {
+    "start_date": "2015-01-01 00:00:00",
+    "end_date": "2015-01-01 23:59:59",
+    "fields": "id,created",
+    "format": "csv"
+}
+
+
+class TestExportJournal(ExportQueueFixture, unittest.TestCase):
+
+    def setUp(self):
+        ExportQueueFixture.setUp(self)
+        self.dirname = tempfile.mkdtemp()
+        self.filepath = os.path.join(self.dirname, "exports.db")
+
+    def tearDown(self):
+        ExportJournal.configure(None)
+        ExportQueueFixture.tearDown(self)
+        shutil.rmtree(self.dirname)
+
+    def endpoint(self):
+        endpoint = AdvertiserReportLogClicks()
+        endpoint._EndpointBase__status_sleep = 0.01
+        return endpoint
+
+    def test_Transitions(self):
+        journal = ExportJournal.configure(ExportJournal(self.filepath))
+        endpoint = self.endpoint()
+
+        job_id = endpoint.export(dict(QUERY)).data
+        self.assertEqual(job_id, "job-1")
+        self.assertEqual(journal.job(job_id).status, "submitted")
+
+        response = endpoint.fetch(job_id)
+        self.assertEqual(response.data["status"], "complete")
+
+        entry = journal.job(job_id)
+        self.assertEqual(entry.controller, "advertiser/stats/clicks")
+        self.assertEqual(entry.export_controller, "export")
+        self.assertEqual(entry.export_action, "download")
+        self.assertEqual(entry.report_url, "https://example.com/job-1.csv")
+        self.assertEqual(entry.query["fields"], "id,created")
+        self.assertEqual(
+            [status for status, _ in journal.transitions(job_id)],
+            ["submitted", "running", "complete"]
+        )
+        # Authentication key is not stored.
+        journal.close()
+        with open(self.filepath, "rb") as handle:
+            self.assertNotIn(b"API_KEY", handle.read())
+
+    def test_ReuseIdenticalQuery(self):
+        journal = ExportJournal.configure(ExportJournal(self.filepath))
+        endpoint = self.endpoint()
+
+        pending = endpoint.export(dict(QUERY)).data
+        # Pending job of identical query is reused.
+        self.assertEqual(endpoint.export(dict(QUERY)).data, pending)
+        endpoint.fetch(pending)
+
+        requests = len(self.queue.paths)
+        self.assertEqual(endpoint.export(dict(QUERY)).data, pending)
+        response = endpoint.fetch(pending)
+        # Completed URL is reused without any request.
+        self.assertEqual(len(self.queue.paths), requests)
+        self.assertEqual(
+            endpoint.parse_response_report_url(response),
+            "https://example.com/job-1.csv"
+        )
+
+        query = dict(QUERY, fields="id")
+        self.assertEqual(endpoint.export(query).data, "job-2")
+        self.assertEqual(self.queue.jobs, 2)
+        journal.close()
+
+    def test_ExpiredUrl(self):
+        journal = ExportJournal.configure(
+            ExportJournal(self.filepath, url_ttl=0)
+        )
+        endpoint = self.endpoint()
+
+        endpoint.fetch(endpoint.export(dict(QUERY)).data)
+        self.assertEqual(endpoint.export(dict(QUERY)).data, "job-2")
+        self.assertIsNone(journal.completed_response("job-1"))
+        journal.close()
+
+    def test_AbandonedJob(self):
+        journal = ExportJournal.configure(ExportJournal(self.filepath))
+        endpoint = self.endpoint()
+        abandoned = endpoint.export(dict(QUERY)).data
+        journal.status(abandoned, "running")
+        # Placed on queue two hours ago by a process which never
+        # completed it.
+        connection = sqlite3.connect(self.filepath)
+        connection.execute(
+            "UPDATE jobs SET submitted = submitted - 7200 WHERE job_id = ?",
+            (abandoned,)
+        )
+        connection.commit()
+        connection.close()
+
+        self.assertFalse(journal.is_reusable(journal.job(abandoned)))
+        self.assertEqual(journal.unfinished(), [])
+        # Identical query places a new job.
+        self.assertEqual(endpoint.export(dict(QUERY)).data, "job-2")
+        self.assertEqual(self.queue.jobs, 2)
+        journal.close()
+
+    def test_AccountsNotShared(self):
+        journal = ExportJournal.configure(ExportJournal(self.filepath))
+        self.endpoint().export(dict(QUERY))
+
+        SdkConfig().set_api_key("OTHER_KEY")
+        try:
+            self.assertEqual(self.endpoint().export(dict(QUERY)).data, "job-2")
+        finally:
+            SdkConfig().set_api_key("API_KEY")
+        journal.close()
+
+    def test_Resume(self):
+        journal = ExportJournal.configure(ExportJournal(self.filepath))
+        endpoint = self.endpoint()
+        first = endpoint.export(dict(QUERY)).data
+        second = endpoint.export(dict(QUERY, fields="id")).data
+        endpoint.fetch(first)
+        journal.close()
+
+        # Restarted process reattaches to unfinished job only.
+        journal = ExportJournal.configure(ExportJournal(self.filepath))
+        self.assertEqual(
+            [entry.job_id for entry in journal.unfinished()], [second]
+        )
+        poller = ExportPoller(sleep=0.01)
+        # Authentication type defaults to configuration's.
+        jobs = journal.resume(poller, auth_key="API_KEY")
+        self.assertEqual([job.job_id for job in jobs], [second])
+        poller.run()
+
+        self.assertEqual(jobs[0].wait().data["status"], "complete")
+        self.assertEqual(journal.job(second).status, "complete")
+        self.assertEqual(journal.unfinished(), [])
+        journal.close()
+
+    def test_ResumeOnAttach(self):
+        journal = ExportJournal.configure(ExportJournal(self.filepath))
+        job_id = self.endpoint().export(dict(QUERY)).data
+        journal.close()
+
+        # Poller provided journal resumes unfinished jobs by itself.
+        journal = ExportJournal.configure(ExportJournal(self.filepath))
+        poller = ExportPoller(sleep=0.01, journal=journal)
+        self.assertEqual([job.job_id for job in poller.resumed], [job_id])
+        poller.run()
+
+        self.assertEqual(journal.job(job_id).status, "complete")
+        # Completed job is then fetched without polling.
+        polls = len(self.queue.paths)
+        response = self.endpoint().fetch(job_id)
+        self.assertEqual(response.data["status"], "complete")
+        self.assertEqual(len(self.queue.paths), polls)
+        journal.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+
+import sys
+import threading
+import time
+import unittest
+
+try:
+    from tune_reporting import (
+        AdvertiserReportCohortRetention,
+        AdvertiserReportLogClicks,
+        ExportPoller,
+        TuneSdkException,
+        TuneServiceException
+    )
+except ImportError as exc:
+    sys.stderr.write("Error: failed to import module ({})".format(exc))
+    raise
+
+from .mock_server import (
+    ExportQueueFixture
+)
+
+COHORT_CONTROLLER = "advertiser/stats/retention/reduced"
+
+
+def required_polls(job_id):
+    """Polls completing job 'job-<n>-<polls>'."""
+    return int(job_id.rsplit("-", 1)[1])
+
+
+class TestExportPoller(ExportQueueFixture, unittest.TestCase):
+
+    queue_options = {"polls": required_polls}
+
+    def test_ManyJobs(self):
+        poller = ExportPoller(sleep=0.01)
+        jobs = []
+        for i in range(60):
+            if i % 2:
+                controller, action = "export", "download"
+            else:
+                controller, action = COHORT_CONTROLLER, "status"
+            jobs.append(poller.add(
+                controller, action, "job-{}-{}".format(i, i % 3 + 1),
+                "API_KEY", "api_key"
+            ))
+        self.assertEqual(poller.pending, 60)
+
+        threads = threading.active_count()
+        poller.run()
+        self.assertEqual(threading.active_count(), threads)
+        self.assertEqual(poller.pending, 0)
+
+        for i, job in enumerate(jobs):
+            self.assertTrue(job.done)
+            self.assertEqual(job.attempts, i % 3 + 1)
+            response = job.wait()
+            self.assertEqual(response.data["status"], "complete")
+        self.assertEqual(
+            len(self.queue.paths), sum(i % 3 + 1 for i in range(60))
+        )
+        self.assertIn("/v2/export/download", self.queue.paths)
+        self.assertIn(
+            "/v2/{}/status".format(COHORT_CONTROLLER), self.queue.paths
+        )
+
+    def test_DueOrder(self):
+        poller = ExportPoller()
+        resolved = []
+        slow = poller.add(
+            "export", "download", "job-1-2", "API_KEY", "api_key", sleep=0.3
+        )
+        fast = poller.add(
+            "export", "download", "job-2-3", "API_KEY", "api_key", sleep=0.01
+        )
+        for job in (slow, fast):
+            job.add_done_callback(lambda job: resolved.append(job.job_id))
+        poller.run()
+        self.assertEqual(resolved, ["job-2-3", "job-1-2"])
+
+    def test_FailAndTimeout(self):
+        poller = ExportPoller(sleep=0.01)
+        failed = poller.add(
+            "export", "download", "fail-1", "API_KEY", "api_key"
+        )
+        slow = poller.add(
+            "export", "download", "slow-1", "API_KEY", "api_key", timeout=0.1
+        )
+        done = poller.add(
+            "export", "download", "job-1-1", "API_KEY", "api_key"
+        )
+
+        start = time.time()
+        poller.run()
+        self.assertLess(time.time() - start, 1)
+
+        self.assertRaises(TuneServiceException, failed.wait)
+        with self.assertRaises(TuneSdkException) as context:
+            slow.wait()
+        self.assertIn("Exceeded timeout", str(context.exception))
+        self.assertEqual(done.wait().http_code, 200)
+
+    def test_StuckRequest(self):
+        poller = ExportPoller(sleep=0.01, request_timeout=0.2)
+        stuck = poller.add(
+            "export", "download", "stuck-1-2", "API_KEY", "api_key"
+        )
+        jobs = [
+            poller.add(
+                "export", "download", "job-{}-3".format(i), "API_KEY",
+                "api_key"
+            )
+            for i in range(5)
+        ]
+
+        start = time.time()
+        poller.run()
+        # Unanswered request only held back other jobs until it timed
+        # out, and its job was polled again.
+        self.assertLess(time.time() - start, 2)
+        self.assertEqual(stuck.wait().data["status"], "complete")
+        self.assertEqual(self.queue.polls["stuck-1-2"], 2)
+        for job in jobs:
+            self.assertEqual(job.wait().data["status"], "complete")
+
+    def test_BackgroundThread(self):
+        poller = ExportPoller().start()
+        try:
+            endpoint = AdvertiserReportLogClicks()
+            endpoint._EndpointBase__status_sleep = 0.01
+            log_job = poller.add_report(endpoint, "job-1-2")
+
+            endpoint = AdvertiserReportCohortRetention()
+            endpoint._EndpointBase__status_sleep = 0.01
+            cohort_job = poller.add_report(endpoint, "job-2-2")
+
+            self.assertEqual(log_job.wait(5).data["status"], "complete")
+            self.assertEqual(cohort_job.wait(5).data["status"], "complete")
+            self.assertRaises(
+                TuneSdkException,
+                poller.add_report(endpoint, "slow-2").wait,
+                0.05
+            )
+        finally:
+            poller.stop()
+
+        self.assertEqual(log_job.export_action, "download")
+        self.assertEqual(cohort_job.export_controller, COHORT_CONTROLLER)
+        self.assertEqual(cohort_job.export_action, "status")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+
+import json
+import sys
+import threading
+import time
+import unittest
+
+try:
+    from tune_reporting import (
+        HedgePolicy
+    )
+    from tune_reporting.base.service import (
+        ConnectionPool,
+        LatencyTracker,
+        RetryPolicy,
+        TuneServiceClient
+    )
+except ImportError as exc:
+    sys.stderr.write("Error: failed to import module ({})".format(exc))
+    raise
+
+from .mock_server import MockServer
+
+CONTROLLER = "advertiser/stats"
+
+
+def warmed_up(latency=0.02, samples=20, **kwargs):
+    """Policy having observed latencies of action 'find'."""
+    latencies = LatencyTracker()
+    for _ in range(samples):
+        latencies.record(CONTROLLER, "find", latency)
+    return HedgePolicy(latencies=latencies, **kwargs)
+
+
+class TestHedgePolicy(unittest.TestCase):
+
+    def test_LatencyTracker(self):
+        latencies = LatencyTracker(window=10)
+        self.assertIsNone(latencies.percentile(CONTROLLER, "find", 50))
+        for i in range(20):
+            latencies.record(CONTROLLER, "find", float(i))
+        # Only most recent samples are kept.
+        self.assertEqual(latencies.count(CONTROLLER, "find"), 10)
+        self.assertEqual(latencies.percentile(CONTROLLER, "find", 0.1), 10)
+        self.assertEqual(latencies.percentile(CONTROLLER, "find", 50), 14)
+        self.assertEqual(latencies.percentile(CONTROLLER, "find", 99.9), 19)
+
+    def test_Delay(self):
+        policy = HedgePolicy(min_samples=5)
+        self.assertIsNone(policy.delay(CONTROLLER, "find"))
+        for i in range(5):
+            policy.latencies.record(CONTROLLER, "find", 0.1)
+            policy.latencies.record(CONTROLLER, "find_export_queue", 0.1)
+        self.assertEqual(policy.delay(CONTROLLER, "find"), 0.1)
+        # Non idempotent actions are never hedged.
+        self.assertIsNone(policy.delay(CONTROLLER, "find_export_queue"))
+
+        self.assertRaises(ValueError, HedgePolicy, percentile=100)
+        self.assertRaises(ValueError, HedgePolicy, max_ratio=0)
+
+    def test_Hedge(self):
+        policy = warmed_up(max_ratio=1, burst=1)
+        calls = []
+
+        def send():
+            calls.append(1)
+            if len(calls) == 1:
+                time.sleep(0.5)
+                return "slow"
+            return "fast"
+
+        start = time.time()
+        self.assertEqual(policy.execute(CONTROLLER, "find", send), "fast")
+        self.assertLess(time.time() - start, 0.4)
+        self.assertEqual(policy.hedges, 1)
+        self.assertEqual(policy.requests, 1)
+
+    def test_HedgeRateCap(self):
+        policy = warmed_up(samples=200, max_ratio=0.5, burst=1)
+
+        def send():
+            time.sleep(0.05)
+            return True
+
+        for _ in range(4):
+            policy.execute(CONTROLLER, "find", send)
+        self.assertEqual(policy.requests, 4)
+        self.assertEqual(policy.hedges, 2)
+
+    def test_Failures(self):
+        policy = warmed_up(max_ratio=1, burst=5)
+        lock = threading.Lock()
+        calls = []
+
+        def send():
+            with lock:
+                calls.append(1)
+                first = len(calls) == 1
+            if first:
+                time.sleep(0.1)
+                raise IOError("reset")
+            return "hedged"
+
+        # Hedge succeeds although the original request failed.
+        self.assertEqual(policy.execute(CONTROLLER, "find", send), "hedged")
+
+        def fail():
+            time.sleep(0.05)
+            raise IOError("reset")
+
+        self.assertRaises(IOError, policy.execute, CONTROLLER, "find", fail)
+
+    def test_ClientHedges(self):
+        requests = []
+
+        def handler(request, body):
+            requests.append(request.path)
+            if len(requests) == 1:
+                time.sleep(0.5)
+            return 200, {}, json.dumps({
+                "status_code": 200, "data": len(requests), "errors": []
+            }).encode("utf-8")
+
+        policy = warmed_up(max_ratio=1, burst=1)
+        with MockServer(handler) as server:
+            client = TuneServiceClient(
+                CONTROLLER, "find", "API_KEY", "api_key",
+                api_url_endpoint=server.url,
+                retry_policy=RetryPolicy(max_attempts=1),
+                transport=ConnectionPool(),
+                coalesce=False,
+                hedge_policy=policy
+            )
+            start = time.time()
+            self.assertTrue(client.call())
+            self.assertLess(time.time() - start, 0.4)
+            self.assertEqual(client.response.data, 2)
+            self.assertEqual(policy.hedges, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,227 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+
+import json
+import os
+import sys
+import unittest
+
+try:
+    from tune_reporting import (
+        SdkConfig
+    )
+    from tune_reporting.base import (
+        CompletionHistory,
+        PollSchedule
+    )
+    from tune_reporting.base.endpoints.report_export_worker import (
+        ReportExportWorker
+    )
+    from tune_reporting.base.service import (
+        RateLimiter,
+        Transport
+    )
+    from tune_reporting.base.service.replay_transport import (
+        ReplayResponse
+    )
+    from tune_reporting.base.service.tune_service_response import (
+        TuneServiceResponse
+    )
+except ImportError as exc:
+    sys.stderr.write("Error: failed to import module ({})".format(exc))
+    raise
+
+CONTROLLER = "advertiser/stats/clicks"
+
+
+def status_response(status, percent=None):
+    data = {"status": status, "data": {}}
+    if percent is not None:
+        data["percent_complete"] = percent
+    return TuneServiceResponse({"status_code": 200, "data": data}, 200)
+
+
+def simulate(schedule, duration, report_progress=False):
+    """Polls sent and seconds from completion until detected of an export
+    taking provided seconds."""
+    elapsed = 0.0
+    polls = 1
+    while elapsed < duration:
+        percent = 100.0 * elapsed / duration if report_progress else None
+        elapsed += schedule.delay(
+            polls, elapsed, status_response("running", percent)
+        )
+        polls += 1
+    return polls, elapsed - duration
+
+
+class FixedSchedule(object):
+    def delay(self, attempt, elapsed, response=None):
+        return 10
+
+
+class TestPollSchedule(unittest.TestCase):
+
+    def test_Exponential(self):
+        schedule = PollSchedule(maximum=10, history=CompletionHistory())
+        self.assertEqual(
+            [schedule.delay(attempt, 0) for attempt in range(1, 8)],
+            [0.5, 1, 2, 4, 8, 10, 10]
+        )
+        # Never past caller's maximum by default, however long polled.
+        self.assertEqual(schedule.delay(7, 1000), 10)
+        self.assertEqual(schedule.delay(100000, 10 ** 6), 10)
+        # Grown with time elapsed past maximum, up to estimate_maximum.
+        schedule = PollSchedule(maximum=10, estimate_maximum=60,
+                                history=CompletionHistory())
+        self.assertEqual(schedule.delay(7, 100), 25)
+        self.assertEqual(schedule.delay(7, 1000), 60)
+        self.assertEqual(PollSchedule(maximum=0).delay(3, 1), 0)
+        self.assertRaises(ValueError, PollSchedule, initial=0)
+        self.assertRaises(ValueError, PollSchedule, factor=0.5)
+
+    def test_Progress(self):
+        schedule = PollSchedule(maximum=10, history=CompletionHistory())
+        # 25% complete after 3 seconds: 9 seconds left.
+        self.assertEqual(
+            schedule.delay(2, 3, status_response("running", 25)), 9
+        )
+        # Estimates are bounded by caller's maximum...
+        self.assertEqual(
+            schedule.delay(2, 30, status_response("running", "10")), 10
+        )
+        # ...unless raised by estimate_maximum.
+        schedule = PollSchedule(maximum=10, estimate_maximum=60,
+                                history=CompletionHistory())
+        self.assertEqual(
+            schedule.delay(2, 30, status_response("running", "10")), 60
+        )
+        self.assertEqual(PollSchedule.progress(status_response("running")),
+                         None)
+
+    def test_History(self):
+        history = CompletionHistory()
+        schedule = PollSchedule(10, CONTROLLER, estimate_maximum=60,
+                                history=history)
+        for seconds in (30, 20, 25):
+            schedule.complete(seconds)
+        self.assertEqual(history.expected(CONTROLLER), 25)
+        self.assertIsNone(history.expected("advertiser/stats/installs"))
+        self.assertEqual(schedule.delay(1, 0.5), 24.5)
+        # Past expected completion, back to exponential delays.
+        self.assertEqual(schedule.delay(3, 26), 2)
+
+    def test_FewerPollsAndLessLag(self):
+        small, large = 1.2, 180.0
+
+        fixed_polls, fixed_lag = simulate(FixedSchedule(), small)
+        polls, lag = simulate(
+            PollSchedule(history=CompletionHistory()), small
+        )
+        self.assertLess(lag, fixed_lag)
+        self.assertLessEqual(polls, fixed_polls + 2)
+
+        fixed_polls, fixed_lag = simulate(FixedSchedule(), large)
+        history = CompletionHistory()
+        history.record(CONTROLLER, large)
+        polls, lag = simulate(
+            PollSchedule(controller=CONTROLLER, estimate_maximum=60,
+                         history=history), large
+        )
+        self.assertLess(polls, fixed_polls / 2)
+        self.assertLessEqual(lag, fixed_lag)
+
+        polls, lag = simulate(
+            PollSchedule(estimate_maximum=60, history=CompletionHistory()),
+            large, report_progress=True
+        )
+        self.assertLess(polls, fixed_polls / 2)
+
+
+class CompletingExport(Transport):
+    """Transport completing export on fourth status poll."""
+
+    def __init__(self):
+        self.polls = 0
+
+    def urlopen(self, url, data=None, headers=None, timeout=None):
+        self.polls += 1
+        status = "complete" if self.polls >= 4 else "running"
+        body = json.dumps({
+            "status_code": 200,
+            "data": {"status": status, "data": {}},
+            "errors": []
+        }).encode("utf-8")
+        return ReplayResponse(200, {}, body, url)
+
+
+class TestReportExportWorkerSchedule(unittest.TestCase):
+
+    def setUp(self):
+        dirname = os.path.dirname(os.path.split(__file__)[0])
+        filepath = os.path.join(
+            dirname, "config", SdkConfig.SDK_CONFIG_FILENAME
+        )
+        SdkConfig(filepath=os.path.abspath(filepath)).set_api_key("API_KEY")
+        RateLimiter.configure({"status": None})
+
+    def tearDown(self):
+        Transport.configure(None)
+        RateLimiter.configure()
+
+    def test_Run(self):
+        transport = CompletingExport()
+        Transport.configure(transport)
+        history = CompletionHistory()
+
+        worker = ReportExportWorker(
+            "export", "download", "API_KEY", "api_key", "job-1",
+            sleep=10,
+            schedule=PollSchedule(
+                0.04, CONTROLLER, initial=0.01, history=history
+            )
+        )
+        self.assertTrue(worker.run())
+        self.assertEqual(worker.response.data["status"], "complete")
+        self.assertEqual(transport.polls, 4)
+        # 0.01 + 0.02 + 0.04 seconds between polls.
+        self.assertGreaterEqual(history.expected(CONTROLLER), 0.06)
+        self.assertLess(history.expected(CONTROLLER), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+import sys
+import threading
+import time
+import unittest
+
+try:
+    from tune_reporting.base.service import (
+        RateLimiter,
+        TokenBucket,
+        TuneServiceClient,
+        TUNE_ACTION_CLASS_QUERY,
+        TUNE_ACTION_CLASS_EXPORT,
+        TUNE_ACTION_CLASS_STATUS
+    )
+    from tune_reporting.helpers import (
+        Deadline,
+        TuneSdkException
+    )
+except ImportError as exc:
+    sys.stderr.write("Error: failed to import module ({})".format(exc))
+    raise
+
+from .mock_server import (
+    MockServer,
+    json_handler
+)
+
+
+count_handler = json_handler(1)
+
+
+class TestRateLimiter(unittest.TestCase):
+
+    def test_TokenBucket(self):
+        bucket = TokenBucket(rate=10, burst=3)
+        self.assertEqual(
+            [bucket.reserve() for _ in range(3)], [0.0, 0.0, 0.0]
+        )
+        # Empty bucket, callers wait in order of arrival.
+        self.assertAlmostEqual(bucket.reserve(), 0.1, delta=0.01)
+        self.assertAlmostEqual(bucket.reserve(), 0.2, delta=0.01)
+
+    def test_ActionClass(self):
+        self.assertEqual(
+            RateLimiter.action_class("advertiser/stats/clicks", "find"),
+            TUNE_ACTION_CLASS_QUERY
+        )
+        self.assertEqual(
+            RateLimiter.action_class(
+                "advertiser/stats/clicks", "find_export_queue"
+            ),
+            TUNE_ACTION_CLASS_EXPORT
+        )
+        self.assertEqual(
+            RateLimiter.action_class("advertiser/stats/ltv", "export"),
+            TUNE_ACTION_CLASS_EXPORT
+        )
+        self.assertEqual(
+            RateLimiter.action_class("export", "download"),
+            TUNE_ACTION_CLASS_STATUS
+        )
+        self.assertEqual(
+            RateLimiter.action_class("advertiser/stats/ltv", "status"),
+            TUNE_ACTION_CLASS_STATUS
+        )
+
+    def test_SeparateBuckets(self):
+        limiter = RateLimiter({
+            TUNE_ACTION_CLASS_QUERY: (1, 1),
+            TUNE_ACTION_CLASS_EXPORT: (1, 1),
+            TUNE_ACTION_CLASS_STATUS: None
+        })
+        self.assertEqual(limiter.reserve("a", "c", "find"), 0)
+        self.assertGreater(limiter.reserve("a", "c", "find"), 0)
+        # Other authentication key or action class is not delayed.
+        self.assertEqual(limiter.reserve("b", "c", "find"), 0)
+        self.assertEqual(limiter.reserve("a", "c", "find_export_queue"), 0)
+        # Not paced.
+        for _ in range(10):
+            self.assertEqual(limiter.reserve("a", "export", "download"), 0)
+
+    def test_SharedAcrossThreads(self):
+        limiter = RateLimiter({TUNE_ACTION_CLASS_EXPORT: (50, 5)})
+
+        def worker():
+            for _ in range(10):
+                limiter.acquire("API_KEY", "c", "find_export_queue")
+
+        threads = [threading.Thread(target=worker) for _ in range(3)]
+        start = time.time()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # 30 requests, 5 at once then 50 per second.
+        self.assertGreaterEqual(time.time() - start, 0.45)
+
+    def test_ServiceClient(self):
+        limiter = RateLimiter({TUNE_ACTION_CLASS_QUERY: (20, 1)})
+        with MockServer(count_handler) as server:
+            start = time.time()
+            for _ in range(5):
+                client = TuneServiceClient(
+                    "advertiser/stats/clicks",
+                    "count",
+                    "API_KEY",
+                    "api_key",
+                    api_url_endpoint=server.url,
+                    rate_limiter=limiter
+                )
+                self.assertTrue(client.call())
+            self.assertGreaterEqual(time.time() - start, 0.19)
+
+    def test_DeadlineReleasesToken(self):
+        limiter = RateLimiter({TUNE_ACTION_CLASS_QUERY: (1, 1)})
+        limiter.acquire("a", "c", "find")
+        # Request that may not be sent before deadline gives back its
+        # token, so it does not delay later requests.
+        for _ in range(3):
+            self.assertRaises(
+                TuneSdkException,
+                limiter.acquire, "a", "c", "find", Deadline(0.5)
+            )
+        self.assertLessEqual(limiter.reserve("a", "c", "find"), 1)
+
+    def test_InvalidRate(self):
+        self.assertRaises(
+            ValueError, RateLimiter, {TUNE_ACTION_CLASS_QUERY: (0, 1)}
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,278 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+if sys.version_info >= (3, 0, 0):
+    import urllib.parse as urlparse
+else:
+    import urlparse
+
+try:
+    from tune_reporting import (
+        AdvertiserReportCohortValues,
+        AdvertiserReportLogClicks,
+        ReportCache,
+        ReportReaderCSV,
+        SdkConfig
+    )
+    from tune_reporting.base.service import (
+        RateLimiter,
+        Transport
+    )
+    from tune_reporting.base.service.replay_transport import (
+        ReplayResponse
+    )
+except ImportError as exc:
+    sys.stderr.write("Error: failed to import module ({})".format(exc))
+    raise
+
+QUERY = {
+    "start_date": "2015-01-01 00:00:00",
+    "end_date": "2015-01-01 23:59:59",
+    "fields": "id,created",
+    "format": "csv"
+}
+
+REPORT = b"id,created\n1,2015-01-01 00:00:00\n2,2015-01-01 00:00:01\n"
+
+
+def timezones():
+    """Whether timezone database is available."""
+    try:
+        from zoneinfo import ZoneInfo
+        ZoneInfo("Pacific/Honolulu")
+        return True
+    except (ImportError, KeyError):
+        return False
+
+
+class FakeExportService(Transport):
+    """Transport placing numbered export jobs completing at once, and
+    serving their reports slowly."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.jobs = 0
+        self.paths = []
+
+    def urlopen(self, url, data=None, headers=None, timeout=None):
+        parsed = urlparse.urlparse(url)
+        with self.lock:
+            self.paths.append(parsed.path)
+            if parsed.path.endswith(".csv"):
+                time.sleep(0.05)
+                return ReplayResponse(200, {}, REPORT, url)
+            if parsed.path.endswith("/find_export_queue") or \
+               parsed.path.endswith("/export"):
+                self.jobs += 1
+                data = "job-{}".format(self.jobs)
+            elif parsed.path.endswith("/status"):
+                # Cohort reports' status holds URL at top of data.
+                job_id = urlparse.parse_qs(parsed.query)["job_id"][0]
+                data = {
+                    "status": "complete",
+                    "url": "https://example.com/{}.csv".format(job_id)
+                }
+            else:
+                job_id = urlparse.parse_qs(parsed.query)["job_id"][0]
+                data = {
+                    "status": "complete",
+                    "data": {"url": "https://example.com/{}.csv".format(
+                        job_id
+                    )}
+                }
+        body = json.dumps({
+            "status_code": 200,
+            "data": data,
+            "errors": []
+        }).encode("utf-8")
+        return ReplayResponse(200, {}, body, url)
+
+
+class TestReportCache(unittest.TestCase):
+
+    def setUp(self):
+        dirname = os.path.dirname(os.path.split(__file__)[0])
+        filepath = os.path.join(
+            dirname, "config", SdkConfig.SDK_CONFIG_FILENAME
+        )
+        SdkConfig(filepath=os.path.abspath(filepath)).set_api_key("API_KEY")
+        self.service = FakeExportService()
+        Transport.configure(self.service)
+        RateLimiter.configure({"status": None, "export": None})
+        self.dirname = tempfile.mkdtemp()
+
+    def tearDown(self):
+        ReportCache.configure(None)
+        Transport.configure(None)
+        RateLimiter.configure()
+        shutil.rmtree(self.dirname)
+
+    def read(self, query, endpoint_class=AdvertiserReportLogClicks):
+        endpoint = endpoint_class()
+        endpoint._EndpointBase__status_sleep = 0.01
+        job_id = endpoint.export(dict(query)).data
+        response = endpoint.fetch(job_id)
+        reader = ReportReaderCSV(endpoint.parse_response_report_url(response))
+        reader.read()
+        return list(reader)
+
+    def test_ExportFetchRead(self):
+        cache = ReportCache.configure(ReportCache(self.dirname))
+        rows = self.read(QUERY)
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(self.service.jobs, 1)
+        requests = len(self.service.paths)
+
+        # Identical query is served from cache without any request.
+        self.assertEqual(self.read(QUERY), rows)
+        self.assertEqual(len(self.service.paths), requests)
+        self.assertEqual(cache.size(), len(REPORT))
+
+        # Account is part of key.
+        self.assertNotEqual(
+            cache.key("advertiser/stats/clicks", QUERY, "A"),
+            cache.key("advertiser/stats/clicks", QUERY, "B")
+        )
+
+        self.read(dict(QUERY, fields="id"))
+        self.assertEqual(self.service.jobs, 2)
+
+        # Once evicted, identical query is exported again.
+        self.assertEqual(len(cache.clear()), 2)
+        self.read(QUERY)
+        self.assertEqual(self.service.jobs, 3)
+
+    def test_CohortExportFetchRead(self):
+        ReportCache.configure(ReportCache(self.dirname))
+        query = {
+            "start_date": "2015-01-01",
+            "end_date": "2015-01-31",
+            "cohort_type": "install",
+            "cohort_interval": "year_day",
+            "aggregation_type": "cumulative",
+            "fields": "site_id",
+            "group": "site_id"
+        }
+        rows = self.read(query, AdvertiserReportCohortValues)
+        requests = len(self.service.paths)
+        self.assertEqual(self.read(query, AdvertiserReportCohortValues), rows)
+        self.assertEqual(len(self.service.paths), requests)
+        self.assertEqual(self.service.jobs, 1)
+
+    def test_Cacheable(self):
+        cache = ReportCache(self.dirname, settle=3600)
+        self.assertTrue(cache.cacheable(QUERY))
+        self.assertFalse(cache.cacheable({"start_date": "2015-01-01"}))
+
+        # Window ended 3 hours ago in UTC.
+        ended = time.gmtime(time.time() - 3 * 3600)
+        query = {"end_date": time.strftime("%Y-%m-%d %H:%M:%S", ended)}
+        # Unknown timezone is taken as the westernmost.
+        self.assertFalse(cache.cacheable(query))
+        if timezones():
+            self.assertTrue(
+                cache.cacheable(dict(query, response_timezone="UTC"))
+            )
+            # Window ends 10 hours later in Honolulu than in UTC.
+            self.assertFalse(cache.cacheable(
+                dict(query, response_timezone="Pacific/Honolulu")
+            ))
+
+    def test_OpenWindowNotCached(self):
+        ReportCache.configure(ReportCache(self.dirname))
+        query = dict(QUERY, end_date=time.strftime("%Y-%m-%d"))
+        self.read(query)
+        self.read(query)
+        self.assertEqual(self.service.jobs, 2)
+        self.assertEqual(ReportCache.default_cache().size(), 0)
+
+    def test_SharedDownload(self):
+        cache = ReportCache(self.dirname)
+        key = cache.key("advertiser/stats/clicks", QUERY)
+        cache.submitted(key, "job-1")
+        cache.completed("job-1", "https://example.com/job-1.csv",
+                        {"status_code": 200, "data": {}})
+
+        # Caches of other processes sharing directory.
+        paths = []
+        threads = [
+            threading.Thread(target=lambda: paths.append(
+                ReportCache(self.dirname).get("https://example.com/job-1.csv")
+            ))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(paths, [cache.report_path(key)] * 4)
+        self.assertEqual(self.service.paths.count("/job-1.csv"), 1)
+        self.assertEqual(cache.cached_job(key), "job-1")
+        self.assertIsNone(cache.get("https://example.com/other.csv"))
+
+    def test_Evict(self):
+        cache = ReportCache(self.dirname, max_bytes=len(REPORT) * 2)
+        for i in range(3):
+            key = cache.key("advertiser/stats/clicks", dict(QUERY, page=i))
+            cache.submitted(key, "job-{}".format(i))
+            cache.completed("job-{}".format(i),
+                            "https://example.com/job-{}.csv".format(i),
+                            {"status_code": 200, "data": {}})
+            cache.get("https://example.com/job-{}.csv".format(i))
+            past = time.time() - 100 + i
+            os.utime(cache.report_path(key), (past, past))
+
+        # Least recently read is removed.
+        self.assertEqual(cache.size(), len(REPORT) * 2)
+        self.assertIsNone(cache.cached_job(
+            cache.key("advertiser/stats/clicks", dict(QUERY, page=0))
+        ))
+        self.assertIsNotNone(cache.completed_response("job-2"))
+        self.assertIsNone(cache.completed_response("job-0"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,223 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+
+import os
+import re
+import shutil
+import sys
+import tempfile
+import unittest
+
+if sys.version_info >= (3, 0, 0):
+    import urllib.error as urllib_error
+else:
+    import urllib2 as urllib_error
+
+try:
+    from tune_reporting import (
+        ReportDownloader,
+        ReportReaderCSV,
+        ReportReaderJSONStream,
+        TuneServiceException
+    )
+    from tune_reporting.base.service import (
+        Transport
+    )
+    from tune_reporting.base.service.replay_transport import (
+        ReplayResponse
+    )
+except ImportError as exc:
+    sys.stderr.write("Error: failed to import module ({})".format(exc))
+    raise
+
+REPORT_URL = "https://example.com/report.csv"
+
+REPORT = ("id,name\n" + "".join(
+    "{0},\"row {0}\nline\"\n".format(i) for i in range(20000)
+)).encode("utf-8")
+
+
+class InterruptedResponse(ReplayResponse):
+    """Response whose connection is reset after 'limit' bytes."""
+
+    def __init__(self, status, headers, body, limit):
+        ReplayResponse.__init__(self, status, headers, body, REPORT_URL)
+        self.remaining = limit
+
+    def read(self, amt=None):
+        if self.remaining is not None and self.remaining <= 0:
+            raise IOError("Connection reset by peer")
+        if self.remaining is not None:
+            amt = min(amt or self.remaining, self.remaining)
+            self.remaining -= amt
+        return ReplayResponse.read(self, amt)
+
+
+class FakeReportServer(Transport):
+    """Transport serving REPORT, resetting connection of the first
+    'interruptions' requests after 'limit' bytes."""
+
+    def __init__(self, interruptions=0, limit=100000, ranges=True,
+                 etag='"v1"'):
+        self.interruptions = interruptions
+        self.limit = limit
+        self.ranges = ranges
+        self.etag = etag
+        self.requests = []
+
+    def urlopen(self, url, data=None, headers=None, timeout=None):
+        headers = headers or {}
+        self.requests.append(headers)
+        limit = None
+        if self.interruptions > 0:
+            self.interruptions -= 1
+            limit = self.limit
+
+        match = re.match(r"bytes=(\d+)-", headers.get("Range", ""))
+        if match and self.ranges and \
+           headers.get("If-Range", self.etag) == self.etag:
+            start = int(match.group(1))
+            body = REPORT[start:]
+            return InterruptedResponse(206, {
+                "ETag": self.etag,
+                "Content-Length": str(len(body)),
+                "Content-Range": "bytes {}-{}/{}".format(
+                    start, len(REPORT) - 1, len(REPORT)
+                )
+            }, body, limit)
+        return InterruptedResponse(200, {
+            "ETag": self.etag,
+            "Content-Length": str(len(REPORT))
+        }, REPORT, limit)
+
+
+class TestReportDownloader(unittest.TestCase):
+
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        self.filepath = os.path.join(self.dirname, "report.csv")
+
+    def tearDown(self):
+        Transport.configure(None)
+        shutil.rmtree(self.dirname)
+
+    def downloader(self, **kwargs):
+        return ReportDownloader(
+            REPORT_URL, self.filepath, backoff=0, chunk_size=8192, **kwargs
+        )
+
+    def test_Resume(self):
+        server = Transport.configure(FakeReportServer(interruptions=3))
+        downloader = self.downloader()
+        self.assertEqual(downloader.download(), self.filepath)
+
+        with open(self.filepath, "rb") as handle:
+            self.assertEqual(handle.read(), REPORT)
+        self.assertEqual(downloader.size, len(REPORT))
+        self.assertEqual(downloader.resumes, 3)
+        self.assertNotIn("Range", server.requests[0])
+        self.assertEqual(server.requests[1]["Range"], "bytes=100000-")
+        self.assertEqual(server.requests[3]["Range"], "bytes=300000-")
+        self.assertEqual(server.requests[3]["If-Range"], '"v1"')
+        self.assertEqual(server.requests[0]["Accept-Encoding"], "identity")
+
+        # Spooled file is not downloaded again.
+        downloader.download()
+        self.assertEqual(len(server.requests), 4)
+
+    def test_RangesNotSupported(self):
+        Transport.configure(FakeReportServer(interruptions=2, ranges=False))
+        self.downloader().download()
+        with open(self.filepath, "rb") as handle:
+            self.assertEqual(handle.read(), REPORT)
+
+    def test_TooManyInterruptions(self):
+        Transport.configure(FakeReportServer(interruptions=10))
+        downloader = self.downloader(max_resumes=2)
+        self.assertRaises(Exception, downloader.download)
+        self.assertFalse(downloader.downloaded)
+
+        # Partial download is resumed by a later downloader.
+        server = Transport.configure(FakeReportServer())
+        self.downloader().download()
+        self.assertEqual(server.requests[0]["Range"], "bytes=300000-")
+        with open(self.filepath, "rb") as handle:
+            self.assertEqual(handle.read(), REPORT)
+
+    def test_NotFound(self):
+        class NotFound(Transport):
+            calls = 0
+
+            def urlopen(self, url, data=None, headers=None, timeout=None):
+                NotFound.calls += 1
+                raise urllib_error.HTTPError(url, 404, "Not Found", {}, None)
+
+        Transport.configure(NotFound())
+        self.assertRaises(TuneServiceException, self.downloader().download)
+        self.assertEqual(NotFound.calls, 1)
+
+    def test_Readers(self):
+        Transport.configure(FakeReportServer(interruptions=1))
+        downloader = self.downloader()
+        for use_mmap in (False, True):
+            reader = downloader.reader(ReportReaderCSV, use_mmap=use_mmap)
+            reader.read()
+            rows = list(reader.reader)
+            self.assertEqual(rows[0], ["id", "name"])
+            self.assertEqual(rows[-1], ["19999", "row 19999\nline"])
+            self.assertEqual(len(rows), 20001)
+
+        with downloader.mmap() as mapped:
+            self.assertEqual(len(mapped), len(REPORT))
+            self.assertEqual(mapped.readline(), b"id,name\n")
+
+        downloader.remove()
+        self.assertFalse(os.path.exists(self.filepath))
+
+    def test_JsonReader(self):
+        with open(self.filepath, "wb") as handle:
+            handle.write(b'[{"id": 1}, {"id": 2}]')
+        reader = ReportReaderJSONStream(
+            REPORT_URL, filepath=self.filepath, use_mmap=True
+        )
+        reader.read()
+        self.assertEqual(list(reader), [{"id": 1}, {"id": 2}])
+        self.assertEqual(reader.count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+
+import codecs
+import csv
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+try:
+    from tune_reporting import (
+        ParallelCSVParser,
+        ReportReaderCSV
+    )
+except ImportError as exc:
+    sys.stderr.write("Error: failed to import module ({})".format(exc))
+    raise
+
+
+def count_revenue(rows):
+    """Aggregates rows of a batch within worker process."""
+    return len(rows), sum(float(row[2]) for row in rows)
+
+
+def build_report(rows):
+    lines = [u"id,site.name,revenue\r\n"]
+    for i in range(rows):
+        if i % 7 == 0:
+            name = u"\"Site \"\"{}\"\"\nsecond line, é\"".format(i)
+        else:
+            name = u"Site {}".format(i)
+        lines.append(u"{},{},{:.2f}\r\n".format(i, name, i / 4.0))
+    return u"".join(lines).encode("utf-8")
+
+
+class TestParallelCSVParser(unittest.TestCase):
+
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        self.filepath = os.path.join(self.dirname, "report.csv")
+        self.report = build_report(3000)
+        with open(self.filepath, "wb") as handle:
+            handle.write(self.report)
+        if sys.version_info >= (3, 0, 0):
+            stream = io.StringIO(self.report.decode("utf-8"), newline="")
+        else:
+            stream = io.BytesIO(self.report)
+        self.expected = list(csv.reader(stream))
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def test_Ranges(self):
+        parser = ParallelCSVParser(self.filepath, range_size=1000)
+        ranges = parser.ranges()
+        self.assertGreater(len(ranges), 50)
+        self.assertEqual(ranges[-1][1], len(self.report))
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            self.assertEqual(end, start)
+            # Every range ends at a record boundary.
+            self.assertEqual(self.report[start - 2:start], b"\r\n")
+
+    def test_Ordered(self):
+        parser = ParallelCSVParser(
+            self.filepath, processes=2, range_size=1000
+        )
+        self.assertEqual(parser.header, self.expected[0])
+        self.assertEqual(list(parser), self.expected[1:])
+
+    def test_UnorderedTransform(self):
+        parser = ParallelCSVParser(
+            self.filepath, processes=3, range_size=2000
+        )
+        batches = list(parser.batches(ordered=False, transform=count_revenue))
+        self.assertEqual(
+            sorted(batch.index for batch in batches),
+            list(range(len(parser.ranges())))
+        )
+        self.assertEqual(sum(batch.rows[0] for batch in batches), 3000)
+        self.assertAlmostEqual(
+            sum(batch.rows[1] for batch in batches),
+            sum(i / 4.0 for i in range(3000)),
+            places=2
+        )
+
+    def test_HeaderOnly(self):
+        with open(self.filepath, "wb") as handle:
+            handle.write(codecs.BOM_UTF8 + b"id,name\n")
+        parser = ParallelCSVParser(self.filepath)
+        self.assertEqual(parser.header, ["id", "name"])
+        self.assertEqual(list(parser), [])
+
+    def test_Reader(self):
+        reader = ReportReaderCSV(
+            "https://example.com/report.csv", filepath=self.filepath
+        )
+        parser = reader.parallel(processes=2, range_size=4000)
+        self.assertEqual(list(parser), self.expected[1:])
+        self.assertRaises(
+            ValueError,
+            ReportReaderCSV("https://example.com/report.csv").parallel
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,240 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+
+import json
+import os
+import sys
+import threading
+import time
+import unittest
+
+if sys.version_info >= (3, 0, 0):
+    import urllib.parse as urlparse
+else:
+    import urlparse
+
+try:
+    from tune_reporting import (
+        AdvertiserReportLogClicks,
+        ReportPipeline,
+        SdkConfig,
+        TuneServiceException
+    )
+    from tune_reporting.base.service import (
+        RateLimiter,
+        Transport
+    )
+    from tune_reporting.base.service.replay_transport import (
+        ReplayResponse
+    )
+except ImportError as exc:
+    sys.stderr.write("Error: failed to import module ({})".format(exc))
+    raise
+
+
+class FakeReports(Transport):
+    """Transport placing export jobs named after query's 'fields'.
+
+    Job 'job-<n>' completes on poll number <n> % 3 + 1 with a CSV report
+    of <n> rows, job 'job-fail' fails.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.polls = {}
+        self.polling = 0
+        self.max_polling = 0
+
+    def urlopen(self, url, data=None, headers=None, timeout=None):
+        parsed = urlparse.urlparse(url)
+        query = urlparse.parse_qs(parsed.query)
+        if parsed.path.endswith(".csv"):
+            with self.lock:
+                self.polling -= 1
+            rows = int(parsed.path.rsplit("-", 1)[1][:-4])
+            body = "id,name\n" + "".join(
+                "{0},\"row {0}\"\n".format(i) for i in range(rows)
+            )
+            return ReplayResponse(200, {}, body.encode("utf-8"), url)
+        if parsed.path.endswith(".json"):
+            with self.lock:
+                self.polling -= 1
+            rows = int(parsed.path.rsplit("-", 1)[1][:-5])
+            body = json.dumps([{"id": i} for i in range(rows)])
+            if "bad" in parsed.path:
+                body = body[:-3]
+            return ReplayResponse(200, {}, body.encode("utf-8"), url)
+
+        if parsed.path.endswith("/find_export_queue"):
+            with self.lock:
+                self.polling += 1
+                self.max_polling = max(self.max_polling, self.polling)
+            data = "job-" + query["fields"][0]
+        else:
+            job_id = query["job_id"][0]
+            with self.lock:
+                polls = self.polls[job_id] = self.polls.get(job_id, 0) + 1
+            if job_id == "job-fail":
+                status = "fail"
+            else:
+                required = int(job_id.rsplit("-", 1)[1]) % 3 + 1
+                status = "complete" if polls >= required else "running"
+            data = {
+                "status": status,
+                "data": {"url": "https://example.com/{}.{}".format(
+                    job_id, "json" if "json" in job_id else "csv"
+                )}
+            }
+        body = json.dumps({
+            "status_code": 200,
+            "data": data,
+            "errors": []
+        }).encode("utf-8")
+        return ReplayResponse(200, {}, body, url)
+
+
+def exports(names, report_format="csv"):
+    for name in names:
+        endpoint = AdvertiserReportLogClicks()
+        endpoint._EndpointBase__status_sleep = 0.01
+        yield endpoint, {
+            "start_date": "2015-01-01 00:00:00",
+            "end_date": "2015-01-01 23:59:59",
+            "fields": str(name),
+            "format": report_format
+        }, name
+
+
+class TestReportPipeline(unittest.TestCase):
+
+    def setUp(self):
+        dirname = os.path.dirname(os.path.split(__file__)[0])
+        filepath = os.path.join(
+            dirname, "config", SdkConfig.SDK_CONFIG_FILENAME
+        )
+        SdkConfig(filepath=os.path.abspath(filepath)).set_api_key("API_KEY")
+        self.reports = FakeReports()
+        Transport.configure(self.reports)
+        RateLimiter.configure({"status": None, "export": None})
+
+    def tearDown(self):
+        Transport.configure(None)
+        RateLimiter.configure()
+
+    def test_Run(self):
+        def handler(key, rows):
+            rows = list(rows)
+            self.assertEqual(rows[0], ["id", "name"])
+            return len(rows) - 1
+
+        pipeline = ReportPipeline(handler)
+        results = list(pipeline.run(exports(range(20))))
+
+        self.assertEqual(
+            sorted((r.key, r.result, r.error) for r in results),
+            [(i, i, None) for i in range(20)]
+        )
+        stats = pipeline.stats
+        for stage in ("export", "poll", "download", "parse"):
+            self.assertEqual(stats[stage].items, 20)
+            self.assertEqual(stats[stage].errors, 0)
+            self.assertGreater(stats[stage].throughput, 0)
+        self.assertEqual(stats["parse"].rows, sum(range(20)) + 20)
+        self.assertGreater(stats["download"].bytes, 0)
+        self.assertIn("parse: items=20", str(stats["parse"]))
+
+    def test_Backpressure(self):
+        def handler(key, rows):
+            time.sleep(0.02)
+            return sum(1 for _ in rows)
+
+        pipeline = ReportPipeline(
+            handler,
+            export_workers=4,
+            poll_capacity=3,
+            download_workers=1,
+            parse_workers=1,
+            queue_size=1
+        )
+        results = list(pipeline.run(exports(range(15))))
+        self.assertEqual(len(results), 15)
+        # Jobs polled never exceed capacity while parsing holds back.
+        self.assertLessEqual(self.reports.max_polling, 3)
+
+    def test_Errors(self):
+        def handler(key, rows):
+            if key == 2:
+                raise ValueError("bad report")
+            return key
+
+        pipeline = ReportPipeline(handler)
+        pipeline.submit(*next(exports(["fail"])))
+        for export in exports(range(1, 4)):
+            pipeline.submit(*export)
+        pipeline.close()
+
+        results = dict((r.key, r) for r in pipeline.results())
+        self.assertIsInstance(results["fail"].error, TuneServiceException)
+        self.assertIsInstance(results[2].error, ValueError)
+        self.assertEqual(results[1].result, 1)
+        self.assertEqual(results[3].result, 3)
+        self.assertEqual(pipeline.stats["poll"].errors, 1)
+        self.assertEqual(pipeline.stats["parse"].errors, 1)
+        # Results may be iterated again once completed.
+        self.assertEqual(len(list(pipeline.results())), 0)
+
+    def test_Json(self):
+        def handler(key, rows):
+            return [row["id"] for row in rows]
+
+        pipeline = ReportPipeline(handler)
+        results = dict(
+            (r.key, r) for r in
+            pipeline.run(exports(["json-3", "json-bad-4"], "json"))
+        )
+        self.assertEqual(results["json-3"].result, [0, 1, 2])
+        # Truncated report is delivered as error, not left pending.
+        self.assertIsNotNone(results["json-bad-4"].error)
+        self.assertEqual(pipeline.stats["parse"].errors, 1)
+
+    def test_Empty(self):
+        pipeline = ReportPipeline(lambda key, rows: None)
+        self.assertEqual(list(pipeline.run([])), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
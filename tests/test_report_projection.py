@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+try:
+    from tune_reporting import (
+        ReportProjection,
+        ReportReaderColumnar,
+        ReportReaderCSV,
+        ReportReaderJSONStream
+    )
+    from tune_reporting.helpers.report_reader_json import (
+        ReportReaderJSON
+    )
+except ImportError as exc:
+    sys.stderr.write("Error: failed to import module ({})".format(exc))
+    raise
+
+HEADER = ["id", "site.name", "country", "clicks"]
+ROWS = [
+    [str(i), u"Site {}".format(i % 3), "US" if i % 2 else "CA", str(i % 7)]
+    for i in range(50)
+]
+
+
+class TestReportProjection(unittest.TestCase):
+
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        self.csv_path = os.path.join(self.dirname, "report.csv")
+        with open(self.csv_path, "wb") as handle:
+            lines = [",".join(HEADER)] + [",".join(row) for row in ROWS]
+            handle.write(("\n".join(lines) + "\n").encode("utf-8"))
+        self.json_path = os.path.join(self.dirname, "report.json")
+        with open(self.json_path, "wb") as handle:
+            handle.write(json.dumps(
+                [dict(zip(HEADER, row)) for row in ROWS]
+            ).encode("utf-8"))
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def expected(self):
+        return [
+            [row[1], row[3]] for row in ROWS
+            if row[2] == "US" and int(row[3]) > 2
+        ]
+
+    def test_Projection(self):
+        self.assertIsNone(ReportProjection.create())
+        projection = ReportProjection(["clicks", "id"], {"country": "US"})
+        names, select = projection.compile(HEADER)
+        self.assertEqual(names, ["clicks", "id"])
+        self.assertEqual(select(["1", "a", "US", "5"]), ["5", "1"])
+        self.assertIsNone(select(["1", "a", "CA", "5"]))
+        self.assertRaises(ValueError, projection.compile, ["id", "clicks"])
+        self.assertRaises(ValueError, ReportProjection, "id")
+        self.assertRaises(ValueError, ReportProjection, None, ["id"])
+
+        # Blank lines are skipped, short records padded.
+        projection = ReportProjection(["id", "clicks"], {"country": "US"})
+        records = [HEADER, ["1", "a", "US", "5"], [], ["2", "b", "US"]]
+        self.assertEqual(
+            list(projection.apply(records)),
+            [["id", "clicks"], ["1", "5"], ["2", None]]
+        )
+
+    def test_ReaderCSV(self):
+        reader = ReportReaderCSV("https://example.com/report.csv",
+                                 filepath=self.csv_path)
+        reader.read(columns=["site.name", "clicks"], where={
+            "country": "US", "clicks": lambda value: int(value) > 2
+        })
+        self.assertEqual(reader.next(), ["site.name", "clicks"])
+        self.assertEqual(list(reader), self.expected())
+
+        # Numbers are compared as text of CSV values.
+        reader.read(columns=["id"], where={"clicks": 5})
+        self.assertEqual(reader.next(), ["id"])
+        self.assertEqual(
+            list(reader), [[row[0]] for row in ROWS if row[3] == "5"]
+        )
+
+    def test_ReaderColumnar(self):
+        reader = ReportReaderColumnar("https://example.com/report.csv",
+                                      filepath=self.csv_path,
+                                      use_numpy=False)
+        reader.read(columns=["site.name", "clicks"], where={"country": "US"})
+        self.assertEqual(reader.columns, ["site.name", "clicks"])
+        self.assertEqual(reader.count, 25)
+        self.assertEqual(reader.sum("clicks"),
+                         sum(int(row[3]) for row in ROWS if row[2] == "US"))
+        self.assertRaises(ValueError, reader.column, "country")
+
+    def test_ReaderJSON(self):
+        expected = [
+            {"site.name": site, "clicks": clicks}
+            for site, clicks in self.expected()
+        ]
+        where = {"country": "US", "clicks": lambda value: int(value) > 2}
+        for cls in (ReportReaderJSON, ReportReaderJSONStream):
+            reader = cls("https://example.com/report.json",
+                         filepath=self.json_path)
+            reader.read(columns=["site.name", "clicks"], where=where)
+            rows = reader.data if cls is ReportReaderJSON else list(reader)
+            self.assertEqual(rows, expected)
+            self.assertEqual(reader.count, len(expected))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,314 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+
+import math
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+if sys.version_info >= (3, 3, 0):
+    from unittest import mock
+else:
+    mock = None
+
+try:
+    from tune_reporting import (
+        ReportReaderCSV,
+        ReportReaderColumnar
+    )
+except ImportError as exc:
+    sys.stderr.write("Error: failed to import module ({})".format(exc))
+    raise
+
+REPORT_URL = "https://example.com/report.csv"
+
+SITES = [u"Site A", u"Site B", u"Sité C"]
+
+
+def build_report(rows):
+    lines = [u"site.name,installs,clicks,revenue,country\n"]
+    for i in range(rows):
+        # Installs turn fractional beyond inferred sample.
+        installs = "{}.5".format(i) if i == rows - 1 else str(i % 10)
+        revenue = "" if i % 100 == 0 else "{:.2f}".format(i / 8.0)
+        lines.append(u"{},{},{},{},\"US, CA\"\n".format(
+            SITES[i % 3], installs, i % 7, revenue
+        ))
+    return u"".join(lines).encode("utf-8")
+
+
+class FakeNumPy(object):
+    """Stand-in of NumPy functions used by ReportReaderColumnar, so its
+    vectorized path is run where NumPy is not installed."""
+
+    class ndarray(list):
+        dtype = None
+
+    class add(object):
+        @staticmethod
+        def at(totals, indices, values):
+            for index, value in zip(indices, values):
+                totals[index] += value
+
+    def __init__(self):
+        self.calls = []
+
+    def frombuffer(self, data, dtype):
+        self.calls.append("frombuffer")
+        return self.array(data, dtype)
+
+    def array(self, values, dtype):
+        values = self.ndarray(values)
+        values.dtype = dtype
+        return values
+
+    def zeros(self, size, dtype):
+        self.calls.append("zeros")
+        return self.array([0] * size, dtype)
+
+    def nansum(self, values):
+        self.calls.append("nansum")
+        return sum(value for value in values if value == value)
+
+    def nan_to_num(self, values):
+        return self.ndarray(value if value == value else 0.0
+                            for value in values)
+
+    def bincount(self, codes, weights, minlength):
+        self.calls.append("bincount")
+        totals = [0.0] * minlength
+        for code, weight in zip(codes, weights):
+            totals[code] += weight
+        return totals
+
+
+class TestReportReaderColumnar(unittest.TestCase):
+
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        self.filepath = os.path.join(self.dirname, "report.csv")
+        self.rows = 3000
+        with open(self.filepath, "wb") as handle:
+            handle.write(build_report(self.rows))
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def reader(self, **kwargs):
+        reader = ReportReaderColumnar(
+            REPORT_URL, filepath=self.filepath, **kwargs
+        )
+        reader.read()
+        return reader
+
+    def test_Columns(self):
+        reader = self.reader(use_numpy=False)
+        self.assertEqual(reader.count, self.rows)
+        self.assertEqual(
+            reader.columns,
+            ["site.name", "installs", "clicks", "revenue", "country"]
+        )
+        self.assertEqual(reader.kind("site.name"), "str")
+        self.assertEqual(reader.kind("installs"), "float")
+        self.assertEqual(reader.kind("clicks"), "int")
+        self.assertEqual(reader.kind("revenue"), "float")
+        self.assertEqual(reader.dictionary("site.name"), SITES)
+        self.assertEqual(reader.dictionary("country"), [u"US, CA"])
+        self.assertEqual(reader.column("clicks").typecode,
+                         "q" if sys.version_info >= (3, 3, 0) else "l")
+        self.assertEqual(len(reader.column("site.name")), self.rows)
+        self.assertEqual(reader.values("site.name")[:4], SITES + SITES[:1])
+        self.assertTrue(math.isnan(reader.values("revenue")[0]))
+
+        self.assertEqual(reader.sum("clicks"), sum(i % 7 for i in range(3000)))
+        self.assertAlmostEqual(
+            reader.sum("revenue"),
+            sum(i / 8.0 for i in range(3000) if i % 100),
+            places=2
+        )
+        totals = reader.aggregate("site.name", ["clicks", "installs"])
+        self.assertEqual(
+            totals[u"Site B"][0], sum(i % 7 for i in range(1, 3000, 3))
+        )
+        self.assertRaises(ValueError, reader.aggregate, "clicks", ["clicks"])
+        self.assertRaises(ValueError, reader.column, "missing")
+
+    def test_Kinds(self):
+        reader = self.reader(use_numpy=False, kinds={"clicks": "str"})
+        self.assertEqual(reader.kind("clicks"), "str")
+        self.assertEqual(reader.dictionary("clicks"),
+                         [str(i) for i in range(7)])
+        self.assertRaises(
+            ValueError, ReportReaderColumnar, REPORT_URL, kinds={"a": "b"}
+        )
+
+    @unittest.skipIf(numpy is None, "requires NumPy")
+    def test_NumPy(self):
+        reader = self.reader(use_numpy=True)
+        plain = self.reader(use_numpy=False)
+        self.assertIsInstance(reader.column("clicks"), numpy.ndarray)
+        self.assertEqual(reader.sum("clicks"), plain.sum("clicks"))
+        by_site = reader.aggregate("site.name", ["clicks", "revenue"])
+        expected = plain.aggregate("site.name", ["clicks", "revenue"])
+        for site in SITES:
+            self.assertEqual(by_site[site][0], expected[site][0])
+            self.assertAlmostEqual(by_site[site][1], expected[site][1])
+
+    @unittest.skipIf(mock is None, "requires unittest.mock")
+    def test_FakeNumPy(self):
+        fake = FakeNumPy()
+        plain = self.reader(use_numpy=False)
+        with mock.patch(
+            "tune_reporting.helpers.report_reader_columnar.numpy", fake
+        ):
+            reader = self.reader(use_numpy=True)
+            self.assertIsInstance(reader.column("clicks"), FakeNumPy.ndarray)
+            self.assertEqual(reader.sum("clicks"), plain.sum("clicks"))
+            self.assertAlmostEqual(reader.sum("revenue"),
+                                   plain.sum("revenue"))
+            by_site = reader.aggregate("site.name", ["clicks", "revenue"])
+        expected = plain.aggregate("site.name", ["clicks", "revenue"])
+        for site in SITES:
+            self.assertEqual(by_site[site][0], expected[site][0])
+            self.assertAlmostEqual(by_site[site][1], expected[site][1])
+        self.assertIn("bincount", fake.calls)
+        self.assertIn("zeros", fake.calls)
+        self.assertIn("nansum", fake.calls)
+
+    def test_Promotion(self):
+        with open(self.filepath, "wb") as handle:
+            handle.write(
+                b"code,id,amount\n"
+                b"001,1,1.50\n"
+                b",99999999999999999999,\n"
+                b"A7,2,x\n"
+            )
+        reader = self.reader(
+            use_numpy=False,
+            kinds={"code": "int", "id": "int", "amount": "float"}
+        )
+        # Text of numbers is kept once column is promoted to strings.
+        self.assertEqual(reader.kind("code"), "str")
+        self.assertEqual(reader.values("code"), [u"001", u"", u"A7"])
+        self.assertEqual(reader.kind("amount"), "str")
+        self.assertEqual(reader.values("amount"), [u"1.50", u"", u"x"])
+        # Integer beyond 64 bits is kept exactly.
+        self.assertEqual(reader.kind("id"), "str")
+        self.assertEqual(reader.values("id"),
+                         [u"1", u"99999999999999999999", u"2"])
+
+    def test_BlankLines(self):
+        with open(self.filepath, "wb") as handle:
+            handle.write(b"site,installs\na,1\n\nb,2\n\n")
+        reader = self.reader(use_numpy=False)
+        # Blank lines are skipped, as by ReportReaderCSV.
+        self.assertEqual(reader.count, 2)
+        self.assertEqual(reader.values("site"), [u"a", u"b"])
+        self.assertEqual(reader.kind("installs"), "int")
+        self.assertEqual(reader.values("installs"), [1, 2])
+
+    def test_EmptyIntegers(self):
+        with open(self.filepath, "wb") as handle:
+            handle.write(
+                b"site,installs,code\n"
+                b"a,1,7\n"
+                b"a,,\n"
+                b"b,9007199254740993,x\n"
+                b"a,9007199254740993,\n"
+            )
+        for use_numpy in (False, True):
+            if use_numpy and numpy is None:
+                continue
+            reader = self.reader(use_numpy=use_numpy)
+            # Empty cell does not promote integer column to floats.
+            self.assertEqual(reader.kind("installs"), "int")
+            self.assertEqual(reader.values("installs"),
+                             [1, 0, 9007199254740993, 9007199254740993])
+            # Integers beyond 2**53 are summed exactly.
+            self.assertEqual(reader.sum("installs"), 18014398509481987)
+            self.assertEqual(
+                reader.aggregate("site", ["installs"]),
+                {u"a": [9007199254740994], u"b": [9007199254740993]}
+            )
+            # Empty cells are kept once promoted to strings.
+            self.assertEqual(reader.values("code"), [u"7", u"", u"x", u""])
+
+    @unittest.skipIf(sys.version_info < (3, 4, 0), "requires tracemalloc")
+    def test_Memory(self):
+        import tracemalloc
+
+        tracemalloc.start()
+        try:
+            reader = self.reader(use_numpy=False)
+            columnar, _ = tracemalloc.get_traced_memory()
+            del reader
+            csv_reader = ReportReaderCSV(REPORT_URL, filepath=self.filepath)
+            csv_reader.read()
+            rows = list(csv_reader)
+            listed, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(len(rows), self.rows + 1)
+        self.assertLess(columnar * 4, listed)
+
+
+class TestReportReaderCSV(unittest.TestCase):
+
+    def test_Iteration(self):
+        dirname = tempfile.mkdtemp()
+        try:
+            filepath = os.path.join(dirname, "report.csv")
+            with open(filepath, "wb") as handle:
+                handle.write(u"id,name\n1,é\n".encode("utf-8"))
+            reader = ReportReaderCSV(REPORT_URL, filepath=filepath)
+            reader.read()
+            self.assertEqual(reader.next(), [u"id", u"name"])
+            self.assertEqual(list(reader), [[u"1", u"é"]])
+            self.assertIsNone(reader.next())
+        finally:
+            shutil.rmtree(dirname)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+
+import json
+import sys
+import time
+import unittest
+
+try:
+    from tune_reporting import (
+        ReportReaderJSONStream,
+        TuneSdkException
+    )
+    from tune_reporting.base.service import (
+        Transport
+    )
+    from tune_reporting.base.service.replay_transport import (
+        ReplayResponse
+    )
+except ImportError as exc:
+    sys.stderr.write("Error: failed to import module ({})".format(exc))
+    raise
+
+REPORT_URL = "https://example.com/report.json"
+
+
+def report_row(i):
+    return {"id": i, "created": "2015-08-01 00:00:00",
+            "site.name": u"Site é {}".format(i)}
+
+
+class GeneratedResponse(ReplayResponse):
+    """Response streaming a JSON array of generated rows."""
+
+    def __init__(self, rows, delay=0):
+        ReplayResponse.__init__(self, 200, {}, b"", REPORT_URL)
+        self.delay = delay
+        self.chunks = self.generate(rows)
+        self.pending = b""
+
+    @staticmethod
+    def generate(rows):
+        yield b"["
+        for i in range(rows):
+            yield (b", " if i else b"") + \
+                json.dumps(report_row(i)).encode("utf-8")
+        yield b"]"
+
+    def read(self, amt=None):
+        time.sleep(self.delay)
+        while len(self.pending) < (amt or 1 << 30):
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                break
+            self.pending += chunk
+        data, self.pending = self.pending[:amt], self.pending[amt:]
+        return data
+
+
+class FakeReport(Transport):
+
+    def __init__(self, rows, delay=0):
+        self.rows = rows
+        self.delay = delay
+
+    def urlopen(self, url, data=None, headers=None, timeout=None):
+        return GeneratedResponse(self.rows, self.delay)
+
+
+class TestReportReaderJSONStream(unittest.TestCase):
+
+    def tearDown(self):
+        Transport.configure(None)
+
+    def test_Rows(self):
+        Transport.configure(FakeReport(5000))
+        reader = ReportReaderJSONStream(REPORT_URL)
+        reader.read()
+        self.assertEqual(reader.next(), report_row(0))
+        self.assertIsNone(reader.count)
+        rows = list(reader)
+        self.assertEqual(len(rows), 4999)
+        self.assertEqual(rows[-1], report_row(4999))
+        self.assertEqual(reader.count, 5000)
+        self.assertIsNone(reader.next())
+
+    def test_Empty(self):
+        Transport.configure(FakeReport(0))
+        reader = ReportReaderJSONStream(REPORT_URL)
+        reader.read()
+        self.assertEqual(list(reader), [])
+        self.assertEqual(reader.count, 0)
+
+    @unittest.skipIf(sys.version_info < (3, 4, 0), "requires tracemalloc")
+    def test_ConstantMemory(self):
+        import tracemalloc
+
+        Transport.configure(FakeReport(50000))
+        reader = ReportReaderJSONStream(REPORT_URL)
+        reader.read()
+        tracemalloc.start()
+        try:
+            count = sum(1 for _ in reader)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(count, 50000)
+        # Report is about 4 MB, memory stays within a few read chunks.
+        self.assertLess(peak, 1024 * 1024)
+
+    def test_Deadline(self):
+        Transport.configure(FakeReport(50000, delay=0.05))
+        reader = ReportReaderJSONStream(REPORT_URL)
+        reader.read(deadline=0.2)
+        with self.assertRaises(TuneSdkException):
+            for _ in reader:
+                pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+import json
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import unittest
+
+try:
+    from tune_reporting import (
+        ReportReaderCSV,
+        ReportReaderJSONStream,
+        ReportRow
+    )
+    from tune_reporting.helpers import (
+        row_type,
+        rows_of_mappings
+    )
+    from tune_reporting.helpers.report_reader_json import (
+        ReportReaderJSON
+    )
+except ImportError as exc:
+    sys.stderr.write("Error: failed to import module ({})".format(exc))
+    raise
+
+HEADER = ["id", "site.name", "site.id", "count"]
+
+
+class TestReportRow(unittest.TestCase):
+
+    def test_RowType(self):
+        cls = row_type(HEADER)
+        self.assertIs(row_type(list(HEADER)), cls)
+        self.assertTrue(issubclass(cls, ReportRow))
+        row = cls._make(["1", "Site A", "7", "3"])
+        self.assertEqual(row.id, "1")
+        self.assertEqual(getattr(row, "site.name"), "Site A")
+        self.assertEqual(row.site.name, "Site A")
+        self.assertEqual(row.site.id, "7")
+        self.assertEqual(row["count"], "3")
+        # Fields shadow tuple's methods.
+        self.assertEqual(row.count, "3")
+        self.assertEqual(row[0], "1")
+        self.assertEqual(row._get("missing", 0), 0)
+        self.assertEqual(row._asdict()["site.id"], "7")
+        self.assertRaises(AttributeError, getattr, row, "missing")
+        self.assertRaises(AttributeError, getattr, row.site, "missing")
+        self.assertRaises(KeyError, row.__getitem__, "missing")
+        self.assertFalse(hasattr(row, "__dict__"))
+        self.assertEqual(pickle.loads(pickle.dumps(row)), row)
+        self.assertRaises(ValueError, row_type, ["id", "id"])
+
+    def test_Mappings(self):
+        rows = list(rows_of_mappings([
+            {"id": 1, "site.name": "A"},
+            {"id": 2, "site.name": "B"},
+            {"site.name": "C"}
+        ]))
+        self.assertIs(type(rows[0]), type(rows[1]))
+        self.assertEqual([row.site.name for row in rows], ["A", "B", "C"])
+        self.assertEqual(rows[1].id, 2)
+        self.assertRaises(AttributeError, getattr, rows[2], "id")
+
+
+class TestReportReaderTyped(unittest.TestCase):
+
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        self.rows = [[str(i), "Site {}".format(i % 3), str(i % 3), "2"]
+                     for i in range(10)]
+        self.csv_path = os.path.join(self.dirname, "report.csv")
+        with open(self.csv_path, "wb") as handle:
+            lines = [",".join(HEADER)] + [",".join(r) for r in self.rows]
+            handle.write(("\n".join(lines) + "\n").encode("utf-8"))
+        self.json_path = os.path.join(self.dirname, "report.json")
+        with open(self.json_path, "wb") as handle:
+            handle.write(json.dumps(
+                [dict(zip(HEADER, r)) for r in self.rows]
+            ).encode("utf-8"))
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def test_ReaderCSV(self):
+        reader = ReportReaderCSV("https://example.com/report.csv",
+                                 filepath=self.csv_path)
+        reader.read(columns=["site.name", "id"], typed=True)
+        self.assertEqual(reader.row_type._fields, ("site.name", "id"))
+        rows = list(reader)
+        self.assertEqual(len(rows), 10)
+        self.assertEqual(rows[4].site.name, "Site 1")
+        self.assertEqual(rows[4].id, "4")
+        self.assertTrue(all(type(row) is reader.row_type for row in rows))
+
+    def test_ReaderJSON(self):
+        for cls in (ReportReaderJSON, ReportReaderJSONStream):
+            reader = cls("https://example.com/report.json",
+                         filepath=self.json_path)
+            reader.read(typed=True)
+            rows = reader.data if cls is ReportReaderJSON else list(reader)
+            self.assertEqual(len(rows), 10)
+            self.assertEqual(rows[5].site.id, "2")
+            self.assertEqual(tuple(rows[5]), tuple(self.rows[5]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,186 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+import json
+import socket
+import sys
+import unittest
+
+if sys.version_info >= (3, 0, 0):
+    import urllib.error as urllib_error
+else:
+    import urllib2 as urllib_error
+
+try:
+    from tune_reporting.base.service import (
+        RetryBudget,
+        RetryPolicy,
+        TuneServiceClient
+    )
+    from tune_reporting.helpers import (
+        TuneSdkException,
+        TuneServiceException
+    )
+except ImportError as exc:
+    sys.stderr.write("Error: failed to import module ({})".format(exc))
+    raise
+
+from .mock_server import MockServer
+
+PAYLOAD = json.dumps({
+    "status_code": 200,
+    "data": 1,
+    "errors": []
+}).encode("utf-8")
+
+
+def sequence_handler(statuses, headers=None):
+    statuses = list(statuses)
+
+    def handler(request, body):
+        status = statuses.pop(0) if statuses else 200
+        if status == 200:
+            return 200, {}, PAYLOAD
+        return status, headers or {}, b"failure"
+
+    return handler
+
+
+def http_error(code, headers=None):
+    return TuneServiceException(
+        "HTTPError",
+        urllib_error.HTTPError("http://localhost/", code, "", headers or {},
+                               None)
+    )
+
+
+class TestRetryPolicy(unittest.TestCase):
+
+    def call(self, server, action, retry_policy):
+        client = TuneServiceClient(
+            "advertiser/stats/clicks",
+            action,
+            "API_KEY",
+            "api_key",
+            api_url_endpoint=server.url,
+            retry_policy=retry_policy
+        )
+        return client.call()
+
+    def test_RetryTransientStatus(self):
+        policy = RetryPolicy(backoff_base=0)
+        with MockServer(sequence_handler([502, 503])) as server:
+            self.assertTrue(self.call(server, "find", policy))
+            self.assertEqual(len(server.requests), 3)
+
+    def test_MaxAttempts(self):
+        policy = RetryPolicy(max_attempts=2, backoff_base=0)
+        with MockServer(sequence_handler([500, 500, 500])) as server:
+            self.assertRaises(
+                TuneSdkException, self.call, server, "find", policy
+            )
+            self.assertEqual(len(server.requests), 2)
+
+    def test_NoRetryClientError(self):
+        policy = RetryPolicy(backoff_base=0)
+        with MockServer(sequence_handler([400])) as server:
+            self.assertRaises(
+                TuneSdkException, self.call, server, "find", policy
+            )
+            self.assertEqual(len(server.requests), 1)
+
+    def test_NonIdempotentAction(self):
+        policy = RetryPolicy(backoff_base=0)
+        with MockServer(sequence_handler([502])) as server:
+            self.assertRaises(
+                TuneSdkException, self.call, server, "find_export_queue",
+                policy
+            )
+            self.assertEqual(len(server.requests), 1)
+
+        # Rejected unprocessed, so safe to resend.
+        handler = sequence_handler([429], {"Retry-After": "0"})
+        with MockServer(handler) as server:
+            self.assertTrue(self.call(server, "find_export_queue", policy))
+            self.assertEqual(len(server.requests), 2)
+
+    def test_RetryAfter(self):
+        policy = RetryPolicy(backoff_base=0, retry_after_max=5)
+        self.assertEqual(
+            policy.backoff("find", http_error(503, {"Retry-After": "2"}), 0),
+            2.0
+        )
+        self.assertIsNone(
+            policy.backoff("find", http_error(503, {"Retry-After": "60"}), 0)
+        )
+
+    def test_BackoffJitter(self):
+        policy = RetryPolicy(
+            max_attempts=10, backoff_base=1, backoff_max=5,
+            budget=RetryBudget(max_tokens=1000)
+        )
+        for attempt, ceiling in ((0, 1), (1, 2), (2, 4), (5, 5)):
+            for _ in range(20):
+                delay = policy.backoff("find", http_error(502), attempt)
+                self.assertGreaterEqual(delay, 0)
+                self.assertLessEqual(delay, ceiling)
+
+    def test_SocketTimeout(self):
+        policy = RetryPolicy(backoff_base=0)
+        timeout = TuneServiceException(
+            "URLError", urllib_error.URLError(socket.timeout("timed out"))
+        )
+        self.assertIsNotNone(policy.backoff("count", timeout, 0))
+        self.assertIsNone(policy.backoff("count", ValueError("bad"), 0))
+
+    def test_RetryBudget(self):
+        budget = RetryBudget(max_tokens=4, token_ratio=1)
+        policy = RetryPolicy(max_attempts=10, backoff_base=0, budget=budget)
+        with MockServer(sequence_handler([500] * 10)) as server:
+            self.assertRaises(
+                TuneSdkException, self.call, server, "find", policy
+            )
+            # Retries stop once half of budget is spent.
+            self.assertEqual(len(server.requests), 2)
+
+            # Successful requests refill budget.
+            budget.record_success()
+            budget.record_success()
+            self.assertEqual(budget.tokens, 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,211 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+import json
+import sys
+import threading
+import time
+import unittest
+
+try:
+    from tune_reporting.base.service import (
+        RateLimiter,
+        SingleFlight,
+        TuneServiceClient,
+        TUNE_ACTION_CLASS_EXPORT
+    )
+    from tune_reporting.helpers import (
+        TuneSdkException
+    )
+except ImportError as exc:
+    sys.stderr.write("Error: failed to import module ({})".format(exc))
+    raise
+
+from .mock_server import MockServer
+
+
+def run_threads(count, target):
+    results = [None] * count
+    errors = []
+    barrier = threading.Event()
+
+    def worker(index):
+        barrier.wait()
+        try:
+            results[index] = target()
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [
+        threading.Thread(target=worker, args=(i,)) for i in range(count)
+    ]
+    for thread in threads:
+        thread.start()
+    barrier.set()
+    for thread in threads:
+        thread.join()
+    return results, errors
+
+
+class TestSingleFlight(unittest.TestCase):
+
+    def test_Coalesce(self):
+        group = SingleFlight()
+        calls = []
+
+        def function():
+            calls.append(1)
+            time.sleep(0.2)
+            return object()
+
+        results, errors = run_threads(
+            8, lambda: group.do(("count", "a"), function)
+        )
+        self.assertEqual(errors, [])
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(set(id(result) for result, _ in results)), 1)
+        self.assertTrue(all(shared for _, shared in results))
+        self.assertEqual(group.in_flight(), 0)
+
+        # Completed call is not cached.
+        group.do(("count", "a"), function)
+        self.assertEqual(len(calls), 2)
+
+    def test_SharedError(self):
+        group = SingleFlight()
+
+        def function():
+            time.sleep(0.1)
+            raise ValueError("failed")
+
+        results, errors = run_threads(5, lambda: group.do("key", function))
+        self.assertEqual(len(errors), 5)
+        self.assertTrue(all(isinstance(e, ValueError) for e in errors))
+
+
+class TestTuneServiceClientCoalesce(unittest.TestCase):
+
+    def handler(self, request, body):
+        time.sleep(0.3)
+        payload = json.dumps({
+            "status_code": 200,
+            "data": 42,
+            "errors": []
+        }).encode("utf-8")
+        return 200, {}, payload
+
+    def call(self, server, action, map_query_string, coalesce=True,
+             deadline=None):
+        client = TuneServiceClient(
+            "advertiser/stats/clicks",
+            action,
+            "API_KEY",
+            "api_key",
+            map_query_string,
+            api_url_endpoint=server.url,
+            rate_limiter=RateLimiter({TUNE_ACTION_CLASS_EXPORT: None}),
+            coalesce=coalesce
+        )
+        client.call(deadline)
+        return client.response
+
+    def test_IdenticalCalls(self):
+        with MockServer(self.handler) as server:
+            results, errors = run_threads(
+                8,
+                lambda: self.call(
+                    server, "count",
+                    {"start_date": "2015-01-01", "filter": "(id > 0)"}
+                )
+            )
+            self.assertEqual(errors, [])
+            self.assertEqual(len(server.requests), 1)
+            self.assertEqual(len(set(id(r) for r in results)), 1)
+            self.assertEqual(results[0].data, 42)
+
+    def test_DistinctCalls(self):
+        counter = iter(range(100))
+        lock = threading.Lock()
+
+        def distinct():
+            with lock:
+                page = next(counter)
+            return self.call(server, "find", {"page": page})
+
+        with MockServer(self.handler) as server:
+            results, errors = run_threads(4, distinct)
+            self.assertEqual(errors, [])
+            self.assertEqual(len(server.requests), 4)
+
+    def test_FollowerDeadline(self):
+        query = {"start_date": "2015-01-01"}
+        errors = []
+
+        def leader():
+            try:
+                self.call(server, "count", query, deadline=0.1)
+            except TuneSdkException as exc:
+                errors.append(exc)
+
+        with MockServer(self.handler) as server:
+            thread = threading.Thread(target=leader)
+            thread.start()
+            time.sleep(0.05)
+
+            # Leader exceeds its deadline, follower sends on its own.
+            response = self.call(server, "count", query, deadline=5)
+            thread.join()
+            self.assertEqual(len(errors), 1)
+            self.assertEqual(response.data, 42)
+            self.assertEqual(len(server.requests), 2)
+
+    def test_NotCoalesced(self):
+        with MockServer(self.handler) as server:
+            # Each export request places a job on queue.
+            run_threads(
+                3, lambda: self.call(server, "find_export_queue", {"a": 1})
+            )
+            self.assertEqual(len(server.requests), 3)
+
+        with MockServer(self.handler) as server:
+            run_threads(
+                3, lambda: self.call(server, "count", {"a": 1}, False)
+            )
+            self.assertEqual(len(server.requests), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,244 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+try:
+    from tune_reporting import (
+        AdvertiserReportLogClicks,
+        ReportReaderCSV,
+        SdkConfig,
+        TuneSdkException
+    )
+    from tune_reporting.base.service import (
+        RecordingTransport,
+        ReplayTransport,
+        RetryPolicy,
+        Transport,
+        TuneServiceClient,
+        UrllibTransport
+    )
+    from tune_reporting.base.service.replay_transport import (
+        ReplayResponse
+    )
+except ImportError as exc:
+    sys.stderr.write("Error: failed to import module ({})".format(exc))
+    raise
+
+from .mock_server import MockServer
+
+API_URL = "https://api.mobileapptracking.com/v2"
+REPORT_URL = "https://s3.amazonaws.com/reports/report.csv"
+
+
+def payload(data):
+    return json.dumps({
+        "status_code": 200,
+        "data": data,
+        "errors": []
+    })
+
+
+class FakeApi(Transport):
+    """Transport emulating TUNE Reporting API and report storage."""
+
+    def __init__(self):
+        self.polls = 0
+
+    def urlopen(self, url, data=None, headers=None, timeout=None):
+        if "find_export_queue" in url:
+            body = payload("job-1")
+        elif "/export/download" in url:
+            self.polls += 1
+            status = "complete" if self.polls >= 3 else "running"
+            body = payload({"status": status, "data": {"url": REPORT_URL}})
+        elif url == REPORT_URL:
+            body = "id,created\n1,2015-01-01\n2,2015-01-02\n"
+        else:
+            raise AssertionError(url)
+        return ReplayResponse(200, {}, body.encode("utf-8"), url)
+
+
+class TestTransport(unittest.TestCase):
+
+    def setUp(self):
+        dirname = os.path.dirname(os.path.split(__file__)[0])
+        filepath = os.path.join(
+            dirname, "config", SdkConfig.SDK_CONFIG_FILENAME
+        )
+        SdkConfig(filepath=os.path.abspath(filepath)).set_api_key("API_KEY")
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        Transport.configure(None)
+        shutil.rmtree(self.tmpdir)
+
+    def test_UrllibTransport(self):
+        def handler(request, body):
+            return 200, {}, payload(1).encode("utf-8")
+
+        with MockServer(handler) as server:
+            for _ in range(3):
+                client = TuneServiceClient(
+                    "advertiser/stats/clicks",
+                    "count",
+                    "API_KEY",
+                    "api_key",
+                    api_url_endpoint=server.url,
+                    transport=UrllibTransport()
+                )
+                self.assertTrue(client.call())
+                self.assertEqual(client.response.data, 1)
+            self.assertEqual(len(server.requests), 3)
+
+    def test_Abstract(self):
+        class Incomplete(Transport):
+            pass
+
+        self.assertRaises(TypeError, Transport)
+        self.assertRaises(TypeError, Incomplete)
+        self.assertIsInstance(FakeApi(), Transport)
+
+    def test_ReplaySequence(self):
+        url = API_URL + "/export/download?job_id=job-1&api_key=A&sdk=x"
+        transport = ReplayTransport([
+            {"request": {"url": url},
+             "response": {"body": payload({"status": "running"})}},
+            {"request": {"url": url},
+             "response": {"body": payload({"status": "complete"})}}
+        ])
+        statuses = []
+        for _ in range(3):
+            client = TuneServiceClient(
+                "export", "download", "OTHER_KEY", "api_key",
+                {"job_id": "job-1"},
+                transport=transport
+            )
+            client.call()
+            statuses.append(client.response.data["status"])
+        # Authentication parameters are ignored, last response is repeated.
+        self.assertEqual(statuses, ["running", "complete", "complete"])
+        self.assertEqual(transport.served(), 3)
+
+    def test_ReplayLatency(self):
+        url = API_URL + "/advertiser/stats/clicks/count"
+        transport = ReplayTransport(
+            [{"request": {"url": url}, "response": {"body": payload(5)}}],
+            latency=(0.05, 0.06)
+        )
+        start = time.time()
+        response = transport.urlopen(url)
+        self.assertGreaterEqual(time.time() - start, 0.05)
+        self.assertEqual(json.loads(response.read().decode("utf-8"))["data"],
+                         5)
+
+        # Configured latency overrides recorded latency.
+        transport = ReplayTransport(
+            [{"request": {"url": url},
+              "response": {"body": payload(5), "latency": 5}}],
+            latency=0
+        )
+        start = time.time()
+        transport.urlopen(url)
+        self.assertLess(time.time() - start, 1)
+
+    def test_ReplayErrors(self):
+        url = API_URL + "/advertiser/stats/clicks/count?page=1"
+        transport = ReplayTransport([
+            {"request": {"url": url},
+             "response": {"status": 503, "body": "unavailable"}},
+            {"request": {"url": url}, "response": {"body": payload(5)}}
+        ])
+        client = TuneServiceClient(
+            "advertiser/stats/clicks", "count", "API_KEY", "api_key",
+            {"page": 1},
+            transport=transport,
+            retry_policy=RetryPolicy(backoff_base=0)
+        )
+        # Recorded 503 is retried.
+        self.assertTrue(client.call())
+        self.assertEqual(client.response.data, 5)
+
+        client = TuneServiceClient(
+            "advertiser/stats/clicks", "count", "API_KEY", "api_key",
+            {"page": 2},
+            transport=transport
+        )
+        self.assertRaises(TuneSdkException, client.call)
+
+    def test_RecordReplayPipeline(self):
+        def export_fetch_read():
+            advertiser_report = AdvertiserReportLogClicks()
+            advertiser_report._EndpointBase__status_sleep = 0
+            response = advertiser_report.export({
+                "start_date": "2015-01-01 00:00:00",
+                "end_date": "2015-01-01 23:59:59",
+                "fields": "id,created",
+                "format": "csv"
+            })
+            response = advertiser_report.fetch(response.data)
+            report_url = advertiser_report.parse_response_report_url(
+                response
+            )
+            reader = ReportReaderCSV(report_url)
+            reader.read()
+            return list(reader.reader)
+
+        recorder = RecordingTransport(FakeApi())
+        Transport.configure(recorder)
+        rows = export_fetch_read()
+        self.assertEqual(len(rows), 3)
+
+        cassette = os.path.join(self.tmpdir, "cassette.json")
+        recorder.save(cassette)
+        with open(cassette) as handle:
+            self.assertNotIn("API_KEY", handle.read())
+
+        # Replayed without network, and without the recorded API.
+        replay = ReplayTransport(cassette)
+        Transport.configure(replay)
+        self.assertEqual(export_fetch_read(), rows)
+        self.assertEqual(replay.served(), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
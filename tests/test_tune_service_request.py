@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+import json
+import sys
+import unittest
+
+try:
+    from tune_reporting.base.service import (
+        ConnectionPool,
+        TuneServiceClient,
+        TUNE_REQUEST_MODE_AUTO,
+        TUNE_REQUEST_MODE_QUERY,
+        TUNE_REQUEST_MODE_FORM,
+        TUNE_REQUEST_MODE_JSON
+    )
+    from tune_reporting.base.service.tune_service_request import (
+        TuneManagementRequest
+    )
+    from tune_reporting.base.service.constants import (
+        __tune_management_api_url_max__ as url_max
+    )
+except ImportError as exc:
+    sys.stderr.write("Error: failed to import module ({})".format(exc))
+    raise
+
+from .mock_server import MockServer
+
+if sys.version_info >= (3, 0, 0):
+    from urllib.parse import parse_qsl
+else:
+    from urlparse import parse_qsl
+
+
+def request(map_query_string, request_mode=TUNE_REQUEST_MODE_AUTO):
+    return TuneManagementRequest(
+        "advertiser/stats/clicks",
+        "find",
+        "API_KEY",
+        "api_key",
+        map_query_string,
+        "https://api.mobileapptracking.com",
+        "v2",
+        request_mode
+    )
+
+
+LONG_FIELDS = ",".join("field_{}.name".format(i) for i in range(300))
+
+
+class TestTuneManagementRequest(unittest.TestCase):
+
+    def test_AutoShortQuery(self):
+        req = request({"fields": "id,created", "limit": 5})
+        self.assertEqual(req.request_mode, TUNE_REQUEST_MODE_QUERY)
+        self.assertEqual(req.method, "GET")
+        self.assertIsNone(req.body)
+        self.assertEqual(req.headers, {})
+        self.assertIn("fields=id%2Ccreated", req.url)
+        self.assertLessEqual(len(req.url), url_max)
+
+    def test_AutoLongQuery(self):
+        req = request({"fields": LONG_FIELDS, "filter": "(id > 0)"})
+        self.assertEqual(req.request_mode, TUNE_REQUEST_MODE_FORM)
+        self.assertEqual(req.method, "POST")
+        self.assertEqual(
+            req.url,
+            "https://api.mobileapptracking.com/v2/advertiser/stats/clicks/find"
+        )
+        self.assertEqual(
+            req.headers["Content-Type"],
+            "application/x-www-form-urlencoded"
+        )
+        params = dict(parse_qsl(req.body.decode("utf-8")))
+        self.assertEqual(params["fields"], LONG_FIELDS)
+        self.assertEqual(params["api_key"], "API_KEY")
+        self.assertEqual(params["filter"], "(id > 0)")
+
+    def test_JsonBody(self):
+        req = request(
+            {"fields": "id", "sort": {"created": "desc"}, "limit": 10},
+            TUNE_REQUEST_MODE_JSON
+        )
+        self.assertEqual(req.method, "POST")
+        self.assertEqual(req.headers["Content-Type"], "application/json")
+        body = json.loads(req.body.decode("utf-8"))
+        self.assertEqual(body["sort[created]"], "DESC")
+        self.assertEqual(body["limit"], 10)
+        self.assertEqual(body["api_key"], "API_KEY")
+
+    def test_EncodedOnce(self):
+        req = request({"fields": LONG_FIELDS})
+        self.assertIs(req.body, req.body)
+        self.assertIs(req.url, req.url)
+
+    def test_InvalidMode(self):
+        self.assertRaises(ValueError, request, {}, "xml")
+
+
+class TestTuneServiceClientRequestMode(unittest.TestCase):
+
+    def test_PostLongQuery(self):
+        def handler(request, body):
+            payload = json.dumps({
+                "status_code": 200,
+                "data": [dict(parse_qsl(body.decode("utf-8")))],
+                "errors": []
+            }).encode("utf-8")
+            return 200, {}, payload
+
+        pool = ConnectionPool.configure(max_size=2, idle_timeout=60)
+        with MockServer(handler) as server:
+            client = TuneServiceClient(
+                "advertiser/stats/clicks",
+                "find",
+                "API_KEY",
+                "api_key",
+                {"fields": LONG_FIELDS},
+                api_url_endpoint=server.url
+            )
+            self.assertTrue(client.call())
+            self.assertEqual(client.response.data[0]["fields"], LONG_FIELDS)
+            path, headers, _ = server.requests[0]
+            self.assertEqual(path, "/v2/advertiser/stats/clicks/find")
+            self.assertEqual(
+                headers["Content-Type"],
+                "application/x-www-form-urlencoded"
+            )
+        pool.clear()
+
+
+if __name__ == '__main__':
+    unittest.main()
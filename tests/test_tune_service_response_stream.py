@@ -0,0 +1,200 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+import io
+import json
+import os
+import sys
+import unittest
+
+try:
+    from tune_reporting import (
+        AdvertiserReportLogClicks,
+        SdkConfig
+    )
+    from tune_reporting.base.service import (
+        Transport,
+        TuneServiceClient,
+        TuneServiceResponseStream
+    )
+    from tune_reporting.base.service.replay_transport import (
+        ReplayResponse
+    )
+    from tune_reporting.helpers.json_stream_parser import (
+        JsonStreamParser
+    )
+except ImportError as exc:
+    sys.stderr.write("Error: failed to import module ({})".format(exc))
+    raise
+
+from .mock_server import MockServer
+
+
+class GeneratedBody(object):
+    """Response body of find() generated while read, never held whole."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.row = 0
+        self.pending = b'{"status_code": 200, "data": ['
+        self.done = False
+        self.max_read = 0
+
+    def read(self, size):
+        self.max_read = max(self.max_read, size)
+        while len(self.pending) < size and not self.done:
+            if self.row < self.rows:
+                row = json.dumps({"id": self.row, "site.name": u"Café"})
+                separator = ", " if self.row else ""
+                self.pending += (separator + row).encode("utf-8")
+                self.row += 1
+            else:
+                self.pending += b'], "errors": [], "response_size": 7}'
+                self.done = True
+        chunk, self.pending = self.pending[:size], self.pending[size:]
+        return chunk
+
+
+class TestJsonStreamParser(unittest.TestCase):
+
+    def test_IterObject(self):
+        document = {
+            "errors": [{"message": "none"}],
+            "data": [{"id": i, "value": 12345678.5} for i in range(100)],
+            "status_code": 200
+        }
+        for chunk_size in (1, 3, 64):
+            parser = JsonStreamParser(
+                io.BytesIO(json.dumps(document).encode("utf-8")),
+                chunk_size
+            )
+            self.assertEqual(list(parser.iter_object("data")),
+                             document["data"])
+            self.assertEqual(parser.members["status_code"], 200)
+            self.assertEqual(parser.members["errors"], document["errors"])
+
+    def test_IterArray(self):
+        parser = JsonStreamParser(io.BytesIO(b' [1, "a", null, {"b": []}] '),
+                                  chunk_size=2)
+        self.assertEqual(list(parser.iter_array()), [1, "a", None, {"b": []}])
+        parser = JsonStreamParser(io.BytesIO(b"[]"))
+        self.assertEqual(list(parser.iter_array()), [])
+
+    def test_Invalid(self):
+        parser = JsonStreamParser(io.BytesIO(b'{"data": [1, 2'))
+        self.assertRaises(ValueError, list, parser.iter_object("data"))
+        parser = JsonStreamParser(io.BytesIO(b'[1 2]'))
+        self.assertRaises(ValueError, list, parser.iter_array())
+
+
+class TestTuneServiceResponseStream(unittest.TestCase):
+
+    def tearDown(self):
+        Transport.configure(None)
+
+    def test_BoundedMemory(self):
+        body = GeneratedBody(20000)
+        response = TuneServiceResponseStream(body, 200)
+        self.assertIsNone(response.status_code)
+        count = 0
+        for row in response:
+            self.assertEqual(row["id"], count)
+            count += 1
+            # Generated body is consumed while rows are parsed.
+            self.assertLess(body.row - count, 64 * 1024)
+        self.assertEqual(count, 20000)
+        self.assertTrue(response.finished)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.errors, [])
+        self.assertEqual(response.size, 7)
+        self.assertIsNone(response.data)
+
+    def test_ServiceClient(self):
+        def handler(request, body):
+            payload = json.dumps({
+                "status_code": 200,
+                "data": [{"id": i} for i in range(1000)],
+                "errors": []
+            }).encode("utf-8")
+            return 200, {}, payload
+
+        with MockServer(handler) as server:
+            client = TuneServiceClient(
+                "advertiser/stats/clicks",
+                "find",
+                "API_KEY",
+                "api_key",
+                {"limit": 0},
+                api_url_endpoint=server.url
+            )
+            response = client.stream()
+            self.assertIs(client.response, response)
+            self.assertEqual(response.http_code, 200)
+            self.assertEqual(sum(1 for _ in response), 1000)
+            self.assertEqual(response.status_code, 200)
+
+    def test_FindStream(self):
+        requests = []
+
+        class FindTransport(Transport):
+            def urlopen(self, url, data=None, headers=None, timeout=None):
+                requests.append(url)
+                body = GeneratedBody(50)
+                return ReplayResponse(200, {}, body.read(1 << 20), url)
+
+        dirname = os.path.dirname(os.path.split(__file__)[0])
+        filepath = os.path.join(
+            dirname, "config", SdkConfig.SDK_CONFIG_FILENAME
+        )
+        SdkConfig(filepath=os.path.abspath(filepath)).set_api_key("API_KEY")
+        Transport.configure(FindTransport())
+
+        advertiser_report = AdvertiserReportLogClicks()
+        response = advertiser_report.find_stream({
+            "start_date": "2015-01-01 00:00:00",
+            "end_date": "2015-01-01 23:59:59",
+            "fields": "id,site.name",
+            "limit": 0
+        })
+        rows = list(response)
+        self.assertEqual(len(rows), 50)
+        self.assertEqual(rows[1]["site.name"], u"Café")
+        self.assertIn("/advertiser/stats/clicks/find?", requests[0])
+        self.assertIn("limit=0", requests[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  benchmark_compression.py
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+#  Benchmark of compressed transfer of report downloads.
+#
+#  Serves a synthetic CSV export from a local mock server, throttled to the
+#  provided bandwidth, then downloads it through the SDK's connection pool
+#  with and without compression, reporting bytes on wire and wall-clock time.
+#
+#  Usage: python tools/benchmark_compression.py [rows] [megabits_per_second]
+#
+
+import gzip
+import io
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+
+if sys.version_info >= (3, 0, 0):
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+else:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+
+from tune_reporting.base.service import ConnectionPool
+
+
+def build_report(rows):
+    """Synthetic export of table advertiser/stats/clicks."""
+    lines = ["id,created,site_id,site.name,publisher_id,publisher.name,"
+             "country.name,device_ip,revenue_usd"]
+    for i in range(rows):
+        lines.append(
+            "{0},2015-08-{1:02d} {2:02d}:{3:02d}:00,{4},\"Site {4}\","
+            "{5},\"Publisher {5}\",United States,10.0.{6}.{7},{8:.2f}".format(
+                1000000 + i, i % 28 + 1, i % 24, i % 60, 100 + i % 17,
+                200 + i % 11, i % 256, (i * 7) % 256, (i % 100) / 3.0
+            )
+        )
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+class BenchmarkServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    bytes_sent = 0
+
+
+class BenchmarkHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        accept = self.headers.get("Accept-Encoding") or ""
+        if "gzip" in accept:
+            payload = self.server.compressed
+            headers = {"Content-Encoding": "gzip"}
+        else:
+            payload = self.server.plain
+            headers = {}
+        self.send_response(200)
+        self.send_header("Content-Type", "text/csv")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.server.bytes_sent += len(payload)
+
+        # Throttle to simulated link bandwidth.
+        chunk = 64 * 1024
+        delay = chunk / self.server.bytes_per_second
+        for offset in range(0, len(payload), chunk):
+            self.wfile.write(payload[offset:offset + chunk])
+            time.sleep(delay)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def download(pool, url):
+    start = time.time()
+    response = pool.urlopen(url)
+    size = 0
+    for line in response:
+        size += len(line)
+    return time.time() - start, size
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    megabits = float(sys.argv[2]) if len(sys.argv) > 2 else 100.0
+
+    plain = build_report(rows)
+    buf = io.BytesIO()
+    with gzip.GzipFile(fileobj=buf, mode="wb", compresslevel=6) as handle:
+        handle.write(plain)
+
+    server = BenchmarkServer(("127.0.0.1", 0), BenchmarkHandler)
+    server.plain = plain
+    server.compressed = buf.getvalue()
+    server.bytes_per_second = megabits * 1000 * 1000 / 8
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    url = "http://127.0.0.1:{}/report.csv".format(server.server_address[1])
+
+    print("rows: {}, simulated link: {} Mbit/s".format(rows, megabits))
+    print("{:<12} {:>14} {:>14} {:>10}".format(
+        "mode", "wire bytes", "decoded bytes", "seconds"))
+    results = {}
+    for compress in (False, True):
+        pool = ConnectionPool(compress=compress)
+        server.bytes_sent = 0
+        seconds, size = download(pool, url)
+        mode = "gzip" if compress else "identity"
+        results[mode] = (server.bytes_sent, seconds)
+        print("{:<12} {:>14} {:>14} {:>10.3f}".format(
+            mode, server.bytes_sent, size, seconds))
+        pool.clear()
+
+    print("wire bytes saved: {:.1f}%, wall-clock saved: {:.1f}%".format(
+        100.0 * (1 - float(results["gzip"][0]) / results["identity"][0]),
+        100.0 * (1 - results["gzip"][1] / results["identity"][1])
+    ))
+
+    server.shutdown()
+    server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -40,7 +40,15 @@ import sys
 
 from .helpers import (
     python_check_version,
+    Deadline,
+    ParallelCSVParser,
+    ReportCache,
+    ReportDownloader,
+    ReportProjection,
     ReportReaderCSV,
+    ReportReaderColumnar,
+    ReportReaderJSONStream,
+    ReportRow,
     SdkConfig,
     TuneSdkException,
     TuneServiceException
@@ -71,9 +79,23 @@ from .api import (
 from .base import (
     TuneServiceClient,
     EndpointBase,
+    ExportExecutor,
+    ExportJournal,
+    ExportPoller,
+    ReportPipeline,
     TUNE_FIELDS_ALL,
     TUNE_FIELDS_DEFAULT,
     TUNE_FIELDS_RELATED,
     TUNE_FIELDS_MINIMAL,
-    TUNE_FIELDS_RECOMMENDED
+    TUNE_FIELDS_RECOMMENDED,
+    TUNE_REQUEST_MODE_AUTO,
+    TUNE_REQUEST_MODE_QUERY,
+    TUNE_REQUEST_MODE_FORM,
+    TUNE_REQUEST_MODE_JSON,
+    CircuitBreaker,
+    TuneCircuitOpenException,
+    TUNE_CIRCUIT_CLOSED,
+    TUNE_CIRCUIT_OPEN,
+    TUNE_CIRCUIT_HALF_OPEN,
+    HedgePolicy
 )
@@ -125,6 +125,24 @@ class AdvertiserReportCohortRetention(AdvertiserReportCohortBase):
 
             :return: TuneServiceResponse
         """
+        return AdvertiserReportBase.call(
+            self,
+            "count",
+            self._build_count_query(map_params)
+        )
+
+    ## Validate parameters of action 'count'.
+    #  @param dict map_params
+    #  @return dict map_query_string
+    #  @throws ValueError
+    def _build_count_query(self, map_params):
+        """Validate parameters of action 'count' and build
+        its query string parameters.
+
+            :param (dict) map_params
+            :return (dict): map_query_string
+            :throws: ValueError
+        """
         map_query_string = {}
         map_query_string = self._validate_datetime(map_params, "start_date", map_query_string)
         map_query_string = self._validate_datetime(map_params, "end_date", map_query_string)
@@ -143,11 +161,7 @@ class AdvertiserReportCohortRetention(AdvertiserReportCohortBase):
         if "response_timezone" in map_params and map_params["response_timezone"] is not None:
             map_query_string["response_timezone"] = map_params["response_timezone"]
 
-        return AdvertiserReportBase.call(
-            self,
-            "count",
-            map_query_string
-        )
+        return map_query_string
 
     ## Finds all existing records that match filter criteria
     #  and returns an array of found model data.
@@ -195,6 +209,23 @@ class AdvertiserReportCohortRetention(AdvertiserReportCohortBase):
 
             :return: (TuneServiceResponse)
         """
+        return self.call(
+            "find",
+            self._build_find_query(map_params)
+        )
+
+    ## Validate parameters of action 'find'.
+    #  @param dict map_params
+    #  @return dict map_query_string
+    #  @throws ValueError
+    def _build_find_query(self, map_params):
+        """Validate parameters of action 'find' and build
+        its query string parameters.
+
+            :param (dict) map_params
+            :return (dict): map_query_string
+            :throws: ValueError
+        """
         map_query_string = {}
         map_query_string = self._validate_datetime(map_params, "start_date", map_query_string)
         map_query_string = self._validate_datetime(map_params, "end_date", map_query_string)
@@ -223,10 +254,7 @@ class AdvertiserReportCohortRetention(AdvertiserReportCohortBase):
         if "response_timezone" in map_params and map_params["response_timezone"] is not None:
             map_query_string["response_timezone"] = map_params["response_timezone"]
 
-        return self.call(
-            "find",
-            map_query_string
-        )
+        return map_query_string
 
     ## Places a job into a queue to generate a report that will contain
     #  records that match provided filter criteria, and it returns a job
@@ -270,6 +298,23 @@ class AdvertiserReportCohortRetention(AdvertiserReportCohortBase):
 
             :return: (TuneServiceResponse)
         """
+        return self.call(
+            "export",
+            self._build_export_query(map_params)
+        )
+
+    ## Validate parameters of action 'export'.
+    #  @param dict map_params
+    #  @return dict map_query_string
+    #  @throws ValueError
+    def _build_export_query(self, map_params):
+        """Validate parameters of action 'export' and build
+        its query string parameters.
+
+            :param (dict) map_params
+            :return (dict): map_query_string
+            :throws: ValueError
+        """
         map_query_string = {}
         map_query_string = self._validate_datetime(map_params, "start_date", map_query_string)
         map_query_string = self._validate_datetime(map_params, "end_date", map_query_string)
@@ -298,30 +343,32 @@ class AdvertiserReportCohortRetention(AdvertiserReportCohortBase):
         if "response_timezone" in map_params and map_params["response_timezone"] is not None:
             map_query_string["response_timezone"] = map_params["response_timezone"]
 
-        return self.call(
-            "export",
-            map_query_string
-        )
+        return map_query_string
 
     ## Helper function for fetching report document given provided job
     #  identifier.
     #
     #  @param str   job_id      Job Identifier of report on queue.
+    #  @param object deadline    Deadline or seconds bounding polling.
     #
     #  @return object
     def fetch(self,
-              job_id):
+              job_id,
+              deadline=None):
         """Helper function for fetching report upon completion.
         Starts worker for polling export queue.
 
             :param str  job_id:     Provided Job Identifier to reference
                                     requested report on export queue.
+            :param Deadline deadline: Deadline, or seconds from now, by
+                                      which report must be completed.
             :return: (TuneServiceResponse)
         """
         return super(AdvertiserReportCohortRetention, self)._fetch(
             self.controller,
             "status",
-            job_id
+            job_id,
+            deadline=deadline
         )
 
     ## Validate query string parameter 'cohort_type'.
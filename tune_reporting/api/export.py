@@ -89,13 +89,17 @@ class Export(EndpointBase):
     #  Starts worker for polling export queue.
     #
     #  @param str   job_id      Job identifier assigned for report export.
+    #  @param object deadline    Deadline or seconds bounding polling.
     #  @return object Document contents
     def fetch(self,
-              job_id):
+              job_id,
+              deadline=None):
         """Helper function for fetching report upon completion.
         Starts worker for polling export queue.
 
             :param str  job_id:     Job identifier assigned for report export.
+            :param Deadline deadline: Deadline, or seconds from now, by
+                                      which report must be completed.
             :return:   Document contents
         """
         if not job_id or len(job_id) < 1:
@@ -104,7 +108,8 @@ class Export(EndpointBase):
         return self._fetch(
             "export",
             "download",
-            job_id
+            job_id,
+            deadline=deadline
         )
 
     ## Helper function for parsing export status response to gather report url.
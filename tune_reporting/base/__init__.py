@@ -39,7 +39,17 @@
 #
 
 from .service import (
-    TuneServiceClient
+    TuneServiceClient,
+    TUNE_REQUEST_MODE_AUTO,
+    TUNE_REQUEST_MODE_QUERY,
+    TUNE_REQUEST_MODE_FORM,
+    TUNE_REQUEST_MODE_JSON,
+    CircuitBreaker,
+    TuneCircuitOpenException,
+    TUNE_CIRCUIT_CLOSED,
+    TUNE_CIRCUIT_OPEN,
+    TUNE_CIRCUIT_HALF_OPEN,
+    HedgePolicy
 )
 from .endpoints import (
     EndpointBase,
@@ -47,6 +57,13 @@ from .endpoints import (
     AdvertiserReportActualsBase,
     AdvertiserReportCohortBase,
     AdvertiserReportLogBase,
+    ExportExecutor,
+    ExportJob,
+    ExportJournal,
+    ExportPoller,
+    CompletionHistory,
+    PollSchedule,
+    ReportPipeline,
     TUNE_FIELDS_ALL,
     TUNE_FIELDS_DEFAULT,
     TUNE_FIELDS_RELATED,
@@ -52,3 +52,24 @@ from .advertiser_report_base import (AdvertiserReportBase)
 from .advertiser_report_actuals_base import (AdvertiserReportActualsBase)
 from .advertiser_report_cohort_base import (AdvertiserReportCohortBase)
 from .advertiser_report_log_base import (AdvertiserReportLogBase)
+from .poll_schedule import (
+    CompletionHistory,
+    PollSchedule
+)
+from .export_executor import (
+    ExportExecutor
+)
+from .export_journal import (
+    ExportJournal,
+    JournalEntry
+)
+from .export_poller import (
+    ExportJob,
+    ExportPoller
+)
+from .report_pipeline import (
+    PipelineResult,
+    ReportPipeline,
+    StageStats,
+    TUNE_PIPELINE_STAGES
+)
@@ -115,6 +115,24 @@ class AdvertiserReportActualsBase(AdvertiserReportBase):
                     default is set in account.\n
             :return: (TuneServiceResponse)
         """
+        return AdvertiserReportBase.call(
+            self,
+            "count",
+            self._build_count_query(map_params)
+        )
+
+    ## Validate parameters of action 'count'.
+    #  @param dict map_params
+    #  @return dict map_query_string
+    #  @throws ValueError
+    def _build_count_query(self, map_params):
+        """Validate parameters of action 'count' and build
+        its query string parameters.
+
+            :param (dict) map_params
+            :return (dict): map_query_string
+            :throws: ValueError
+        """
         map_query_string = {}
         map_query_string = self._validate_datetime(map_params, "start_date", map_query_string)
         map_query_string = self._validate_datetime(map_params, "end_date", map_query_string)
@@ -127,11 +145,7 @@ class AdvertiserReportActualsBase(AdvertiserReportBase):
         if "response_timezone" in map_params and map_params["response_timezone"] is not None:
             map_query_string["response_timezone"] = map_params["response_timezone"]
 
-        return AdvertiserReportBase.call(
-            self,
-            "count",
-            map_query_string
-        )
+        return map_query_string
 
     ## Finds all existing records that match filter criteria
     #  and returns an array of found model data.
@@ -177,6 +191,24 @@ class AdvertiserReportActualsBase(AdvertiserReportBase):
                     default is set in account.\n
             :return: (TuneServiceResponse)
         """
+        return AdvertiserReportBase.call(
+            self,
+            "find",
+            self._build_find_query(map_params)
+        )
+
+    ## Validate parameters of action 'find'.
+    #  @param dict map_params
+    #  @return dict map_query_string
+    #  @throws ValueError
+    def _build_find_query(self, map_params):
+        """Validate parameters of action 'find' and build
+        its query string parameters.
+
+            :param (dict) map_params
+            :return (dict): map_query_string
+            :throws: ValueError
+        """
         map_query_string = {}
         map_query_string = self._validate_datetime(map_params, "start_date", map_query_string)
         map_query_string = self._validate_datetime(map_params, "end_date", map_query_string)
@@ -205,11 +237,7 @@ class AdvertiserReportActualsBase(AdvertiserReportBase):
         if "response_timezone" in map_params and map_params["response_timezone"] is not None:
             map_query_string["response_timezone"] = map_params["response_timezone"]
 
-        return AdvertiserReportBase.call(
-            self,
-            "find",
-            map_query_string
-        )
+        return map_query_string
 
     ## Places a job into a queue to generate a report that will contain
     #  records that match provided filter criteria, and it returns a job
@@ -251,6 +279,24 @@ class AdvertiserReportActualsBase(AdvertiserReportBase):
                     default is set in account.\n
             :return: (TuneServiceResponse)
         """
+        return AdvertiserReportBase.call(
+            self,
+            "find_export_queue",
+            self._build_export_query(map_params)
+        )
+
+    ## Validate parameters of action 'export'.
+    #  @param dict map_params
+    #  @return dict map_query_string
+    #  @throws ValueError
+    def _build_export_query(self, map_params):
+        """Validate parameters of action 'export' and build
+        its query string parameters.
+
+            :param (dict) map_params
+            :return (dict): map_query_string
+            :throws: ValueError
+        """
         map_query_string = {}
         map_query_string = self._validate_datetime(map_params, "start_date", map_query_string)
         map_query_string = self._validate_datetime(map_params, "end_date", map_query_string)
@@ -276,11 +322,7 @@ class AdvertiserReportActualsBase(AdvertiserReportBase):
         if "response_timezone" in map_params and map_params["response_timezone"] is not None:
             map_query_string["response_timezone"] = map_params["response_timezone"]
 
-        return AdvertiserReportBase.call(
-            self,
-            "find_export_queue",
-            map_query_string
-        )
+        return map_query_string
 
     ## Query status of insight reports. Upon completion will
     #  return url to download requested report.
@@ -321,15 +363,20 @@ class AdvertiserReportActualsBase(AdvertiserReportBase):
     #  Starts worker for polling export queue.
     #
     #  @param str   job_id      Job identifier assigned for report export.
+    #  @param object deadline    Deadline or seconds bounding polling.
     #
     #  @return object TuneServiceResponse
     #
     def fetch(self,
-              job_id):
+              job_id,
+              deadline=None):
         """Helper function for fetching report upon completion.
-        Starts worker for polling export queue.
+        Starts worker for polling export queue, unless completed within
+        export journal, see _fetch().
 
             :param str  job_id:     Job identifier assigned for report export.
+            :param Deadline deadline: Deadline, or seconds from now, by
+                                      which report must be completed.
             :return: (TuneServiceResponse)
         """
         # job_id
@@ -339,7 +386,8 @@ class AdvertiserReportActualsBase(AdvertiserReportBase):
         return self._fetch(
             "export",
             "download",
-            job_id
+            job_id,
+            deadline=deadline
         )
 
     ## Validate query string parameter 'timestamp'.
@@ -379,3 +427,21 @@ class AdvertiserReportActualsBase(AdvertiserReportBase):
 
         map_query_string["timestamp"] = timestamp
         return map_query_string
+
+    ## Endpoint placing a report export job on queue.
+    #  @return tuple (controller, action)
+    def _export_endpoint(self):
+        """Endpoint placing a report export job on queue.
+
+            :return (tuple): (controller, action)
+        """
+        return (self.controller, "find_export_queue")
+
+    ## Endpoint polled for status of a report export job.
+    #  @return tuple (controller, action)
+    def _export_status_endpoint(self):
+        """Endpoint polled for status of a report export job.
+
+            :return (tuple): (controller, action)
+        """
+        return ("export", "download")
@@ -40,14 +40,33 @@ TUNE Service Reports Endpoint base
 #  @link      https://developers.mobileapptracking.com @endlink
 #
 
+import sys
+
 from tune_reporting.base.endpoints import (
     EndpointBase
 )
+from tune_reporting.base.service.tune_service_response import (
+    TuneServiceResponse
+)
+from tune_reporting.helpers.report_cache import (
+    ReportCache
+)
+from .export_journal import (
+    ExportJournal
+)
+from .export_executor import (
+    ExportExecutor
+)
+
+if sys.version_info >= (3, 5, 0):
+    from .endpoint_async import (AdvertiserReportAsyncMixin)
+else:
+    AdvertiserReportAsyncMixin = object
 
 
 ## Base components for every TUNE Reporting API reports.
 #
-class AdvertiserReportBase(EndpointBase):
+class AdvertiserReportBase(EndpointBase, AdvertiserReportAsyncMixin):
     """Base components for every TUNE Reporting API reports.
     """
 
@@ -107,13 +126,16 @@ class AdvertiserReportBase(EndpointBase):
     #
     #  @param str   action Endpoint action to be called.
     #  @param dict  map_query_string Query str parameters for this action.
+    #  @param object deadline       Deadline or seconds bounding call.
     #
-    def call(self, action, map_query_string):
+    def call(self, action, map_query_string, deadline=None):
         """
         Make service request for report.
 
             :param (str) action: Endpoint action name.
             :param (dict) map_query_string: Query str parameters of action.
+            :param (Deadline) deadline: Deadline, or seconds from now,
+                                        bounding request.
             :return: (TuneServiceResponse)
         """
         if not isinstance(action, str) or len(action) < 1:
@@ -127,6 +149,130 @@ class AdvertiserReportBase(EndpointBase):
                 "Parameter 'map_query_string' is not defined as dict."
             )
 
+        map_query_string = self._prepare_query_string(map_query_string)
+
+        if hasattr(self, "_export_endpoint") and \
+           (self.controller, action) == self._export_endpoint():
+            return self._export_cached(action, map_query_string, deadline)
+
+        return EndpointBase.call(
+            self,
+            action,
+            map_query_string,
+            deadline
+        )
+
+    #  Place report export job on queue, unless cache holds report of
+    #  identical query.
+    #
+    def _export_cached(self, action, map_query_string, deadline):
+        """
+        Place report export job on queue, returning instead the job of
+        identical query whose report is within ReportCache.
+
+            :param (str) action: Export action name.
+            :param (dict) map_query_string: Prepared query str parameters.
+            :param (Deadline) deadline: Deadline bounding request.
+            :return: (TuneServiceResponse)
+        """
+        key = None
+        cache = ReportCache.default_cache()
+        if cache is not None and cache.cacheable(map_query_string):
+            key = cache.key(self.controller, map_query_string, self.auth_key)
+            job_id = cache.cached_job(key)
+            if job_id is not None:
+                return TuneServiceResponse(
+                    {"status_code": 200, "data": job_id, "errors": []},
+                    200
+                )
+
+        journal = ExportJournal.default_journal()
+        if journal is not None:
+            response = self._export_journaled(
+                journal, action, map_query_string, deadline
+            )
+        else:
+            response = EndpointBase.call(
+                self, action, map_query_string, deadline
+            )
+
+        job_id = response.data if response.http_code == 200 else None
+        if key is not None and job_id and \
+           not isinstance(job_id, (dict, list)):
+            cache.submitted(key, job_id)
+        return response
+
+    #  Place report export job on queue, unless journal holds a job of
+    #  identical query either pending or completed with unexpired URL.
+    #
+    def _export_journaled(self, journal, action, map_query_string, deadline):
+        """
+        Place report export job on queue and journal it, reusing
+        journaled job of identical query if still reusable.
+
+            :param (ExportJournal) journal: Journal of export jobs.
+            :param (str) action: Export action name.
+            :param (dict) map_query_string: Prepared query str parameters.
+            :param (Deadline) deadline: Deadline bounding request.
+            :return: (TuneServiceResponse)
+        """
+        entry = journal.find(self.controller, map_query_string, self.auth_key)
+        if entry is not None:
+            return TuneServiceResponse(
+                {"status_code": 200, "data": entry.job_id, "errors": []},
+                200
+            )
+
+        response = EndpointBase.call(self, action, map_query_string, deadline)
+
+        job_id = response.data if response.http_code == 200 else None
+        if job_id and not isinstance(job_id, (dict, list)):
+            export_controller, export_action = self._export_status_endpoint()
+            journal.submitted(
+                job_id,
+                self.controller,
+                map_query_string,
+                export_controller,
+                export_action,
+                self.auth_key
+            )
+        return response
+
+    ## Places a job into a queue to generate a report, without blocking.
+    #  @param dict   map_params Parameters of export().
+    #  @param object reader     Reader class built upon report URL.
+    #  @param object deadline   Deadline or seconds.
+    #  @return object concurrent.futures.Future
+    def export_async(self, map_params, reader=None, deadline=None):
+        """
+        Place report export job on queue from a background thread, then
+        poll it along with other jobs from a single thread.
+
+            :param (dict) map_params: Parameters of export().
+            :param (type) reader: Callable of report URL, as
+                                  ReportReaderCSV, whose result resolves
+                                  future instead of report URL.
+            :param (Deadline) deadline: Deadline, or seconds from now, by
+                                        which report must be completed.
+            :return: (concurrent.futures.Future) resolved to report URL,
+                     or reader, once report is completed.
+        """
+        return ExportExecutor.shared_executor().submit(
+            self, map_params, reader, deadline
+        )
+
+    #  Apply SDK filters upon query str parameter 'filter'.
+    #
+    #  @param dict  map_query_string Query str parameters for this action.
+    #
+    def _prepare_query_string(self, map_query_string):
+        """
+        Apply SDK filters, removing debug mode and test profile
+        information, upon query str parameter 'filter'.
+
+            :param (dict) map_query_string: Query str parameters of action.
+            :return (dict): map_query_string
+        """
         sdk_filter = ""
 
         if self.__filter_debug_mode:
@@ -164,8 +310,4 @@ class AdvertiserReportBase(EndpointBase):
                             map_query_string["filter"]
                         )
 
-        return EndpointBase.call(
-            self,
-            action,
-            map_query_string
-        )
+        return map_query_string
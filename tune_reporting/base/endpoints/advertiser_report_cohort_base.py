@@ -112,6 +112,24 @@ class AdvertiserReportCohortBase(AdvertiserReportBase):
             }
         )
 
+    ## Endpoint placing a report export job on queue.
+    #  @return tuple (controller, action)
+    def _export_endpoint(self):
+        """Endpoint placing a report export job on queue.
+
+            :return (tuple): (controller, action)
+        """
+        return (self.controller, "export")
+
+    ## Endpoint polled for status of a report export job.
+    #  @return tuple (controller, action)
+    def _export_status_endpoint(self):
+        """Endpoint polled for status of a report export job.
+
+            :return (tuple): (controller, action)
+        """
+        return (self.controller, "status")
+
     ## Helper function for parsing export status response to gather report url.
     #  @param @see TuneServiceResponse
     #  @return str Report Url
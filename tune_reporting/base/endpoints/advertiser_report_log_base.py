@@ -119,6 +119,24 @@ class AdvertiserReportLogBase(AdvertiserReportBase):
 
             :return: (TuneServiceResponse)
         """
+        return AdvertiserReportBase.call(
+            self,
+            "count",
+            self._build_count_query(map_params)
+        )
+
+    ## Validate parameters of action 'count'.
+    #  @param dict map_params
+    #  @return dict map_query_string
+    #  @throws ValueError
+    def _build_count_query(self, map_params):
+        """Validate parameters of action 'count' and build
+        its query string parameters.
+
+            :param (dict) map_params
+            :return (dict): map_query_string
+            :throws: ValueError
+        """
         map_query_string = {};
         map_query_string = self._validate_datetime(map_params, "start_date", map_query_string)
         map_query_string = self._validate_datetime(map_params, "end_date", map_query_string)
@@ -129,11 +147,7 @@ class AdvertiserReportLogBase(AdvertiserReportBase):
         if "response_timezone" in map_params and map_params["response_timezone"] is not None:
             map_query_string["response_timezone"] = map_params["response_timezone"]
 
-        return AdvertiserReportBase.call(
-            self,
-            "count",
-            map_query_string
-        )
+        return map_query_string
 
     ## Finds all existing records that match filter criteria
     #  and returns an array of found model data.
@@ -174,6 +188,43 @@ class AdvertiserReportLogBase(AdvertiserReportBase):
 
             :return (object): (TuneServiceResponse)
         """
+        return AdvertiserReportBase.call(
+            self,
+            "find",
+            self._build_find_query(map_params)
+        )
+
+    ## Finds all existing records that match filter criteria, of which
+    #  rows are parsed while iterated.
+    #  @param dict map_params    Parameters of find().
+    #  @return object @see TuneServiceResponseStream
+    def find_stream(self,
+                    map_params):
+        """Finds all existing records that match filter criteria, parsing
+        rows while iterated so memory is bounded by a single row, as
+        needed when finding all records with 'limit' of 0.
+
+            :param dict map_params: Parameters of find().
+            :return (object): (TuneServiceResponseStream)
+        """
+        return AdvertiserReportBase.call_stream(
+            self,
+            "find",
+            self._prepare_query_string(self._build_find_query(map_params))
+        )
+
+    ## Validate parameters of action 'find'.
+    #  @param dict map_params
+    #  @return dict map_query_string
+    #  @throws ValueError
+    def _build_find_query(self, map_params):
+        """Validate parameters of action 'find' and build
+        its query string parameters.
+
+            :param (dict) map_params
+            :return (dict): map_query_string
+            :throws: ValueError
+        """
         if map_params is None or \
            not isinstance(map_params, dict):
             raise ValueError(
@@ -203,11 +254,7 @@ class AdvertiserReportLogBase(AdvertiserReportBase):
         if "response_timezone" in map_params and map_params["response_timezone"] is not None:
             map_query_string["response_timezone"] = map_params["response_timezone"]
 
-        return AdvertiserReportBase.call(
-            self,
-            "find",
-            map_query_string
-        )
+        return map_query_string
 
     ## Places a job into a queue to generate a report that will contain
     #  records that match provided filter criteria, and it returns a job
@@ -246,6 +293,24 @@ class AdvertiserReportLogBase(AdvertiserReportBase):
 
             :return: (TuneServiceResponse)
         """
+        return AdvertiserReportBase.call(
+            self,
+            "find_export_queue",
+            self._build_export_query(map_params)
+        )
+
+    ## Validate parameters of action 'export'.
+    #  @param dict map_params
+    #  @return dict map_query_string
+    #  @throws ValueError
+    def _build_export_query(self, map_params):
+        """Validate parameters of action 'export' and build
+        its query string parameters.
+
+            :param (dict) map_params
+            :return (dict): map_query_string
+            :throws: ValueError
+        """
         if map_params is None or \
            not isinstance(map_params, dict):
             raise ValueError(
@@ -272,11 +337,7 @@ class AdvertiserReportLogBase(AdvertiserReportBase):
         if "response_timezone" in map_params and map_params["response_timezone"] is not None:
             map_query_string["response_timezone"] = map_params["response_timezone"]
 
-        return AdvertiserReportBase.call(
-            self,
-            "find_export_queue",
-            map_query_string
-        )
+        return map_query_string
 
     ## Query status of insight reports. Upon completion will
     #  return url to download requested report.
@@ -316,12 +377,17 @@ class AdvertiserReportLogBase(AdvertiserReportBase):
     ## Helper function for fetching report upon completion.
     #
     #  @param str   job_id      Job identifier assigned for report export.
+    #  @param object deadline    Deadline or seconds bounding polling.
     #  @return object @see TuneServiceResponse
     def fetch(self,
-              job_id):
+              job_id,
+              deadline=None):
         """Helper function for fetching report upon completion.
+        A journaled job is resolved as described by _fetch().
 
             :param str  job_id:     Job identifier assigned for report export.
+            :param Deadline deadline: Deadline, or seconds from now, by
+                                      which report must be completed.
             :return: (TuneServiceResponse)
         """
         # job_id
@@ -331,5 +397,24 @@ class AdvertiserReportLogBase(AdvertiserReportBase):
         return self._fetch(
             "export",
             "download",
-            job_id
+            job_id,
+            deadline=deadline
         )
+
+    ## Endpoint placing a report export job on queue.
+    #  @return tuple (controller, action)
+    def _export_endpoint(self):
+        """Endpoint placing a report export job on queue.
+
+            :return (tuple): (controller, action)
+        """
+        return (self.controller, "find_export_queue")
+
+    ## Endpoint polled for status of a report export job.
+    #  @return tuple (controller, action)
+    def _export_status_endpoint(self):
+        """Endpoint polled for status of a report export job.
+
+            :return (tuple): (controller, action)
+        """
+        return ("export", "download")
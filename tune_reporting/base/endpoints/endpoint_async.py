@@ -0,0 +1,264 @@
+"""
+TUNE Reporting API asyncio endpoint actions
+=============================================
+"""
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  endpoint_async.py
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 3.5 and above
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+import asyncio
+import time
+
+from tune_reporting.base.service import (
+    AsyncTuneServiceClient
+)
+from tune_reporting.helpers import (
+    Deadline,
+    TuneSdkException,
+    TuneServiceException
+)
+from .poll_schedule import (
+    PollSchedule
+)
+from .report_export_worker import (
+    ReportExportWorker
+)
+
+if hasattr(time, "monotonic"):
+    __clock__ = time.monotonic
+else:
+    __clock__ = time.time
+
+
+## Coroutine actions of TUNE Reporting API report endpoints.
+#
+class AdvertiserReportAsyncMixin(object):
+    """Coroutine actions of TUNE Reporting API report endpoints.
+
+    Query string parameters are validated exactly as their blocking
+    counterparts: count(), find(), export(), status() and fetch().
+    """
+
+    ## Call TUNE Reporting API service for this controller.
+    #  @param str   action              Endpoint's action name.
+    #  @param dict  map_query_string    Action's query string parameters.
+    #  @return object @see TuneServiceResponse
+    async def acall(self, action, map_query_string=None):
+        """Call TUNE Reporting API service for this controller
+        within running event loop.
+
+            :param str  action:             Endpoint's action name.
+            :param dict map_query_string:   Action's query string parameters.
+            :return: (TuneServiceResponse)
+        """
+        if not isinstance(action, str) or len(action) < 1:
+            raise ValueError(
+                "Parameter 'action' is not defined."
+            )
+
+        if map_query_string is not None:
+            map_query_string = self._prepare_query_string(map_query_string)
+
+        return await self._acall(self.controller, action, map_query_string)
+
+    async def _acall(self, controller, action, map_query_string,
+                     deadline=None):
+        client = AsyncTuneServiceClient(
+            controller,
+            action,
+            self.auth_key,
+            self.auth_type,
+            map_query_string
+        )
+
+        await client.call(deadline)
+
+        return client.response
+
+    ## Gather fields of this endpoint before validating action's parameters,
+    #  so validation does not block event loop.
+    async def _aload_fields(self):
+        if self.validate_fields and not self._has_endpoint_fields():
+            response = await self._acall(
+                "apidoc",
+                "get_controllers",
+                self._endpoint_fields_query()
+            )
+            self._load_endpoint_fields(response)
+
+    ## Counts all existing records that match filter criteria
+    #  and returns an array of found model data.
+    #  @param dict map_params    Mapping of: <p><dl>
+    #  @return object @see TuneServiceResponse
+    async def acount(self, map_params):
+        """Coroutine of count().
+
+            :param (dict) map_params: Parameters of count().
+            :return: (TuneServiceResponse)
+        """
+        await self._aload_fields()
+        return await self.acall("count", self._build_count_query(map_params))
+
+    ## Finds all existing records that match filter criteria
+    #  and returns an array of found model data.
+    #  @param dict map_params    Mapping of: <p><dl>
+    #  @return object @see TuneServiceResponse
+    async def afind(self, map_params):
+        """Coroutine of find().
+
+            :param (dict) map_params: Parameters of find().
+            :return: (TuneServiceResponse)
+        """
+        await self._aload_fields()
+        return await self.acall("find", self._build_find_query(map_params))
+
+    ## Places a job into a queue to generate a report.
+    #  @param dict map_params    Mapping of: <p><dl>
+    #  @return object @see TuneServiceResponse
+    async def aexport(self, map_params):
+        """Coroutine of export().
+
+            :param (dict) map_params: Parameters of export().
+            :return: (TuneServiceResponse)
+        """
+        await self._aload_fields()
+        map_query_string = self._prepare_query_string(
+            self._build_export_query(map_params)
+        )
+        controller, action = self._export_endpoint()
+        return await self._acall(controller, action, map_query_string)
+
+    ## Query status of report export job.
+    #  @param str job_id    Job identifier assigned for report export.
+    #  @param object deadline   Deadline or seconds bounding request.
+    #  @return object @see TuneServiceResponse
+    async def astatus(self, job_id, deadline=None):
+        """Coroutine of status().
+
+            :param (str) job_id: Job identifier assigned for report export.
+            :param (Deadline) deadline: Deadline, or seconds from now,
+                                        bounding request.
+            :return: (TuneServiceResponse)
+        """
+        if not job_id or len(job_id) < 1:
+            raise ValueError(
+                "Parameter 'job_id' is not defined."
+            )
+
+        controller, action = self._export_status_endpoint()
+        return await self._acall(
+            controller, action, {'job_id': job_id}, deadline
+        )
+
+    ## Poll status of report export job until completed, yielding
+    #  event loop while sleeping between attempts, as scheduled by
+    #  PollSchedule as fetch() does.
+    #  @param str job_id    Job identifier assigned for report export.
+    #  @param object deadline   Deadline or seconds bounding polling.
+    #  @return object @see TuneServiceResponse
+    async def afetch(self, job_id, deadline=None):
+        """Coroutine of fetch().
+
+            :param (str) job_id: Job identifier assigned for report export.
+            :param (Deadline) deadline: Deadline, or seconds from now, by
+                                        which report must be completed.
+            :return: (TuneServiceResponse)
+            :throws: TuneSdkException
+            :throws: TuneServiceException
+        """
+        if not job_id or len(job_id) < 1:
+            raise ValueError(
+                "Parameter 'job_id' is not defined."
+            )
+
+        attempt = 0
+        response = None
+
+        deadline = Deadline.create(deadline)
+        timeout = Deadline(self.status_timeout) \
+            if self.status_timeout > 0 else None
+        polling = Deadline.earliest(timeout, deadline)
+        schedule = PollSchedule(self.status_sleep, self.controller)
+        start = __clock__()
+
+        try:
+            while True:
+                if timeout is not None and timeout.expired:
+                    raise TuneSdkException(
+                        "Exceeded timeout."
+                    )
+                if deadline is not None:
+                    deadline.check()
+
+                response = await self.astatus(job_id, polling)
+
+                status = ReportExportWorker.parse_status(response)
+                attempt += 1
+                if status == "complete":
+                    schedule.complete(__clock__() - start)
+                    break
+                if status == "fail":
+                    break
+
+                if self.status_verbose:
+                    print(
+                        " attempt: {}, response: {}".format(attempt, response)
+                    )
+
+                sleep = schedule.delay(attempt, __clock__() - start, response)
+                if polling is not None:
+                    sleep = min(sleep, polling.remaining())
+                await asyncio.sleep(sleep)
+        except (TuneSdkException, TuneServiceException):
+            raise
+        except Exception as ex:
+            raise TuneSdkException(
+                "Failed get export status: (Error:{0})".format(
+                    str(ex)
+                ),
+                ex
+            )
+
+        if response.http_code != 200 \
+           or response.data["status"] == "fail":
+            raise TuneServiceException(
+                "Report request failed: {}".format(
+                    str(response)
+                )
+            )
+
+        return response
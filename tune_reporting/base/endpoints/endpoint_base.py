@@ -56,9 +56,18 @@ from tune_reporting.helpers import (
 from tune_reporting.helpers.sdk_config import (
     SdkConfig
 )
+from tune_reporting.helpers.report_cache import (
+    ReportCache
+)
 from .report_export_worker import (
     ReportExportWorker
 )
+from .poll_schedule import (
+    PollSchedule
+)
+from .export_journal import (
+    ExportJournal
+)
 
 TUNE_FIELDS_UNDEFINED = 0
 TUNE_FIELDS_ALL = 1
@@ -210,14 +219,44 @@ class EndpointBase(object):
         """TUNE Reporting API Authentication Type."""
         return self.__auth_type
 
+    #  Get whether action's parameters are validated against fields.
+    #  @return bool
+    @property
+    def validate_fields(self):
+        """Validate action's parameters against this endpoint's fields."""
+        return self.__validate_fields
+
+    #  Get verbose output when fetching report download url.
+    #  @return bool
+    @property
+    def status_verbose(self):
+        """Verbose output when fetching report download url."""
+        return self.__status_verbose
+
+    #  Get export status sleep (seconds).
+    #  @return int
+    @property
+    def status_sleep(self):
+        """Export status sleep (seconds)."""
+        return self.__status_sleep
+
+    #  Get export fetch timeout (seconds).
+    #  @return int
+    @property
+    def status_timeout(self):
+        """Export fetch timeout (seconds), 0 if none."""
+        return self.__status_timeout
+
     #  Call TUNE Reporting API service for this controller.
     #  @param str action              TUNE Reporting API endpoint's
     #                                   action name.
     #  @param array  map_query_string   Action's query string parameters
+    #  @param object deadline           Deadline or seconds bounding call.
     #  @return object @see TuneServiceResponse
     def call(self,
              action,
-             map_query_string=None):
+             map_query_string=None,
+             deadline=None):
         """Call TUNE Reporting API service requesting response
         endpoint_base upon provided controller/action?query_string.
 
@@ -225,6 +264,8 @@ class EndpointBase(object):
                                         action name.
             :param array    map_query_string:  Action's query string
                                         parameters.
+            :param Deadline deadline:   Deadline, or seconds from now,
+                                        bounding request.
             :return: (TuneServiceResponse)
         """
         client = TuneServiceClient(
@@ -235,10 +276,53 @@ class EndpointBase(object):
             map_query_string
         )
 
-        client.call()
+        client.call(deadline)
 
         return client.response
 
+    #  Call TUNE Reporting API service for this controller, parsing rows
+    #  of response while iterated.
+    #  @param str action              TUNE Reporting API endpoint's
+    #                                   action name.
+    #  @param array  map_query_string   Action's query string parameters
+    #  @param object deadline           Deadline or seconds bounding call.
+    #  @return object @see TuneServiceResponseStream
+    def call_stream(self,
+                    action,
+                    map_query_string=None,
+                    deadline=None):
+        """Call TUNE Reporting API service for this controller, of which
+        rows of response's 'data' are parsed while iterated.
+
+            :param str      action:     TUNE Reporting API endpoint's
+                                        action name.
+            :param array    map_query_string:  Action's query string
+                                        parameters.
+            :param Deadline deadline:   Deadline, or seconds from now,
+                                        bounding request.
+            :return: (TuneServiceResponseStream)
+        """
+        client = TuneServiceClient(
+            self.controller,
+            action,
+            self.__auth_key,
+            self.__auth_type,
+            map_query_string
+        )
+
+        return client.stream(deadline)
+
+    #  Prepare query string parameters of an action before being sent.
+    #  @param dict map_query_string
+    #  @return dict map_query_string
+    def _prepare_query_string(self, map_query_string):
+        """Prepare query string parameters of an action before being sent.
+
+            :param (dict) map_query_string
+            :return (dict): map_query_string
+        """
+        return map_query_string
+
     #  Provide complete definition for this endpoint.
     #  @return object @see TuneServiceResponse
     def define(self):
@@ -352,44 +436,74 @@ class EndpointBase(object):
             :return: list endpoint fields
             :throws: TuneServiceException
         """
-        map_query_string = {
-            'controllers': self.__controller,
-            'details': 'modelName,fields'
-        }
-
         client = TuneServiceClient(
             "apidoc",
             "get_controllers",
             self.__auth_key,
             self.__auth_type,
-            map_query_string
+            self._endpoint_fields_query()
         )
 
         client.call()
 
-        if client.response.http_code != 200:
+        return self._load_endpoint_fields(client.response)
+
+    ## Query string parameters requesting fields of this endpoint
+    #  from 'apidoc/get_controllers'.
+    #  @return dict map_query_string
+    def _endpoint_fields_query(self):
+        """Query string parameters requesting fields of this endpoint
+        from 'apidoc/get_controllers'.
+
+            :return (dict): map_query_string
+        """
+        return {
+            'controllers': self.__controller,
+            'details': 'modelName,fields'
+        }
+
+    ## Whether fields of this endpoint have already been gathered.
+    #  @return bool
+    def _has_endpoint_fields(self):
+        """Whether fields of this endpoint have already been gathered."""
+        return self.__fields is not None
+
+    ## Load fields from model and related models of this endpoint
+    #  provided response of 'apidoc/get_controllers'.
+    #  @param object response @see TuneServiceResponse
+    #  @return list endpoint fields
+    #  @throws TuneServiceException
+    def _load_endpoint_fields(self, response):
+        """Load all available fields for this endpoint provided
+        response of 'apidoc/get_controllers'.
+
+            :param (TuneServiceResponse) response:
+            :return: list endpoint fields
+            :throws: TuneServiceException
+        """
+        if response.http_code != 200:
             raise TuneServiceException(
                 "Connection failure '{}': {}".format(
-                    client.response.request_url,
-                    client.response.http_code
+                    response.request_url,
+                    response.http_code
                 )
             )
 
-        if client.response.data is None:
+        if response.data is None:
             raise TuneServiceException(
                 "Failed to get fields for "
                 "endpoint: '{}'".format(self.__controller)
             )
 
-        if (isinstance(client.response.data, list) and
-                len(client.response.data) == 0):
+        if (isinstance(response.data, list) and
+                len(response.data) == 0):
             raise TuneServiceException(
                 "Failed to get fields for "
                 "endpoint: '{}'".format(self.__controller)
             )
 
-        fields = client.response.data[0]["fields"]
-        self.__model_name = client.response.data[0]["modelName"]
+        fields = response.data[0]["fields"]
+        self.__model_name = response.data[0]["modelName"]
 
         fields_found = {}
         related_fields = {}
@@ -819,7 +933,6 @@ class EndpointBase(object):
         limit = map_params["limit"]
 
         if (limit is None
-                or not limit
                 or not isinstance(limit, int)
                 or 0 > limit):
             raise ValueError("Parameter 'limit' is not valid.")
@@ -894,6 +1007,7 @@ class EndpointBase(object):
     #  @param str   export_controller   Export controller.
     #  @param str   export_action       Export status action.
     #  @param str   job_id              Job Identifier of report on queue.
+    #  @param object deadline           Deadline or seconds bounding polling.
     #
     #  @return object @see TuneServiceResponse
     #  @throws ValueError
@@ -902,15 +1016,25 @@ class EndpointBase(object):
     def _fetch(self,
                export_controller,
                export_action,
-               job_id):
+               job_id,
+               deadline=None):
         """
         Helper function for fetching report document given provided
         job identifier.
+
+        With a journal selected by ExportJournal.configure(), a job
+        journaled as completed is returned without polling. Jobs left
+        unfinished by a previous process are only polled by fetch(),
+        unless resumed by ExportPoller(journal=journal).
+
             :param str      export_controller:  Export controller.
             :param str      export_action:      Export status action.
             :param str      job_id:             Provided Job Identifier to
                                                 reference requested report on
                                                 export queue.
+            :param Deadline deadline:           Deadline, or seconds from
+                                                now, by which report must
+                                                be completed.
         """
 
         # export_controller
@@ -929,6 +1053,18 @@ class EndpointBase(object):
                 "Parameter 'job_id' is not defined."
             )
 
+        cache = ReportCache.default_cache()
+        if cache is not None:
+            response = cache.completed_response(job_id)
+            if response is not None:
+                return response
+
+        journal = ExportJournal.default_journal()
+        if journal is not None:
+            response = journal.completed_response(job_id)
+            if response is not None:
+                return response
+
         export_worker = ReportExportWorker(
             export_controller,
             export_action,
@@ -937,7 +1073,10 @@ class EndpointBase(object):
             job_id,
             self.__status_verbose,
             self.__status_sleep,
-            self.__status_timeout
+            self.__status_timeout,
+            deadline,
+            PollSchedule(self.__status_sleep, self.controller),
+            journal
         )
 
         try:
@@ -971,6 +1110,16 @@ class EndpointBase(object):
         if not export_worker.response:
             raise TuneSdkException("Failed to get export status.")
 
+        if cache is not None:
+            try:
+                cache.completed(
+                    job_id,
+                    self.parse_response_report_url(export_worker.response),
+                    export_worker.response.json
+                )
+            except (ValueError, TuneSdkException):
+                pass
+
         return export_worker.response
 
     ## Helper function for parsing export status response to
@@ -0,0 +1,207 @@
+"""
+TUNE Reports Export Executor
+=============================================
+"""
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  export_executor.py
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+
+import threading
+
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor
+)
+
+from tune_reporting.helpers import (
+    Deadline
+)
+from .export_poller import (
+    ExportPoller
+)
+
+
+## Submits report exports in the background, resolving futures once
+#  reports are completed.
+#
+class ExportExecutor(object):
+    """Submits report exports in the background, resolving futures once
+    reports are completed.
+
+    Export requests are sent from a small thread pool, then every job is
+    polled by a single ExportPoller thread, so any number of reports may
+    be awaited with concurrent.futures.as_completed() or wait(), or with
+    asyncio.wrap_future() within an event loop.
+    """
+
+    #  Executor shared by endpoints' export_async().
+    #  @var ExportExecutor
+    __shared = None
+
+    #  @var object
+    __shared_lock = threading.Lock()
+
+    #  Threads sending export requests.
+    #  @var object
+    __executor = None
+
+    #  @var object @see ExportPoller
+    __poller = None
+
+    #  The constructor
+    #
+    #  @param int    max_workers    Concurrent export requests.
+    #  @param object poller         ExportPoller polling submitted jobs.
+    #
+    def __init__(self, max_workers=4, poller=None):
+        """The constructor.
+
+            :param int max_workers:         Export requests sent
+                                            concurrently.
+            :param ExportPoller poller:     Poller of submitted jobs, a
+                                            poller of its own if not
+                                            provided.
+        """
+        if max_workers < 1:
+            raise ValueError(
+                "Parameter 'max_workers' is not valid: '{}'".format(
+                    max_workers
+                )
+            )
+        self.__executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.__poller = poller if poller is not None else ExportPoller()
+
+    @classmethod
+    def shared_executor(cls):
+        """Executor shared by the SDK.
+
+            :rtype: ExportExecutor
+        """
+        with cls.__shared_lock:
+            if cls.__shared is None:
+                cls.__shared = cls()
+            return cls.__shared
+
+    @classmethod
+    def configure(cls, *args, **kwargs):
+        """Replace the executor shared by the SDK, letting exports
+        submitted to the previous one complete.
+
+            :rtype: ExportExecutor
+        """
+        executor = cls(*args, **kwargs)
+        with cls.__shared_lock:
+            previous, cls.__shared = cls.__shared, executor
+        if previous is not None:
+            previous.shutdown(wait=False)
+        return executor
+
+    @property
+    def poller(self):
+        """Poller of submitted jobs."""
+        return self.__poller
+
+    ## Place report export job on queue, without blocking.
+    #  @param object endpoint   Report endpoint.
+    #  @param dict   map_params Parameters of endpoint's export().
+    #  @param object reader     Reader class built upon report URL.
+    #  @param object deadline   Deadline or seconds.
+    #  @return object Future
+    def submit(self, endpoint, map_params, reader=None, deadline=None):
+        """Place report export job on queue, without blocking.
+
+            :param EndpointBase endpoint:   Report endpoint.
+            :param dict map_params:         Parameters of endpoint's
+                                            export().
+            :param type reader:             Callable of report URL, as
+                                            ReportReaderCSV, whose result
+                                            resolves future instead of
+                                            report URL.
+            :param Deadline deadline:       Deadline, or seconds from now,
+                                            by which report must complete.
+            :return: Future resolved to report URL, or reader, once
+                report is completed; cancelled unless its export request
+                is being sent.
+            :rtype: concurrent.futures.Future
+        """
+        deadline = Deadline.create(deadline)
+        future = Future()
+
+        def completed(job):
+            try:
+                response = job.wait(0)
+                report_url = endpoint.parse_response_report_url(response)
+                future.set_result(
+                    reader(report_url) if reader is not None else report_url
+                )
+            except Exception as ex:
+                future.set_exception(ex)
+
+        def export():
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                _, action = endpoint._export_endpoint()
+                response = endpoint.call(
+                    action,
+                    endpoint._build_export_query(map_params),
+                    deadline
+                )
+                job_id = endpoint.parse_response_report_job_id(response)
+                job = self.__poller.add_report(endpoint, job_id, deadline)
+                self.__poller.start()
+                job.add_done_callback(completed)
+            except Exception as ex:
+                future.set_exception(ex)
+
+        self.__executor.submit(export)
+        return future
+
+    def shutdown(self, wait=True):
+        """Stop sending export requests and polling jobs.
+
+            :param bool wait:   Wait for export requests being sent, then
+                                stop polling. Otherwise return at once,
+                                polling stopping by itself once jobs of
+                                export requests submitted are resolved.
+        """
+        self.__executor.shutdown(wait=wait)
+        if wait:
+            self.__poller.stop()
+        else:
+            self.__poller.stop_when_idle()
@@ -0,0 +1,498 @@
+"""
+TUNE Reports Export Journal
+=============================================
+"""
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  export_journal.py
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+
+import collections
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+
+from tune_reporting.helpers.sdk_config import (
+    SdkConfig
+)
+from tune_reporting.base.service.tune_service_response import (
+    TuneServiceResponse
+)
+
+#  Export statuses after which a job is no longer polled.
+__final_statuses__ = ("complete", "fail")
+
+#  Status of a job placed on queue, before its first poll.
+TUNE_EXPORT_SUBMITTED = 'submitted'
+
+__schema__ = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    account TEXT,
+    controller TEXT,
+    query TEXT,
+    export_controller TEXT NOT NULL,
+    export_action TEXT NOT NULL,
+    status TEXT NOT NULL,
+    report_url TEXT,
+    response TEXT,
+    submitted REAL NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_query ON jobs (account, controller, query);
+CREATE TABLE IF NOT EXISTS transitions (
+    job_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS transitions_job ON transitions (job_id);
+"""
+
+#  Journal entry of a report export job.
+JournalEntry = collections.namedtuple("JournalEntry", [
+    "job_id",
+    "controller",
+    "query",
+    "export_controller",
+    "export_action",
+    "status",
+    "report_url",
+    "response",
+    "submitted",
+    "updated"
+])
+
+
+## Durable journal of report export jobs.
+#
+class ExportJournal(object):
+    """Durable journal of report export jobs, kept in a SQLite database.
+
+    Records every job placed on queue with its report controller and
+    query, and every status transition seen while polling it. Once
+    selected with configure(), export() reuses the job of an identical
+    query placed on queue within `pending_ttl` seconds and still pending,
+    or completed within `url_ttl` seconds, fetch()
+    returns a journaled completed response without polling, and resume()
+    reattaches pollers to jobs left unfinished by a previous process.
+
+    Jobs left unfinished are not polled again until fetch() is called
+    with their job identifier, unless resumed: pass the journal to
+    ExportPoller(journal=...), which resumes them on construction, or
+    call resume() with a poller.
+    """
+
+    #  Journal used by endpoints.
+    #  @var ExportJournal
+    __default = None
+
+    #  @var object
+    __default_lock = threading.Lock()
+
+    #  @var str
+    __filepath = None
+
+    #  Seconds a completed report URL is reused.
+    #  @var float
+    __url_ttl = None
+
+    #  Seconds an unfinished job is reused or resumed.
+    #  @var float
+    __pending_ttl = None
+
+    #  @var object
+    __connection = None
+
+    #  @var object
+    __lock = None
+
+    #  The constructor
+    #
+    #  @param str   filepath    SQLite database file.
+    #  @param float url_ttl     Seconds a completed report URL is reused.
+    #  @param float pending_ttl Seconds an unfinished job is reused.
+    #
+    def __init__(self, filepath, url_ttl=3600, pending_ttl=3600):
+        """The constructor.
+
+            :param str filepath:    SQLite database file, created if
+                                    missing.
+            :param float url_ttl:   Seconds after completion a report URL
+                                    is reused, before it expires.
+            :param float pending_ttl: Seconds after being placed on queue
+                                    an unfinished job is reused or
+                                    resumed, before it is presumed
+                                    abandoned: its fetch() timed out or
+                                    its process died, and the service
+                                    may have dropped it.
+        """
+        if not filepath:
+            raise ValueError(
+                "Parameter 'filepath' is not defined."
+            )
+        if url_ttl < 0:
+            raise ValueError(
+                "Parameter 'url_ttl' is not valid: '{}'".format(url_ttl)
+            )
+        if pending_ttl < 0:
+            raise ValueError(
+                "Parameter 'pending_ttl' is not valid: '{}'".format(
+                    pending_ttl
+                )
+            )
+
+        self.__filepath = filepath
+        self.__url_ttl = url_ttl
+        self.__pending_ttl = pending_ttl
+        self.__lock = threading.Lock()
+        self.__connection = sqlite3.connect(
+            filepath,
+            check_same_thread=False
+        )
+        self.__connection.execute("PRAGMA journal_mode=WAL")
+        self.__connection.execute("PRAGMA synchronous=NORMAL")
+        self.__connection.executescript(__schema__)
+        self.__connection.commit()
+
+    @classmethod
+    def configure(cls, journal):
+        """Select journal used by endpoints' export() and fetch().
+
+            :param ExportJournal journal:   Journal, None to stop
+                                            journaling.
+            :rtype: ExportJournal
+        """
+        if journal is not None and not isinstance(journal, ExportJournal):
+            raise ValueError(
+                "Parameter 'journal' is not valid: '{}'".format(journal)
+            )
+        with ExportJournal.__default_lock:
+            ExportJournal.__default = journal
+        return journal
+
+    @classmethod
+    def default_journal(cls):
+        """Journal selected with configure(), None if not selected.
+
+            :rtype: ExportJournal
+        """
+        with ExportJournal.__default_lock:
+            return ExportJournal.__default
+
+    @property
+    def filepath(self):
+        """SQLite database file."""
+        return self.__filepath
+
+    @property
+    def url_ttl(self):
+        """Seconds after completion a report URL is reused."""
+        return self.__url_ttl
+
+    @property
+    def pending_ttl(self):
+        """Seconds after being placed on queue an unfinished job is
+        reused."""
+        return self.__pending_ttl
+
+    @staticmethod
+    def account(auth_key):
+        """Digest of authentication key, so jobs are only reused for
+        the account which placed them, without storing the key."""
+        if auth_key is None:
+            return None
+        return hashlib.sha256(auth_key.encode("utf-8")).hexdigest()[:32]
+
+    @staticmethod
+    def query_key(map_query_string):
+        """Canonical form of query string parameters."""
+        return json.dumps(map_query_string, sort_keys=True, default=str)
+
+    @staticmethod
+    def report_url(response_json):
+        """Report URL within export status response, None if missing."""
+        data = response_json.get("data") if response_json else None
+        if not isinstance(data, dict):
+            return None
+        if data.get("url"):
+            return data["url"]
+        nested = data.get("data")
+        if isinstance(nested, dict) and nested.get("url"):
+            return nested["url"]
+        return None
+
+    def __execute(self, statement, parameters=()):
+        with self.__lock:
+            cursor = self.__connection.execute(statement, parameters)
+            self.__connection.commit()
+            return cursor
+
+    def __select(self, statement, parameters=()):
+        with self.__lock:
+            return self.__connection.execute(statement, parameters).fetchall()
+
+    @staticmethod
+    def __entry(row):
+        (job_id, controller, query, export_controller, export_action,
+         status, report_url, response, submitted, updated) = row
+        return JournalEntry(
+            job_id,
+            controller,
+            json.loads(query) if query else None,
+            export_controller,
+            export_action,
+            status,
+            report_url,
+            json.loads(response) if response else None,
+            submitted,
+            updated
+        )
+
+    __columns__ = (
+        "job_id, controller, query, export_controller, export_action, "
+        "status, report_url, response, submitted, updated"
+    )
+
+    def submitted(self,
+                  job_id,
+                  controller,
+                  map_query_string,
+                  export_controller,
+                  export_action,
+                  auth_key=None):
+        """Record a job placed on queue.
+
+            :param str job_id:              Job identifier of report export.
+            :param str controller:          Report controller.
+            :param dict map_query_string:   Query of export.
+            :param str export_controller:   Controller polled for status.
+            :param str export_action:       Action polled for status.
+            :param str auth_key:            Authentication key of account.
+        """
+        now = time.time()
+        with self.__lock:
+            self.__connection.execute(
+                "INSERT OR REPLACE INTO jobs VALUES "
+                "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (job_id, self.account(auth_key), controller,
+                 self.query_key(map_query_string), export_controller,
+                 export_action, TUNE_EXPORT_SUBMITTED, None, None, now, now)
+            )
+            self.__connection.execute(
+                "INSERT INTO transitions VALUES (?, ?, ?)",
+                (job_id, TUNE_EXPORT_SUBMITTED, now)
+            )
+            self.__connection.commit()
+
+    def status(self,
+               job_id,
+               status,
+               response_json=None,
+               export_controller=None,
+               export_action=None):
+        """Record status of a job seen while polling, once per transition.
+
+            :param str job_id:              Job identifier of report export.
+            :param str status:              Export status.
+            :param dict response_json:      Full export status response.
+            :param str export_controller:   Controller polled, recording a
+                                            job not yet journaled.
+            :param str export_action:       Action polled.
+        """
+        now = time.time()
+        with self.__lock:
+            row = self.__connection.execute(
+                "SELECT status FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+            if row is not None and row[0] == status:
+                return
+            if row is None:
+                if export_controller is None or export_action is None:
+                    return
+                self.__connection.execute(
+                    "INSERT INTO jobs VALUES "
+                    "(?, NULL, NULL, NULL, ?, ?, ?, NULL, NULL, ?, ?)",
+                    (job_id, export_controller, export_action, status,
+                     now, now)
+                )
+            final = status in __final_statuses__
+            self.__connection.execute(
+                "UPDATE jobs SET status = ?, report_url = ?, response = ?, "
+                "updated = ? WHERE job_id = ?",
+                (status,
+                 self.report_url(response_json) if final else None,
+                 json.dumps(response_json) if final and response_json
+                 else None,
+                 now,
+                 job_id)
+            )
+            self.__connection.execute(
+                "INSERT INTO transitions VALUES (?, ?, ?)",
+                (job_id, status, now)
+            )
+            self.__connection.commit()
+
+    def job(self, job_id):
+        """Journal entry of a job.
+
+            :rtype: JournalEntry, None if not journaled.
+        """
+        rows = self.__select(
+            "SELECT " + self.__columns__ + " FROM jobs WHERE job_id = ?",
+            (job_id,)
+        )
+        return self.__entry(rows[0]) if rows else None
+
+    def transitions(self, job_id):
+        """Statuses of a job in order seen.
+
+            :return: [(status, timestamp)]
+            :rtype: list
+        """
+        return [
+            (status, at) for status, at in self.__select(
+                "SELECT status, at FROM transitions WHERE job_id = ? "
+                "ORDER BY rowid",
+                (job_id,)
+            )
+        ]
+
+    def is_reusable(self, entry):
+        """Whether a job may be reused instead of placing an identical one
+        on queue: unfinished and placed within `pending_ttl`, or completed
+        with an unexpired report URL.
+
+            :param JournalEntry entry:
+            :rtype: bool
+        """
+        if entry.status == "complete":
+            return entry.report_url is not None and \
+                time.time() - entry.updated < self.__url_ttl
+        return entry.status not in __final_statuses__ and \
+            time.time() - entry.submitted < self.__pending_ttl
+
+    def find(self, controller, map_query_string, auth_key=None):
+        """Most recent reusable job of an identical export query.
+
+            :param str controller:          Report controller.
+            :param dict map_query_string:   Query of export.
+            :param str auth_key:            Authentication key of account.
+            :rtype: JournalEntry, None if none reusable.
+        """
+        rows = self.__select(
+            "SELECT " + self.__columns__ + " FROM jobs "
+            "WHERE account IS ? AND controller = ? AND query = ? "
+            "ORDER BY submitted DESC",
+            (self.account(auth_key), controller,
+             self.query_key(map_query_string))
+        )
+        for row in rows:
+            entry = self.__entry(row)
+            if self.is_reusable(entry):
+                return entry
+        return None
+
+    def completed_response(self, job_id):
+        """Journaled status response of a job completed with an unexpired
+        report URL.
+
+            :rtype: TuneServiceResponse, None if not reusable.
+        """
+        entry = self.job(job_id)
+        if entry is None or entry.status != "complete" or \
+           entry.response is None or not self.is_reusable(entry):
+            return None
+        return TuneServiceResponse(entry.response, 200)
+
+    def unfinished(self):
+        """Jobs neither completed nor failed, placed on queue within
+        `pending_ttl`, oldest first.
+
+            :rtype: list of JournalEntry
+        """
+        return [
+            self.__entry(row) for row in self.__select(
+                "SELECT " + self.__columns__ + " FROM jobs "
+                "WHERE status NOT IN (?, ?) AND submitted > ? "
+                "ORDER BY submitted",
+                __final_statuses__ + (time.time() - self.__pending_ttl,)
+            )
+        ]
+
+    def resume(self, poller, auth_key=None, auth_type=None):
+        """Reattach poller to jobs left unfinished, journaling their
+        statuses.
+
+            :param ExportPoller poller:     Poller of jobs.
+            :param str auth_key:            Authentication key, the SDK
+                                            configuration's if not provided.
+            :param str auth_type:           Authentication type, the SDK
+                                            configuration's if not provided.
+            :return: Jobs added to poller.
+            :rtype: list of ExportJob
+        """
+        if auth_key is None or auth_type is None:
+            sdk_config = SdkConfig()
+            if auth_key is None:
+                auth_key = sdk_config.auth_key
+            if auth_type is None:
+                auth_type = sdk_config.auth_type
+
+        jobs = []
+        account = self.account(auth_key)
+        for entry in self.unfinished():
+            row = self.__select(
+                "SELECT account FROM jobs WHERE job_id = ?", (entry.job_id,)
+            )
+            if row and row[0][0] not in (None, account):
+                continue
+            jobs.append(poller.add(
+                entry.export_controller,
+                entry.export_action,
+                entry.job_id,
+                auth_key,
+                auth_type,
+                journal=self
+            ))
+        return jobs
+
+    def close(self):
+        """Close database."""
+        with self.__lock:
+            self.__connection.close()
@@ -0,0 +1,713 @@
+"""
+TUNE Reports Export Poller
+=============================================
+"""
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  export_poller.py
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+
+import heapq
+import itertools
+import threading
+import time
+
+from tune_reporting.helpers import (
+    Deadline,
+    TuneSdkException,
+    TuneServiceException
+)
+from tune_reporting.base.service import (
+    TuneServiceClient
+)
+from .report_export_worker import (
+    ReportExportWorker
+)
+from .poll_schedule import (
+    PollSchedule
+)
+from .export_journal import (
+    ExportJournal
+)
+
+if hasattr(time, "monotonic"):
+    __clock__ = time.monotonic
+else:
+    __clock__ = time.time
+
+
+## Report export job tracked by ExportPoller.
+#
+class ExportJob(object):
+    """Report export job tracked by ExportPoller, resolved once its
+    status is 'complete' or 'fail'.
+    """
+
+    #  @var str
+    __export_controller = None
+
+    #  @var str
+    __export_action = None
+
+    #  @var str
+    __job_id = None
+
+    #  @var str
+    __auth_key = None
+
+    #  @var str
+    __auth_type = None
+
+    #  @var int
+    __sleep = None
+
+    #  @var object @see Deadline
+    __timeout = None
+
+    #  @var object @see Deadline
+    __deadline = None
+
+    #  Timeout of each status request.
+    #  @var float
+    __request_timeout = None
+
+    #  @var object @see PollSchedule
+    __schedule = None
+
+    #  @var object @see ExportJournal
+    __journal = None
+
+    #  Clock value of first poll.
+    #  @var float
+    __started = None
+
+    #  @var int
+    __attempts = 0
+
+    #  @var object @see TuneServiceResponse
+    __response = None
+
+    #  @var Exception
+    __error = None
+
+    #  @var object
+    __done = None
+
+    #  Callbacks called once resolved.
+    #  @var list
+    __callbacks = None
+
+    #  @var object
+    __lock = None
+
+    #  The constructor
+    #
+    #  @param str   export_controller   Export controller.
+    #  @param str   export_action       Export status action.
+    #  @param str   job_id              Job identifier of report export.
+    #  @param str   auth_key            TUNE Reporting authentication key.
+    #  @param str   auth_type           TUNE Reporting authentication type.
+    #  @param int   sleep               Polling delay (seconds).
+    #  @param int   timeout             Poll until exceeds timeout.
+    #  @param object deadline           Deadline or seconds.
+    #  @param object schedule           PollSchedule.
+    #  @param object journal            ExportJournal.
+    #  @param float request_timeout     Timeout of each status request.
+    #
+    def __init__(self,
+                 export_controller,
+                 export_action,
+                 job_id,
+                 auth_key,
+                 auth_type,
+                 sleep=10,
+                 timeout=0,
+                 deadline=None,
+                 schedule=None,
+                 journal=None,
+                 request_timeout=0):
+        """The constructor.
+
+            :param str export_controller:   Export controller.
+            :param str export_action:       Export status action.
+            :param str job_id:              Job identifier of report export.
+            :param str auth_key:            TUNE Reporting authentication
+                                            key.
+            :param str auth_type:           TUNE Reporting authentication
+                                            type.
+            :param int sleep:               Polling delay between querying
+                                            job status (seconds).
+            :param int timeout:             Poll until exceeds timeout,
+                                            0 if none.
+            :param Deadline deadline:       Deadline, or seconds from now,
+                                            by which job must complete.
+            :param PollSchedule schedule:   Adaptive delays between polls,
+                                            fixed delay of 'sleep' if not
+                                            provided.
+            :param ExportJournal journal:   Journal recording job's status
+                                            transitions.
+            :param float request_timeout:   Timeout of each status request,
+                                            polled again later once
+                                            exceeded, 0 if none.
+        """
+        if not export_controller or len(export_controller) < 1:
+            raise ValueError(
+                "Parameter 'export_controller' is not defined."
+            )
+        if not export_action or len(export_action) < 1:
+            raise ValueError(
+                "Parameter 'export_action' is not defined."
+            )
+        if not job_id or len(job_id) < 1:
+            raise ValueError(
+                "Parameter 'job_id' is not defined."
+            )
+        if not auth_key or len(auth_key) < 1:
+            raise ValueError(
+                "Parameter 'auth_key' is not defined."
+            )
+        if not auth_type or len(auth_type) < 1:
+            raise ValueError(
+                "Parameter 'auth_type' is not defined."
+            )
+
+        self.__export_controller = export_controller
+        self.__export_action = export_action
+        self.__job_id = job_id
+        self.__auth_key = auth_key
+        self.__auth_type = auth_type
+        self.__sleep = sleep
+        self.__timeout = Deadline(timeout) if timeout > 0 else None
+        self.__deadline = Deadline.create(deadline)
+        self.__request_timeout = request_timeout
+        self.__schedule = schedule
+        self.__journal = journal
+        self.__started = None
+        self.__attempts = 0
+        self.__response = None
+        self.__error = None
+        self.__done = threading.Event()
+        self.__callbacks = []
+        self.__lock = threading.Lock()
+
+    @property
+    def export_controller(self):
+        """Export controller."""
+        return self.__export_controller
+
+    @property
+    def export_action(self):
+        """Export status action."""
+        return self.__export_action
+
+    @property
+    def job_id(self):
+        """Job identifier of report export."""
+        return self.__job_id
+
+    @property
+    def sleep(self):
+        """Polling delay (seconds)."""
+        return self.__sleep
+
+    @property
+    def attempts(self):
+        """Status requests sent so far."""
+        return self.__attempts
+
+    @property
+    def done(self):
+        """Whether job was resolved."""
+        return self.__done.is_set()
+
+    @property
+    def response(self):
+        """Export status response once 'complete', None otherwise."""
+        return self.__response
+
+    @property
+    def error(self):
+        """Exception resolving job, None unless failed."""
+        return self.__error
+
+    def wait(self, timeout=None):
+        """Wait until job is resolved.
+
+            :param float timeout:   Seconds to wait, forever if None.
+            :return: Export status response, as returned by fetch().
+            :rtype: TuneServiceResponse
+            :throws: TuneServiceException if report request failed.
+            :throws: TuneSdkException if not resolved within timeout,
+                or upon polling failure.
+        """
+        if not self.__done.wait(timeout):
+            raise TuneSdkException(
+                "Export job not completed: {}".format(self.__job_id)
+            )
+        if self.__error is not None:
+            raise self.__error
+        return self.__response
+
+    def add_done_callback(self, callback):
+        """Call callback with job once resolved, immediately if it is.
+
+            :param callable callback:
+        """
+        with self.__lock:
+            if not self.__done.is_set():
+                self.__callbacks.append(callback)
+                return
+        callback(self)
+
+    #  Poll job status once.
+    #  @return float Seconds until next poll, None once resolved.
+    def _poll(self, verbose=False):
+        """Poll job status once.
+
+            :return: Seconds until next poll, None once resolved.
+        """
+        response = None
+        request = Deadline(self.__request_timeout) \
+            if self.__request_timeout > 0 else None
+        try:
+            if self.__timeout is not None and self.__timeout.expired:
+                raise TuneSdkException(
+                    "Exceeded timeout."
+                )
+            if self.__deadline is not None:
+                self.__deadline.check()
+
+            client = TuneServiceClient(
+                self.__export_controller,
+                self.__export_action,
+                self.__auth_key,
+                self.__auth_type,
+                map_query_string={
+                    'job_id': self.__job_id
+                }
+            )
+            if self.__started is None:
+                self.__started = __clock__()
+            client.call(
+                Deadline.earliest(self.__timeout, self.__deadline, request)
+            )
+            response = client.response
+            self.__attempts += 1
+
+            status = ReportExportWorker.parse_status(response)
+            if self.__journal is not None:
+                self.__journal.status(
+                    self.__job_id,
+                    status,
+                    response.json,
+                    self.__export_controller,
+                    self.__export_action
+                )
+        except (TuneSdkException, TuneServiceException) as ex:
+            # Request cut short by timeout expiring while it was sent.
+            if self.__timeout is not None and self.__timeout.expired:
+                ex = TuneSdkException("Exceeded timeout.", ex)
+            # Status request left unanswered, poll again later.
+            elif request is not None and request.expired and \
+                    (self.__deadline is None or not self.__deadline.expired):
+                if verbose:
+                    print(" job: {}, status request timed out".format(
+                        self.__job_id
+                    ))
+                return self.__delay()
+            self._resolve(error=ex)
+            return None
+        except Exception as ex:
+            self._resolve(error=TuneSdkException(
+                "Failed get export status: (Error:{0})".format(
+                    str(ex)
+                ),
+                ex
+            ))
+            return None
+
+        if verbose:
+            print(
+                " job: {}, attempt: {}, response: {}".format(
+                    self.__job_id, self.__attempts, response
+                )
+            )
+
+        if status == "complete":
+            if self.__schedule is not None:
+                self.__schedule.complete(__clock__() - self.__started)
+            self._resolve(response=response)
+            return None
+        if status == "fail":
+            self._resolve(error=TuneServiceException(
+                "Report request failed: {}".format(
+                    str(response)
+                )
+            ))
+            return None
+
+        return self.__delay(response)
+
+    #  Seconds until next poll.
+    def __delay(self, response=None):
+        delay = self.__sleep
+        if self.__schedule is not None:
+            delay = self.__schedule.delay(
+                max(self.__attempts, 1),
+                __clock__() - self.__started,
+                response
+            )
+        deadline = Deadline.earliest(self.__timeout, self.__deadline)
+        if deadline is not None:
+            delay = min(delay, deadline.remaining())
+        return delay
+
+    #  Resolve job with completed response or error.
+    def _resolve(self, response=None, error=None):
+        with self.__lock:
+            self.__response = response
+            self.__error = error
+            self.__done.set()
+            callbacks, self.__callbacks = self.__callbacks, []
+        for callback in callbacks:
+            callback(self)
+
+    def __str__(self):
+        return "ExportJob({}/{}, job_id={}, attempts={}, done={})".format(
+            self.__export_controller,
+            self.__export_action,
+            self.__job_id,
+            self.__attempts,
+            self.done
+        )
+
+
+## Poller of any number of report export jobs from a single thread.
+#
+class ExportPoller(object):
+    """Poller of any number of report export jobs from a single thread.
+
+    Jobs are kept in a min-heap ordered by time of their next poll, so
+    the polling thread only wakes up when a job is due, instead of one
+    thread sleeping per job as with ReportExportWorker. Jobs of
+    'export/download' and of cohort reports' 'status' action may be
+    mixed. A status request left unanswered is abandoned after
+    `request_timeout` and its job polled again later, so it does not
+    hold back polls of other jobs due meanwhile.
+    """
+
+    #  Jobs as (time of next poll, sequence, job).
+    #  @var list
+    __heap = None
+
+    #  @var object
+    __sequence = None
+
+    #  @var int
+    __sleep = None
+
+    #  @var int
+    __timeout = None
+
+    #  @var float
+    __request_timeout = None
+
+    #  Jobs resumed from journal.
+    #  @var list
+    __resumed = None
+
+    #  @var bool
+    __verbose = None
+
+    #  @var object
+    __condition = None
+
+    #  @var object
+    __thread = None
+
+    #  @var bool
+    __stopped = False
+
+    #  Stop background thread once no job is pending.
+    #  @var bool
+    __draining = False
+
+    #  The constructor
+    #
+    #  @param int   sleep               Default polling delay (seconds).
+    #  @param int   timeout             Default timeout per job.
+    #  @param bool  verbose             Print status of each poll.
+    #  @param float request_timeout     Timeout of each status request.
+    #  @param object journal            ExportJournal of jobs to resume.
+    #
+    def __init__(self, sleep=10, timeout=0, verbose=False,
+                 request_timeout=10, journal=None):
+        """The constructor.
+
+            :param int sleep:       Polling delay between querying status
+                                    of a job, unless provided to add().
+            :param int timeout:     Poll a job until exceeds timeout,
+                                    0 if none, unless provided to add().
+            :param bool verbose:    Debug purposes only to view progress
+                                    of jobs on export queue.
+            :param float request_timeout: Timeout of each status request,
+                                    as jobs are polled one at a time, so a
+                                    request left unanswered only holds
+                                    back other jobs' polls that long;
+                                    0 if none.
+            :param ExportJournal journal: Journal whose jobs left
+                                    unfinished by a previous process are
+                                    resumed by this poller right away.
+        """
+        if sleep < 0:
+            raise ValueError(
+                "Parameter 'sleep' is not valid: '{}'".format(sleep)
+            )
+        self.__heap = []
+        self.__sequence = itertools.count()
+        self.__sleep = sleep
+        self.__timeout = timeout
+        self.__request_timeout = request_timeout
+        self.__verbose = verbose
+        self.__condition = threading.Condition()
+        self.__thread = None
+        self.__stopped = False
+        self.__draining = False
+        self.__resumed = []
+        if journal is not None:
+            self.__resumed = journal.resume(self)
+
+    @property
+    def resumed(self):
+        """Jobs resumed from journal provided to constructor.
+
+            :rtype: list of ExportJob
+        """
+        return list(self.__resumed)
+
+    @property
+    def pending(self):
+        """Number of jobs not yet resolved."""
+        with self.__condition:
+            return len(self.__heap)
+
+    ## Track a report export job.
+    #  @param str   export_controller   Export controller.
+    #  @param str   export_action       Export status action.
+    #  @param str   job_id              Job identifier of report export.
+    #  @param str   auth_key            TUNE Reporting authentication key.
+    #  @param str   auth_type           TUNE Reporting authentication type.
+    #  @return object @see ExportJob
+    def add(self,
+            export_controller,
+            export_action,
+            job_id,
+            auth_key,
+            auth_type,
+            sleep=None,
+            timeout=None,
+            deadline=None,
+            schedule=None,
+            journal=None):
+        """Track a report export job, polled right away.
+
+            :param str export_controller:   Export controller, as 'export'
+                                            or cohort report's controller.
+            :param str export_action:       Export status action, as
+                                            'download' or 'status'.
+            :param str job_id:              Job identifier of report export.
+            :param str auth_key:            TUNE Reporting authentication
+                                            key.
+            :param str auth_type:           TUNE Reporting authentication
+                                            type.
+            :param int sleep:               Polling delay, poller's if not
+                                            provided.
+            :param int timeout:             Timeout, poller's if not
+                                            provided.
+            :param Deadline deadline:       Deadline, or seconds from now,
+                                            by which job must complete.
+            :param PollSchedule schedule:   Adaptive delays between polls,
+                                            fixed delay of 'sleep' if not
+                                            provided.
+            :param ExportJournal journal:   Journal recording job's status
+                                            transitions.
+            :rtype: ExportJob
+        """
+        job = ExportJob(
+            export_controller,
+            export_action,
+            job_id,
+            auth_key,
+            auth_type,
+            self.__sleep if sleep is None else sleep,
+            self.__timeout if timeout is None else timeout,
+            deadline,
+            schedule,
+            journal,
+            self.__request_timeout
+        )
+        self._schedule(job, 0)
+        return job
+
+    ## Track a report export job of an endpoint.
+    #  @param object endpoint   Report endpoint which exported job.
+    #  @param str    job_id     Job identifier of report export.
+    #  @return object @see ExportJob
+    def add_report(self, endpoint, job_id, deadline=None):
+        """Track a report export job placed on queue by an endpoint's
+        export(), polled as by its fetch() with adaptive delays.
+
+            :param EndpointBase endpoint:   Report endpoint.
+            :param str job_id:              Job identifier of report export.
+            :param Deadline deadline:       Deadline, or seconds from now,
+                                            by which job must complete.
+            :rtype: ExportJob
+        """
+        if hasattr(endpoint, "_export_status_endpoint"):
+            export_controller, export_action = \
+                endpoint._export_status_endpoint()
+        else:
+            export_controller, export_action = "export", "download"
+
+        return self.add(
+            export_controller,
+            export_action,
+            job_id,
+            endpoint.auth_key,
+            endpoint.auth_type,
+            sleep=endpoint.status_sleep,
+            timeout=endpoint.status_timeout,
+            deadline=deadline,
+            schedule=PollSchedule(endpoint.status_sleep, endpoint.controller),
+            journal=ExportJournal.default_journal()
+        )
+
+    #  Push job on heap, due in provided seconds.
+    def _schedule(self, job, delay):
+        with self.__condition:
+            heapq.heappush(
+                self.__heap,
+                (__clock__() + delay, next(self.__sequence), job)
+            )
+            self.__condition.notify_all()
+
+    def poll(self):
+        """Poll status of every job due, once.
+
+            :return: Seconds until next job is due, None if no job
+                is pending.
+            :rtype: float
+        """
+        while True:
+            with self.__condition:
+                if not self.__heap:
+                    return None
+                due, _, job = self.__heap[0]
+                delay = due - __clock__()
+                if delay > 0:
+                    return delay
+                heapq.heappop(self.__heap)
+
+            delay = job._poll(self.__verbose)
+            if delay is not None:
+                self._schedule(job, delay)
+
+    def run(self):
+        """Poll jobs within calling thread until every job is resolved."""
+        while True:
+            self.poll()
+            with self.__condition:
+                if not self.__heap:
+                    return
+                self.__wait()
+
+    #  Wait until next job is due or a job is added, holding condition.
+    def __wait(self):
+        delay = None
+        if self.__heap:
+            delay = self.__heap[0][0] - __clock__()
+            if delay <= 0:
+                return
+        self.__condition.wait(delay)
+
+    def start(self):
+        """Poll jobs within a background thread until stopped.
+
+            :return: self
+        """
+        with self.__condition:
+            if self.__thread is not None:
+                return self
+            self.__stopped = False
+            self.__thread = threading.Thread(target=self.__serve)
+            self.__thread.daemon = True
+            self.__thread.start()
+        return self
+
+    def stop(self):
+        """Stop background thread started by start(), leaving pending
+        jobs unresolved."""
+        with self.__condition:
+            thread = self.__thread
+            self.__stopped = True
+            self.__thread = None
+            self.__condition.notify_all()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def stop_when_idle(self):
+        """Let background thread stop by itself once every job is
+        resolved, without waiting. Thread started again by start() for
+        jobs added later stops likewise."""
+        with self.__condition:
+            self.__draining = True
+            self.__condition.notify_all()
+
+    def __serve(self):
+        while True:
+            with self.__condition:
+                if self.__stopped:
+                    return
+            self.poll()
+            with self.__condition:
+                if self.__stopped:
+                    return
+                if self.__draining and not self.__heap:
+                    if self.__thread is threading.current_thread():
+                        self.__thread = None
+                    return
+                self.__wait()
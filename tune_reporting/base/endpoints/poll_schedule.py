@@ -0,0 +1,326 @@
+"""
+TUNE Reports Export Poll Schedule
+=============================================
+"""
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  poll_schedule.py
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+
+import collections
+import math
+import threading
+
+#  Keys of export status 'data' reporting progress in percent.
+__progress_keys__ = ("percent_complete", "progress")
+
+
+## Completion times of report exports per report controller.
+#
+class CompletionHistory(object):
+    """Completion times of the most recent report exports of every
+    report controller, shared by polling schedules to learn how long
+    exports of each report take."""
+
+    #  Shared history
+    #  @var CompletionHistory
+    __shared = None
+
+    #  @var object
+    __shared_lock = threading.Lock()
+
+    #  Samples kept per controller.
+    #  @var int
+    __window = None
+
+    #  Completion times per controller.
+    #  @var dict
+    __samples = None
+
+    #  @var object
+    __lock = None
+
+    #  The constructor
+    #
+    #  @param int window    Samples kept per controller.
+    #
+    def __init__(self, window=50):
+        """The constructor.
+
+            :param int window:  Most recent completion times kept per
+                                report controller.
+        """
+        if not isinstance(window, int) or window < 1:
+            raise ValueError(
+                "Parameter 'window' is not valid: '{}'".format(window)
+            )
+        self.__window = window
+        self.__samples = {}
+        self.__lock = threading.Lock()
+
+    @classmethod
+    def shared_history(cls):
+        """Completion history shared by the SDK.
+
+            :rtype: CompletionHistory
+        """
+        with cls.__shared_lock:
+            if cls.__shared is None:
+                cls.__shared = cls()
+            return cls.__shared
+
+    @classmethod
+    def configure(cls, *args, **kwargs):
+        """Replace the completion history shared by the SDK.
+
+            :rtype: CompletionHistory
+        """
+        history = cls(*args, **kwargs)
+        with cls.__shared_lock:
+            cls.__shared = history
+        return history
+
+    def record(self, controller, seconds):
+        """Record completion time of a report export.
+
+            :param str controller:  Report controller.
+            :param float seconds:   Time from first poll until complete.
+        """
+        with self.__lock:
+            samples = self.__samples.get(controller)
+            if samples is None:
+                samples = collections.deque(maxlen=self.__window)
+                self.__samples[controller] = samples
+            samples.append(seconds)
+
+    def expected(self, controller):
+        """Median completion time of a report controller's exports.
+
+            :param str controller:  Report controller.
+            :return: Seconds, None without history.
+            :rtype: float
+        """
+        with self.__lock:
+            samples = sorted(self.__samples.get(controller, ()))
+        if not samples:
+            return None
+        return samples[len(samples) // 2]
+
+
+## Adaptive delays between export status polls.
+#
+class PollSchedule(object):
+    """Adaptive delays between export status polls.
+
+    Without other information, delays start short and grow exponentially
+    up to `maximum`, the caller's sleep ceiling, so small exports are
+    picked up quickly. A progress percentage reported within the status
+    response, or else the median completion time of the report
+    controller's previous exports, is used to wait until the export is
+    expected to complete. Delays only exceed `maximum` if the caller
+    raises `estimate_maximum`: delays then grow with time elapsed by
+    `elapsed_ratio`, and estimates may wait up to it, so large exports
+    are polled less often, detected within a fraction of their duration.
+    """
+
+    #  @var float
+    __initial = None
+
+    #  @var float
+    __factor = None
+
+    #  @var float
+    __maximum = None
+
+    #  @var float
+    __estimate_maximum = None
+
+    #  @var float
+    __elapsed_ratio = None
+
+    #  @var str
+    __controller = None
+
+    #  @var CompletionHistory
+    __history = None
+
+    #  The constructor
+    #
+    #  @param float maximum             Cap of exponential delays.
+    #  @param str   controller          Report controller.
+    #  @param float initial             First delay.
+    #  @param float factor              Growth of delays.
+    #  @param float estimate_maximum    Cap of estimated delays.
+    #  @param float elapsed_ratio       Delay per second elapsed.
+    #  @param object history            CompletionHistory.
+    #
+    def __init__(self,
+                 maximum=10,
+                 controller=None,
+                 initial=0.5,
+                 factor=2.0,
+                 estimate_maximum=None,
+                 elapsed_ratio=0.25,
+                 history=None):
+        """The constructor.
+
+            :param float maximum:           Cap of exponentially growing
+                                            delays, as status_sleep.
+                                            0 polls without delay.
+            :param str controller:          Report controller, whose
+                                            completion times are learned.
+            :param float initial:           Delay after first poll.
+            :param float factor:            Growth of delays.
+            :param float estimate_maximum:  Cap of delays estimated from
+                                            progress or history, and of
+                                            delays grown with time elapsed;
+                                            'maximum' if not provided.
+            :param float elapsed_ratio:     Delay per second elapsed once
+                                            'maximum' is reached.
+            :param CompletionHistory history: Completion times, shared
+                                            history if not provided.
+        """
+        if maximum < 0:
+            raise ValueError(
+                "Parameter 'maximum' is not valid: '{}'".format(maximum)
+            )
+        if initial <= 0:
+            raise ValueError(
+                "Parameter 'initial' is not valid: '{}'".format(initial)
+            )
+        if factor < 1:
+            raise ValueError(
+                "Parameter 'factor' is not valid: '{}'".format(factor)
+            )
+        self.__maximum = float(maximum)
+        self.__controller = controller
+        self.__initial = float(initial)
+        self.__factor = float(factor)
+        if estimate_maximum is None:
+            estimate_maximum = maximum
+        self.__estimate_maximum = max(float(estimate_maximum), self.__maximum)
+        self.__elapsed_ratio = float(elapsed_ratio)
+        self.__history = history or CompletionHistory.shared_history()
+
+    @property
+    def controller(self):
+        """Report controller."""
+        return self.__controller
+
+    @property
+    def history(self):
+        """Completion times of report exports."""
+        return self.__history
+
+    @staticmethod
+    def progress(response):
+        """Progress percentage reported by export status response.
+
+            :param TuneServiceResponse response:
+            :return: Percent, None if not reported.
+            :rtype: float
+        """
+        data = getattr(response, "data", None)
+        if not isinstance(data, dict):
+            return None
+        for key in __progress_keys__:
+            value = data.get(key)
+            if value is None:
+                continue
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
+                continue
+            if 0 < value < 100:
+                return value
+        return None
+
+    def delay(self, attempt, elapsed, response=None):
+        """Seconds to wait before next poll.
+
+            :param int attempt:     Polls sent so far, starting at 1.
+            :param float elapsed:   Seconds since first poll.
+            :param TuneServiceResponse response: Last status response.
+            :rtype: float
+        """
+        if self.__maximum == 0:
+            return 0.0
+
+        # Exponent is capped once delays reach maximum, so it never
+        # overflows however long export is polled.
+        exponent = max(0, attempt - 1)
+        if self.__factor > 1:
+            if self.__initial < self.__maximum:
+                exponent = min(exponent, int(math.ceil(math.log(
+                    self.__maximum / self.__initial, self.__factor
+                ))))
+            else:
+                exponent = 0
+        delay = min(
+            self.__maximum,
+            self.__initial * self.__factor ** exponent
+        )
+        if delay == self.__maximum:
+            delay = min(
+                self.__estimate_maximum,
+                max(delay, elapsed * self.__elapsed_ratio)
+            )
+
+        estimate = None
+        percent = self.progress(response)
+        if percent is not None and elapsed > 0:
+            estimate = elapsed * (100.0 - percent) / percent
+        elif self.__controller is not None:
+            expected = self.__history.expected(self.__controller)
+            if expected is not None and elapsed < expected:
+                estimate = expected - elapsed
+
+        if estimate is not None:
+            delay = min(
+                self.__estimate_maximum,
+                max(self.__initial, estimate)
+            )
+
+        return delay
+
+    def complete(self, elapsed):
+        """Record completion time of export.
+
+            :param float elapsed:   Seconds from first poll until complete.
+        """
+        if self.__controller is not None:
+            self.__history.record(self.__controller, elapsed)
@@ -43,6 +43,7 @@ TUNE Reports Export Status Worker
 import time
 
 from tune_reporting.helpers import (
+    Deadline,
     TuneSdkException,
     TuneServiceException
 )
@@ -50,6 +51,11 @@ from tune_reporting.base.service import (
     TuneServiceClient
 )
 
+if hasattr(time, "monotonic"):
+    __clock__ = time.monotonic
+else:
+    __clock__ = time.time
+
 
 #  Worker for handle polling of report request on export queue.
 #
@@ -92,6 +98,21 @@ class ReportExportWorker(object):
     #
     __timeout = None
 
+    #
+    #  @var object @see Deadline
+    #
+    __deadline = None
+
+    #
+    #  @var object @see PollSchedule
+    #
+    __schedule = None
+
+    #
+    #  @var object @see ExportJournal
+    #
+    __journal = None
+
     #
     #  @var boolean
     #
@@ -116,6 +137,10 @@ class ReportExportWorker(object):
     #  @param int   sleep               Polling delay between querying job
     #                                   status on export queue.
     #  @param int   timeout             Poll until exceeds timeout.
+    #  @param object deadline           Deadline or seconds bounding
+    #                                   polling and its requests.
+    #  @param object schedule           PollSchedule.
+    #  @param object journal            ExportJournal.
     #
     def __init__(self,
                  export_controller,
@@ -125,7 +150,10 @@ class ReportExportWorker(object):
                  job_id,
                  verbose=False,
                  sleep=10,
-                 timeout=0):
+                 timeout=0,
+                 deadline=None,
+                 schedule=None,
+                 journal=None):
         """The constructor.
 
             :param str      export_controller:  Export controller.
@@ -142,6 +170,15 @@ class ReportExportWorker(object):
             :param int      sleep:              Polling delay between querying
                                                 job status on export queue.
             :param int      timeout:            Poll until exceeds timeout.
+            :param Deadline deadline:           Deadline, or seconds from
+                                                now, by which polling must
+                                                complete, including its
+                                                requests.
+            :param PollSchedule schedule:       Adaptive delays between
+                                                polls, fixed delay of
+                                                'sleep' if not provided.
+            :param ExportJournal journal:       Journal recording job's
+                                                status transitions.
         """
         # export_controller
         if not export_controller or len(export_controller) < 1:
@@ -176,6 +213,9 @@ class ReportExportWorker(object):
         self.__job_id = job_id
         self.__sleep = sleep
         self.__timeout = timeout
+        self.__deadline = Deadline.create(deadline)
+        self.__schedule = schedule
+        self.__journal = journal
         self.__verbose = verbose
         self.__response = None
 
@@ -185,13 +225,20 @@ class ReportExportWorker(object):
         """Poll status until status of "complete" or "fail" to
         gather download URL for report export.
 
+        Timeout is measured by a monotonic clock from start of polling,
+        including time spent waiting for responses.
+
             :return: True upon success.
             :rtype: bool
+            :throws: TuneSdkException once timeout or deadline passed.
         """
         status = None
         response = None
         attempt = 0
-        total_time = 0
+
+        timeout = Deadline(self.__timeout) if self.__timeout > 0 else None
+        deadline = Deadline.earliest(timeout, self.__deadline)
+        start = __clock__()
 
         client = TuneServiceClient(
             self.__export_controller,
@@ -205,62 +252,48 @@ class ReportExportWorker(object):
 
         try:
             while True:
-                if self.__timeout > 0:
-                    if total_time >= self.__timeout:
-                        raise TuneSdkException(
-                            "Exceeded timeout."
-                        )
-                    total_time += self.__sleep
-
-                client.call()
-
-                response = client.response
-
-                # Failed to return response.
-                if not response:
+                if timeout is not None and timeout.expired:
                     raise TuneSdkException(
-                        "No response returned from export request."
+                        "Exceeded timeout."
                     )
+                if self.__deadline is not None:
+                    self.__deadline.check()
 
-                # Failed to get successful service response.
-                if response.http_code != 200 or response.errors:
-                    raise TuneServiceException(
-                        "Service failed:\nHTTP Code: {}:\n Service Error: {}".format(
-                            response.http_code,
-                            str(response)
-                        )
-                    )
+                client.call(deadline)
 
-                # Failed to get data.
-                if not response.data:
-                    raise TuneSdkException(
-                        "No response data returned from export,"
-                        "response: {}".format(
-                            str(response)
-                        )
-                    )
+                response = client.response
 
-                # Failed to get status.
-                if "status" not in response.data:
-                    raise TuneSdkException(
-                        "Export data does not contain report 'status',"
-                        "response: {}".format(
-                            str(response)
-                        )
+                status = self.parse_status(response)
+                if self.__journal is not None:
+                    self.__journal.status(
+                        self.__job_id,
+                        status,
+                        response.json,
+                        self.__export_controller,
+                        self.__export_action
                     )
-
-                # Get status.
-                status = response.data["status"]
-                if status == "complete" or status == "fail":
+                attempt += 1
+                if status == "complete":
+                    if self.__schedule is not None:
+                        self.__schedule.complete(__clock__() - start)
+                    break
+                if status == "fail":
                     break
 
-                attempt += 1
                 if self.__verbose:
                     print(
                         " attempt: {}, response: {}".format(attempt, response)
                     )
 
-                time.sleep(self.__sleep)
+                sleep = self.__sleep
+                if self.__schedule is not None:
+                    sleep = self.__schedule.delay(
+                        attempt, __clock__() - start, response
+                    )
+                if deadline is not None:
+                    deadline.sleep(sleep)
+                else:
+                    time.sleep(sleep)
         except (TuneSdkException, TuneServiceException):
             raise
         except Exception as ex:
@@ -278,6 +311,56 @@ class ReportExportWorker(object):
 
         return True
 
+    ## Validate export status response and gather its status.
+    #
+    #  @param object response @see TuneServiceResponse
+    #  @return str status
+    #  @throws TuneSdkException
+    #  @throws TuneServiceException
+    @staticmethod
+    def parse_status(response):
+        """Validate export status response and gather its status.
+
+            :param (TuneServiceResponse) response:
+            :return (str): Report export status, as 'complete' or 'fail'.
+            :throws: TuneSdkException
+            :throws: TuneServiceException
+        """
+        # Failed to return response.
+        if not response:
+            raise TuneSdkException(
+                "No response returned from export request."
+            )
+
+        # Failed to get successful service response.
+        if response.http_code != 200 or response.errors:
+            raise TuneServiceException(
+                "Service failed:\nHTTP Code: {}:\n Service Error: {}".format(
+                    response.http_code,
+                    str(response)
+                )
+            )
+
+        # Failed to get data.
+        if not response.data:
+            raise TuneSdkException(
+                "No response data returned from export,"
+                "response: {}".format(
+                    str(response)
+                )
+            )
+
+        # Failed to get status.
+        if "status" not in response.data:
+            raise TuneSdkException(
+                "Export data does not contain report 'status',"
+                "response: {}".format(
+                    str(response)
+                )
+            )
+
+        return response.data["status"]
+
     @property
     def response(self):
         """Property that will hold completed report downloaded
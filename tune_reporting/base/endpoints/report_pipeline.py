@@ -0,0 +1,600 @@
+"""
+TUNE Reports Pipeline
+=============================================
+"""
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  report_pipeline.py
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+
+import codecs
+import collections
+import csv
+import sys
+import tempfile
+import threading
+import time
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+from tune_reporting.helpers import (
+    TuneSdkException
+)
+from tune_reporting.helpers.json_stream_parser import (
+    JsonStreamParser
+)
+from tune_reporting.base.service import (
+    TuneServiceProxy
+)
+from .export_poller import (
+    ExportPoller
+)
+
+if hasattr(time, "monotonic"):
+    __clock__ = time.monotonic
+else:
+    __clock__ = time.time
+
+#  Stages of ReportPipeline in order.
+TUNE_PIPELINE_STAGES = ("export", "poll", "download", "parse")
+
+#  Outcome of a report run through ReportPipeline.
+PipelineResult = collections.namedtuple(
+    "PipelineResult", ["key", "result", "error"]
+)
+
+
+## Throughput statistics of a pipeline stage.
+#
+class StageStats(object):
+    """Throughput statistics of a pipeline stage."""
+
+    #  @var str
+    __name = None
+
+    #  @var int
+    __workers = None
+
+    #  @var int
+    __items = 0
+
+    #  @var int
+    __errors = 0
+
+    #  Seconds spent processing items, summed over workers.
+    #  @var float
+    __busy = 0.0
+
+    #  @var int
+    __bytes = 0
+
+    #  @var int
+    __rows = 0
+
+    #  @var float
+    __started = None
+
+    #  @var object
+    __lock = None
+
+    def __init__(self, name, workers):
+        """The constructor.
+
+            :param str name:        Stage name.
+            :param int workers:     Concurrency of stage.
+        """
+        self.__name = name
+        self.__workers = workers
+        self.__lock = threading.Lock()
+        self.__started = __clock__()
+
+    def record(self, seconds, error=False, size=0, rows=0):
+        """Record an item processed by stage.
+
+            :param float seconds:   Time spent processing item.
+            :param bool error:      Whether processing failed.
+            :param int size:        Bytes processed.
+            :param int rows:        Rows processed.
+        """
+        with self.__lock:
+            self.__items += 1
+            if error:
+                self.__errors += 1
+            self.__busy += seconds
+            self.__bytes += size
+            self.__rows += rows
+
+    @property
+    def name(self):
+        """Stage name."""
+        return self.__name
+
+    @property
+    def workers(self):
+        """Concurrency of stage."""
+        return self.__workers
+
+    @property
+    def items(self):
+        """Items processed."""
+        return self.__items
+
+    @property
+    def errors(self):
+        """Items failed."""
+        return self.__errors
+
+    @property
+    def busy(self):
+        """Seconds spent processing items, summed over workers."""
+        return self.__busy
+
+    @property
+    def bytes(self):
+        """Bytes processed."""
+        return self.__bytes
+
+    @property
+    def rows(self):
+        """Rows processed."""
+        return self.__rows
+
+    @property
+    def elapsed(self):
+        """Seconds since pipeline started."""
+        return __clock__() - self.__started
+
+    @property
+    def throughput(self):
+        """Items processed per second since pipeline started."""
+        elapsed = self.elapsed
+        return self.__items / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def utilization(self):
+        """Share of stage's capacity spent processing, between 0 and 1."""
+        capacity = self.elapsed * self.__workers
+        return min(1.0, self.__busy / capacity) if capacity > 0 else 0.0
+
+    def __str__(self):
+        return (
+            "{}: items={}, errors={}, throughput={:.2f}/s, "
+            "utilization={:.0%}, bytes={}, rows={}"
+        ).format(
+            self.__name, self.__items, self.__errors, self.throughput,
+            self.utilization, self.__bytes, self.__rows
+        )
+
+
+#  Report moving through pipeline.
+#
+class _Item(object):
+    """Report moving through pipeline."""
+
+    def __init__(self, key, endpoint, map_params, deadline):
+        self.key = key
+        self.endpoint = endpoint
+        self.map_params = map_params
+        self.deadline = deadline
+        self.report_url = None
+        self.spool = None
+
+
+## Runs report exports through overlapped export, poll, download and
+#  parse stages.
+#
+class ReportPipeline(object):
+    """Runs report exports through overlapped stages:
+
+    - export: export requests, sent by 'export_workers' threads;
+    - poll: export status of up to 'poll_capacity' jobs, polled by a
+      single ExportPoller thread;
+    - download: completed reports spooled to temporary files by
+      'download_workers' threads;
+    - parse: rows of spooled reports passed to handler by
+      'parse_workers' threads.
+
+    Stages are connected by bounded queues, so a slow stage holds back
+    the ones before it, down to submit(), instead of buffering reports
+    without limit. Downloads and parsing of completed reports overlap
+    with polling of the others.
+    """
+
+    #  Called with (key, rows) of each report.
+    #  @var callable
+    __handler = None
+
+    #  @var dict of StageStats
+    __stats = None
+
+    #  @var object @see ExportPoller
+    __poller = None
+
+    #  Jobs exported, not yet downloaded.
+    #  @var object
+    __polling = None
+
+    #  @var object
+    __export_queue = None
+
+    #  @var object
+    __download_queue = None
+
+    #  @var object
+    __parse_queue = None
+
+    #  @var object
+    __results = None
+
+    #  Worker threads of each queue.
+    #  @var list
+    __workers = None
+
+    #  @var str
+    __spool_dir = None
+
+    #  @var int
+    __submitted = 0
+
+    #  @var int
+    __delivered = 0
+
+    #  @var bool
+    __closed = False
+
+    #  @var object
+    __lock = None
+
+    #  The constructor
+    #
+    #  @param callable handler          Called with (key, rows).
+    #  @param int   export_workers      Concurrent export requests.
+    #  @param int   poll_capacity       Jobs polled concurrently.
+    #  @param int   download_workers    Concurrent downloads.
+    #  @param int   parse_workers       Concurrent parsing.
+    #  @param int   queue_size          Bound of queues between stages.
+    #  @param str   spool_dir           Directory of spooled reports.
+    #
+    def __init__(self,
+                 handler,
+                 export_workers=2,
+                 poll_capacity=50,
+                 download_workers=4,
+                 parse_workers=2,
+                 queue_size=8,
+                 spool_dir=None):
+        """The constructor.
+
+            :param callable handler:    Called with (key, rows) of each
+                                        completed report from a parse
+                                        worker, rows being lists of CSV
+                                        values, header first, or objects
+                                        of a JSON report. Its return
+                                        value is the report's result.
+            :param int export_workers:  Export requests sent concurrently.
+            :param int poll_capacity:   Jobs polled or downloaded
+                                        concurrently; further exports wait
+                                        for a report to be downloaded.
+            :param int download_workers:    Reports downloaded
+                                            concurrently.
+            :param int parse_workers:   Reports parsed concurrently.
+            :param int queue_size:      Reports waiting for export or
+                                        parsing, beyond which submit() and
+                                        downloads block.
+            :param str spool_dir:       Directory of temporary files of
+                                        downloaded reports.
+        """
+        if not callable(handler):
+            raise ValueError(
+                "Parameter 'handler' is not callable."
+            )
+        for name, value in (("export_workers", export_workers),
+                            ("poll_capacity", poll_capacity),
+                            ("download_workers", download_workers),
+                            ("parse_workers", parse_workers),
+                            ("queue_size", queue_size)):
+            if value < 1:
+                raise ValueError(
+                    "Parameter '{}' is not valid: '{}'".format(name, value)
+                )
+
+        self.__handler = handler
+        self.__spool_dir = spool_dir
+        self.__stats = dict(
+            (name, StageStats(name, workers)) for name, workers in zip(
+                TUNE_PIPELINE_STAGES,
+                (export_workers, poll_capacity, download_workers,
+                 parse_workers)
+            )
+        )
+        self.__poller = ExportPoller()
+        self.__polling = threading.BoundedSemaphore(poll_capacity)
+        self.__export_queue = queue.Queue(queue_size)
+        # Holds at most poll_capacity jobs, so completed jobs never block
+        # polling thread.
+        self.__download_queue = queue.Queue()
+        self.__parse_queue = queue.Queue(queue_size)
+        self.__results = queue.Queue()
+        self.__submitted = 0
+        self.__delivered = 0
+        self.__closed = False
+        self.__lock = threading.Lock()
+
+        self.__workers = (
+            (self.__export_queue, self.__export, export_workers),
+            (self.__download_queue, self.__download, download_workers),
+            (self.__parse_queue, self.__parse, parse_workers)
+        )
+        for _, target, workers in self.__workers:
+            for _ in range(workers):
+                thread = threading.Thread(target=target)
+                thread.daemon = True
+                thread.start()
+        self.__poller.start()
+
+    @property
+    def stats(self):
+        """Statistics of each stage.
+
+            :rtype: dict of StageStats
+        """
+        return self.__stats
+
+    ## Submit report export, blocking while export queue is full.
+    #  @param object endpoint   Report endpoint.
+    #  @param dict   map_params Parameters of endpoint's export().
+    #  @param object key        Identifies report within results.
+    #  @param object deadline   Deadline or seconds.
+    def submit(self, endpoint, map_params, key=None, deadline=None):
+        """Submit report export, blocking while export queue is full.
+
+            :param EndpointBase endpoint:   Report endpoint.
+            :param dict map_params:         Parameters of endpoint's
+                                            export().
+            :param object key:              Identifies report within
+                                            results, submission index if
+                                            not provided.
+            :param Deadline deadline:       Deadline, or seconds from now,
+                                            by which report must complete.
+        """
+        with self.__lock:
+            if self.__closed:
+                raise TuneSdkException("Pipeline is closed.")
+            if key is None:
+                key = self.__submitted
+            self.__submitted += 1
+        self.__export_queue.put(_Item(key, endpoint, map_params, deadline))
+
+    def close(self):
+        """No further reports are submitted."""
+        with self.__lock:
+            self.__closed = True
+            finished = self.__delivered == self.__submitted
+        if finished:
+            self.__stop()
+
+    def results(self):
+        """Results of reports in order completed, until every report
+        submitted before close() is completed.
+
+            :rtype: generator of PipelineResult
+        """
+        while True:
+            result = self.__results.get()
+            if result is None:
+                self.__results.put(None)
+                return
+            yield result
+
+    ## Run reports through pipeline.
+    #  @param iterable exports  (endpoint, map_params) or
+    #                           (endpoint, map_params, key).
+    #  @return generator of PipelineResult
+    def run(self, exports):
+        """Submit reports from a feeding thread, then close pipeline.
+
+            :param iterable exports:    (endpoint, map_params) or
+                                        (endpoint, map_params, key).
+            :return: Results in order completed.
+            :rtype: generator of PipelineResult
+        """
+        def feed():
+            try:
+                for export in exports:
+                    self.submit(*export)
+            finally:
+                self.close()
+
+        thread = threading.Thread(target=feed)
+        thread.daemon = True
+        thread.start()
+        return self.results()
+
+    #  Deliver outcome of a report.
+    def __deliver(self, item, result=None, error=None):
+        if item.spool is not None:
+            item.spool.close()
+            item.spool = None
+        self.__results.put(PipelineResult(item.key, result, error))
+        with self.__lock:
+            self.__delivered += 1
+            finished = self.__closed and \
+                self.__delivered == self.__submitted
+        if finished:
+            self.__stop()
+
+    #  Stop workers and wake up results() once every report delivered.
+    def __stop(self):
+        for stage_queue, _, workers in self.__workers:
+            for _ in range(workers):
+                stage_queue.put(None)
+        self.__results.put(None)
+        self.__poller.stop()
+
+    def __export(self):
+        while True:
+            item = self.__export_queue.get()
+            if item is None:
+                return
+            self.__polling.acquire()
+            start = __clock__()
+            try:
+                response = item.endpoint.export(item.map_params)
+                job_id = item.endpoint.parse_response_report_job_id(response)
+            except Exception as ex:
+                self.__stats["export"].record(__clock__() - start, True)
+                self.__polling.release()
+                self.__deliver(item, error=ex)
+                continue
+            self.__stats["export"].record(__clock__() - start)
+
+            polled = __clock__()
+            job = self.__poller.add_report(
+                item.endpoint, job_id, item.deadline
+            )
+            job.add_done_callback(
+                lambda job, item=item, polled=polled:
+                    self.__polled(item, job, polled)
+            )
+
+    #  Called by polling thread once job is resolved.
+    def __polled(self, item, job, polled):
+        error = job.error
+        if error is None:
+            try:
+                item.report_url = item.endpoint.parse_response_report_url(
+                    job.response
+                )
+            except Exception as ex:
+                error = ex
+        self.__stats["poll"].record(__clock__() - polled, error is not None)
+        if error is not None:
+            self.__polling.release()
+            self.__deliver(item, error=error)
+            return
+        self.__download_queue.put(item)
+
+    def __download(self):
+        while True:
+            item = self.__download_queue.get()
+            if item is None:
+                return
+            start = __clock__()
+            size = 0
+            try:
+                proxy = TuneServiceProxy(item.report_url)
+                proxy.execute()
+                item.spool = tempfile.TemporaryFile(dir=self.__spool_dir)
+                for chunk in iter(lambda: proxy.response.read(65536), b""):
+                    item.spool.write(chunk)
+                    size += len(chunk)
+                item.spool.seek(0)
+                self.__polling.release()
+            except Exception as ex:
+                self.__polling.release()
+                self.__stats["download"].record(
+                    __clock__() - start, True, size
+                )
+                self.__deliver(item, error=TuneSdkException(
+                    "Failed to download report: (Error:{0})".format(
+                        str(ex)
+                    ),
+                    ex
+                ))
+                continue
+            self.__stats["download"].record(__clock__() - start, size=size)
+            self.__parse_queue.put(item)
+
+    def __parse(self):
+        while True:
+            item = self.__parse_queue.get()
+            if item is None:
+                return
+            start = __clock__()
+            counted = None
+            try:
+                # Within try: a report which cannot be parsed is delivered
+                # as its item's error.
+                counted = _Counter(self.__rows(item))
+                result = self.__handler(item.key, counted)
+            except Exception as ex:
+                self.__stats["parse"].record(
+                    __clock__() - start, True,
+                    rows=counted.count if counted is not None else 0
+                )
+                self.__deliver(item, error=ex)
+                continue
+            self.__stats["parse"].record(
+                __clock__() - start, rows=counted.count
+            )
+            self.__deliver(item, result=result)
+
+    #  Rows of spooled report.
+    @staticmethod
+    def __rows(item):
+        report_format = item.map_params.get("format", "csv") \
+            if isinstance(item.map_params, dict) else "csv"
+        if report_format == "json":
+            return JsonStreamParser(item.spool).iter_array()
+        if sys.version_info >= (3, 0, 0):
+            return csv.reader(
+                codecs.iterdecode(item.spool, "utf-8"), dialect=csv.excel
+            )
+        return csv.reader(item.spool, dialect=csv.excel)
+
+
+#  Iterator counting items it yielded.
+#
+class _Counter(object):
+    """Iterator counting items it yielded."""
+
+    def __init__(self, iterable):
+        self.iterator = iter(iterable)
+        self.count = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        value = next(self.iterator)
+        self.count += 1
+        return value
+
+    next = __next__
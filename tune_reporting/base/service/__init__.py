@@ -38,5 +38,53 @@
 #  @link      https://developers.mobileapptracking.com @endlink
 #
 
+import sys
+
 from .tune_service_client import TuneServiceClient
+from .tune_service_response_stream import TuneServiceResponseStream
 from .tune_service_proxy import TuneServiceProxy
+from .transport import (
+    Transport,
+    UrllibTransport
+)
+from .connection_pool import ConnectionPool
+from .replay_transport import (
+    RecordingTransport,
+    ReplayTransport
+)
+from .rate_limiter import (
+    RateLimiter,
+    TokenBucket,
+    TUNE_ACTION_CLASS_QUERY,
+    TUNE_ACTION_CLASS_EXPORT,
+    TUNE_ACTION_CLASS_STATUS
+)
+from .single_flight import SingleFlight
+from .hedge_policy import (
+    HedgePolicy,
+    LatencyTracker
+)
+from .circuit_breaker import (
+    Circuit,
+    CircuitBreaker,
+    TuneCircuitOpenException,
+    TUNE_CIRCUIT_CLOSED,
+    TUNE_CIRCUIT_OPEN,
+    TUNE_CIRCUIT_HALF_OPEN
+)
+from .retry_policy import (
+    RetryBudget,
+    RetryPolicy
+)
+from .constants import (
+    TUNE_REQUEST_MODE_AUTO,
+    TUNE_REQUEST_MODE_QUERY,
+    TUNE_REQUEST_MODE_FORM,
+    TUNE_REQUEST_MODE_JSON
+)
+
+if sys.version_info >= (3, 5, 0):
+    from .async_tune_service_client import (
+        AsyncConnectionPool,
+        AsyncTuneServiceClient
+    )
@@ -0,0 +1,637 @@
+"""
+TUNE Service Client for asyncio
+=============================================
+"""
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  async_tune_service_client.py
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 3.5 and above
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+import asyncio
+import email.parser
+import http.client
+import io
+import json
+import socket
+import ssl
+import time
+import urllib.error
+import urllib.parse
+import weakref
+
+from tune_reporting.helpers import (
+    Deadline,
+    TuneSdkException
+)
+from tune_reporting.version import (
+    __sdk_name__,
+    __sdk_version__
+)
+from .constants import (
+    TUNE_REQUEST_MODE_AUTO,
+    __tune_management_api_endpoint__,
+    __tune_management_api_timeout__,
+    __tune_management_api_version__
+)
+from .content_decoder import (
+    ContentDecoder,
+    __accept_encoding__
+)
+from .circuit_breaker import (
+    CircuitBreaker,
+    TuneCircuitOpenException
+)
+from .rate_limiter import (RateLimiter)
+from .retry_policy import (RetryPolicy)
+from .tune_service_request import (TuneManagementRequest)
+from .tune_service_response import (TuneServiceResponse)
+
+#  HTTP status codes answered with a 'Location' to follow.
+__redirect_codes__ = (301, 302, 303, 307, 308)
+
+#  Maximum number of redirects followed for a single request.
+__redirect_max__ = 5
+
+
+#  Response read from an asyncio connection.
+#
+class AsyncResponse(object):
+    """Response read from an asyncio connection, mimicking the response
+    object returned by urlopen().
+    """
+
+    __status = None
+    __headers = None
+    __body = None
+    __url = None
+
+    def __init__(self, status, headers, body, url):
+        """The constructor.
+
+            :param int status:      HTTP status code.
+            :param object headers:  HTTP headers.
+            :param bytes body:      Decoded response body.
+            :param str url:         Requested URL.
+        """
+        self.__status = status
+        self.__headers = headers
+        self.__body = io.BytesIO(body)
+        self.__url = url
+
+    def read(self, amt=None):
+        """Read response body."""
+        return self.__body.read(amt)
+
+    def readline(self, limit=-1):
+        """Read single line of response body."""
+        return self.__body.readline(limit)
+
+    def __iter__(self):
+        return iter(self.__body)
+
+    def getcode(self):
+        """HTTP status code of response."""
+        return self.__status
+
+    def info(self):
+        """HTTP headers of response."""
+        return self.__headers
+
+    def geturl(self):
+        """Requested URL."""
+        return self.__url
+
+    @property
+    def status(self):
+        """HTTP status code of response."""
+        return self.__status
+
+    @property
+    def headers(self):
+        """HTTP headers of response."""
+        return self.__headers
+
+
+#  Pool of persistent HTTP/1.1 asyncio connections per host.
+#
+class AsyncConnectionPool(object):
+    """Pool of persistent HTTP/1.1 asyncio connections per host.
+
+    The asyncio counterpart of ConnectionPool: one event loop drives any
+    number of concurrent requests without a thread per request.
+    """
+
+    #  Shared pool per event loop.
+    #  @var WeakKeyDictionary
+    __shared = weakref.WeakKeyDictionary()
+
+    __max_size = None
+    __idle_timeout = None
+    __compress = True
+    __idle = None
+
+    #  The constructor
+    #
+    #  @param int   max_size        Maximum idle connections per host.
+    #  @param float idle_timeout    Idle seconds before eviction.
+    #  @param bool  compress        Request gzip or deflate responses.
+    #
+    def __init__(self, max_size=10, idle_timeout=60, compress=True):
+        """The constructor.
+
+            :param int max_size:        Maximum idle connections per host.
+            :param float idle_timeout:  Idle seconds before a connection
+                                        is evicted.
+            :param bool compress:       Request compressed responses.
+        """
+        if not isinstance(max_size, int) or max_size < 1:
+            raise ValueError(
+                "Parameter 'max_size' is not valid: '{}'".format(max_size)
+            )
+        self.__max_size = max_size
+        self.__idle_timeout = idle_timeout
+        self.__compress = compress
+        self.__idle = {}
+
+    @classmethod
+    def shared_pool(cls):
+        """Connection pool shared by the SDK within running event loop.
+
+            :rtype: AsyncConnectionPool
+        """
+        loop = asyncio.get_event_loop()
+        pool = cls.__shared.get(loop)
+        if pool is None:
+            pool = cls()
+            cls.__shared[loop] = pool
+        return pool
+
+    def idle_count(self):
+        """Number of idle connections."""
+        return sum(len(idle) for idle in self.__idle.values())
+
+    async def urlopen(self, url, data=None, headers=None, timeout=None):
+        """Send HTTP request using a pooled connection.
+
+            :param str url:         Request URL.
+            :param bytes data:      Request body, sent with POST if provided.
+            :param dict headers:    Additional request headers.
+            :param float timeout:   Timeout of the whole request (seconds),
+                                    60 if not provided.
+            :return: AsyncResponse
+            :throws: HTTPError for HTTP status codes of 400 and above.
+            :throws: URLError upon connection failure or timeout.
+        """
+        if timeout is None:
+            timeout = __tune_management_api_timeout__
+        request = self._urlopen(url, data, headers)
+        try:
+            return await asyncio.wait_for(request, timeout)
+        except asyncio.TimeoutError:
+            raise urllib.error.URLError(socket.timeout("timed out"))
+
+    async def _urlopen(self, url, data, headers):
+        method = "GET" if data is None else "POST"
+
+        for _ in range(__redirect_max__ + 1):
+            status, response_headers, body = await self._request(
+                method, url, data, headers
+            )
+            if status not in __redirect_codes__:
+                break
+            location = response_headers.get("Location")
+            if not location:
+                break
+            url = urllib.parse.urljoin(url, location)
+            if status == 303 or (status in (301, 302) and method == "POST"):
+                method = "GET"
+                data = None
+
+        if status >= 400:
+            raise urllib.error.HTTPError(
+                url,
+                status,
+                http.client.responses.get(status, ""),
+                response_headers,
+                io.BytesIO(body)
+            )
+
+        return AsyncResponse(status, response_headers, body, url)
+
+    async def _request(self, method, url, data, headers):
+        """Send a single HTTP request, without following redirects.
+
+            :return: (status, headers, body)
+        """
+        parsed = urllib.parse.urlparse(url)
+        scheme = parsed.scheme.lower()
+        if scheme not in ("http", "https"):
+            raise ValueError("Unsupported URL scheme: '{}'".format(url))
+        port = parsed.port or (443 if scheme == "https" else 80)
+        key = (scheme, parsed.hostname, port)
+        selector = parsed.path or "/"
+        if parsed.query:
+            selector += "?" + parsed.query
+
+        request_headers = {
+            "Host": parsed.netloc,
+            "User-Agent": "{}/{}".format(__sdk_name__, __sdk_version__),
+            "Connection": "keep-alive"
+        }
+        if self.__compress:
+            request_headers["Accept-Encoding"] = __accept_encoding__
+        if data is not None:
+            request_headers["Content-Length"] = str(len(data))
+        if headers:
+            request_headers.update(headers)
+
+        head = "{} {} HTTP/1.1\r\n".format(method, selector)
+        for name, value in request_headers.items():
+            head += "{}: {}\r\n".format(name, value)
+        head += "\r\n"
+        payload = head.encode("latin-1") + (data or b"")
+
+        while True:
+            reader, writer, reused = await self._acquire(key)
+            try:
+                writer.write(payload)
+                await writer.drain()
+                status, response_headers, body, will_close = \
+                    await self._read_response(reader, method)
+            except (ConnectionError, asyncio.IncompleteReadError) as ex:
+                writer.close()
+                # Kept-alive connection was closed by server, retry
+                # with a new connection.
+                if reused:
+                    continue
+                raise urllib.error.URLError(ex)
+            except BaseException:
+                writer.close()
+                raise
+
+            if will_close:
+                writer.close()
+            else:
+                self._release(key, reader, writer)
+            return status, response_headers, body
+
+    async def _acquire(self, key):
+        """Get idle connection for pool key, or open a new one.
+
+            :return: (reader, writer, bool reused)
+        """
+        now = time.time()
+        idle = self.__idle.get(key, [])
+        while idle:
+            reader, writer, last_used = idle.pop()
+            if now - last_used <= self.__idle_timeout and \
+               not reader.at_eof():
+                return reader, writer, True
+            writer.close()
+
+        scheme, host, port = key
+        try:
+            reader, writer = await asyncio.open_connection(
+                host,
+                port,
+                ssl=ssl.create_default_context() if scheme == "https"
+                else None
+            )
+        except OSError as ex:
+            raise urllib.error.URLError(ex)
+        return reader, writer, False
+
+    def _release(self, key, reader, writer):
+        """Return connection to pool."""
+        idle = self.__idle.setdefault(key, [])
+        if len(idle) < self.__max_size:
+            idle.append((reader, writer, time.time()))
+        else:
+            writer.close()
+
+    def clear(self):
+        """Close all idle connections."""
+        for idle in self.__idle.values():
+            for _, writer, _ in idle:
+                writer.close()
+        self.__idle = {}
+
+    @staticmethod
+    async def _read_response(reader, method):
+        """Read HTTP/1.1 response.
+
+            :return: (status, headers, body, will_close)
+        """
+        status_line = await reader.readline()
+        if not status_line:
+            raise asyncio.IncompleteReadError(status_line, None)
+        version, status, _ = (
+            status_line.decode("latin-1").rstrip("\r\n") + "  "
+        ).split(" ", 2)
+        status = int(status)
+
+        lines = []
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            lines.append(line.decode("latin-1"))
+        headers = email.parser.Parser(
+            _class=http.client.HTTPMessage
+        ).parsestr("".join(lines))
+
+        connection = (headers.get("Connection") or "").lower()
+        will_close = connection == "close" or \
+            (version == "HTTP/1.0" and connection != "keep-alive")
+
+        transfer_encoding = (headers.get("Transfer-Encoding") or "").lower()
+        content_length = headers.get("Content-Length")
+        if method == "HEAD" or status in (204, 304) or 100 <= status < 200:
+            body = b""
+        elif transfer_encoding == "chunked":
+            chunks = []
+            while True:
+                size_line = await reader.readline()
+                size = int(size_line.split(b";", 1)[0].strip(), 16)
+                if size == 0:
+                    # Trailers
+                    while (await reader.readline()) not in \
+                            (b"\r\n", b"\n", b""):
+                        pass
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readline()
+            body = b"".join(chunks)
+        elif content_length is not None:
+            body = await reader.readexactly(int(content_length))
+        else:
+            body = await reader.read()
+            will_close = True
+
+        decoder = ContentDecoder.create(headers.get("Content-Encoding"))
+        if decoder is not None:
+            body = decoder.decompress(body) + decoder.flush()
+
+        return status, headers, body, will_close
+
+
+#  TUNE MobileAppTracking TUNE Reporting API access class for asyncio.
+#
+class AsyncTuneServiceClient(object):
+    """TUNE MobileAppTracking Service access class for asyncio.
+
+    Same request and response as TuneServiceClient, where call()
+    is a coroutine.
+    """
+    #
+    #  @var object @see TuneManagementRequest
+    #
+    __request = None
+
+    #
+    #  @var object @see TuneServiceResponse
+    #
+    __response = None
+
+    #
+    #  @var object @see AsyncConnectionPool
+    #
+    __pool = None
+
+    #
+    #  @var object @see RetryPolicy
+    #
+    __retry_policy = None
+
+    #
+    #  @var object @see RateLimiter
+    #
+    __rate_limiter = None
+
+    #
+    #  @var object @see CircuitBreaker
+    #
+    __circuit_breaker = None
+
+    #  Constructor
+    #
+    #  @param str      controller           TUNE Reporting API endpoint
+    #                                       name.
+    #  @param str      action               TUNE Reporting API endpoint's
+    #                                       action name.
+    #  @param str      auth_key             TUNE Reporting authentication key.
+    #  @param str      auth_type            TUNE Reporting authentication type.
+    #  @param null|array  map_query_string Action's query string parameters.
+    #  @param null|string api_url_endpoint  TUNE Reporting API endpoint path.
+    #  @param null|string api_url_version   TUNE Reporting API version.
+    #  @param null|object pool              AsyncConnectionPool.
+    #  @param str      request_mode         Parameters sent within query
+    #                                       string, form or JSON body.
+    #  @param null|object retry_policy      RetryPolicy.
+    #  @param null|object rate_limiter      RateLimiter.
+    #  @param null|object circuit_breaker   CircuitBreaker.
+    #
+    def __init__(self,
+                 controller,
+                 action,
+                 auth_key,
+                 auth_type,
+                 map_query_string=None,
+                 api_url_endpoint=__tune_management_api_endpoint__,
+                 api_url_version=__tune_management_api_version__,
+                 pool=None,
+                 request_mode=TUNE_REQUEST_MODE_AUTO,
+                 retry_policy=None,
+                 rate_limiter=None,
+                 circuit_breaker=None):
+        """The constructor.
+
+            :param str      controller:         TUNE Reporting API
+                                                endpoint name.
+            :param str      action:             TUNE Reporting API endpoint's
+                                                action name.
+            :param str      auth_key:           TUNE Reporting authentication
+                                                key.
+            :param str      auth_type:          TUNE Reporting authentication
+                                                type.
+            :param array    map_query_string:   Action's query string
+                                                parameters.
+            :param str      api_url_endpoint:   TUNE Reporting API
+                                                endpoint path.
+            :param str      api_url_version:    TUNE Reporting API version.
+            :param AsyncConnectionPool pool:    Pool of persistent
+                                                connections, shared pool of
+                                                event loop if not provided.
+            :param str      request_mode:       'query', 'form', 'json', or
+                                                'auto' for body only if URL
+                                                is too long.
+            :param RetryPolicy retry_policy:    Policy resending failed
+                                                requests, shared policy
+                                                if not provided.
+            :param RateLimiter rate_limiter:    Limiter pacing requests,
+                                                shared limiter if not
+                                                provided.
+            :param CircuitBreaker circuit_breaker: Breaker failing fast
+                                                while action's circuit is
+                                                open, shared breaker if
+                                                not provided.
+        """
+        # controller
+        if not controller or len(controller) < 1:
+            raise ValueError("Parameter 'controller' is not defined.")
+        # action
+        if not action or len(action) < 1:
+            raise ValueError("Parameter 'action' is not defined.")
+
+        self.__request = TuneManagementRequest(
+            controller.strip(),
+            action.strip(),
+            auth_key,
+            auth_type,
+            map_query_string,
+            api_url_endpoint,
+            api_url_version,
+            request_mode
+        )
+        self.__pool = pool
+        self.__retry_policy = retry_policy
+        self.__rate_limiter = rate_limiter
+        self.__circuit_breaker = circuit_breaker
+
+    async def call(self, deadline=None):
+        """Sends a request and gets a response from the TUNE Management
+        API Service.
+
+            :param Deadline deadline:   Deadline, or seconds from now,
+                                        bounding every wait of request.
+            :return: True upon HTTP status code 200.
+            :rtype: bool
+        """
+        response_success = False
+        deadline = Deadline.create(deadline)
+        pool = self.__pool or AsyncConnectionPool.shared_pool()
+        retry_policy = self.__retry_policy or RetryPolicy.shared_policy()
+        rate_limiter = self.__rate_limiter or RateLimiter.shared_limiter()
+        circuit_breaker = self.__circuit_breaker or \
+            CircuitBreaker.shared_breaker()
+
+        try:
+            attempt = 0
+            while True:
+                delay = rate_limiter.reserve(
+                    self.__request.auth_key,
+                    self.__request.controller,
+                    self.__request.action
+                )
+                if deadline is not None and delay >= deadline.remaining():
+                    rate_limiter.release(
+                        self.__request.auth_key,
+                        self.__request.controller,
+                        self.__request.action
+                    )
+                    raise TuneSdkException(
+                        "Exceeded deadline waiting {:.3f} seconds to send "
+                        "request.".format(delay)
+                    )
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                circuit = circuit_breaker.acquire(
+                    self.__request.controller,
+                    self.__request.action
+                )
+                try:
+                    response = await pool.urlopen(
+                        self.__request.url,
+                        data=self.__request.body,
+                        headers=self.__request.headers,
+                        timeout=None if deadline is None
+                        else deadline.socket_timeout(
+                            __tune_management_api_timeout__
+                        )
+                    )
+                    circuit_breaker.record(circuit)
+                    break
+                except Exception as ex:
+                    circuit_breaker.record(circuit, ex)
+                    delay = retry_policy.backoff(
+                        self.__request.action, ex, attempt
+                    )
+                    if delay is None:
+                        raise
+                    if deadline is not None and \
+                       delay >= deadline.remaining():
+                        raise
+                    await asyncio.sleep(delay)
+                    attempt += 1
+            retry_policy.budget.record_success()
+
+            response_json = json.loads(response.read().decode('utf-8'))
+            response_http_code = response.getcode()
+
+            self.__response = TuneServiceResponse(
+                response_json,
+                response_http_code,
+                response.info(),
+                request_url=self.__request.url
+            )
+
+            if response_http_code == 200:
+                response_success = True
+
+        except TuneCircuitOpenException:
+            raise
+        except Exception as ex:
+            raise TuneSdkException(
+                "Failed to execute client request ({}): ({})".format(
+                    str(self.__request),
+                    str(ex)
+                ),
+                ex
+            )
+
+        return response_success
+
+    @property
+    def request(self):
+        """Property get request object.
+        """
+        return self.__request
+
+    @property
+    def response(self):
+        """Property get response object.
+        """
+        return self.__response
@@ -0,0 +1,421 @@
+"""
+TUNE Circuit Breaker
+=============================================
+"""
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  circuit_breaker.py
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+
+import sys
+import threading
+import time
+
+if sys.version_info >= (3, 0, 0):
+    import urllib.error as urllib_error
+else:
+    import urllib2 as urllib_error
+
+from tune_reporting.helpers import (
+    TuneSdkException
+)
+from .retry_policy import (
+    RetryPolicy
+)
+
+if hasattr(time, "monotonic"):
+    __clock__ = time.monotonic
+else:
+    __clock__ = time.time
+
+#  States of a circuit.
+TUNE_CIRCUIT_CLOSED = 'closed'
+TUNE_CIRCUIT_OPEN = 'open'
+TUNE_CIRCUIT_HALF_OPEN = 'half_open'
+
+
+## Exception raised instead of sending request through an open circuit.
+#
+class TuneCircuitOpenException(TuneSdkException):
+    """Exception raised instead of sending a request to an endpoint's
+    action whose circuit is open.
+    """
+
+    #  Seconds until a probe request is let through.
+    #  @var float
+    __retry_in = None
+
+    def __init__(self, message=None, retry_in=None):
+        """The constructor.
+
+            :param str message:     Message describing error.
+            :param float retry_in:  Seconds until a probe request
+                                    is let through.
+        """
+        TuneSdkException.__init__(self, message)
+        self.__retry_in = retry_in
+
+    @property
+    def retry_in(self):
+        """Seconds until a probe request is let through."""
+        return self.__retry_in
+
+
+#  Circuit of a single endpoint's action.
+#
+class Circuit(object):
+    """Circuit of a single endpoint's action.
+
+    Closed, requests are sent and consecutive failures counted. Once
+    `failure_threshold` is reached the circuit opens: requests fail fast
+    for `reset_timeout` seconds, then the circuit turns half open and
+    lets `half_open_max` probe requests through. A successful probe
+    closes the circuit, a failed one opens it again.
+    """
+
+    #  @var str
+    __state = None
+
+    #  Consecutive failures while closed.
+    #  @var int
+    __failures = None
+
+    #  Clock value when circuit opened.
+    #  @var float
+    __opened_at = None
+
+    #  Probe requests in flight while half open.
+    #  @var int
+    __probes = None
+
+    #  @var int
+    __failure_threshold = None
+
+    #  @var float
+    __reset_timeout = None
+
+    #  @var int
+    __half_open_max = None
+
+    #  @var object
+    __lock = None
+
+    #  The constructor
+    #
+    #  @param int   failure_threshold   Consecutive failures opening circuit.
+    #  @param float reset_timeout       Seconds open before probing.
+    #  @param int   half_open_max       Probe requests while half open.
+    #
+    def __init__(self, failure_threshold=5, reset_timeout=30,
+                 half_open_max=1):
+        """The constructor.
+
+            :param int failure_threshold:   Consecutive failures opening
+                                            circuit.
+            :param float reset_timeout:     Seconds open before probing.
+            :param int half_open_max:       Probe requests let through
+                                            while half open.
+        """
+        if not isinstance(failure_threshold, int) or failure_threshold < 1:
+            raise ValueError(
+                "Parameter 'failure_threshold' is not valid: '{}'".format(
+                    failure_threshold
+                )
+            )
+        if not isinstance(reset_timeout, (int, float)) or reset_timeout < 0:
+            raise ValueError(
+                "Parameter 'reset_timeout' is not valid: '{}'".format(
+                    reset_timeout
+                )
+            )
+        if not isinstance(half_open_max, int) or half_open_max < 1:
+            raise ValueError(
+                "Parameter 'half_open_max' is not valid: '{}'".format(
+                    half_open_max
+                )
+            )
+
+        self.__failure_threshold = failure_threshold
+        self.__reset_timeout = float(reset_timeout)
+        self.__half_open_max = half_open_max
+        self.__state = TUNE_CIRCUIT_CLOSED
+        self.__failures = 0
+        self.__opened_at = None
+        self.__probes = 0
+        self.__lock = threading.Lock()
+
+    @property
+    def state(self):
+        """State: 'closed', 'open' or 'half_open'."""
+        with self.__lock:
+            return self.__current_state()
+
+    @property
+    def failures(self):
+        """Consecutive failures while closed."""
+        return self.__failures
+
+    def retry_in(self):
+        """Seconds until circuit lets a probe request through,
+        0 unless open.
+
+            :rtype: float
+        """
+        with self.__lock:
+            if self.__current_state() != TUNE_CIRCUIT_OPEN:
+                return 0.0
+            return max(
+                0.0,
+                self.__opened_at + self.__reset_timeout - __clock__()
+            )
+
+    def __current_state(self):
+        if self.__state == TUNE_CIRCUIT_OPEN and \
+           __clock__() - self.__opened_at >= self.__reset_timeout:
+            self.__state = TUNE_CIRCUIT_HALF_OPEN
+            self.__probes = 0
+        return self.__state
+
+    def acquire(self):
+        """Whether a request may be sent now, taking a probe slot
+        while half open.
+
+            :rtype: bool
+        """
+        with self.__lock:
+            state = self.__current_state()
+            if state == TUNE_CIRCUIT_CLOSED:
+                return True
+            if state == TUNE_CIRCUIT_HALF_OPEN and \
+               self.__probes < self.__half_open_max:
+                self.__probes += 1
+                return True
+            return False
+
+    def record_success(self):
+        """Record request answered by service, closing circuit."""
+        with self.__lock:
+            self.__state = TUNE_CIRCUIT_CLOSED
+            self.__failures = 0
+            self.__probes = 0
+
+    def record_failure(self):
+        """Record failed request, opening circuit at threshold or
+        upon failed probe."""
+        with self.__lock:
+            state = self.__current_state()
+            if state == TUNE_CIRCUIT_HALF_OPEN:
+                self.__open()
+                return
+            self.__failures += 1
+            if state == TUNE_CIRCUIT_CLOSED and \
+               self.__failures >= self.__failure_threshold:
+                self.__open()
+
+    def release(self):
+        """Record request without outcome, as one not sent, giving back
+        its probe slot."""
+        with self.__lock:
+            if self.__state == TUNE_CIRCUIT_HALF_OPEN and self.__probes > 0:
+                self.__probes -= 1
+
+    def __open(self):
+        self.__state = TUNE_CIRCUIT_OPEN
+        self.__opened_at = __clock__()
+        self.__probes = 0
+
+
+## Circuit breakers of TUNE Reporting API endpoints' actions.
+#
+class CircuitBreaker(object):
+    """Circuit breakers of TUNE Reporting API endpoints' actions, keyed by
+    controller and action.
+
+    Shared by every service client of the SDK, so an action failing
+    during a partial outage fails fast instead of tying up callers with
+    full timeouts, while other actions are unaffected. Schedulers may
+    query state() to route work elsewhere.
+
+    Failures are HTTP status codes 500 and above, socket timeouts and
+    failed connections. Other responses, including client errors, show
+    the service is answering and count as successes.
+    """
+
+    #  Shared breaker
+    #  @var CircuitBreaker
+    __shared = None
+
+    #  @var object
+    __shared_lock = threading.Lock()
+
+    #  Circuits per (controller, action).
+    #  @var dict
+    __circuits = None
+
+    #  Constructor arguments of circuits.
+    #  @var tuple
+    __settings = None
+
+    #  @var object
+    __lock = None
+
+    #  The constructor
+    #
+    #  @param int   failure_threshold   Consecutive failures opening circuit.
+    #  @param float reset_timeout       Seconds open before probing.
+    #  @param int   half_open_max       Probe requests while half open.
+    #
+    def __init__(self, failure_threshold=5, reset_timeout=30,
+                 half_open_max=1):
+        """The constructor.
+
+            :param int failure_threshold:   Consecutive failures opening
+                                            a circuit.
+            :param float reset_timeout:     Seconds a circuit stays open
+                                            before probing.
+            :param int half_open_max:       Probe requests let through
+                                            while half open.
+        """
+        # Validate settings.
+        Circuit(failure_threshold, reset_timeout, half_open_max)
+        self.__settings = (failure_threshold, reset_timeout, half_open_max)
+        self.__circuits = {}
+        self.__lock = threading.Lock()
+
+    @classmethod
+    def shared_breaker(cls):
+        """Circuit breaker shared by the SDK.
+
+            :rtype: CircuitBreaker
+        """
+        with cls.__shared_lock:
+            if cls.__shared is None:
+                cls.__shared = cls()
+            return cls.__shared
+
+    @classmethod
+    def configure(cls, *args, **kwargs):
+        """Replace the circuit breaker shared by the SDK.
+
+            :rtype: CircuitBreaker
+        """
+        breaker = cls(*args, **kwargs)
+        with cls.__shared_lock:
+            cls.__shared = breaker
+        return breaker
+
+    def circuit(self, controller, action):
+        """Circuit of an endpoint's action.
+
+            :param str controller:  TUNE Reporting API endpoint name.
+            :param str action:      Endpoint's action name.
+            :rtype: Circuit
+        """
+        key = (controller, action)
+        with self.__lock:
+            circuit = self.__circuits.get(key)
+            if circuit is None:
+                circuit = Circuit(*self.__settings)
+                self.__circuits[key] = circuit
+            return circuit
+
+    def state(self, controller, action):
+        """State of an endpoint's action: 'closed', 'open' or 'half_open'.
+
+            :param str controller:  TUNE Reporting API endpoint name.
+            :param str action:      Endpoint's action name.
+            :rtype: str
+        """
+        with self.__lock:
+            circuit = self.__circuits.get((controller, action))
+        if circuit is None:
+            return TUNE_CIRCUIT_CLOSED
+        return circuit.state
+
+    def states(self):
+        """State of every endpoint's action called so far.
+
+            :return: {(controller, action): state}
+            :rtype: dict
+        """
+        with self.__lock:
+            circuits = list(self.__circuits.items())
+        return dict((key, circuit.state) for key, circuit in circuits)
+
+    def acquire(self, controller, action):
+        """Let a request through, or fail fast if circuit is open.
+
+            :param str controller:  TUNE Reporting API endpoint name.
+            :param str action:      Endpoint's action name.
+            :rtype: Circuit
+            :throws: TuneCircuitOpenException
+        """
+        circuit = self.circuit(controller, action)
+        if not circuit.acquire():
+            retry_in = circuit.retry_in()
+            raise TuneCircuitOpenException(
+                "Circuit open: {}/{}, retry in {:.1f} seconds.".format(
+                    controller, action, retry_in
+                ),
+                retry_in
+            )
+        return circuit
+
+    @staticmethod
+    def record(circuit, error=None):
+        """Record outcome of a request let through by acquire().
+
+            :param Circuit circuit:     Circuit returned by acquire().
+            :param Exception error:     Failure of request, None
+                                        upon response.
+        """
+        if error is None:
+            circuit.record_success()
+            return
+
+        cause = RetryPolicy.cause(error)
+        if isinstance(cause, urllib_error.HTTPError):
+            if cause.code >= 500:
+                circuit.record_failure()
+            elif cause.code == 429:
+                circuit.release()
+            else:
+                circuit.record_success()
+        elif RetryPolicy.is_transient(cause):
+            circuit.record_failure()
+        else:
+            circuit.release()
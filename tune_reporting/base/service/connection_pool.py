@@ -0,0 +1,600 @@
+"""
+TUNE Connection Pool
+=============================================
+"""
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  connection_pool.py
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+import io
+import socket
+import sys
+import threading
+import time
+
+if sys.version_info >= (3, 0, 0):
+    import http.client as httplib
+    import urllib.error as urllib_error
+    import urllib.parse as urlparse
+else:
+    import httplib
+    import urllib2 as urllib_error
+    import urlparse
+
+from tune_reporting.version import (
+    __sdk_name__,
+    __sdk_version__
+)
+from .content_decoder import (
+    ContentDecoder,
+    __accept_encoding__
+)
+from .transport import (
+    Transport
+)
+
+#  HTTP status codes answered with a 'Location' to follow.
+__redirect_codes__ = (301, 302, 303, 307, 308)
+
+#  Maximum number of redirects followed for a single request.
+__redirect_max__ = 5
+
+#  Number of compressed bytes read at once from a compressed body.
+__chunk_size__ = 64 * 1024
+
+#  Exceptions raised by a kept-alive connection the server already closed.
+__stale_connection_errors__ = (
+    httplib.BadStatusLine,
+    httplib.CannotSendRequest,
+    socket.error
+)
+
+
+#  Response of a pooled connection.
+#
+#  Returns its connection to the pool once the body has been read to the end,
+#  so that the connection can be reused by the next request to the same host.
+#
+class PooledResponse(object):
+    """Response of a pooled connection, mimicking the response object
+    returned by urlopen().
+    """
+
+    __pool = None
+    __key = None
+    __connection = None
+    __response = None
+    __url = None
+    __status = None
+    __headers = None
+
+    #  Decoder of compressed body, None if body is not compressed.
+    #  @var ContentDecoder
+    __decoder = None
+
+    #  Decoded bytes not yet read.
+    #  @var bytearray
+    __buffer = None
+
+    #  Whether the compressed body has been read to the end.
+    #  @var bool
+    __eof = False
+
+    #  The constructor
+    #
+    #  @param object pool         ConnectionPool owning the connection.
+    #  @param tuple  key          Pool key (scheme, host, port).
+    #  @param object connection   HTTP connection.
+    #  @param object response     HTTP response read from connection.
+    #  @param str    url          Requested URL.
+    #
+    def __init__(self, pool, key, connection, response, url):
+        """The constructor.
+
+            :param ConnectionPool pool:     Pool owning the connection.
+            :param tuple key:               Pool key (scheme, host, port).
+            :param object connection:       HTTP connection.
+            :param object response:         HTTP response.
+            :param str url:                 Requested URL.
+        """
+        self.__pool = pool
+        self.__key = key
+        self.__connection = connection
+        self.__response = response
+        self.__url = url
+        self.__status = response.status
+        self.__headers = response.msg
+        self.__decoder = ContentDecoder.create(
+            response.getheader("Content-Encoding")
+        )
+        self.__buffer = bytearray()
+        self.__eof = False
+
+    def read(self, amt=None):
+        """Read response body, decoded if it was sent compressed.
+
+            :param int amt: Maximum number of bytes to read, all if None.
+            :rtype: bytes
+        """
+        if self.__decoder is None:
+            return self.__read_raw(amt)
+
+        if amt is None:
+            parts = [bytes(self.__buffer)]
+            del self.__buffer[:]
+            while self.__fill():
+                parts.append(bytes(self.__buffer))
+                del self.__buffer[:]
+            parts.append(bytes(self.__buffer))
+            del self.__buffer[:]
+            return b''.join(parts)
+
+        while len(self.__buffer) < amt:
+            if not self.__fill():
+                break
+        data = bytes(self.__buffer[:amt])
+        del self.__buffer[:amt]
+        return data
+
+    def readline(self, limit=-1):
+        """Read single line of response body, decoded if it was
+        sent compressed.
+
+            :param int limit: Maximum number of bytes to read.
+            :rtype: bytes
+        """
+        if self.__decoder is None:
+            return self.__readline_raw(limit)
+
+        start = 0
+        while True:
+            index = self.__buffer.find(b'\n', start)
+            if index >= 0:
+                end = index + 1
+                break
+            if 0 <= limit <= len(self.__buffer):
+                end = limit
+                break
+            start = len(self.__buffer)
+            if not self.__fill():
+                end = len(self.__buffer)
+                break
+        if 0 <= limit < end:
+            end = limit
+        line = bytes(self.__buffer[:end])
+        del self.__buffer[:end]
+        return line
+
+    def __fill(self):
+        """Decode next chunk of compressed body into buffer.
+
+            :return: False once the body has been read to the end.
+        """
+        if self.__eof:
+            return False
+        data = self.__read_raw(__chunk_size__)
+        if data:
+            self.__buffer.extend(self.__decoder.decompress(data))
+            return True
+        self.__buffer.extend(self.__decoder.flush())
+        self.__eof = True
+        return False
+
+    def __read_raw(self, amt=None):
+        """Read response body as sent over the wire."""
+        if self.__response is None:
+            return b''
+        try:
+            if amt is None:
+                data = self.__response.read()
+            else:
+                data = self.__response.read(amt)
+        except Exception:
+            self.__discard()
+            raise
+        if amt is None or not data or self.__response.isclosed():
+            self.__release()
+        return data
+
+    def __readline_raw(self, limit=-1):
+        """Read single line of response body as sent over the wire."""
+        if self.__response is None:
+            return b''
+        try:
+            line = self.__response.readline(limit)
+        except Exception:
+            self.__discard()
+            raise
+        if not line or self.__response.isclosed():
+            self.__release()
+        return line
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        line = self.readline()
+        if not line:
+            raise StopIteration
+        return line
+
+    next = __next__
+
+    def getcode(self):
+        """HTTP status code of response."""
+        return self.status
+
+    def info(self):
+        """HTTP headers of response."""
+        return self.headers
+
+    def geturl(self):
+        """Requested URL."""
+        return self.__url
+
+    @property
+    def status(self):
+        """HTTP status code of response."""
+        return self.__status
+
+    @property
+    def headers(self):
+        """HTTP headers of response."""
+        return self.__headers
+
+    def close(self):
+        """Close response. A body which was not read to the end
+        leaves the connection in an unknown state, so it is discarded.
+        """
+        if self.__response is None:
+            return
+        if self.__response.isclosed():
+            self.__release()
+        else:
+            self.__discard()
+
+    def __release(self):
+        """Return connection to pool."""
+        if self.__response is None:
+            return
+        will_close = self.__response.will_close
+        self.__response = None
+        if will_close:
+            self.__connection.close()
+        else:
+            self.__pool.release(self.__key, self.__connection)
+        self.__connection = None
+
+    def __discard(self):
+        """Close connection without returning it to pool."""
+        if self.__response is not None:
+            self.__response.close()
+            self.__response = None
+        if self.__connection is not None:
+            self.__connection.close()
+            self.__connection = None
+
+
+#  Thread-safe pool of persistent HTTP/1.1 connections per host.
+#
+class ConnectionPool(Transport):
+    """Thread-safe pool of persistent HTTP/1.1 connections per host.
+
+    Connections are kept alive between requests to skip the TCP and TLS
+    handshakes. At most `max_size` idle connections are kept per host and
+    connections idle for longer than `idle_timeout` seconds are closed.
+    """
+
+    #  Shared pool
+    #  @var ConnectionPool
+    __shared = None
+
+    #  @var object
+    __shared_lock = threading.Lock()
+
+    #  Maximum number of idle connections kept per host.
+    #  @var int
+    __max_size = None
+
+    #  Seconds a connection may be idle before being closed.
+    #  @var float
+    __idle_timeout = None
+
+    #  Request compressed responses.
+    #  @var bool
+    __compress = True
+
+    #  Idle connections per pool key: list of (connection, last used).
+    #  @var dict
+    __idle = None
+
+    #  @var object
+    __lock = None
+
+    #  The constructor
+    #
+    #  @param int   max_size        Maximum idle connections per host.
+    #  @param float idle_timeout    Idle seconds before eviction.
+    #  @param bool  compress        Request gzip or deflate responses.
+    #
+    def __init__(self, max_size=10, idle_timeout=60, compress=True):
+        """The constructor.
+
+            :param int max_size:        Maximum idle connections per host.
+            :param float idle_timeout:  Idle seconds before a connection
+                                        is evicted.
+            :param bool compress:       Request gzip or deflate compressed
+                                        responses, decoded while read.
+        """
+        if not isinstance(max_size, int) or max_size < 1:
+            raise ValueError(
+                "Parameter 'max_size' is not valid: '{}'".format(max_size)
+            )
+        if idle_timeout is None or idle_timeout < 0:
+            raise ValueError(
+                "Parameter 'idle_timeout' is not valid: '{}'".format(
+                    idle_timeout
+                )
+            )
+
+        self.__max_size = max_size
+        self.__idle_timeout = idle_timeout
+        self.__compress = compress
+        self.__idle = {}
+        self.__lock = threading.Lock()
+
+    @classmethod
+    def shared_pool(cls):
+        """Connection pool shared by the SDK.
+
+            :rtype: ConnectionPool
+        """
+        with cls.__shared_lock:
+            if cls.__shared is None:
+                cls.__shared = cls()
+            return cls.__shared
+
+    @classmethod
+    def configure(cls, max_size=10, idle_timeout=60, compress=True):
+        """Replace the connection pool shared by the SDK.
+
+            :param int max_size:        Maximum idle connections per host.
+            :param float idle_timeout:  Idle seconds before eviction.
+            :param bool compress:       Request compressed responses.
+            :rtype: ConnectionPool
+        """
+        pool = cls(max_size, idle_timeout, compress)
+        with cls.__shared_lock:
+            previous = cls.__shared
+            cls.__shared = pool
+        if previous is not None:
+            previous.clear()
+        return pool
+
+    @property
+    def max_size(self):
+        """Maximum number of idle connections kept per host."""
+        return self.__max_size
+
+    @property
+    def idle_timeout(self):
+        """Seconds a connection may be idle before being closed."""
+        return self.__idle_timeout
+
+    @property
+    def compress(self):
+        """Whether compressed responses are requested."""
+        return self.__compress
+
+    def idle_count(self, url=None):
+        """Number of idle connections, for one host if url provided.
+
+            :param str url: URL of host.
+            :rtype: int
+        """
+        with self.__lock:
+            if url is not None:
+                return len(self.__idle.get(self._key(url), []))
+            return sum(len(idle) for idle in self.__idle.values())
+
+    def urlopen(self, url, data=None, headers=None, timeout=None):
+        """Send HTTP request using a pooled connection.
+
+            :param str url:         Request URL.
+            :param bytes data:      Request body, sent with POST if provided.
+            :param dict headers:    Additional request headers.
+            :param float timeout:   Socket timeout (seconds).
+            :return: PooledResponse
+            :throws: HTTPError for HTTP status codes of 400 and above.
+            :throws: URLError upon connection failure.
+        """
+        method = "GET" if data is None else "POST"
+
+        for _ in range(__redirect_max__ + 1):
+            response = self._request(method, url, data, headers, timeout)
+
+            if response.status not in __redirect_codes__:
+                break
+
+            location = response.headers.get("Location")
+            if not location:
+                break
+            response.read()
+            url = urlparse.urljoin(url, location)
+            if response.status == 303 or \
+               (response.status in (301, 302) and method == "POST"):
+                method = "GET"
+                data = None
+
+        if response.status >= 400:
+            body = response.read()
+            raise urllib_error.HTTPError(
+                url,
+                response.status,
+                httplib.responses.get(response.status, ""),
+                response.headers,
+                io.BytesIO(body)
+            )
+
+        return response
+
+    def _request(self, method, url, data, headers, timeout):
+        """Send a single HTTP request, without following redirects.
+
+            :return: PooledResponse
+        """
+        key = self._key(url)
+        parsed = urlparse.urlparse(url)
+        selector = parsed.path or "/"
+        if parsed.query:
+            selector += "?" + parsed.query
+
+        request_headers = {
+            "User-Agent": "{}/{}".format(__sdk_name__, __sdk_version__),
+            "Connection": "keep-alive"
+        }
+        if self.__compress:
+            request_headers["Accept-Encoding"] = __accept_encoding__
+        if headers:
+            request_headers.update(headers)
+
+        while True:
+            connection, reused = self.acquire(key, timeout)
+            try:
+                connection.request(method, selector, data, request_headers)
+                response = connection.getresponse()
+            except socket.timeout as ex:
+                connection.close()
+                raise urllib_error.URLError(ex)
+            except __stale_connection_errors__ as ex:
+                connection.close()
+                # Kept-alive connection was closed by server, retry
+                # with a new connection.
+                if reused:
+                    continue
+                raise urllib_error.URLError(ex)
+            except Exception:
+                connection.close()
+                raise
+
+            return PooledResponse(self, key, connection, response, url)
+
+    def acquire(self, key, timeout=None):
+        """Get idle connection for pool key, or create a new one.
+
+            :param tuple key:       Pool key (scheme, host, port).
+            :param float timeout:   Socket timeout (seconds).
+            :return: (connection, bool reused)
+        """
+        if timeout is None:
+            timeout = socket._GLOBAL_DEFAULT_TIMEOUT
+
+        connection = None
+        now = time.time()
+        with self.__lock:
+            idle = self.__idle.get(key, [])
+            while idle:
+                candidate, last_used = idle.pop()
+                if now - last_used <= self.__idle_timeout:
+                    connection = candidate
+                    break
+                candidate.close()
+
+        if connection is not None:
+            connection.timeout = timeout
+            if connection.sock is not None:
+                connection.sock.settimeout(
+                    None if timeout is socket._GLOBAL_DEFAULT_TIMEOUT
+                    else timeout
+                )
+            return connection, True
+
+        scheme, host, port = key
+        if scheme == "https":
+            connection = httplib.HTTPSConnection(host, port, timeout=timeout)
+        else:
+            connection = httplib.HTTPConnection(host, port, timeout=timeout)
+        return connection, False
+
+    def release(self, key, connection):
+        """Return connection to pool.
+
+            :param tuple key:           Pool key (scheme, host, port).
+            :param object connection:   HTTP connection.
+        """
+        now = time.time()
+        evicted = []
+        with self.__lock:
+            idle = self.__idle.setdefault(key, [])
+            if len(idle) < self.__max_size:
+                idle.append((connection, now))
+            else:
+                evicted.append(connection)
+            for pool_key, pool_idle in self.__idle.items():
+                fresh = []
+                for candidate, last_used in pool_idle:
+                    if now - last_used <= self.__idle_timeout:
+                        fresh.append((candidate, last_used))
+                    else:
+                        evicted.append(candidate)
+                self.__idle[pool_key] = fresh
+
+        for candidate in evicted:
+            candidate.close()
+
+    def clear(self):
+        """Close all idle connections."""
+        with self.__lock:
+            idle = self.__idle
+            self.__idle = {}
+        for pool_idle in idle.values():
+            for connection, _ in pool_idle:
+                connection.close()
+
+    @staticmethod
+    def _key(url):
+        """Pool key of URL: (scheme, host, port)."""
+        parsed = urlparse.urlparse(url)
+        scheme = parsed.scheme.lower()
+        if scheme not in ("http", "https"):
+            raise ValueError(
+                "Unsupported URL scheme: '{}'".format(url)
+            )
+        port = parsed.port
+        if port is None:
+            port = 443 if scheme == "https" else 80
+        return (scheme, parsed.hostname, port)
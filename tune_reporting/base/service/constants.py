@@ -42,3 +42,18 @@ TUNE Reporting API service constants
 
 __tune_management_api_endpoint__ = 'https://api.mobileapptracking.com'
 __tune_management_api_version__ = 'v2'
+
+#  Request modes of TuneManagementRequest: parameters sent within
+#  query string of GET, form body or JSON body of POST, or picked by
+#  encoded size of query string.
+TUNE_REQUEST_MODE_AUTO = 'auto'
+TUNE_REQUEST_MODE_QUERY = 'query'
+TUNE_REQUEST_MODE_FORM = 'form'
+TUNE_REQUEST_MODE_JSON = 'json'
+
+#  Maximum length of request URL before mode 'auto' sends parameters
+#  within form body.
+__tune_management_api_url_max__ = 2048
+
+#  Socket timeout in seconds of requests sent without a deadline.
+__tune_management_api_timeout__ = 60
@@ -0,0 +1,133 @@
+"""
+TUNE Content Decoder
+=============================================
+"""
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  content_decoder.py
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+import zlib
+
+#  Value of request header 'Accept-Encoding'.
+__accept_encoding__ = "gzip, deflate"
+
+
+#  Incremental decoder of a compressed HTTP response body.
+#
+class ContentDecoder(object):
+    """Incremental decoder of 'gzip' or 'deflate' HTTP response body.
+
+    Compressed chunks are decoded as they arrive, so the compressed body
+    is never buffered as a whole.
+    """
+
+    #  Content-Encoding being decoded.
+    #  @var str
+    __encoding = None
+
+    #  @var object zlib decompression object
+    __decompressor = None
+
+    #  Whether the first chunk has been decoded.
+    #  @var bool
+    __started = False
+
+    #  The constructor
+    #
+    #  @param str encoding    Content-Encoding: gzip or deflate.
+    #
+    def __init__(self, encoding):
+        """The constructor.
+
+            :param str encoding: Content-Encoding: gzip or deflate.
+        """
+        if encoding == "gzip":
+            self.__decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        elif encoding == "deflate":
+            self.__decompressor = zlib.decompressobj(zlib.MAX_WBITS)
+        else:
+            raise ValueError(
+                "Unsupported content encoding: '{}'".format(encoding)
+            )
+        self.__encoding = encoding
+        self.__started = False
+
+    @staticmethod
+    def create(content_encoding):
+        """Decoder for value of response header 'Content-Encoding'.
+
+            :param str content_encoding: Response header value.
+            :return: ContentDecoder, None if body is not encoded.
+        """
+        if not content_encoding:
+            return None
+        encoding = content_encoding.strip().lower()
+        if encoding in ("", "identity"):
+            return None
+        if encoding == "x-gzip":
+            encoding = "gzip"
+        return ContentDecoder(encoding)
+
+    @property
+    def encoding(self):
+        """Content-Encoding being decoded."""
+        return self.__encoding
+
+    def decompress(self, data):
+        """Decode next chunk of compressed body.
+
+            :param bytes data: Compressed chunk.
+            :rtype: bytes
+        """
+        if self.__started or self.__encoding != "deflate":
+            self.__started = True
+            return self.__decompressor.decompress(data)
+
+        # Servers disagree on 'deflate' being zlib wrapped or raw.
+        self.__started = True
+        try:
+            return self.__decompressor.decompress(data)
+        except zlib.error:
+            self.__decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+            return self.__decompressor.decompress(data)
+
+    def flush(self):
+        """Decode remainder of compressed body.
+
+            :rtype: bytes
+        """
+        return self.__decompressor.flush()
@@ -0,0 +1,371 @@
+"""
+TUNE Hedge Policy
+=============================================
+"""
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  hedge_policy.py
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+
+import collections
+import threading
+import time
+
+if hasattr(time, "monotonic"):
+    __clock__ = time.monotonic
+else:
+    __clock__ = time.time
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+from .retry_policy import (
+    RetryPolicy
+)
+
+
+#  Observed latencies of endpoints' actions.
+#
+class LatencyTracker(object):
+    """Latencies of the most recent successful requests of every
+    endpoint's action."""
+
+    #  Samples kept per action.
+    #  @var int
+    __window = None
+
+    #  Latencies per (controller, action).
+    #  @var dict
+    __samples = None
+
+    #  @var object
+    __lock = None
+
+    #  The constructor
+    #
+    #  @param int window    Samples kept per action.
+    #
+    def __init__(self, window=200):
+        """The constructor.
+
+            :param int window:  Most recent samples kept per action.
+        """
+        if not isinstance(window, int) or window < 1:
+            raise ValueError(
+                "Parameter 'window' is not valid: '{}'".format(window)
+            )
+        self.__window = window
+        self.__samples = {}
+        self.__lock = threading.Lock()
+
+    def record(self, controller, action, seconds):
+        """Record latency of a successful request.
+
+            :param str controller:  TUNE Reporting API endpoint name.
+            :param str action:      Endpoint's action name.
+            :param float seconds:   Latency.
+        """
+        key = (controller, action)
+        with self.__lock:
+            samples = self.__samples.get(key)
+            if samples is None:
+                samples = collections.deque(maxlen=self.__window)
+                self.__samples[key] = samples
+            samples.append(seconds)
+
+    def count(self, controller, action):
+        """Number of samples kept for an action.
+
+            :rtype: int
+        """
+        with self.__lock:
+            return len(self.__samples.get((controller, action), ()))
+
+    def percentile(self, controller, action, percentile):
+        """Latency below which the provided percentage of samples fall.
+
+            :param str controller:      TUNE Reporting API endpoint name.
+            :param str action:          Endpoint's action name.
+            :param float percentile:    Between 0 and 100.
+            :return: Seconds, None without samples.
+            :rtype: float
+        """
+        with self.__lock:
+            samples = sorted(self.__samples.get((controller, action), ()))
+        if not samples:
+            return None
+        index = int(round(percentile / 100.0 * (len(samples) - 1)))
+        return samples[index]
+
+
+#  Policy sending a duplicate of slow requests.
+#
+class HedgePolicy(object):
+    """Policy sending a duplicate of a request of an idempotent action
+    once no response arrived within a percentile of the action's observed
+    latency, taking whichever response arrives first.
+
+    Hedging is opt-in: service clients hedge only with a policy provided
+    to them or selected with configure(). Actions are not hedged before
+    `min_samples` latencies were observed, and duplicates are capped to
+    `max_ratio` of requests by a token bucket of `burst` tokens.
+    """
+
+    #  Policy used when a client is not provided one.
+    #  @var HedgePolicy
+    __default = None
+
+    #  @var object
+    __default_lock = threading.Lock()
+
+    #  @var float
+    __percentile = None
+
+    #  @var float
+    __min_delay = None
+
+    #  @var int
+    __min_samples = None
+
+    #  @var float
+    __max_ratio = None
+
+    #  @var float
+    __burst = None
+
+    #  Hedge tokens, given back by every request.
+    #  @var float
+    __tokens = None
+
+    #  @var int
+    __requests = None
+
+    #  @var int
+    __hedges = None
+
+    #  @var LatencyTracker
+    __latencies = None
+
+    #  @var object
+    __lock = None
+
+    #  The constructor
+    #
+    #  @param float percentile  Percentile of latency before hedging.
+    #  @param float min_delay   Minimum seconds before hedging.
+    #  @param int   min_samples Latencies observed before hedging.
+    #  @param float max_ratio   Maximum ratio of hedged requests.
+    #  @param float burst       Hedges allowed in a burst.
+    #  @param object latencies  LatencyTracker.
+    #
+    def __init__(self,
+                 percentile=95,
+                 min_delay=0.01,
+                 min_samples=20,
+                 max_ratio=0.05,
+                 burst=10,
+                 latencies=None):
+        """The constructor.
+
+            :param float percentile:    Percentile of observed latency
+                                        after which a duplicate request
+                                        is sent.
+            :param float min_delay:     Minimum seconds before hedging.
+            :param int min_samples:     Latencies observed of an action
+                                        before it is hedged.
+            :param float max_ratio:     Maximum ratio of hedged requests
+                                        over requests.
+            :param float burst:         Hedges allowed in a burst.
+            :param LatencyTracker latencies: Tracker of latencies, a new
+                                        one if not provided.
+        """
+        if not 0 < percentile < 100:
+            raise ValueError(
+                "Parameter 'percentile' is not valid: '{}'".format(percentile)
+            )
+        if min_delay < 0:
+            raise ValueError(
+                "Parameter 'min_delay' is not valid: '{}'".format(min_delay)
+            )
+        if not 0 < max_ratio <= 1:
+            raise ValueError(
+                "Parameter 'max_ratio' is not valid: '{}'".format(max_ratio)
+            )
+        if burst < 1:
+            raise ValueError(
+                "Parameter 'burst' is not valid: '{}'".format(burst)
+            )
+
+        self.__percentile = float(percentile)
+        self.__min_delay = float(min_delay)
+        self.__min_samples = max(1, int(min_samples))
+        self.__max_ratio = float(max_ratio)
+        self.__burst = float(burst)
+        self.__tokens = 0.0
+        self.__requests = 0
+        self.__hedges = 0
+        self.__latencies = latencies or LatencyTracker()
+        self.__lock = threading.Lock()
+
+    @classmethod
+    def configure(cls, policy):
+        """Select policy used by the SDK when a client is not provided one.
+
+            :param HedgePolicy policy:  Policy, None to stop hedging.
+            :rtype: HedgePolicy
+        """
+        if policy is not None and not isinstance(policy, HedgePolicy):
+            raise ValueError(
+                "Parameter 'policy' is not valid: '{}'".format(policy)
+            )
+        with HedgePolicy.__default_lock:
+            HedgePolicy.__default = policy
+        return policy
+
+    @classmethod
+    def default_policy(cls):
+        """Policy selected with configure(), None if not selected.
+
+            :rtype: HedgePolicy
+        """
+        with HedgePolicy.__default_lock:
+            return HedgePolicy.__default
+
+    @property
+    def latencies(self):
+        """Tracker of observed latencies."""
+        return self.__latencies
+
+    @property
+    def requests(self):
+        """Requests sent through policy, not counting duplicates."""
+        return self.__requests
+
+    @property
+    def hedges(self):
+        """Duplicate requests sent."""
+        return self.__hedges
+
+    def delay(self, controller, action):
+        """Seconds without response after which a request is duplicated.
+
+            :param str controller:  TUNE Reporting API endpoint name.
+            :param str action:      Endpoint's action name.
+            :return: Seconds, None if action is not hedged.
+            :rtype: float
+        """
+        if not RetryPolicy.is_idempotent(action):
+            return None
+        if self.__latencies.count(controller, action) < self.__min_samples:
+            return None
+        return max(
+            self.__min_delay,
+            self.__latencies.percentile(controller, action, self.__percentile)
+        )
+
+    def __take_hedge(self):
+        with self.__lock:
+            if self.__tokens < 1:
+                return False
+            self.__tokens -= 1
+            self.__hedges += 1
+            return True
+
+    def execute(self, controller, action, send):
+        """Send request, duplicating it if slow.
+
+            :param str controller:  TUNE Reporting API endpoint name.
+            :param str action:      Endpoint's action name.
+            :param callable send:   Sends request once, possibly from
+                                    another thread.
+            :return: Return value of first successful send.
+            :throws: Exception raised by send, once every request failed.
+        """
+        with self.__lock:
+            self.__requests += 1
+            self.__tokens = min(
+                self.__burst, self.__tokens + self.__max_ratio
+            )
+
+        delay = self.delay(controller, action)
+        if delay is None:
+            start = __clock__()
+            result = send()
+            self.__latencies.record(controller, action, __clock__() - start)
+            return result
+
+        outcomes = queue.Queue()
+
+        def attempt():
+            start = __clock__()
+            try:
+                result = send()
+            except BaseException as ex:
+                outcomes.put((False, ex))
+                return
+            self.__latencies.record(controller, action, __clock__() - start)
+            outcomes.put((True, result))
+
+        self.__start(attempt)
+        pending = 1
+        try:
+            success, value = outcomes.get(timeout=delay)
+        except queue.Empty:
+            if self.__take_hedge():
+                self.__start(attempt)
+                pending += 1
+            success, value = outcomes.get()
+        pending -= 1
+
+        error = None
+        while not success:
+            if error is None:
+                error = value
+            if pending == 0:
+                raise error
+            success, value = outcomes.get()
+            pending -= 1
+
+        return value
+
+    @staticmethod
+    def __start(function):
+        thread = threading.Thread(target=function)
+        thread.daemon = True
+        thread.start()
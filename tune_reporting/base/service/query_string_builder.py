@@ -60,12 +60,14 @@ class QueryStringBuilder(object):
     """Build Query String provide with dictionary of query parameters."""
 
     __query = ""
+    __params = None
 
     def __init__(self, name=None, value=None):
         """Constructor a query string builder.
         :param name (str, optional): query string parameter's key.
         :param value (str, optional): query string parameter's value.
         """
+        self.__params = []
         if name is not None and isinstance(name, str) and len(name) > 0:
             self.add(name, value)
 
@@ -161,6 +163,7 @@ class QueryStringBuilder(object):
             else:
                 param = urllib.urlencode({name: value})
             self.__query += param
+            self.__params.append((name, value))
         except Exception as ex:
             raise TuneSdkException(
                 "Failed to URL encode ({}:{}): ({0})".format(
@@ -171,6 +174,14 @@ class QueryStringBuilder(object):
                 ex
             )
 
+    @property
+    def params(self):
+        """Query string parameters as added, before URL encoding.
+
+            :rtype: list of (name, value)
+        """
+        return list(self.__params)
+
     def __str__(self):
         """String representation of an object."""
         return self.__query
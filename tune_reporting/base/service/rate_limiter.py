@@ -0,0 +1,311 @@
+"""
+TUNE Rate Limiter
+=============================================
+"""
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  rate_limiter.py
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+
+import threading
+import time
+
+from tune_reporting.helpers import (
+    TuneSdkException
+)
+
+#  Action classes paced by separate buckets.
+TUNE_ACTION_CLASS_QUERY = 'query'
+TUNE_ACTION_CLASS_EXPORT = 'export'
+TUNE_ACTION_CLASS_STATUS = 'status'
+
+#  Default (requests per second, burst) of each action class.
+__default_rates__ = {
+    TUNE_ACTION_CLASS_QUERY: (20.0, 20),
+    TUNE_ACTION_CLASS_EXPORT: (2.0, 5),
+    TUNE_ACTION_CLASS_STATUS: (5.0, 10)
+}
+
+if hasattr(time, "monotonic"):
+    __clock__ = time.monotonic
+else:
+    __clock__ = time.time
+
+
+#  Token bucket refilled at a constant rate.
+#
+class TokenBucket(object):
+    """Token bucket refilled at a constant rate.
+
+    Tokens are reserved ahead of time: a caller finding the bucket empty
+    takes a token anyway and is told how long to wait for it, so waiting
+    callers are served in order of arrival.
+    """
+
+    #  Tokens added per second.
+    #  @var float
+    __rate = None
+
+    #  Capacity of bucket.
+    #  @var float
+    __burst = None
+
+    #  @var float
+    __tokens = None
+
+    #  @var float
+    __updated = None
+
+    #  @var object
+    __lock = None
+
+    #  The constructor
+    #
+    #  @param float rate    Tokens added per second.
+    #  @param int   burst   Capacity of bucket.
+    #
+    def __init__(self, rate, burst):
+        """The constructor.
+
+            :param float rate:  Tokens added per second.
+            :param int burst:   Capacity of bucket, requests sent at once
+                                after being idle.
+        """
+        if rate is None or rate <= 0:
+            raise ValueError(
+                "Parameter 'rate' is not valid: '{}'".format(rate)
+            )
+        if burst is None or burst < 1:
+            raise ValueError(
+                "Parameter 'burst' is not valid: '{}'".format(burst)
+            )
+        self.__rate = float(rate)
+        self.__burst = float(burst)
+        self.__tokens = float(burst)
+        self.__updated = __clock__()
+        self.__lock = threading.Lock()
+
+    @property
+    def rate(self):
+        """Tokens added per second."""
+        return self.__rate
+
+    @property
+    def burst(self):
+        """Capacity of bucket."""
+        return self.__burst
+
+    def reserve(self):
+        """Take a token.
+
+            :return: Seconds to wait before token is available.
+            :rtype: float
+        """
+        with self.__lock:
+            now = __clock__()
+            self.__tokens = min(
+                self.__burst,
+                self.__tokens + (now - self.__updated) * self.__rate
+            )
+            self.__updated = now
+            self.__tokens -= 1
+            if self.__tokens >= 0:
+                return 0.0
+            return -self.__tokens / self.__rate
+
+    def release(self):
+        """Return a token reserved but not used."""
+        with self.__lock:
+            self.__tokens = min(self.__burst, self.__tokens + 1)
+
+
+#  Client-side rate limiter per authentication key and action class.
+#
+class RateLimiter(object):
+    """Client-side rate limiter per authentication key and action class.
+
+    Shared by every endpoint, service client and export worker of the SDK,
+    so requests sent in parallel for the same authentication key are paced
+    together. Queries, export requests and export status polls are paced
+    by separate buckets.
+    """
+
+    #  Shared limiter
+    #  @var RateLimiter
+    __shared = None
+
+    #  @var object
+    __shared_lock = threading.Lock()
+
+    #  (requests per second, burst) per action class.
+    #  @var dict
+    __rates = None
+
+    #  Token buckets per (auth_key, action class).
+    #  @var dict
+    __buckets = None
+
+    #  @var object
+    __lock = None
+
+    #  The constructor
+    #
+    #  @param dict rates    (requests per second, burst) per action class.
+    #
+    def __init__(self, rates=None):
+        """The constructor.
+
+            :param dict rates:  (requests per second, burst) per action
+                                class, overriding defaults. An action class
+                                mapped to None is not paced.
+        """
+        self.__rates = dict(__default_rates__)
+        if rates:
+            self.__rates.update(rates)
+        # Validate rates.
+        for rate in self.__rates.values():
+            if rate is not None:
+                TokenBucket(*rate)
+        self.__buckets = {}
+        self.__lock = threading.Lock()
+
+    @classmethod
+    def shared_limiter(cls):
+        """Rate limiter shared by the SDK.
+
+            :rtype: RateLimiter
+        """
+        with cls.__shared_lock:
+            if cls.__shared is None:
+                cls.__shared = cls()
+            return cls.__shared
+
+    @classmethod
+    def configure(cls, rates=None):
+        """Replace the rate limiter shared by the SDK.
+
+            :param dict rates:  (requests per second, burst) per action
+                                class.
+            :rtype: RateLimiter
+        """
+        limiter = cls(rates)
+        with cls.__shared_lock:
+            cls.__shared = limiter
+        return limiter
+
+    @staticmethod
+    def action_class(controller, action):
+        """Action class of an endpoint's action.
+
+            :param str controller:  TUNE Reporting API endpoint name.
+            :param str action:      Endpoint's action name.
+            :return: TUNE_ACTION_CLASS_QUERY, TUNE_ACTION_CLASS_EXPORT or
+                TUNE_ACTION_CLASS_STATUS
+        """
+        if action in ("find_export_queue", "export"):
+            return TUNE_ACTION_CLASS_EXPORT
+        if action == "status" or \
+           (controller == "export" and action == "download"):
+            return TUNE_ACTION_CLASS_STATUS
+        return TUNE_ACTION_CLASS_QUERY
+
+    def bucket(self, auth_key, action_class):
+        """Token bucket of authentication key and action class.
+
+            :return: TokenBucket, None if action class is not paced.
+        """
+        rate = self.__rates.get(action_class)
+        if rate is None:
+            return None
+        key = (auth_key, action_class)
+        with self.__lock:
+            bucket = self.__buckets.get(key)
+            if bucket is None:
+                bucket = TokenBucket(*rate)
+                self.__buckets[key] = bucket
+            return bucket
+
+    def reserve(self, auth_key, controller, action):
+        """Take a token for a request.
+
+            :param str auth_key:    TUNE Reporting authentication key.
+            :param str controller:  TUNE Reporting API endpoint name.
+            :param str action:      Endpoint's action name.
+            :return: Seconds to wait before sending request.
+            :rtype: float
+        """
+        bucket = self.bucket(
+            auth_key,
+            self.action_class(controller, action)
+        )
+        if bucket is None:
+            return 0.0
+        return bucket.reserve()
+
+    def release(self, auth_key, controller, action):
+        """Return a token taken by reserve() for a request not sent.
+
+            :param str auth_key:    TUNE Reporting authentication key.
+            :param str controller:  TUNE Reporting API endpoint name.
+            :param str action:      Endpoint's action name.
+        """
+        bucket = self.bucket(
+            auth_key,
+            self.action_class(controller, action)
+        )
+        if bucket is not None:
+            bucket.release()
+
+    def acquire(self, auth_key, controller, action, deadline=None):
+        """Wait until a request may be sent.
+
+            :param str auth_key:        TUNE Reporting authentication key.
+            :param str controller:      TUNE Reporting API endpoint name.
+            :param str action:          Endpoint's action name.
+            :param Deadline deadline:   Request must be sent before it.
+            :throws: TuneSdkException if request may not be sent
+                before deadline.
+        """
+        delay = self.reserve(auth_key, controller, action)
+        if deadline is not None and delay >= deadline.remaining():
+            self.release(auth_key, controller, action)
+            raise TuneSdkException(
+                "Exceeded deadline waiting {:.3f} seconds to send "
+                "request: {}/{}".format(delay, controller, action)
+            )
+        if delay > 0:
+            time.sleep(delay)
@@ -0,0 +1,475 @@
+"""
+TUNE Replay Transport
+=============================================
+"""
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  replay_transport.py
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+
+import base64
+import email.message
+import io
+import json
+import os
+import random
+import sys
+import threading
+import time
+
+if sys.version_info >= (3, 0, 0):
+    import http.client as httplib
+    import urllib.error as urllib_error
+    import urllib.parse as urlparse
+    from urllib.parse import urlencode
+else:
+    import httplib
+    import urllib2 as urllib_error
+    import urlparse
+    from urllib import urlencode
+
+from tune_reporting.helpers import (
+    TuneSdkException
+)
+from .transport import (
+    Transport
+)
+
+#  Parameters ignored when matching requests.
+__ignored_params__ = ("api_key", "session_token", "sdk", "ver")
+
+#  Parameters redacted when recording.
+__redacted_params__ = ("api_key", "session_token")
+
+
+#  Response served from a cassette.
+#
+class ReplayResponse(object):
+    """Response served from a cassette, mimicking the response object
+    returned by urlopen().
+    """
+
+    __status = None
+    __headers = None
+    __body = None
+    __url = None
+
+    def __init__(self, status, headers, body, url):
+        """The constructor.
+
+            :param int status:      HTTP status code.
+            :param dict headers:    HTTP headers.
+            :param bytes body:      Response body.
+            :param str url:         Requested URL.
+        """
+        self.__status = status
+        self.__headers = email.message.Message()
+        for name, value in (headers or {}).items():
+            self.__headers[name] = value
+        self.__body = io.BytesIO(body)
+        self.__url = url
+
+    def read(self, amt=None):
+        """Read response body."""
+        return self.__body.read(amt)
+
+    def readline(self, limit=-1):
+        """Read single line of response body."""
+        return self.__body.readline(limit)
+
+    def __iter__(self):
+        return iter(self.__body)
+
+    def getcode(self):
+        """HTTP status code of response."""
+        return self.__status
+
+    def info(self):
+        """HTTP headers of response."""
+        return self.__headers
+
+    def geturl(self):
+        """Requested URL."""
+        return self.__url
+
+    def close(self):
+        """Release response body."""
+        self.__body.close()
+
+    @property
+    def status(self):
+        """HTTP status code of response."""
+        return self.__status
+
+    @property
+    def headers(self):
+        """HTTP headers of response."""
+        return self.__headers
+
+
+## Key of a request within a cassette, ignoring order of parameters and
+#  authentication parameters.
+def request_key(method, url, body=None):
+    """Key of a request within a cassette.
+
+        :param str method:  HTTP method.
+        :param str url:     Request URL.
+        :param bytes body:  Request body.
+        :rtype: tuple
+    """
+    parsed = urlparse.urlparse(url)
+    params = [
+        (name, value)
+        for name, value in urlparse.parse_qsl(parsed.query, True)
+        if name not in __ignored_params__
+    ]
+
+    if body:
+        if isinstance(body, bytes):
+            body = body.decode("utf-8")
+        try:
+            body_params = json.loads(body)
+        except ValueError:
+            body_params = urlparse.parse_qsl(body, True)
+        else:
+            if isinstance(body_params, dict):
+                body_params = [
+                    (name, json.dumps(value) if not isinstance(value, str)
+                     else value)
+                    for name, value in body_params.items()
+                ]
+            else:
+                body_params = [("", body)]
+        params += [
+            (name, value)
+            for name, value in body_params
+            if name not in __ignored_params__
+        ]
+
+    return (
+        method.upper(),
+        "{}://{}{}".format(parsed.scheme, parsed.netloc, parsed.path),
+        tuple(sorted(params))
+    )
+
+
+## Replace values of authentication parameters of a query string,
+#  form body or JSON body.
+def redact(query):
+    """Replace values of authentication parameters of a query string,
+    form body or JSON body.
+
+        :param str query: Query string or body.
+        :rtype: str
+    """
+    try:
+        params = json.loads(query)
+    except ValueError:
+        pass
+    else:
+        if isinstance(params, dict):
+            for name in __redacted_params__:
+                if name in params:
+                    params[name] = "REDACTED"
+            return json.dumps(params)
+        return query
+
+    return urlencode([
+        (name, "REDACTED" if name in __redacted_params__ else value)
+        for name, value in urlparse.parse_qsl(query, True)
+    ])
+
+
+#  Transport serving recorded responses from a cassette.
+#
+class ReplayTransport(Transport):
+    """Transport serving recorded responses from a cassette, without
+    network, to benchmark and load test report pipelines on one machine.
+
+    A cassette is a JSON document {"interactions": [...]} where every
+    interaction is:
+        {"request": {"method": "GET", "url": "...", "body": null},
+         "response": {"status": 200, "headers": {...}, "body": "...",
+                      "body_base64": "...", "latency": 0.1}}
+
+    Responses are served after their recorded latency, unless a latency
+    is configured, which then applies to every response.
+
+    Requests match regardless of parameter order and authentication
+    parameters. Interactions recorded for the same request are served in
+    order, the last one being served again once all have been served,
+    so polling of an export job replays its recorded progress.
+    """
+
+    #  Responses per request key, in order of recording.
+    #  @var dict
+    __interactions = None
+
+    #  Responses served per request key.
+    #  @var dict
+    __served = None
+
+    #  Synthetic latency: seconds, or (min, max) seconds.
+    #  @var float|tuple
+    __latency = None
+
+    #  @var object
+    __lock = None
+
+    #  The constructor
+    #
+    #  @param str|list cassette     Path of cassette file, or interactions.
+    #  @param float|tuple latency   Synthetic latency of every response.
+    #
+    def __init__(self, cassette, latency=None):
+        """The constructor.
+
+            :param str|list cassette:   Path of cassette file, or its list
+                                        of interactions.
+            :param float|tuple latency: Synthetic latency added to every
+                                        response: seconds, or (min, max)
+                                        seconds drawn uniformly, recorded
+                                        latency if not provided.
+        """
+        if isinstance(cassette, str):
+            if not os.path.exists(cassette):
+                raise ValueError(
+                    "Cassette filepath invalid: '{}'".format(cassette)
+                )
+            with open(cassette, "r") as handle:
+                cassette = json.load(handle)["interactions"]
+
+        if not isinstance(cassette, list):
+            raise ValueError(
+                "Parameter 'cassette' is not valid: '{}'".format(cassette)
+            )
+
+        self.__interactions = {}
+        for interaction in cassette:
+            request = interaction["request"]
+            key = request_key(
+                request.get("method", "GET"),
+                request["url"],
+                request.get("body")
+            )
+            self.__interactions.setdefault(key, []).append(
+                interaction["response"]
+            )
+        self.__served = {}
+        self.__latency = latency
+        self.__lock = threading.Lock()
+
+    def urlopen(self, url, data=None, headers=None, timeout=None):
+        """Serve recorded response of request.
+
+            :param str url:         Request URL.
+            :param bytes data:      Request body, sent with POST if provided.
+            :param dict headers:    Additional request headers.
+            :param float timeout:   Unused.
+            :return: ReplayResponse
+            :throws: HTTPError for recorded HTTP status codes of 400 and
+                above.
+            :throws: TuneSdkException if request was not recorded.
+        """
+        method = "GET" if data is None else "POST"
+        key = request_key(method, url, data)
+
+        with self.__lock:
+            responses = self.__interactions.get(key)
+            if not responses:
+                raise TuneSdkException(
+                    "No recorded response for request: {} {}".format(
+                        method, url
+                    )
+                )
+            served = self.__served.get(key, 0)
+            self.__served[key] = served + 1
+            response = responses[min(served, len(responses) - 1)]
+
+        latency = self.__latency
+        if latency is None:
+            latency = response.get("latency")
+        if isinstance(latency, (tuple, list)):
+            latency = random.uniform(latency[0], latency[1])
+        if latency:
+            time.sleep(latency)
+
+        if "body_base64" in response:
+            body = base64.b64decode(response["body_base64"])
+        else:
+            body = (response.get("body") or "").encode("utf-8")
+
+        status = response.get("status", 200)
+        if status >= 400:
+            raise urllib_error.HTTPError(
+                url,
+                status,
+                httplib.responses.get(status, ""),
+                ReplayResponse(status, response.get("headers"), b"",
+                               url).info(),
+                io.BytesIO(body)
+            )
+
+        return ReplayResponse(status, response.get("headers"), body, url)
+
+    def served(self, url=None):
+        """Number of responses served, for one URL if provided.
+
+            :rtype: int
+        """
+        with self.__lock:
+            if url is None:
+                return sum(self.__served.values())
+            path = request_key("GET", url)[1]
+            return sum(
+                count for key, count in self.__served.items()
+                if key[1] == path
+            )
+
+
+#  Transport recording requests and responses of another transport.
+#
+class RecordingTransport(Transport):
+    """Transport recording requests and responses of another transport
+    into a cassette replayed by ReplayTransport.
+
+    Authentication parameters are redacted from recorded requests.
+    """
+
+    #  @var Transport
+    __transport = None
+
+    #  @var list
+    __interactions = None
+
+    #  @var object
+    __lock = None
+
+    #  The constructor
+    #
+    #  @param object transport  Transport sending requests.
+    #
+    def __init__(self, transport):
+        """The constructor.
+
+            :param Transport transport: Transport sending requests.
+        """
+        if transport is None or not hasattr(transport, "urlopen"):
+            raise ValueError(
+                "Parameter 'transport' is not valid: '{}'".format(transport)
+            )
+        self.__transport = transport
+        self.__interactions = []
+        self.__lock = threading.Lock()
+
+    @property
+    def interactions(self):
+        """Recorded interactions."""
+        with self.__lock:
+            return list(self.__interactions)
+
+    def urlopen(self, url, data=None, headers=None, timeout=None):
+        """Send HTTP request, recording its response.
+
+            :param str url:         Request URL.
+            :param bytes data:      Request body, sent with POST if provided.
+            :param dict headers:    Additional request headers.
+            :param float timeout:   Socket timeout (seconds).
+            :return: ReplayResponse of response read.
+        """
+        start = time.time()
+        try:
+            response = self.__transport.urlopen(url, data, headers, timeout)
+            status = response.getcode()
+            response_headers = response.info()
+            body = response.read()
+        except urllib_error.HTTPError as ex:
+            status = ex.code
+            response_headers = ex.headers
+            body = ex.read() if ex.fp is not None else b""
+            self.__record(url, data, status, response_headers, body, start)
+            raise
+        self.__record(url, data, status, response_headers, body, start)
+        return ReplayResponse(status, dict(response_headers.items()), body,
+                              url)
+
+    def __record(self, url, data, status, headers, body, start):
+        parsed = urlparse.urlparse(url)
+        recorded_url = urlparse.urlunparse(
+            parsed[:4] + (redact(parsed.query),) + parsed[5:]
+        )
+        if data is not None:
+            data = redact(data.decode("utf-8"))
+
+        recorded = {
+            "status": status,
+            "headers": dict(
+                (name, value) for name, value in headers.items()
+                if name.lower() not in ("content-encoding",
+                                        "content-length",
+                                        "transfer-encoding",
+                                        "connection")
+            ),
+            "latency": round(time.time() - start, 3)
+        }
+        try:
+            recorded["body"] = body.decode("utf-8")
+        except UnicodeDecodeError:
+            recorded["body_base64"] = base64.b64encode(body).decode("ascii")
+
+        with self.__lock:
+            self.__interactions.append({
+                "request": {
+                    "method": "GET" if data is None else "POST",
+                    "url": recorded_url,
+                    "body": data
+                },
+                "response": recorded
+            })
+
+    def save(self, filepath):
+        """Write recorded interactions as cassette file.
+
+            :param str filepath: Path of cassette file.
+        """
+        with open(filepath, "w") as handle:
+            json.dump(
+                {"interactions": self.interactions},
+                handle,
+                indent=2,
+                sort_keys=True
+            )
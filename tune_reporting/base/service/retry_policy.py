@@ -0,0 +1,382 @@
+"""
+TUNE Retry Policy
+=============================================
+"""
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  retry_policy.py
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+
+import email.utils
+import random
+import socket
+import ssl
+import sys
+import threading
+import time
+
+if sys.version_info >= (3, 0, 0):
+    import urllib.error as urllib_error
+else:
+    import urllib2 as urllib_error
+
+#  HTTP status codes of transient failures.
+__retry_statuses__ = (429, 500, 502, 503, 504)
+
+#  Actions that place a new job on a queue each time they are sent, and
+#  so are only resent when the service rejected them unprocessed (429).
+__non_idempotent_actions__ = ("find_export_queue", "export")
+
+
+#  Global retry budget, shared by every request of a retry policy.
+#
+class RetryBudget(object):
+    """Token bucket limiting retries to a share of successful requests.
+
+    Every failed attempt takes one token and every successful request
+    gives back `token_ratio` tokens. Retries stop while the bucket holds
+    half of `max_tokens` or less, so during an outage clients fall back
+    to a single attempt per request instead of multiplying the load.
+    """
+
+    #  @var float
+    __max_tokens = None
+
+    #  @var float
+    __token_ratio = None
+
+    #  @var float
+    __tokens = None
+
+    #  @var object
+    __lock = None
+
+    #  The constructor
+    #
+    #  @param float max_tokens      Capacity of bucket.
+    #  @param float token_ratio     Tokens given back per success.
+    #
+    def __init__(self, max_tokens=10, token_ratio=0.1):
+        """The constructor.
+
+            :param float max_tokens:    Capacity of bucket.
+            :param float token_ratio:   Tokens given back per successful
+                                        request.
+        """
+        if max_tokens <= 0:
+            raise ValueError(
+                "Parameter 'max_tokens' is not valid: '{}'".format(max_tokens)
+            )
+        if token_ratio <= 0:
+            raise ValueError(
+                "Parameter 'token_ratio' is not valid: '{}'".format(
+                    token_ratio
+                )
+            )
+        self.__max_tokens = float(max_tokens)
+        self.__token_ratio = float(token_ratio)
+        self.__tokens = float(max_tokens)
+        self.__lock = threading.Lock()
+
+    @property
+    def tokens(self):
+        """Tokens left in bucket."""
+        return self.__tokens
+
+    def record_success(self):
+        """Give back tokens for a successful request."""
+        with self.__lock:
+            self.__tokens = min(
+                self.__max_tokens,
+                self.__tokens + self.__token_ratio
+            )
+
+    def record_failure(self):
+        """Take a token for a failed attempt.
+
+            :return: True if a retry is still allowed.
+            :rtype: bool
+        """
+        with self.__lock:
+            self.__tokens = max(0.0, self.__tokens - 1)
+            return self.__tokens > self.__max_tokens / 2
+
+
+#  Policy resending failed requests with exponential backoff.
+#
+class RetryPolicy(object):
+    """Policy resending failed requests of TuneServiceClient.
+
+    Idempotent actions are resent upon HTTP status codes 429 and 5xx,
+    socket timeouts and failed connections; actions placing an export
+    job on queue only upon 429. Attempts are spaced by exponential
+    backoff with full jitter, or by the 'Retry-After' response header.
+    """
+
+    #  Shared policy
+    #  @var RetryPolicy
+    __shared = None
+
+    #  @var object
+    __shared_lock = threading.Lock()
+
+    #  Maximum attempts per request, including the first.
+    #  @var int
+    __max_attempts = None
+
+    #  Seconds of backoff before first retry, doubled per retry.
+    #  @var float
+    __backoff_base = None
+
+    #  Maximum seconds of backoff.
+    #  @var float
+    __backoff_max = None
+
+    #  Maximum seconds waited for a 'Retry-After', failing if longer.
+    #  @var float
+    __retry_after_max = None
+
+    #  @var RetryBudget
+    __budget = None
+
+    #  The constructor
+    #
+    #  @param int   max_attempts        Maximum attempts per request.
+    #  @param float backoff_base        Backoff before first retry.
+    #  @param float backoff_max         Maximum backoff.
+    #  @param float retry_after_max     Maximum 'Retry-After' honored.
+    #  @param object budget             RetryBudget.
+    #
+    def __init__(self,
+                 max_attempts=4,
+                 backoff_base=0.5,
+                 backoff_max=30,
+                 retry_after_max=120,
+                 budget=None):
+        """The constructor.
+
+            :param int max_attempts:        Maximum attempts per request,
+                                            1 to disable retries.
+            :param float backoff_base:      Seconds of backoff before first
+                                            retry, doubled per retry.
+            :param float backoff_max:       Maximum seconds of backoff.
+            :param float retry_after_max:   Maximum seconds waited upon
+                                            'Retry-After', failing if
+                                            longer.
+            :param RetryBudget budget:      Retry budget shared by every
+                                            request of this policy.
+        """
+        if not isinstance(max_attempts, int) or max_attempts < 1:
+            raise ValueError(
+                "Parameter 'max_attempts' is not valid: '{}'".format(
+                    max_attempts
+                )
+            )
+        if backoff_base < 0 or backoff_max < 0:
+            raise ValueError(
+                "Parameter 'backoff_base' or 'backoff_max' is not valid."
+            )
+
+        self.__max_attempts = max_attempts
+        self.__backoff_base = backoff_base
+        self.__backoff_max = backoff_max
+        self.__retry_after_max = retry_after_max
+        self.__budget = budget if budget is not None else RetryBudget()
+
+    @classmethod
+    def shared_policy(cls):
+        """Retry policy shared by the SDK.
+
+            :rtype: RetryPolicy
+        """
+        with cls.__shared_lock:
+            if cls.__shared is None:
+                cls.__shared = cls()
+            return cls.__shared
+
+    @classmethod
+    def configure(cls, *args, **kwargs):
+        """Replace the retry policy shared by the SDK, provided the
+        constructor's parameters.
+
+            :rtype: RetryPolicy
+        """
+        policy = cls(*args, **kwargs)
+        with cls.__shared_lock:
+            cls.__shared = policy
+        return policy
+
+    @property
+    def max_attempts(self):
+        """Maximum attempts per request, including the first."""
+        return self.__max_attempts
+
+    @property
+    def budget(self):
+        """Retry budget shared by every request of this policy."""
+        return self.__budget
+
+    ## Send request, resending it upon transient failures.
+    #  @param str      action      TUNE Reporting API endpoint's action name.
+    #  @param callable send        Sends request once, raising
+    #                              TuneServiceException upon failure.
+    #  @return Return value of send.
+    def execute(self, action, send, deadline=None):
+        """Send request, resending it upon transient failures.
+
+            :param str action:          Action name of request.
+            :param callable send:       Sends request once, raising
+                                        TuneServiceException upon failure.
+            :param Deadline deadline:   No attempt is made after it.
+            :return: Return value of send.
+            :throws: TuneServiceException once no retry is left.
+        """
+        attempt = 0
+        while True:
+            try:
+                result = send()
+            except Exception as ex:
+                delay = self.backoff(action, ex, attempt)
+                if delay is None:
+                    raise
+                if deadline is not None and delay >= deadline.remaining():
+                    raise
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+            self.__budget.record_success()
+            return result
+
+    ## Seconds to wait before resending failed request.
+    #  @param str       action      Action name of request.
+    #  @param Exception error       Failure of attempt.
+    #  @param int       attempt     Failed attempt, starting at 0.
+    #  @return float, None if request should not be resent.
+    def backoff(self, action, error, attempt):
+        """Seconds to wait before resending failed request.
+
+            :param str action:          Action name of request.
+            :param Exception error:     Failure of attempt, possibly
+                                        wrapping URLError or HTTPError
+                                        as its 'errors'.
+            :param int attempt:         Failed attempt, starting at 0.
+            :return: Seconds, None if request should not be resent.
+            :rtype: float
+        """
+        cause = self.cause(error)
+        status = getattr(cause, "code", None) \
+            if isinstance(cause, urllib_error.HTTPError) else None
+
+        if status is not None:
+            if status not in __retry_statuses__:
+                return None
+        elif not self.is_transient(cause):
+            return None
+
+        if not self.is_idempotent(action) and status != 429:
+            return None
+
+        # Every transient failure takes from budget, even the last attempt.
+        if not self.__budget.record_failure():
+            return None
+        if attempt + 1 >= self.__max_attempts:
+            return None
+
+        delay = random.uniform(
+            0,
+            min(self.__backoff_max, self.__backoff_base * (2 ** attempt))
+        )
+
+        retry_after = self.retry_after(cause)
+        if retry_after is not None:
+            if retry_after > self.__retry_after_max:
+                return None
+            delay = max(delay, retry_after)
+
+        return delay
+
+    @staticmethod
+    def is_idempotent(action):
+        """Whether sending action twice has the effect of sending it once.
+
+            :param str action: Action name of request.
+            :rtype: bool
+        """
+        return action not in __non_idempotent_actions__
+
+    @staticmethod
+    def cause(error):
+        """Innermost exception wrapped as 'errors' by SDK exceptions."""
+        while not isinstance(error, urllib_error.URLError) and \
+                isinstance(getattr(error, "errors", None), Exception):
+            error = error.errors
+        return error
+
+    @staticmethod
+    def is_transient(error):
+        """Whether exception is a socket timeout or failed connection."""
+        if isinstance(error, urllib_error.URLError) and \
+           not isinstance(error, urllib_error.HTTPError):
+            error = error.reason
+        if isinstance(error, socket.timeout):
+            return True
+        if isinstance(error, getattr(ssl, "CertificateError", ())):
+            return False
+        return isinstance(error, socket.error)
+
+    @staticmethod
+    def retry_after(error):
+        """Seconds requested by header 'Retry-After' of HTTPError.
+
+            :return: Seconds, None if not provided.
+            :rtype: float
+        """
+        headers = getattr(error, "headers", None) or \
+            getattr(error, "hdrs", None)
+        if headers is None:
+            return None
+        value = headers.get("Retry-After")
+        if not value:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        parsed = email.utils.parsedate_tz(value)
+        if parsed is None:
+            return None
+        return max(0.0, email.utils.mktime_tz(parsed) - time.time())
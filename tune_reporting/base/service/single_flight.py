@@ -0,0 +1,153 @@
+"""
+TUNE Single-Flight Request Coalescing
+=============================================
+"""
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  single_flight.py
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+
+import threading
+
+from tune_reporting.helpers import (
+    TuneSdkException
+)
+
+
+#  Call in flight, awaited by callers of the same key.
+#
+class _Call(object):
+    """Call in flight, awaited by callers of the same key."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+#  Coalesces concurrent identical calls into a single call.
+#
+class SingleFlight(object):
+    """Coalesces concurrent identical calls into a single call.
+
+    The first caller of a key executes the call, callers of the same key
+    arriving while it is in flight wait and share its result, or its
+    exception. Calls made after it completed execute again.
+    """
+
+    #  Shared group
+    #  @var SingleFlight
+    __shared = None
+
+    #  @var object
+    __shared_lock = threading.Lock()
+
+    #  Calls in flight per key.
+    #  @var dict
+    __calls = None
+
+    #  @var object
+    __lock = None
+
+    def __init__(self):
+        """The constructor."""
+        self.__calls = {}
+        self.__lock = threading.Lock()
+
+    @classmethod
+    def shared_group(cls):
+        """Group of calls shared by the SDK.
+
+            :rtype: SingleFlight
+        """
+        with cls.__shared_lock:
+            if cls.__shared is None:
+                cls.__shared = cls()
+            return cls.__shared
+
+    def in_flight(self):
+        """Number of calls in flight."""
+        with self.__lock:
+            return len(self.__calls)
+
+    ## Execute call once for all concurrent callers of the same key.
+    #  @param tuple     key         Hashable key identifying call.
+    #  @param callable  function    Call to execute.
+    #  @return (result, bool shared)
+    def do(self, key, function, timeout=None):
+        """Execute call once for all concurrent callers of the same key.
+
+            :param tuple key:           Hashable key identifying call.
+            :param callable function:   Call to execute.
+            :param float timeout:       Seconds to wait for call in flight.
+            :return: (result of call, True if shared with another caller)
+            :throws: Exception raised by call.
+            :throws: TuneSdkException if call in flight did not complete
+                within timeout.
+        """
+        with self.__lock:
+            call = self.__calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self.__calls[key] = call
+            else:
+                call.waiters += 1
+
+        if not leader:
+            if not call.done.wait(timeout):
+                with self.__lock:
+                    call.waiters -= 1
+                raise TuneSdkException(
+                    "Exceeded timeout waiting for call in flight."
+                )
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = function()
+        except BaseException as ex:
+            call.error = ex
+            raise
+        finally:
+            with self.__lock:
+                del self.__calls[key]
+            call.done.set()
+
+        return call.result, call.waiters > 0
@@ -0,0 +1,148 @@
+"""
+TUNE Service Transports
+=============================================
+"""
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  transport.py
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+
+import socket
+import sys
+import threading
+from abc import ABCMeta, abstractmethod
+
+if sys.version_info >= (3, 0, 0):
+    import urllib.request as urllib_request
+else:
+    import urllib2 as urllib_request
+
+from tune_reporting.version import (
+    __sdk_name__,
+    __sdk_version__
+)
+
+
+#  Abstract base of both Python 2 and 3: the __metaclass__ attribute
+#  is ignored by Python 3.
+_TransportBase = ABCMeta("_TransportBase", (object,), {})
+
+
+#  Interface of transports sending HTTP requests of the SDK.
+#
+class Transport(_TransportBase):
+    """Interface of transports sending HTTP requests of the SDK.
+
+    A transport sends a request and returns a response object mimicking
+    the one returned by urlopen(): read(), readline(), iteration over
+    lines, getcode(), info() and geturl(). Failures are raised as
+    urllib's HTTPError, for HTTP status codes of 400 and above, or
+    URLError. A transport not implementing urlopen() cannot be created.
+    """
+
+    #  Transport used when a client is not provided one.
+    #  @var Transport
+    __default = None
+
+    #  @var object
+    __default_lock = threading.Lock()
+
+    @abstractmethod
+    def urlopen(self, url, data=None, headers=None, timeout=None):
+        """Send HTTP request.
+
+            :param str url:         Request URL.
+            :param bytes data:      Request body, sent with POST if provided.
+            :param dict headers:    Additional request headers.
+            :param float timeout:   Socket timeout (seconds).
+            :return: Response object.
+            :throws: HTTPError for HTTP status codes of 400 and above.
+            :throws: URLError upon connection failure.
+        """
+
+    @classmethod
+    def configure(cls, transport):
+        """Select transport used by the SDK when a client is not
+        provided one.
+
+            :param Transport transport: Transport, None to restore the
+                                        shared ConnectionPool.
+            :rtype: Transport
+        """
+        if transport is not None and not hasattr(transport, "urlopen"):
+            raise ValueError(
+                "Parameter 'transport' is not valid: '{}'".format(transport)
+            )
+        with Transport.__default_lock:
+            Transport.__default = transport
+        return transport
+
+    @classmethod
+    def default_transport(cls):
+        """Transport selected with configure(), None if not selected.
+
+            :rtype: Transport
+        """
+        return Transport.__default
+
+
+#  Transport opening a new connection for every request with urllib.
+#
+class UrllibTransport(Transport):
+    """Transport opening a new connection for every request with urllib,
+    as the SDK did before connections were pooled.
+    """
+
+    def urlopen(self, url, data=None, headers=None, timeout=None):
+        """Send HTTP request with urllib's urlopen().
+
+            :param str url:         Request URL.
+            :param bytes data:      Request body, sent with POST if provided.
+            :param dict headers:    Additional request headers.
+            :param float timeout:   Socket timeout (seconds).
+            :return: Response object of urlopen().
+        """
+        request_headers = {
+            "User-Agent": "{}/{}".format(__sdk_name__, __sdk_version__)
+        }
+        if headers:
+            request_headers.update(headers)
+
+        request = urllib_request.Request(url, data, request_headers)
+        if timeout is None:
+            timeout = socket._GLOBAL_DEFAULT_TIMEOUT
+        return urllib_request.urlopen(request, timeout=timeout)
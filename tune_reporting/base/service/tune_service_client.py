@@ -54,16 +54,36 @@ import json
 
 from .tune_service_request import (TuneManagementRequest)
 from .tune_service_response import (TuneServiceResponse)
+from .tune_service_response_stream import (TuneServiceResponseStream)
 from .constants import (
+    TUNE_REQUEST_MODE_AUTO,
     __tune_management_api_endpoint__,
+    __tune_management_api_timeout__,
     __tune_management_api_version__
 )
 from tune_reporting.helpers import (
+    Deadline,
     TuneSdkException
 )
 from .tune_service_proxy import (
     TuneServiceProxy
 )
+from .rate_limiter import (
+    RateLimiter
+)
+from .retry_policy import (
+    RetryPolicy
+)
+from .single_flight import (
+    SingleFlight
+)
+from .hedge_policy import (
+    HedgePolicy
+)
+from .circuit_breaker import (
+    CircuitBreaker,
+    TuneCircuitOpenException
+)
 
 
 #  TUNE MobileAppTracking TUNE Reporting API access class
@@ -83,6 +103,36 @@ class TuneServiceClient(object):
     #
     __response = None
 
+    #
+    #  @var object @see RetryPolicy
+    #
+    __retry_policy = None
+
+    #
+    #  @var object @see RateLimiter
+    #
+    __rate_limiter = None
+
+    #
+    #  @var object @see Transport
+    #
+    __transport = None
+
+    #
+    #  @var bool Coalesce concurrent identical requests.
+    #
+    __coalesce = True
+
+    #
+    #  @var object @see CircuitBreaker
+    #
+    __circuit_breaker = None
+
+    #
+    #  @var object @see HedgePolicy
+    #
+    __hedge_policy = None
+
     #  Constructor
     #
     #  @param str      controller           TUNE Reporting API endpoint
@@ -94,6 +144,15 @@ class TuneServiceClient(object):
     #  @param null|array  map_query_string Action's query string parameters.
     #  @param null|string api_url_endpoint  TUNE Reporting API endpoint path.
     #  @param null|string api_url_version   TUNE Reporting API version.
+    #  @param str      request_mode         Parameters sent within query
+    #                                       string, form or JSON body.
+    #  @param null|object retry_policy      RetryPolicy.
+    #  @param null|object rate_limiter      RateLimiter.
+    #  @param null|object transport         Transport.
+    #  @param bool     coalesce             Coalesce concurrent identical
+    #                                       requests.
+    #  @param null|object circuit_breaker   CircuitBreaker.
+    #  @param null|object hedge_policy      HedgePolicy.
     #
     def __init__(self,
                  controller,
@@ -102,7 +161,14 @@ class TuneServiceClient(object):
                  auth_type,
                  map_query_string=None,
                  api_url_endpoint=__tune_management_api_endpoint__,
-                 api_url_version=__tune_management_api_version__):
+                 api_url_version=__tune_management_api_version__,
+                 request_mode=TUNE_REQUEST_MODE_AUTO,
+                 retry_policy=None,
+                 rate_limiter=None,
+                 transport=None,
+                 coalesce=True,
+                 circuit_breaker=None,
+                 hedge_policy=None):
         """The constructor.
 
             :param str      controller:         TUNE Reporting API
@@ -118,6 +184,31 @@ class TuneServiceClient(object):
             :param str      api_url_endpoint:   TUNE Reporting API
                                                 endpoint path.
             :param str      api_url_version:    TUNE Reporting API version.
+            :param str      request_mode:       'query', 'form', 'json', or
+                                                'auto' for body only if URL
+                                                is too long.
+            :param RetryPolicy retry_policy:    Policy resending failed
+                                                requests, shared policy
+                                                if not provided.
+            :param RateLimiter rate_limiter:    Limiter pacing requests,
+                                                shared limiter if not
+                                                provided.
+            :param Transport transport:         Transport sending requests,
+                                                selected by
+                                                Transport.configure() if
+                                                not provided.
+            :param bool coalesce:               Share a single request and
+                                                response among concurrent
+                                                identical calls of
+                                                idempotent actions.
+            :param CircuitBreaker circuit_breaker: Breaker failing fast
+                                                while action's circuit is
+                                                open, shared breaker if
+                                                not provided.
+            :param HedgePolicy hedge_policy:    Policy duplicating slow
+                                                requests, the one selected
+                                                by HedgePolicy.configure()
+                                                if not provided, if any.
         """
         # controller
         if not controller or len(controller) < 1:
@@ -134,8 +225,15 @@ class TuneServiceClient(object):
             auth_type,
             map_query_string,
             api_url_endpoint,
-            api_url_version
+            api_url_version,
+            request_mode
         )
+        self.__retry_policy = retry_policy
+        self.__rate_limiter = rate_limiter
+        self.__transport = transport
+        self.__coalesce = coalesce
+        self.__circuit_breaker = circuit_breaker
+        self.__hedge_policy = hedge_policy
 
     @staticmethod
     def version():
@@ -145,26 +243,96 @@ class TuneServiceClient(object):
     #  Sends a request and gets a response from the TUNE Management
     #  API Service.
     #
-    def call(self):
+    #  @param null|object deadline  Deadline or seconds, bounding waits
+    #                               for rate limiter, retries and socket.
+    #
+    def call(self, deadline=None):
         """Sends a request and gets a response from the TUNE Management
         API Service.
+
+            :param Deadline deadline:   Deadline, or seconds from now,
+                                        bounding every wait of request.
+                                        A coalesced caller waits for call
+                                        in flight only for its own time
+                                        left, and resends request itself
+                                        if that call exceeded the deadline
+                                        of the caller that sent it.
+            :throws: TuneSdkException once deadline has passed.
         """
         response_success = False
+        deadline = Deadline.create(deadline)
 
         if self.__request is None or \
            not isinstance(self.__request, TuneManagementRequest):
             raise TuneSdkException("TuneManagementRequest was not defined.")
 
+        if self.__coalesce and \
+           RetryPolicy.is_idempotent(self.__request.action):
+            led = []
+
+            def lead():
+                led.append(True)
+                return self.__call(deadline)
+
+            try:
+                (self.__response, response_success), _ = \
+                    SingleFlight.shared_group().do(
+                        self.__request.key,
+                        lead,
+                        timeout=None if deadline is None
+                        else deadline.remaining())
+            except TuneSdkException:
+                # Shared call was bounded by its leader's deadline: a
+                # follower with time left sends request on its own.
+                if led or (deadline is not None and deadline.expired):
+                    raise
+                self.__response, response_success = self.__call(deadline)
+        else:
+            self.__response, response_success = self.__call(deadline)
+
+        return response_success
+
+    #  Sends request, resending it upon transient failures.
+    #
+    def __call(self, deadline):
+        """Sends request, resending it upon transient failures.
+
+            :param Deadline deadline:
+            :return: (TuneServiceResponse, bool success)
+        """
+        response_success = False
+        service_response = None
+
+        retry_policy = self.__retry_policy
+        if retry_policy is None:
+            retry_policy = RetryPolicy.shared_policy()
+
+        hedge_policy = self.__hedge_policy
+        if hedge_policy is None:
+            hedge_policy = HedgePolicy.default_policy()
+
+        def send():
+            if hedge_policy is None:
+                return self.__send(deadline)
+            return hedge_policy.execute(
+                self.__request.controller,
+                self.__request.action,
+                lambda: self.__send(deadline)
+            )
+
         try:
-            proxy = TuneServiceProxy(self.__request.url)
-            if proxy.execute():
-                json_string = proxy.response.read().decode('utf-8')
+            response, json_string = retry_policy.execute(
+                self.__request.action,
+                send,
+                deadline=deadline
+            )
+            if response is not None:
                 # Convert from json to python data
                 response_json = json.loads(json_string)
-                response_http_code = proxy.response.getcode()
-                response_headers = proxy.response.info()
+                response_http_code = response.getcode()
+                response_headers = response.info()
 
-                self.__response = TuneServiceResponse(
+                service_response = TuneServiceResponse(
                     response_json,
                     response_http_code,
                     response_headers,
@@ -174,6 +342,8 @@ class TuneServiceClient(object):
                 if response_http_code == 200:
                     response_success = True
 
+        except TuneCircuitOpenException:
+            raise
         except Exception as ex:
             raise TuneSdkException(
                 "Failed to execute client request ({}): ({})".format(
@@ -183,7 +353,127 @@ class TuneServiceClient(object):
                 ex
             )
 
-        return response_success
+        return service_response, response_success
+
+    #  Sends a request and gets a response from the TUNE Management
+    #  API Service, of which rows of 'data' are parsed while iterated.
+    #
+    def stream(self, deadline=None):
+        """Sends a request and gets a response from the TUNE Management
+        API Service, of which rows of 'data' are parsed while iterated,
+        bounding memory by a single row.
+
+            :param Deadline deadline:   Deadline, or seconds from now,
+                                        bounding request; socket reads
+                                        of rows time out by then.
+            :return: TuneServiceResponseStream
+        """
+        deadline = Deadline.create(deadline)
+        if self.__request is None or \
+           not isinstance(self.__request, TuneManagementRequest):
+            raise TuneSdkException("TuneManagementRequest was not defined.")
+
+        retry_policy = self.__retry_policy
+        if retry_policy is None:
+            retry_policy = RetryPolicy.shared_policy()
+
+        try:
+            response = retry_policy.execute(
+                self.__request.action,
+                lambda: self.__open(deadline),
+                deadline=deadline
+            )
+        except TuneCircuitOpenException:
+            raise
+        except Exception as ex:
+            raise TuneSdkException(
+                "Failed to execute client request ({}): ({})".format(
+                    str(self.__request),
+                    str(ex)
+                ),
+                ex
+            )
+
+        if response is None:
+            return None
+
+        self.__response = TuneServiceResponseStream(
+            response,
+            response.getcode(),
+            response.info(),
+            request_url=self.__request.url
+        )
+
+        return self.__response
+
+    #  Sends request once, reading its response body.
+    #
+    def __send(self, deadline=None):
+        """Sends request once, reading its response body.
+
+            :param Deadline deadline:
+            :return: (response, str json_string), (None, None) if request
+                was not executed.
+        """
+        response = self.__open(deadline)
+        if response is None:
+            return None, None
+
+        return response, response.read().decode('utf-8')
+
+    #  Sends request once.
+    #
+    def __open(self, deadline=None):
+        """Sends request once, without reading its response body.
+
+            :param Deadline deadline:
+            :return: Response object of transport, None if request was
+                not executed.
+            :throws: TuneCircuitOpenException while action's circuit
+                is open.
+        """
+        circuit_breaker = self.__circuit_breaker
+        if circuit_breaker is None:
+            circuit_breaker = CircuitBreaker.shared_breaker()
+        circuit = circuit_breaker.acquire(
+            self.__request.controller,
+            self.__request.action
+        )
+        try:
+            response = self.__send_once(deadline)
+        except Exception as ex:
+            circuit_breaker.record(circuit, ex)
+            raise
+        circuit_breaker.record(circuit)
+
+        return response
+
+    #  Paces and sends request once.
+    #
+    def __send_once(self, deadline):
+        rate_limiter = self.__rate_limiter
+        if rate_limiter is None:
+            rate_limiter = RateLimiter.shared_limiter()
+        rate_limiter.acquire(
+            self.__request.auth_key,
+            self.__request.controller,
+            self.__request.action,
+            deadline=deadline
+        )
+
+        proxy = TuneServiceProxy(
+            self.__request.url,
+            transport=self.__transport,
+            data=self.__request.body,
+            headers=self.__request.headers,
+            timeout=None if deadline is None else deadline.socket_timeout(
+                __tune_management_api_timeout__
+            )
+        )
+        if not proxy.execute():
+            return None
+
+        return proxy.response
 
     @property
     def request(self):
@@ -43,7 +43,7 @@ TUNE Service Proxy
 import sys
 
 if sys.version_info >= (3, 0, 0):
-    import urllib.request
+    import urllib.error
 else:
     import urllib2
 
@@ -51,6 +51,15 @@ from tune_reporting.helpers import (
     TuneSdkException,
     TuneServiceException
 )
+from .constants import (
+    __tune_management_api_timeout__
+)
+from .connection_pool import (
+    ConnectionPool
+)
+from .transport import (
+    Transport
+)
 
 
 #
@@ -63,7 +72,11 @@ class TuneServiceProxy(object):
     """
 
     __request_url = None
+    __request_data = None
+    __request_headers = None
     __response = None
+    __transport = None
+    __timeout = None
 
     @property
     def response(self):
@@ -72,10 +85,25 @@ class TuneServiceProxy(object):
 
     ## Constructor
     #  @param str request_url
-    def __init__(self, request_url):
+    #  @param object transport  Transport, configured transport or
+    #                           shared ConnectionPool if None.
+    #  @param bytes data        Encoded body of POST request.
+    #  @param dict headers      Request headers.
+    #  @param float timeout     Socket timeout in seconds.
+    def __init__(self, request_url, transport=None, data=None, headers=None,
+                 timeout=None):
         """The constructor
 
             :param str request_url:
+            :param Transport transport: Transport sending request, the one
+                                        selected by Transport.configure()
+                                        or the shared ConnectionPool if
+                                        not provided.
+            :param bytes data:          Encoded body, sent with POST
+                                        if provided.
+            :param dict headers:        Request headers.
+            :param float timeout:       Socket timeout in seconds,
+                                        60 if not provided.
         """
         if request_url is None or not isinstance(request_url, str):
             raise ValueError(
@@ -83,6 +111,16 @@ class TuneServiceProxy(object):
             )
 
         self.__request_url = request_url
+        self.__request_data = data
+        self.__request_headers = headers
+        if timeout is None:
+            timeout = __tune_management_api_timeout__
+        self.__timeout = timeout
+        if transport is None:
+            transport = Transport.default_transport()
+        if transport is None:
+            transport = ConnectionPool.shared_pool()
+        self.__transport = transport
 
     def execute(self):
         """HTTP POST request to TUNE MobileAppTracking TUNE Reporting API.
@@ -96,7 +134,12 @@ class TuneServiceProxy(object):
         self.__response = None
         if sys.version_info >= (3, 0, 0):
             try:
-                self.__response = urllib.request.urlopen(self.__request_url)
+                self.__response = self.__transport.urlopen(
+                    self.__request_url,
+                    data=self.__request_data,
+                    headers=self.__request_headers,
+                    timeout=self.__timeout
+                )
             except TuneSdkException as ex:
                 raise
             except TuneServiceException as ex:
@@ -127,7 +170,12 @@ class TuneServiceProxy(object):
                 )
         else:
             try:
-                self.__response = urllib2.urlopen(self.__request_url)
+                self.__response = self.__transport.urlopen(
+                    self.__request_url,
+                    data=self.__request_data,
+                    headers=self.__request_headers,
+                    timeout=self.__timeout
+                )
             except TuneSdkException as ex:
                 raise
             except TuneServiceException as ex:
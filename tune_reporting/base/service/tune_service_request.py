@@ -40,9 +40,19 @@ TUNE Service Request
 #  @link      https://developers.mobileapptracking.com @endlink
 #
 
+import json
+from collections import OrderedDict
+
 from tune_reporting.helpers import (
     TuneSdkException
 )
+from .constants import (
+    TUNE_REQUEST_MODE_AUTO,
+    TUNE_REQUEST_MODE_QUERY,
+    TUNE_REQUEST_MODE_FORM,
+    TUNE_REQUEST_MODE_JSON,
+    __tune_management_api_url_max__
+)
 from .query_string_builder import (
     QueryStringBuilder
 )
@@ -61,6 +71,13 @@ class TuneManagementRequest(object):
     __query_string_dict = None
     __api_url_endpoint = None
     __api_url_version = None
+    __request_mode = None
+
+    #  Encoded once upon first use, and reused by every send of request.
+    __query_string = None
+    __params = None
+    __url = None
+    __body = None
 
     #  Constructor
     #
@@ -73,6 +90,10 @@ class TuneManagementRequest(object):
     #  @param null|array  map_query_string Action's query string parameters.
     #  @param null|string api_url_endpoint  TUNE Reporting API endpoint path.
     #  @param null|string api_url_version   TUNE Reporting API version.
+    #  @param str      request_mode         TUNE_REQUEST_MODE_AUTO,
+    #                                       TUNE_REQUEST_MODE_QUERY,
+    #                                       TUNE_REQUEST_MODE_FORM or
+    #                                       TUNE_REQUEST_MODE_JSON.
     #
     def __init__(self,
                  controller,
@@ -81,7 +102,8 @@ class TuneManagementRequest(object):
                  auth_type,
                  map_query_string,
                  api_url_endpoint,
-                 api_url_version):
+                 api_url_version,
+                 request_mode=TUNE_REQUEST_MODE_AUTO):
         """The constructor.
 
             :param str      controller:         TUNE Reporting API
@@ -97,6 +119,12 @@ class TuneManagementRequest(object):
             :param str      api_url_endpoint:   TUNE Reporting API
                                                 endpoint path
             :param str      api_url_version:    TUNE Reporting API version
+            :param str      request_mode:       Parameters sent within
+                                                query string ('query'),
+                                                form body ('form'),
+                                                JSON body ('json'), or
+                                                body only if URL is too
+                                                long ('auto').
         """
         # -----------------------------------------------------------------
         # validate_fields inputs
@@ -112,6 +140,15 @@ class TuneManagementRequest(object):
             raise ValueError("Parameter 'api_url_endpoint' is not defined.")
         if not api_url_version or len(api_url_version) < 1:
             raise ValueError("Parameter 'api_url_version' is not defined.")
+        if request_mode not in (TUNE_REQUEST_MODE_AUTO,
+                                TUNE_REQUEST_MODE_QUERY,
+                                TUNE_REQUEST_MODE_FORM,
+                                TUNE_REQUEST_MODE_JSON):
+            raise ValueError(
+                "Parameter 'request_mode' is invalid: '{}'.".format(
+                    request_mode
+                )
+            )
 
         self.__controller = controller
         self.__action = action
@@ -120,6 +157,7 @@ class TuneManagementRequest(object):
         self.__query_string_dict = map_query_string
         self.__api_url_endpoint = api_url_endpoint
         self.__api_url_version = api_url_version
+        self.__request_mode = request_mode
 
     @property
     def controller(self):
@@ -161,6 +199,12 @@ class TuneManagementRequest(object):
     @property
     def query_string(self):
         """TUNE Reporting API query string."""
+        if self.__query_string is None:
+            self.__encode()
+        return self.__query_string
+
+    def __encode(self):
+        """Encode query string parameters."""
         qsb = QueryStringBuilder()
 
         qsb.add("sdk", __sdk_name__)
@@ -174,7 +218,25 @@ class TuneManagementRequest(object):
             for name, value in self.__query_string_dict.items():
                 qsb.add(name, value)
 
-        return str(qsb)
+        self.__query_string = str(qsb)
+        self.__params = qsb.params
+
+    @property
+    def key(self):
+        """Key identifying request regardless of order of its parameters:
+        (method, path, parameters including authentication).
+
+            :rtype: tuple
+        """
+        if self.__params is None:
+            self.__encode()
+        return (
+            self.method,
+            self.path,
+            tuple(sorted(
+                (name, str(value)) for name, value in self.__params
+            ))
+        )
 
     @property
     def path(self):
@@ -188,15 +250,71 @@ class TuneManagementRequest(object):
 
         return request_path
 
+    @property
+    def request_mode(self):
+        """How parameters are sent: TUNE_REQUEST_MODE_QUERY,
+        TUNE_REQUEST_MODE_FORM or TUNE_REQUEST_MODE_JSON.
+        """
+        if self.__request_mode == TUNE_REQUEST_MODE_AUTO:
+            request_url = "{0}?{1}".format(self.path, self.query_string)
+            if len(request_url) > __tune_management_api_url_max__:
+                self.__request_mode = TUNE_REQUEST_MODE_FORM
+            else:
+                self.__request_mode = TUNE_REQUEST_MODE_QUERY
+                self.__url = request_url
+        return self.__request_mode
+
+    @property
+    def method(self):
+        """HTTP method of request: GET or POST."""
+        if self.request_mode == TUNE_REQUEST_MODE_QUERY:
+            return "GET"
+        return "POST"
+
     @property
     def url(self):
         """TUNE Reporting API full service request."""
-        request_url = "{0}?{1}".format(
-            self.path,
-            self.query_string
-        )
+        if self.__url is None:
+            if self.request_mode == TUNE_REQUEST_MODE_QUERY:
+                self.__url = "{0}?{1}".format(
+                    self.path,
+                    self.query_string
+                )
+            else:
+                self.__url = self.path
+
+        return self.__url
+
+    @property
+    def body(self):
+        """Encoded body of POST request, None if sent with GET.
+
+            :rtype: bytes
+        """
+        request_mode = self.request_mode
+        if request_mode == TUNE_REQUEST_MODE_QUERY:
+            return None
 
-        return request_url
+        if self.__body is None:
+            if request_mode == TUNE_REQUEST_MODE_FORM:
+                body = self.query_string
+            else:
+                if self.__params is None:
+                    self.__encode()
+                body = json.dumps(OrderedDict(self.__params))
+            self.__body = body.encode('utf-8')
+
+        return self.__body
+
+    @property
+    def headers(self):
+        """HTTP headers describing body of request."""
+        request_mode = self.request_mode
+        if request_mode == TUNE_REQUEST_MODE_FORM:
+            return {"Content-Type": "application/x-www-form-urlencoded"}
+        if request_mode == TUNE_REQUEST_MODE_JSON:
+            return {"Content-Type": "application/json"}
+        return {}
 
     def __str__(self):
         """Pretty print.
@@ -209,5 +327,8 @@ class TuneManagementRequest(object):
         pretty += "\naction:\t " + str(self.__action)
         pretty += "\nauth_type:\t " + str(self.__auth_type)
         pretty += "\nauth_key:\t " + str(self.__auth_key)
+        pretty += "\nmethod:\t " + str(self.method)
         pretty += "\nurl:\t " + str(self.url)
+        if self.body is not None:
+            pretty += "\nbody:\t " + self.body.decode('utf-8')
         return pretty
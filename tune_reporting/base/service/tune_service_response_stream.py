@@ -0,0 +1,131 @@
+"""
+TUNE Service Streamed Response
+=============================================
+"""
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  tune_service_response_stream.py
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+
+from tune_reporting.helpers.json_stream_parser import (
+    JsonStreamParser
+)
+from .tune_service_response import (
+    TuneServiceResponse
+)
+
+
+#  Response of TUNE Service Client, of which rows of 'data' are parsed
+#  while iterated.
+#
+class TuneServiceResponseStream(TuneServiceResponse):
+    """Response of TUNE Service Client, of which rows of 'data' are
+    parsed while iterated instead of being held in memory.
+
+    Properties 'status_code', 'size' and 'errors' are available once
+    iteration has finished. Property 'data' is None, unless 'data' of
+    response was not a list.
+    """
+
+    #  @var object
+    __response = None
+
+    #  @var JsonStreamParser
+    __parser = None
+
+    #  @var bool
+    __finished = False
+
+    def __init__(self,
+                 response,
+                 response_http_code=None,
+                 response_headers=None,
+                 request_url=None):
+        """The constructor.
+
+            :param object response:             Response object of
+                                                transport, body not yet read.
+            :param str   response_http_code:    TUNE Reporting API Service
+                                                response HTTP code.
+            :param array response_headers:      TUNE Reporting API Service
+                                                response HTTP headers.
+            :param str   request_url:           TUNE Reporting API request
+                                                URL.
+        """
+        self.__response = response
+        self.__parser = JsonStreamParser(response)
+        self.__finished = False
+
+        # Members are gathered by parser while rows are iterated.
+        TuneServiceResponse.__init__(
+            self,
+            self.__parser.members,
+            response_http_code,
+            response_headers,
+            request_url
+        )
+
+    @property
+    def finished(self):
+        """Whether response has been parsed to the end."""
+        return self.__finished
+
+    def __iter__(self):
+        """Yield rows of 'data' portion of JSON response."""
+        if self.__finished:
+            return
+        try:
+            for row in self.__parser.iter_object("data"):
+                yield row
+            self.__finished = True
+        finally:
+            self.close()
+
+    def rows(self):
+        """Yield rows of 'data' portion of JSON response."""
+        return iter(self)
+
+    def close(self):
+        """Release response, discarding rows not yet parsed."""
+        if hasattr(self.__response, "close"):
+            self.__response.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -49,9 +49,43 @@ from .sdk_exception import (
 from .service_exception import (
     TuneServiceException
 )
+from .deadline import (
+    Deadline
+)
+from .report_downloader import (
+    MappedFile,
+    ReportDownloader
+)
+from .csv_record_counter import (
+    CSVRecordCounter
+)
+from .report_cache import (
+    ReportCache
+)
+from .report_parser_parallel import (
+    ParallelCSVParser,
+    ParsedBatch
+)
+from .report_projection import (
+    ReportProjection
+)
+from .report_row import (
+    ReportRow,
+    row_type,
+    rows_of_mappings
+)
 from .report_reader_csv import (
     ReportReaderCSV
 )
+from .report_reader_columnar import (
+    ReportReaderColumnar,
+    TUNE_COLUMN_INT,
+    TUNE_COLUMN_FLOAT,
+    TUNE_COLUMN_STR
+)
+from .report_reader_json_stream import (
+    ReportReaderJSONStream
+)
 from .sdk_config import (
     SdkConfig
 )
@@ -0,0 +1,153 @@
+"""
+TUNE Advertiser Report CSV Record Counter
+=============================================
+"""
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  csv_record_counter.py
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+from .deadline import (
+    Deadline
+)
+
+#  Number of bytes scanned at once.
+__chunk_size__ = 1024 * 1024
+
+
+## Counts records of CSV report without parsing them.
+#
+class CSVRecordCounter(object):
+    """Counts records of CSV report without parsing them.
+
+    Bytes are scanned chunk by chunk: a record ends at a newline outside
+    double quotes, so quoted values with embedded newlines are counted
+    once, and blank lines are not records, as csv.reader rows read by
+    ReportReaderCSV. Newlines are counted by bytes methods over the text
+    between quotes, not per byte, so scanning runs close to the speed of
+    reading the report.
+    """
+
+    #  Whether scanning is within a quoted value.
+    #  @var bool
+    __quoted = False
+
+    #  Records ended by a newline.
+    #  @var int
+    __records = 0
+
+    #  Whether scanning is at start of a line, nothing of it scanned yet.
+    #  @var bool
+    __line_start = True
+
+    def __init__(self):
+        """The constructor."""
+        self.__quoted = False
+        self.__records = 0
+        self.__line_start = True
+
+    ## Scan next chunk of report.
+    #  @param bytes chunk
+    def feed(self, chunk):
+        """Scan next chunk of report.
+
+            :param bytes chunk:
+        """
+        if not chunk:
+            return
+        if not self.__quoted and b'"' not in chunk:
+            self.__scan(chunk)
+            return
+        # Pieces alternate outside and within quoted values.
+        quoted = self.__quoted
+        for i, piece in enumerate(chunk.split(b'"')):
+            if i > 0:
+                # A quote is content of its line.
+                self.__line_start = False
+                quoted = not quoted
+            if not quoted and piece:
+                self.__scan(piece)
+        self.__quoted = quoted
+
+    #  Count records ended within text outside quoted values.
+    def __scan(self, text):
+        if b"\r" in text:
+            text = text.replace(b"\r", b"")
+            if not text:
+                return
+        newlines = text.count(b"\n")
+        if not newlines:
+            self.__line_start = False
+            return
+        # Newlines ending blank lines end no record.
+        blank = 1 if self.__line_start and text[:1] == b"\n" else 0
+        if b"\n\n" in text:
+            blank += text.split(b"\n")[1:-1].count(b"")
+        self.__records += newlines - blank
+        self.__line_start = text[-1:] == b"\n"
+
+    @property
+    def records(self):
+        """Records scanned, including last one not ended by a newline."""
+        return self.__records + (0 if self.__line_start else 1)
+
+    ## Count records of report stream.
+    #  @param object stream     File-like object of report.
+    #  @param object deadline   Deadline or seconds.
+    #  @param int    chunk_size Bytes read at once.
+    #  @return int
+    @staticmethod
+    def count(stream, deadline=None, chunk_size=__chunk_size__):
+        """Count records of report read from stream, including header.
+
+            :param object stream:       File-like object of report, as a
+                                        spooled file or download.
+            :param Deadline deadline:   Deadline, or seconds from now, by
+                                        which report must be scanned.
+            :param int chunk_size:      Bytes read at once.
+            :rtype: int
+            :throws: TuneSdkException once deadline has passed.
+        """
+        deadline = Deadline.create(deadline)
+        counter = CSVRecordCounter()
+        while True:
+            if deadline is not None:
+                deadline.check()
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                break
+            counter.feed(chunk)
+        return counter.records
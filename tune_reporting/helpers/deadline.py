@@ -0,0 +1,168 @@
+"""
+TUNE Deadline
+=============================================
+"""
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  deadline.py
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+
+import time
+
+from .sdk_exception import (
+    TuneSdkException
+)
+
+if hasattr(time, "monotonic"):
+    __clock__ = time.monotonic
+else:
+    __clock__ = time.time
+
+
+## Point in time by which a whole operation must complete.
+#
+class Deadline(object):
+    """Point in time by which a whole operation must complete: service
+    calls, export status polling and report download share it, so each
+    step is only given the time left, measured with a monotonic clock.
+    """
+
+    #  Seconds provided to operation.
+    #  @var float
+    __timeout = None
+
+    #  Clock value of deadline.
+    #  @var float
+    __expires = None
+
+    #  The constructor
+    #
+    #  @param float timeout     Seconds from now.
+    #
+    def __init__(self, timeout):
+        """The constructor.
+
+            :param float timeout: Seconds from now.
+        """
+        if not isinstance(timeout, (int, float)) or \
+           isinstance(timeout, bool) or timeout <= 0:
+            raise ValueError(
+                "Parameter 'timeout' is not valid: '{}'".format(timeout)
+            )
+        self.__timeout = float(timeout)
+        self.__expires = __clock__() + self.__timeout
+
+    @staticmethod
+    def create(deadline):
+        """Deadline provided a Deadline, seconds from now, or None.
+
+            :param Deadline|float deadline:
+            :return: Deadline, None if not provided.
+        """
+        if deadline is None or isinstance(deadline, Deadline):
+            return deadline
+        return Deadline(deadline)
+
+    @staticmethod
+    def earliest(*deadlines):
+        """Earliest of provided deadlines, ignoring None.
+
+            :return: Deadline, None if none provided.
+        """
+        earliest = None
+        for deadline in deadlines:
+            if deadline is None:
+                continue
+            if earliest is None or \
+               deadline.remaining() < earliest.remaining():
+                earliest = deadline
+        return earliest
+
+    @property
+    def timeout(self):
+        """Seconds provided to operation."""
+        return self.__timeout
+
+    def remaining(self):
+        """Seconds left before deadline, 0 once expired.
+
+            :rtype: float
+        """
+        return max(0.0, self.__expires - __clock__())
+
+    @property
+    def expired(self):
+        """Whether deadline has passed."""
+        return self.remaining() <= 0
+
+    def check(self):
+        """Raise if deadline has passed.
+
+            :throws: TuneSdkException
+        """
+        if self.expired:
+            raise TuneSdkException(
+                "Exceeded deadline of {} seconds.".format(self.__timeout)
+            )
+
+    def socket_timeout(self, default=None):
+        """Socket timeout of a request sent now: time left, at most
+        the provided default.
+
+            :param float default: Socket timeout without deadline.
+            :rtype: float
+            :throws: TuneSdkException if deadline has passed.
+        """
+        self.check()
+        remaining = self.remaining()
+        if default is None:
+            return remaining
+        return min(remaining, default)
+
+    def sleep(self, seconds):
+        """Sleep provided seconds, waking up at deadline at the latest.
+
+            :param float seconds:
+        """
+        seconds = min(seconds, self.remaining())
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def __str__(self):
+        return "Deadline({:.3f}s of {}s left)".format(
+            self.remaining(), self.__timeout
+        )
@@ -0,0 +1,230 @@
+"""
+TUNE Streaming JSON Parser
+=============================================
+"""
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  json_stream_parser.py
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+
+import codecs
+import json
+
+#  Number of bytes read at once from stream.
+__chunk_size__ = 64 * 1024
+
+#  JSON insignificant whitespace.
+__whitespace__ = " \t\n\r"
+
+
+## Incremental parser of a JSON document read from a stream.
+#
+class JsonStreamParser(object):
+    """Incremental parser of a JSON document read from a stream.
+
+    Elements of a streamed array are parsed and returned one at a time,
+    so memory is bounded by the largest element and not by the document.
+    """
+
+    #  Stream of UTF-8 encoded JSON.
+    #  @var object
+    __stream = None
+
+    #  @var int
+    __chunk_size = None
+
+    #  @var object
+    __decoder = None
+
+    #  @var object
+    __json = None
+
+    #  Decoded text not yet parsed starts at __pos.
+    #  @var str
+    __buffer = ""
+
+    #  @var int
+    __pos = 0
+
+    #  @var bool
+    __eof = False
+
+    #  Members of a parsed object, other than its streamed array.
+    #  @var dict
+    __members = None
+
+    #  The constructor
+    #
+    #  @param object stream     File-like object providing read(size).
+    #  @param int chunk_size    Number of bytes read at once.
+    #
+    def __init__(self, stream, chunk_size=__chunk_size__):
+        """The constructor.
+
+            :param object stream:   File-like object, read(size) returning
+                                    UTF-8 encoded JSON.
+            :param int chunk_size:  Number of bytes read at once.
+        """
+        if stream is None or not hasattr(stream, "read"):
+            raise ValueError(
+                "Parameter 'stream' is not valid: '{}'".format(stream)
+            )
+        self.__stream = stream
+        self.__chunk_size = chunk_size
+        self.__decoder = codecs.getincrementaldecoder("utf-8")()
+        self.__json = json.JSONDecoder()
+        self.__buffer = ""
+        self.__pos = 0
+        self.__eof = False
+        self.__members = {}
+
+    @property
+    def members(self):
+        """Members of parsed object, other than its streamed array."""
+        return self.__members
+
+    ## Yield elements of the array provided as document.
+    def iter_array(self):
+        """Yield elements of the array provided as document.
+
+            :throws: ValueError if document is not a JSON array.
+        """
+        self.__expect("[")
+        if self.__peek() == "]":
+            self.__pos += 1
+            return
+        while True:
+            yield self.__value()
+            if self.__next_separator("]"):
+                return
+
+    ## Yield elements of an array member of the object provided as
+    #  document, gathering its other members.
+    #  @param str array_key     Name of array member to stream.
+    def iter_object(self, array_key):
+        """Yield elements of an array member of the object provided as
+        document. Other members are gathered within property 'members'.
+
+            :param str array_key: Name of array member to stream.
+            :throws: ValueError if document is not a JSON object.
+        """
+        self.__expect("{")
+        if self.__peek() == "}":
+            self.__pos += 1
+            return
+        while True:
+            key = self.__value()
+            self.__expect(":")
+            if key == array_key and self.__peek() == "[":
+                for element in self.iter_array():
+                    yield element
+            else:
+                self.__members[key] = self.__value()
+            if self.__next_separator("}"):
+                return
+
+    def __fill(self):
+        """Read next chunk of stream into buffer.
+
+            :return: False once stream was read to the end.
+        """
+        if self.__eof:
+            return False
+        chunk = self.__stream.read(self.__chunk_size)
+        if chunk and not isinstance(chunk, bytes):
+            chunk = chunk.encode("utf-8")
+        self.__buffer = self.__buffer[self.__pos:] + \
+            self.__decoder.decode(chunk or b"", final=not chunk)
+        self.__pos = 0
+        if not chunk:
+            self.__eof = True
+        return True
+
+    def __peek(self):
+        """Next significant character, None at end of document."""
+        while True:
+            while self.__pos < len(self.__buffer) and \
+                    self.__buffer[self.__pos] in __whitespace__:
+                self.__pos += 1
+            if self.__pos < len(self.__buffer):
+                return self.__buffer[self.__pos]
+            if not self.__fill():
+                return None
+
+    def __expect(self, character):
+        found = self.__peek()
+        if found != character:
+            raise ValueError(
+                "Expecting '{}' but found '{}' in JSON document.".format(
+                    character, found
+                )
+            )
+        self.__pos += 1
+
+    def __next_separator(self, closing):
+        """Consume ',' or closing character following a value.
+
+            :return: True upon closing character.
+        """
+        found = self.__peek()
+        if found == ",":
+            self.__pos += 1
+            return False
+        if found == closing:
+            self.__pos += 1
+            return True
+        raise ValueError(
+            "Expecting ',' or '{}' but found '{}' in JSON document.".format(
+                closing, found
+            )
+        )
+
+    def __value(self):
+        """Parse next value, reading stream until value is complete."""
+        self.__peek()
+        while True:
+            try:
+                value, end = self.__json.raw_decode(self.__buffer, self.__pos)
+            except ValueError:
+                if not self.__fill():
+                    raise
+                continue
+            # A number at the end of buffer may continue within next chunk.
+            if end == len(self.__buffer) and self.__fill():
+                continue
+            self.__pos = end
+            return value
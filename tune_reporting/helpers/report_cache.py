@@ -0,0 +1,466 @@
+"""
+TUNE Advertiser Report Cache
+=============================================
+"""
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  report_cache.py
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+import calendar
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+from datetime import datetime, timedelta
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:
+    ZoneInfo = None
+
+try:
+    import fcntl
+    msvcrt = None
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+from .deadline import (
+    Deadline
+)
+from tune_reporting.base.service.tune_service_response import (
+    TuneServiceResponse
+)
+
+#  Hours west of UTC of its westernmost timezone, bounding when a date
+#  window of an unknown timezone ends.
+__westernmost_offset__ = timedelta(hours=12)
+
+#  Replace file atomically, even if it exists.
+if hasattr(os, "replace"):
+    __replace__ = os.replace
+else:
+    __replace__ = os.rename
+
+
+#  Exclusive lock of a file shared by processes, held while open.
+#
+class _FileLock(object):
+    """Exclusive lock of a file shared by processes."""
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self.handle = None
+
+    def __enter__(self):
+        self.handle = open(self.filepath, "a+b")
+        if fcntl is not None:
+            fcntl.flock(self.handle.fileno(), fcntl.LOCK_EX)
+        else:
+            while True:
+                try:
+                    self.handle.seek(0)
+                    msvcrt.locking(self.handle.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except IOError:
+                    pass
+        return self
+
+    def __exit__(self, *args):
+        try:
+            if fcntl is not None:
+                fcntl.flock(self.handle.fileno(), fcntl.LOCK_UN)
+            else:
+                self.handle.seek(0)
+                msvcrt.locking(self.handle.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            self.handle.close()
+            self.handle = None
+
+
+## Content-addressed local cache of exported report files.
+#
+class ReportCache(object):
+    """Content-addressed local cache of exported report files.
+
+    Report files are keyed by a canonical hash of account, report
+    controller and export query. Once selected with configure(), export()
+    of a query already cached returns its job without placing a new one
+    on queue, fetch() of that job returns its completed status without
+    polling, and readers read the cached file instead of downloading.
+
+    Files are spooled under an exclusive file lock of their key, so that
+    processes sharing the cache directory download a report once, then
+    renamed into place. Least recently read files are removed once cache
+    exceeds 'max_bytes'. Only queries whose date window ended 'settle'
+    seconds ago are cached, as reports of open windows still change.
+    """
+
+    #  Cache used by endpoints and readers.
+    #  @var ReportCache
+    __default = None
+
+    #  @var object
+    __default_lock = threading.Lock()
+
+    #  @var str
+    __directory = None
+
+    #  @var int
+    __max_bytes = None
+
+    #  @var float
+    __settle = None
+
+    #  The constructor
+    #
+    #  @param str   directory   Cache directory.
+    #  @param int   max_bytes   Bytes of report files kept.
+    #  @param float settle      Seconds after end of date window.
+    #
+    def __init__(self, directory, max_bytes=1024 * 1024 * 1024, settle=86400):
+        """The constructor.
+
+            :param str directory:   Cache directory, created if missing,
+                                    may be shared by processes.
+            :param int max_bytes:   Bytes of report files kept, least
+                                    recently read removed beyond.
+            :param float settle:    Seconds after end of a query's date
+                                    window before its report is cached.
+        """
+        if not directory:
+            raise ValueError(
+                "Parameter 'directory' is not defined."
+            )
+        if max_bytes <= 0:
+            raise ValueError(
+                "Parameter 'max_bytes' is not valid: '{}'".format(max_bytes)
+            )
+        if settle < 0:
+            raise ValueError(
+                "Parameter 'settle' is not valid: '{}'".format(settle)
+            )
+
+        self.__directory = directory
+        self.__max_bytes = max_bytes
+        self.__settle = settle
+        for name in ("reports", "index", "refs", "locks"):
+            path = os.path.join(directory, name)
+            if not os.path.isdir(path):
+                try:
+                    os.makedirs(path)
+                except OSError:
+                    if not os.path.isdir(path):
+                        raise
+
+    @classmethod
+    def configure(cls, cache):
+        """Select cache consulted by endpoints' export(), fetch() and
+        report readers.
+
+            :param ReportCache cache:   Cache, None to stop caching.
+            :rtype: ReportCache
+        """
+        if cache is not None and not isinstance(cache, ReportCache):
+            raise ValueError(
+                "Parameter 'cache' is not valid: '{}'".format(cache)
+            )
+        with ReportCache.__default_lock:
+            ReportCache.__default = cache
+        return cache
+
+    @classmethod
+    def default_cache(cls):
+        """Cache selected with configure(), None if not selected.
+
+            :rtype: ReportCache
+        """
+        with ReportCache.__default_lock:
+            return ReportCache.__default
+
+    @property
+    def directory(self):
+        """Cache directory."""
+        return self.__directory
+
+    @property
+    def max_bytes(self):
+        """Bytes of report files kept."""
+        return self.__max_bytes
+
+    @staticmethod
+    def key(controller, map_query_string, auth_key=None):
+        """Canonical hash of export query of an account.
+
+            :param str controller:          Report controller.
+            :param dict map_query_string:   Query of export.
+            :param str auth_key:            Authentication key of account.
+            :rtype: str
+        """
+        account = None
+        if auth_key is not None:
+            account = hashlib.sha256(auth_key.encode("utf-8")).hexdigest()
+        canonical = json.dumps(
+            [account, controller, map_query_string],
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def cacheable(self, map_query_string):
+        """Whether query's date window ended at least 'settle' seconds ago,
+        in query's 'response_timezone'. Without it, or if timezone is not
+        known, window is taken as ending in the westernmost timezone,
+        the latest it may end.
+
+            :param dict map_query_string:   Query of export.
+            :rtype: bool
+        """
+        end_date = map_query_string.get("end_date")
+        if not end_date:
+            return False
+        try:
+            ended = datetime.strptime(end_date, "%Y-%m-%d %H:%M:%S")
+        except ValueError:
+            try:
+                ended = datetime.strptime(end_date, "%Y-%m-%d")
+            except ValueError:
+                return False
+            ended = ended.replace(hour=23, minute=59, second=59)
+        ended = self.__utc(ended, map_query_string.get("response_timezone"))
+        age = time.time() - calendar.timegm(ended.timetuple())
+        return age >= self.__settle
+
+    #  UTC time of local time within timezone.
+    @staticmethod
+    def __utc(local, timezone):
+        if timezone and ZoneInfo is not None:
+            try:
+                offset = local.replace(tzinfo=ZoneInfo(timezone)).utcoffset()
+                return local - offset
+            except (KeyError, ValueError):
+                pass
+        return local + __westernmost_offset__
+
+    def report_path(self, key):
+        """Local file of report of key, existing once cached."""
+        return os.path.join(self.__directory, "reports", key)
+
+    def __path(self, kind, name):
+        if kind == "refs":
+            name = hashlib.sha256(name.encode("utf-8")).hexdigest()
+        return os.path.join(self.__directory, kind, name)
+
+    def __load(self, kind, name):
+        try:
+            with open(self.__path(kind, name), "r") as handle:
+                return json.load(handle)
+        except (IOError, OSError, ValueError):
+            return None
+
+    #  Write file by renaming a complete temporary file into place.
+    def __store(self, kind, name, value):
+        path = self.__path(kind, name)
+        handle, temporary = tempfile.mkstemp(
+            dir=os.path.dirname(path), suffix=".tmp"
+        )
+        try:
+            with os.fdopen(handle, "w") as stream:
+                json.dump(value, stream)
+            __replace__(temporary, path)
+        except Exception:
+            if os.path.isfile(temporary):
+                os.remove(temporary)
+            raise
+
+    def submitted(self, key, job_id):
+        """Record export job placed on queue for query of key."""
+        self.__store("refs", "job:" + job_id, {"key": key})
+
+    def completed(self, job_id, report_url, response_json):
+        """Record report URL and status response of completed export job,
+        so that report is cached once read.
+
+            :param str job_id:          Job identifier.
+            :param str report_url:      Report URL of completed export.
+            :param dict response_json:  Full status response of endpoint,
+                                        returned as is upon cache hits.
+            :return: Key of job, None if job's query is not cached.
+        """
+        ref = self.__load("refs", "job:" + job_id)
+        if ref is None:
+            return None
+        key = ref["key"]
+        self.__store("index", key, {
+            "job_id": job_id,
+            "report_url": report_url,
+            "response": response_json
+        })
+        self.__store("refs", "url:" + report_url, {"key": key})
+        return key
+
+    def contains(self, key):
+        """Whether report of key is cached."""
+        return os.path.isfile(self.report_path(key))
+
+    def cached_job(self, key):
+        """Export job whose report of key is cached.
+
+            :rtype: str, None if not cached.
+        """
+        entry = self.__load("index", key)
+        if entry is None or not self.contains(key):
+            return None
+        return entry["job_id"]
+
+    def completed_response(self, job_id):
+        """Completed export status of job whose report is cached.
+
+            :rtype: TuneServiceResponse, None if not cached.
+        """
+        ref = self.__load("refs", "job:" + job_id)
+        if ref is None:
+            return None
+        entry = self.__load("index", ref["key"])
+        if entry is None or not entry.get("response") or \
+           not self.contains(ref["key"]):
+            return None
+        # Status response as endpoint returned it, as its report URL is
+        # not within same field of every endpoint.
+        return TuneServiceResponse(entry["response"], 200)
+
+    ## Local file of report URL, downloaded unless cached.
+    #  @param str    report_url Report URL of completed export.
+    #  @param object deadline   Deadline or seconds bounding download.
+    #  @return str file path, None if report URL is not cached
+    def get(self, report_url, deadline=None):
+        """Local file of report URL of a cached query, spooled once
+        amongst processes sharing cache.
+
+            :param str report_url:      Report URL of completed export.
+            :param Deadline deadline:   Deadline, or seconds from now, by
+                                        which report must be spooled.
+            :return: Local file path, None if report URL is not of a
+                cached query.
+            :throws: TuneSdkException if download failed.
+        """
+        ref = self.__load("refs", "url:" + report_url)
+        if ref is None:
+            return None
+        key = ref["key"]
+        filepath = self.report_path(key)
+        if not os.path.isfile(filepath):
+            # Not imported with module: endpoints import this module while
+            # report_downloader is being imported.
+            from .report_downloader import ReportDownloader
+
+            deadline = Deadline.create(deadline)
+            with _FileLock(self.__path("locks", key)):
+                # Spooled by another process while waiting for lock.
+                if not os.path.isfile(filepath):
+                    ReportDownloader(
+                        report_url, filepath=filepath
+                    ).download(deadline)
+            self.evict(keep=filepath)
+        try:
+            os.utime(filepath, None)
+        except OSError:
+            return None
+        return filepath
+
+    def size(self):
+        """Bytes of cached report files."""
+        return sum(size for _, size, _ in self.__reports())
+
+    def __reports(self):
+        directory = os.path.join(self.__directory, "reports")
+        reports = []
+        for name in os.listdir(directory):
+            # Spooled by ReportDownloader, not yet renamed into place.
+            if name.endswith(".part"):
+                continue
+            path = os.path.join(directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            reports.append((stat.st_mtime, stat.st_size, name))
+        return reports
+
+    def evict(self, keep=None):
+        """Remove least recently read report files beyond 'max_bytes'.
+
+            :param str keep:    Report file never removed.
+            :return: Keys removed.
+            :rtype: list
+        """
+        reports = sorted(self.__reports())
+        total = sum(size for _, size, _ in reports)
+        removed = []
+        for _, size, name in reports:
+            if total <= self.__max_bytes:
+                break
+            path = os.path.join(self.__directory, "reports", name)
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                # Removed by another process, or open elsewhere.
+                continue
+            total -= size
+            removed.append(name)
+        return removed
+
+    def clear(self):
+        """Remove every cached report file.
+
+            :return: Keys removed.
+            :rtype: list
+        """
+        removed = []
+        for _, _, name in self.__reports():
+            try:
+                os.remove(os.path.join(self.__directory, "reports", name))
+            except OSError:
+                continue
+            removed.append(name)
+        return removed
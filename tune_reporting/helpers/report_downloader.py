@@ -0,0 +1,420 @@
+"""
+TUNE Advertiser Report Downloader
+=============================================
+"""
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  report_downloader.py
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+
+import io
+import mmap
+import os
+import re
+import tempfile
+import time
+
+from .deadline import (
+    Deadline
+)
+from .sdk_exception import (
+    TuneSdkException
+)
+from .service_exception import (
+    TuneServiceException
+)
+from tune_reporting.base.service.constants import (
+    __tune_management_api_timeout__
+)
+from tune_reporting.base.service.tune_service_proxy import (
+    TuneServiceProxy
+)
+
+#  Number of bytes read at once from download.
+__chunk_size__ = 1024 * 1024
+
+#  Suffix of file being spooled.
+__partial_suffix__ = ".part"
+
+#  Value of response header 'Content-Range': bytes <first>-<last>/<length>.
+__content_range__ = re.compile(r"bytes\s+(\d+)-(\d+)/(\d+|\*)")
+
+
+## Read-only memory mapped file.
+#
+class MappedFile(object):
+    """Read-only memory mapped file, read as a file object: read(),
+    readline() and iteration over lines, buffered by the OS page cache.
+    """
+
+    #  @var object
+    __file = None
+
+    #  @var object
+    __map = None
+
+    def __init__(self, filepath):
+        """The constructor.
+
+            :param str filepath:    File to map.
+        """
+        self.__file = open(filepath, "rb")
+        if os.fstat(self.__file.fileno()).st_size > 0:
+            self.__map = mmap.mmap(
+                self.__file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+        else:
+            # Empty files cannot be mapped.
+            self.__map = io.BytesIO(b"")
+
+    @property
+    def map(self):
+        """Memory map of file."""
+        return self.__map
+
+    def read(self, size=-1):
+        """Read bytes from current position."""
+        if size is None or size < 0:
+            return self.__map.read()
+        return self.__map.read(size)
+
+    def readline(self):
+        """Read line from current position."""
+        return self.__map.readline()
+
+    def __iter__(self):
+        return iter(self.__map.readline, b"")
+
+    def __len__(self):
+        return len(self.__map.getvalue()) \
+            if isinstance(self.__map, io.BytesIO) else len(self.__map)
+
+    def close(self):
+        """Unmap and close file."""
+        self.__map.close()
+        self.__file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+## Spools report download to a local file, resuming interrupted downloads.
+#
+class ReportDownloader(object):
+    """Spools report download to a local file.
+
+    Once interrupted, download resumes from the bytes already spooled with
+    an HTTP 'Range' request, conditional upon the report being unchanged
+    ('If-Range'). A partially spooled file, kept with suffix '.part',
+    is resumed as well by a later download of the same file path. The
+    spooled file is then handed to readers, read directly or through
+    mmap.
+    """
+
+    #  @var str
+    __report_url = None
+
+    #  @var str
+    __filepath = None
+
+    #  @var int
+    __max_resumes = None
+
+    #  @var float
+    __backoff = None
+
+    #  @var int
+    __chunk_size = None
+
+    #  Requests resumed after an interruption.
+    #  @var int
+    __resumes = 0
+
+    #  @var int
+    __size = None
+
+    #  Validator of report served, as ETag, sent with 'If-Range'.
+    #  @var str
+    __validator = None
+
+    #  The constructor
+    #
+    #  @param str   report_url      Download report URL.
+    #  @param str   filepath        Local file spooled.
+    #  @param int   max_resumes     Interruptions tolerated.
+    #  @param float backoff         Delay before resuming (seconds).
+    #  @param int   chunk_size      Bytes read at once.
+    #
+    def __init__(self,
+                 report_url,
+                 filepath=None,
+                 max_resumes=5,
+                 backoff=0.5,
+                 chunk_size=__chunk_size__):
+        """The constructor.
+
+            :param str report_url:      Download report URL.
+            :param str filepath:        Local file spooled, a temporary
+                                        file removed by remove() if not
+                                        provided.
+            :param int max_resumes:     Interruptions tolerated before
+                                        download fails.
+            :param float backoff:       Delay before resuming, doubled
+                                        upon every further interruption
+                                        (seconds).
+            :param int chunk_size:      Bytes read at once.
+        """
+        if not report_url or \
+           not isinstance(report_url, str) or \
+           len(report_url) < 1:
+            raise ValueError("Parameter 'report_url' is not defined.")
+        if max_resumes < 0:
+            raise ValueError(
+                "Parameter 'max_resumes' is not valid: '{}'".format(
+                    max_resumes
+                )
+            )
+
+        self.__report_url = report_url
+        if filepath is None:
+            handle, filepath = tempfile.mkstemp(suffix=".report")
+            os.close(handle)
+            os.remove(filepath)
+        self.__filepath = filepath
+        self.__max_resumes = max_resumes
+        self.__backoff = backoff
+        self.__chunk_size = chunk_size
+        self.__resumes = 0
+        self.__size = None
+
+    @property
+    def report_url(self):
+        """Download report URL."""
+        return self.__report_url
+
+    @property
+    def filepath(self):
+        """Local file spooled."""
+        return self.__filepath
+
+    @property
+    def resumes(self):
+        """Requests resumed after an interruption."""
+        return self.__resumes
+
+    @property
+    def size(self):
+        """Bytes spooled, None until downloaded."""
+        return self.__size
+
+    @property
+    def downloaded(self):
+        """Whether report was spooled completely."""
+        return os.path.isfile(self.__filepath)
+
+    ## Spool report to local file.
+    #  @param object deadline   Deadline or seconds.
+    #  @return str file path
+    def download(self, deadline=None):
+        """Spool report to local file, unless already spooled.
+
+            :param Deadline deadline:   Deadline, or seconds from now, by
+                                        which report must be spooled.
+            :return: Local file path.
+            :rtype: str
+            :throws: TuneSdkException if download failed after
+                'max_resumes' interruptions, or once deadline passed.
+            :throws: TuneServiceException if report cannot be requested.
+        """
+        if self.downloaded:
+            self.__size = os.path.getsize(self.__filepath)
+            return self.__filepath
+
+        deadline = Deadline.create(deadline)
+        partial = self.__filepath + __partial_suffix__
+        failures = 0
+
+        while True:
+            if deadline is not None:
+                deadline.check()
+            offset = os.path.getsize(partial) \
+                if os.path.isfile(partial) else 0
+            try:
+                self.__spool(partial, offset, deadline)
+                break
+            except TuneSdkException:
+                raise
+            except Exception as ex:
+                if not self.__resumable(ex):
+                    raise
+                failures += 1
+                if failures > self.__max_resumes:
+                    raise TuneSdkException(
+                        "Failed to download report after {} attempts: "
+                        "(Error:{})".format(failures, str(ex)),
+                        ex
+                    )
+                delay = self.__backoff * (2 ** (failures - 1))
+                if deadline is not None:
+                    deadline.sleep(delay)
+                else:
+                    time.sleep(delay)
+                self.__resumes += 1
+
+        os.rename(partial, self.__filepath)
+        self.__size = os.path.getsize(self.__filepath)
+        return self.__filepath
+
+    #  Request report from offset, appending it to partial file.
+    def __spool(self, partial, offset, deadline):
+        headers = {"Accept-Encoding": "identity"}
+        if offset > 0:
+            headers["Range"] = "bytes={}-".format(offset)
+            if self.__validator:
+                headers["If-Range"] = self.__validator
+
+        timeout = None
+        if deadline is not None:
+            timeout = deadline.socket_timeout(__tune_management_api_timeout__)
+        proxy = TuneServiceProxy(
+            self.__report_url, headers=headers, timeout=timeout
+        )
+        try:
+            proxy.execute()
+        except TuneServiceException as ex:
+            # Range no longer satisfiable: spool again from the start.
+            if offset > 0 and getattr(ex.errors, "code", None) == 416:
+                os.remove(partial)
+            raise
+        response = proxy.response
+        info = response.info()
+
+        length = None
+        if response.getcode() == 206:
+            match = __content_range__.match(info.get("Content-Range") or "")
+            if match is None or int(match.group(1)) != offset:
+                os.remove(partial)
+                raise IOError("Unexpected Content-Range of report.")
+            if match.group(3) != "*":
+                length = int(match.group(3))
+        else:
+            # Report served whole, as it changed or ranges are not
+            # supported.
+            offset = 0
+            if info.get("Content-Length"):
+                length = int(info.get("Content-Length"))
+
+        self.__validator = info.get("ETag") or info.get("Last-Modified")
+        encoding = (info.get("Content-Encoding") or "identity").lower()
+        resumable = encoding == "identity"
+
+        with open(partial, "ab" if offset > 0 else "wb") as handle:
+            try:
+                while True:
+                    if deadline is not None:
+                        deadline.check()
+                    chunk = response.read(self.__chunk_size)
+                    if not chunk:
+                        break
+                    handle.write(chunk)
+                    offset += len(chunk)
+            except TuneSdkException:
+                raise
+            except Exception:
+                if not resumable:
+                    handle.truncate(0)
+                raise
+        if resumable and length is not None and offset < length:
+            raise IOError(
+                "Report download interrupted at {} of {} bytes.".format(
+                    offset, length
+                )
+            )
+
+    #  Whether download may resume after error.
+    @staticmethod
+    def __resumable(ex):
+        if isinstance(ex, TuneServiceException):
+            code = getattr(ex.errors, "code", None)
+            # Client errors other than timeouts, throttling and
+            # unsatisfiable ranges are final.
+            return code is None or code >= 500 or code in (408, 416, 429)
+        return True
+
+    def open(self):
+        """Open spooled file.
+
+            :rtype: file
+        """
+        return open(self.__filepath, "rb")
+
+    def mmap(self):
+        """Open spooled file memory mapped.
+
+            :rtype: MappedFile
+        """
+        return MappedFile(self.__filepath)
+
+    ## Reader of spooled report.
+    #  @param type reader_class     ReportReaderBase subclass.
+    #  @param bool use_mmap         Read file through mmap.
+    def reader(self, reader_class, use_mmap=False, deadline=None):
+        """Spool report, then reader of spooled file.
+
+            :param type reader_class:   Reader, as ReportReaderCSV.
+            :param bool use_mmap:       Read spooled file through mmap.
+            :param Deadline deadline:   Deadline, or seconds from now, by
+                                        which report must be spooled.
+            :return: Reader, read() not yet called.
+        """
+        self.download(deadline)
+        return reader_class(
+            self.__report_url,
+            filepath=self.__filepath,
+            use_mmap=use_mmap
+        )
+
+    def remove(self):
+        """Remove spooled file, and its partial download."""
+        for filepath in (self.__filepath,
+                         self.__filepath + __partial_suffix__):
+            if os.path.isfile(filepath):
+                os.remove(filepath)
+        self.__size = None
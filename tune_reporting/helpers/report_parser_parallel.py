@@ -0,0 +1,273 @@
+"""
+TUNE Advertiser Report Parallel CSV Parser
+=============================================
+"""
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  report_parser_parallel.py
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+
+import codecs
+import collections
+import csv
+import io
+import mmap
+import multiprocessing
+import os
+import sys
+
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    wait
+)
+
+#  Approximate number of bytes parsed by a worker at once.
+__range_size__ = 16 * 1024 * 1024
+
+#  Batch of rows parsed from a byte range of a report.
+ParsedBatch = collections.namedtuple(
+    "ParsedBatch", ["index", "start", "end", "rows"]
+)
+
+
+#  Parse records within byte range of CSV file, within worker process.
+def _parse_range(filepath, start, end, transform):
+    with open(filepath, "rb") as handle:
+        handle.seek(start)
+        data = handle.read(end - start)
+    if sys.version_info >= (3, 0, 0):
+        stream = io.StringIO(data.decode("utf-8"), newline="")
+    else:
+        stream = io.BytesIO(data)
+    rows = list(csv.reader(stream, dialect=csv.excel))
+    if transform is not None:
+        return transform(rows)
+    return rows
+
+
+## Parses a spooled CSV report within a pool of processes.
+#
+class ParallelCSVParser(object):
+    """Parses a spooled CSV report within a pool of processes.
+
+    The report is split into byte ranges ending at record boundaries: a
+    newline preceded by an even number of double quotes since the start
+    of the file, so quoted values with embedded newlines are never split.
+    Each range is parsed by a worker process, and its rows returned
+    either in file order or as unordered batches as soon as parsed.
+    """
+
+    #  @var str
+    __filepath = None
+
+    #  @var int
+    __processes = None
+
+    #  @var int
+    __range_size = None
+
+    #  Header record.
+    #  @var list
+    __header = None
+
+    #  Offset of first record following header.
+    #  @var int
+    __data_start = None
+
+    #  The constructor
+    #
+    #  @param str   filepath        Spooled CSV report.
+    #  @param int   processes       Worker processes.
+    #  @param int   range_size      Approximate bytes parsed at once.
+    #
+    def __init__(self, filepath, processes=None, range_size=__range_size__):
+        """The constructor.
+
+            :param str filepath:    Spooled CSV report, as downloaded by
+                                    ReportDownloader.
+            :param int processes:   Worker processes, number of CPUs if
+                                    not provided.
+            :param int range_size:  Approximate bytes parsed by a worker
+                                    at once.
+        """
+        if not filepath or not os.path.isfile(filepath):
+            raise ValueError(
+                "Parameter 'filepath' is not a file: '{}'".format(filepath)
+            )
+        if processes is not None and processes < 1:
+            raise ValueError(
+                "Parameter 'processes' is not valid: '{}'".format(processes)
+            )
+        if range_size < 1:
+            raise ValueError(
+                "Parameter 'range_size' is not valid: '{}'".format(range_size)
+            )
+        self.__filepath = filepath
+        self.__processes = processes
+        self.__range_size = range_size
+        self.__read_header()
+
+    @property
+    def filepath(self):
+        """Spooled CSV report."""
+        return self.__filepath
+
+    @property
+    def header(self):
+        """Header record, None if report is empty."""
+        return self.__header
+
+    #  Parse header record, locating first data record.
+    def __read_header(self):
+        with open(self.__filepath, "rb") as handle:
+            start = 3 if handle.read(3) == codecs.BOM_UTF8 else 0
+        ranges = self.__boundaries(start, 1)
+        if not ranges:
+            self.__header = None
+            self.__data_start = start
+            return
+        header_start, header_end = ranges[0]
+        rows = _parse_range(self.__filepath, header_start, header_end, None)
+        self.__header = rows[0] if rows else None
+        self.__data_start = header_end
+
+    ## Byte ranges of records following header.
+    #  @return list of (start, end)
+    def ranges(self):
+        """Byte ranges of records following header, each ending at a
+        record boundary.
+
+            :rtype: list of (start, end)
+        """
+        return self.__boundaries(self.__data_start, self.__range_size)
+
+    #  Split file from offset into ranges of about range_size bytes.
+    def __boundaries(self, start, range_size):
+        size = os.path.getsize(self.__filepath)
+        if start >= size:
+            return []
+        with open(self.__filepath, "rb") as handle:
+            data = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                return self.__split(data, start, size, range_size)
+            finally:
+                data.close()
+
+    @staticmethod
+    def __split(data, start, size, range_size):
+        ranges = []
+        # Quotes counted from start, which is at a record boundary.
+        quotes = 0
+        scanned = start
+        while start < size:
+            target = start + range_size
+            if target >= size:
+                ranges.append((start, size))
+                break
+            quotes += data[scanned:target].count(b'"')
+            scanned = target
+            end = size
+            while True:
+                newline = data.find(b"\n", scanned)
+                if newline < 0:
+                    break
+                quotes += data[scanned:newline].count(b'"')
+                scanned = newline + 1
+                if quotes % 2 == 0:
+                    end = scanned
+                    break
+            ranges.append((start, end))
+            start = end
+            quotes = 0
+            scanned = start
+        return ranges
+
+    ## Parse records in batches of byte ranges.
+    #  @param bool      ordered     Batches in file order.
+    #  @param callable  transform   Applied to rows of each batch.
+    #  @return generator of ParsedBatch
+    def batches(self, ordered=True, transform=None):
+        """Parse records following header in batches, one per byte
+        range, within worker processes.
+
+            :param bool ordered:        Yield batches in file order, as
+                                        parsed otherwise.
+            :param callable transform:  Module level function applied to
+                                        rows of each batch within worker,
+                                        its result replacing rows, as to
+                                        aggregate in parallel.
+            :rtype: generator of ParsedBatch
+        """
+        ranges = self.ranges()
+        if not ranges:
+            return
+        processes = min(
+            self.__processes or multiprocessing.cpu_count(), len(ranges)
+        )
+        # Bounds batches parsed ahead of consumer.
+        window = processes * 2
+
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            pending = collections.OrderedDict()
+            queued = iter(enumerate(ranges))
+            while True:
+                while len(pending) < window:
+                    item = next(queued, None)
+                    if item is None:
+                        break
+                    index, (start, end) = item
+                    future = executor.submit(
+                        _parse_range, self.__filepath, start, end, transform
+                    )
+                    pending[future] = (index, start, end)
+                if not pending:
+                    return
+                if ordered:
+                    future = next(iter(pending))
+                    done = [future]
+                else:
+                    done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, start, end = pending.pop(future)
+                    yield ParsedBatch(index, start, end, future.result())
+
+    def __iter__(self):
+        """Rows following header, in file order."""
+        for batch in self.batches(ordered=True):
+            for row in batch.rows:
+                yield row
@@ -0,0 +1,238 @@
+"""
+TUNE Advertiser Report Projection
+=============================================
+"""
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  report_projection.py
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+
+import operator
+
+
+## Column projection and row predicate applied by report readers.
+#
+class ReportProjection(object):
+    """Column projection and row predicate applied by report readers
+    while rows are parsed.
+
+    The predicate is compiled against the report header into tests of
+    values by column position, run upon each parsed record before the
+    reader converts it into a row. Rows kept only hold the selected
+    columns; others are not kept. The parser, csv.reader or JSON, still
+    builds every field of a record before it is projected.
+    """
+
+    #  Selected column names, all if None.
+    #  @var list
+    __columns = None
+
+    #  Tests of column values by column name.
+    #  @var dict
+    __where = None
+
+    #  The constructor
+    #
+    #  @param list  columns     Selected column names.
+    #  @param dict  where       Tests of column values by column name.
+    #
+    def __init__(self, columns=None, where=None):
+        """The constructor.
+
+            :param list columns:    Selected column names in order, all
+                                    columns if not provided.
+            :param dict where:      Tests of rows kept, by column name:
+                                    a callable of column value returning
+                                    True to keep row, or a value column
+                                    must be equal to. CSV values being
+                                    text, a number is compared as text,
+                                    as 1 with '1'.
+        """
+        if columns is not None:
+            if isinstance(columns, str) or len(columns) < 1:
+                raise ValueError(
+                    "Parameter 'columns' is not a list of column names."
+                )
+            columns = list(columns)
+        if where is not None and not isinstance(where, dict):
+            raise ValueError(
+                "Parameter 'where' is not defined as dict."
+            )
+        self.__columns = columns
+        self.__where = dict(where or {})
+
+    @staticmethod
+    def create(columns=None, where=None):
+        """Projection of provided parameters, None if neither is.
+
+            :rtype: ReportProjection
+        """
+        if columns is None and not where:
+            return None
+        return ReportProjection(columns, where)
+
+    @property
+    def columns(self):
+        """Selected column names, None if all."""
+        return self.__columns
+
+    @staticmethod
+    def __test(test, text=False):
+        if callable(test):
+            return test
+        if text and isinstance(test, (int, float)):
+            test = str(test)
+
+        def equal(value):
+            return value == test
+
+        return equal
+
+    ## Compile projection against report header.
+    #  @param list header   Column names of report.
+    #  @param bool text     Values of records are text.
+    #  @return (list names, callable select)
+    def compile(self, header, text=True):
+        """Compile projection against report header.
+
+            :param list header: Column names of report.
+            :param bool text:   Values of records are text, as of CSV,
+                                numbers tested being compared as text.
+            :return: (selected names, select) select being a callable of
+                a record, as wide as header, returning its selected values
+                as a list, or None if record is rejected.
+            :throws: ValueError if a column is not within header.
+        """
+        header = list(header)
+        positions = dict((name, i) for i, name in enumerate(header))
+
+        def position(name):
+            if name not in positions:
+                raise ValueError(
+                    "Column is not defined within report: '{}'".format(name)
+                )
+            return positions[name]
+
+        names = header if self.__columns is None else self.__columns
+        indexes = [position(name) for name in names]
+        tests = [
+            (position(name), self.__test(test, text))
+            for name, test in self.__where.items()
+        ]
+
+        if self.__columns is None:
+            project = list
+        elif len(indexes) == 1:
+            index = indexes[0]
+
+            def project(record):
+                return [record[index]]
+        else:
+            getter = operator.itemgetter(*indexes)
+
+            def project(record):
+                return list(getter(record))
+
+        if not tests:
+            return list(names), project
+
+        def select(record):
+            for index, test in tests:
+                if not test(record[index]):
+                    return None
+            return project(record)
+
+        return list(names), select
+
+    ## Apply projection upon CSV records, header first.
+    #  @param iterable records
+    #  @return generator of lists, projected header first
+    def apply(self, records):
+        """Apply projection upon CSV records whose first is header.
+        Empty records, as of blank lines, are skipped; short records are
+        padded with None.
+
+            :param iterable records:    Lists of values, header first.
+            :return: Projected header, then selected records.
+            :rtype: generator of list
+        """
+        records = iter(records)
+        header = next(records, None)
+        if header is None:
+            return
+        names, select = self.compile(header)
+        yield names
+        width = len(header)
+        for record in records:
+            if len(record) < width:
+                if not record:
+                    continue
+                record = list(record) + [None] * (width - len(record))
+            selected = select(record)
+            if selected is not None:
+                yield selected
+
+    ## Apply projection upon JSON rows.
+    #  @param iterable rows     Mappings of column name to value.
+    #  @return generator of dicts
+    def apply_mapping(self, rows):
+        """Apply projection upon JSON rows, mappings of column name to
+        value. Rows missing a tested column are rejected.
+
+            :param iterable rows:
+            :rtype: generator of dict
+        """
+        tests = [
+            (name, self.__test(test)) for name, test in self.__where.items()
+        ]
+        columns = self.__columns
+        missing = object()
+        for row in rows:
+            rejected = False
+            for name, test in tests:
+                value = row.get(name, missing)
+                if value is missing or not test(value):
+                    rejected = True
+                    break
+            if rejected:
+                continue
+            if columns is None:
+                yield row
+            else:
+                yield dict(
+                    (name, row[name]) for name in columns if name in row
+                )
@@ -38,8 +38,23 @@
 #  @link      https://developers.mobileapptracking.com @endlink
 #
 
+import os
+
 from abc import ABCMeta, abstractproperty
 
+from tune_reporting.base.service.constants import (
+    __tune_management_api_timeout__
+)
+from tune_reporting.base.service.tune_service_proxy import (
+    TuneServiceProxy
+)
+from .report_downloader import (
+    MappedFile
+)
+from .report_cache import (
+    ReportCache
+)
+
 
 class ReportReaderBase(object):
     """Base Abstract class."""
@@ -49,33 +64,116 @@ class ReportReaderBase(object):
     __report_url = None
     __report_data = None
     __row_count = None
+    __filepath = None
+    __use_mmap = False
 
     #  The constructor
     #  @param str report_url Download report URL
     #                         of requested report to be exported.
-    def __init__(self, report_url):
+    #  @param str filepath   Spooled local file of report.
+    #  @param bool use_mmap  Read spooled file through mmap.
+    def __init__(self, report_url, filepath=None, use_mmap=False):
         """Constructor
 
-            :param str report_url: Download report URL.
+            :param str report_url:  Download report URL.
+            :param str filepath:    Spooled local file of report, read
+                                    instead of downloading report URL,
+                                    as by ReportDownloader.
+            :param bool use_mmap:   Read spooled file through mmap.
         """
         if not report_url or \
            not isinstance(report_url, str) or \
            len(report_url) < 1:
             raise ValueError("Parameter 'report_url' is not defined.")
+        if filepath is not None and not os.path.isfile(filepath):
+            raise ValueError(
+                "Parameter 'filepath' is not a file: '{}'".format(filepath)
+            )
 
         self.__report_url = report_url
         self.__report_data = None
+        self.__filepath = filepath
+        self.__use_mmap = use_mmap
 
     @abstractproperty
     def read(self):
         """Get property for TuneManagementRequest Action Name."""
         return
 
+    #  Open report, either spooled file or download.
+    #  @param object deadline
+    #  @return object file-like, None if download failed
+    def _open(self, deadline):
+        """Open report: spooled local file if provided, file of
+        ReportCache if report URL is of a cached query, report URL
+        download otherwise.
+
+            :param Deadline deadline:
+            :return: File-like object, None if download failed.
+        """
+        cache = ReportCache.default_cache()
+        if self.__filepath is None and cache is not None:
+            self.__filepath = cache.get(self.report_url, deadline)
+
+        if self.__filepath is not None:
+            if self.__use_mmap:
+                return MappedFile(self.__filepath)
+            return open(self.__filepath, "rb")
+
+        proxy = TuneServiceProxy(
+            self.report_url,
+            timeout=self._socket_timeout(deadline)
+        )
+        if proxy.execute():
+            return proxy.response
+        return None
+
+    #  Socket timeout of download bounded by deadline.
+    #  @param object deadline
+    #  @return float, None without deadline
+    @staticmethod
+    def _socket_timeout(deadline):
+        """Socket timeout of report download bounded by deadline.
+
+            :param Deadline deadline:
+            :return: Seconds, None without deadline.
+        """
+        if deadline is None:
+            return None
+        return deadline.socket_timeout(
+            __tune_management_api_timeout__
+        )
+
+    #  Lines of report download, raising once deadline has passed.
+    #  @param object lines
+    #  @param object deadline
+    @staticmethod
+    def _until(lines, deadline):
+        """Lines of report download, raising once deadline has passed,
+        so a slowly trickling download does not outlive it.
+
+            :param iterable lines:
+            :param Deadline deadline:
+            :throws: TuneSdkException
+        """
+        if deadline is None:
+            for line in lines:
+                yield line
+            return
+        for line in lines:
+            deadline.check()
+            yield line
+
     @property
     def report_url(self):
         """REPORT_URL of completed report on SQS."""
         return self.__report_url
 
+    @property
+    def filepath(self):
+        """Spooled local file of report, None if downloaded."""
+        return self.__filepath
+
     @property
     def data(self):
         """Provide created reader populated with file data."""
@@ -0,0 +1,485 @@
+"""
+TUNE Advertiser Report Columnar Reader
+=============================================
+"""
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  report_reader_columnar.py
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+
+import array
+import codecs
+import csv
+import sys
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from .deadline import (
+    Deadline
+)
+from .report_reader_base import (
+    ReportReaderBase
+)
+from .report_projection import (
+    ReportProjection
+)
+from .utf8_recorder import (UTF8Recoder)
+
+#  Kinds of column values.
+TUNE_COLUMN_INT = "int"
+TUNE_COLUMN_FLOAT = "float"
+TUNE_COLUMN_STR = "str"
+
+#  Array typecodes of column kinds, strings stored as dictionary codes.
+if sys.version_info >= (3, 3, 0):
+    __typecodes__ = {"int": "q", "float": "d", "str": "i"}
+else:
+    __typecodes__ = {"int": "l", "float": "d", "str": "i"}
+
+#  Rows whose values infer kind of each column.
+__sample_size__ = 1000
+
+
+#  Text of CSV value, as read by Python 2 csv module as UTF-8 bytes.
+def _text(value):
+    if sys.version_info < (3, 0, 0) and isinstance(value, bytes):
+        return value.decode("utf-8")
+    return value
+
+
+#  Column of report values, held within a typed array.
+#
+class _Column(object):
+    """Column of report values, held within a typed array. Strings are
+    dictionary-encoded: array holds codes of distinct values. Text of
+    numeric values differing from their number's, as '001' or '', is
+    kept aside, so a column promoted to strings keeps its values. Empty
+    cells are held as 0 by integer columns, NaN by float columns."""
+
+    def __init__(self, name, kind):
+        self.name = name
+        self.kind = kind
+        self.data = array.array(__typecodes__[kind])
+        self.values = [] if kind == TUNE_COLUMN_STR else None
+        self.codes = {} if kind == TUNE_COLUMN_STR else None
+        # Text of numeric values by row, whenever not their number's.
+        self.raw = {}
+        # Rows appended as integers before column was promoted to floats.
+        self.ints = 0
+
+    @staticmethod
+    def infer(values):
+        """Narrowest kind of provided string values."""
+        kind = TUNE_COLUMN_INT
+        for value in values:
+            if kind == TUNE_COLUMN_INT:
+                try:
+                    int(value)
+                    continue
+                except ValueError:
+                    kind = TUNE_COLUMN_FLOAT
+            try:
+                float(value)
+            except ValueError:
+                return TUNE_COLUMN_STR
+        return kind
+
+    def append(self, value):
+        kind = self.kind
+        if kind == TUNE_COLUMN_STR:
+            value = _text(value)
+            code = self.codes.get(value)
+            if code is None:
+                code = self.codes[value] = len(self.values)
+                self.values.append(value)
+            self.data.append(code)
+            return
+        try:
+            if kind == TUNE_COLUMN_INT:
+                number = int(value) if value else 0
+                self.data.append(number)
+                text = str(number)
+            else:
+                number = float(value) if value else float("nan")
+                self.data.append(number)
+                text = repr(number)
+        except ValueError:
+            self.promote(value)
+            self.append(value)
+            return
+        except OverflowError:
+            # Integer beyond array's range, kept exactly as string.
+            self.promote(value, TUNE_COLUMN_STR)
+            self.append(value)
+            return
+        if text != value:
+            self.raw[len(self.data) - 1] = _text(value)
+
+    def text(self, index):
+        """Text of value of numeric column, as read."""
+        text = self.raw.get(index)
+        if text is not None:
+            return text
+        number = self.data[index]
+        if self.kind == TUNE_COLUMN_INT or index < self.ints:
+            return str(int(number))
+        return repr(number)
+
+    def promote(self, value, kind=None):
+        """Widen column to hold value: integers to floats, numbers to
+        strings."""
+        if kind is None and self.kind == TUNE_COLUMN_INT and \
+           _Column.infer([value or "nan"]) != TUNE_COLUMN_STR:
+            self.kind = TUNE_COLUMN_FLOAT
+            self.ints = len(self.data)
+            for index, number in enumerate(self.data):
+                # Integers not exactly held as floats.
+                if float(number) != number and index not in self.raw:
+                    self.raw[index] = str(number)
+            self.data = array.array(__typecodes__[self.kind], self.data)
+            for index, text in self.raw.items():
+                if not text:
+                    self.data[index] = float("nan")
+            return
+        texts = [self.text(index) for index in range(len(self.data))]
+        self.kind = TUNE_COLUMN_STR
+        self.data = array.array(__typecodes__[self.kind])
+        self.values = []
+        self.codes = {}
+        self.raw = {}
+        for text in texts:
+            self.append(text)
+
+
+## Helper class reading remote CSV file into typed columns
+#
+class ReportReaderColumnar(ReportReaderBase):
+    """Helper class reading remote CSV file into typed columns.
+
+    Values of each column are held within an array: integers and floats
+    as machine values, strings dictionary-encoded as codes of distinct
+    values, so a report takes a fraction of the memory of its rows and
+    aggregates are computed over whole columns, vectorized with NumPy
+    whenever installed.
+    """
+
+    #  Kinds of columns provided, inferred otherwise.
+    #  @var dict
+    __kinds = None
+
+    #  Return NumPy arrays.
+    #  @var bool
+    __use_numpy = None
+
+    #  Columns by name.
+    #  @var dict
+    __columns = None
+
+    #  Column names in report order.
+    #  @var list
+    __names = None
+
+    #  The constructor
+    #  @param str report_url Download report URL
+    #                         of requested report to be exported.
+    #  @param str filepath   Spooled local file of report.
+    #  @param bool use_mmap  Read spooled file through mmap.
+    #  @param dict kinds     Kinds of columns by name.
+    #  @param bool use_numpy Return NumPy arrays.
+    def __init__(self,
+                 report_url,
+                 filepath=None,
+                 use_mmap=False,
+                 kinds=None,
+                 use_numpy=None):
+        """The constructor.
+
+            :param str report_url:  Report URL to be downloaded.
+            :param str filepath:    Spooled local file of report, read
+                                    instead of downloading report URL.
+            :param bool use_mmap:   Read spooled file through mmap.
+            :param dict kinds:      Kind of columns by name: 'int',
+                                    'float' or 'str', inferred from first
+                                    rows otherwise.
+            :param bool use_numpy:  Return columns as NumPy arrays, by
+                                    default whenever NumPy is installed.
+        """
+        ReportReaderBase.__init__(self, report_url, filepath, use_mmap)
+        if use_numpy and numpy is None:
+            raise ValueError("Parameter 'use_numpy' requires NumPy.")
+        for name, kind in (kinds or {}).items():
+            if kind not in __typecodes__:
+                raise ValueError(
+                    "Kind of column '{}' is not valid: '{}'".format(
+                        name, kind
+                    )
+                )
+        self.__kinds = dict(kinds or {})
+        self.__use_numpy = numpy is not None if use_numpy is None \
+            else use_numpy
+        self.__columns = {}
+        self.__names = []
+
+    #  Using provided report download URL, extract CSV contents into
+    #  columns.
+    #  @param object deadline   Deadline or seconds bounding download.
+    #  @param list   columns    Selected column names.
+    #  @param dict   where      Tests of rows kept by column name.
+    #
+    def read(self, deadline=None, columns=None, where=None):
+        """Read CSV data provided remote path report_url into columns.
+
+            :param Deadline deadline:   Deadline, or seconds from now,
+                                        by which report must be read.
+            :param list columns:        Selected column names, all if not
+                                        provided; no array is allocated
+                                        for others.
+            :param dict where:          Tests of rows kept by column name,
+                                        upon values as read, before
+                                        conversion.
+        """
+        self.count = None
+        self.__columns = {}
+        self.__names = []
+        deadline = Deadline.create(deadline)
+
+        response = self._open(deadline)
+        if response is None:
+            return
+        if sys.version_info >= (3, 0, 0):
+            stream = codecs.iterdecode(
+                self._until(response, deadline), 'utf-8-sig'
+            )
+        else:
+            stream = self._until(UTF8Recoder(response, 'utf-8'), deadline)
+        reader = csv.reader(stream, dialect=csv.excel)
+        projection = ReportProjection.create(columns, where)
+        if projection is not None:
+            reader = projection.apply(reader)
+
+        header = next(reader, None)
+        if header is None:
+            self.count = 0
+            return
+        self.__names = [_text(name) for name in header]
+
+        sample = []
+        for row in reader:
+            # Blank line, skipped as by ReportReaderCSV.
+            if not row:
+                continue
+            sample.append(row)
+            if len(sample) >= __sample_size__:
+                break
+
+        columns = []
+        for i, name in enumerate(self.__names):
+            kind = self.__kinds.get(name)
+            if kind is None:
+                kind = _Column.infer(
+                    row[i] for row in sample if i < len(row) and row[i]
+                )
+            column = _Column(name, kind)
+            self.__columns[name] = column
+            columns.append(column)
+
+        width = len(columns)
+        count = 0
+        for rows in (sample, reader):
+            for row in rows:
+                if not row:
+                    continue
+                if len(row) != width:
+                    row = (row + [""] * width)[:width]
+                for column, value in zip(columns, row):
+                    column.append(value)
+                count += 1
+        self.count = count
+
+    @property
+    def columns(self):
+        """Column names in report order."""
+        return list(self.__names)
+
+    def kind(self, name):
+        """Kind of column: 'int', 'float' or 'str'.
+
+            :param str name:    Column name.
+            :rtype: str
+        """
+        return self.__column(name).kind
+
+    def __column(self, name):
+        column = self.__columns.get(name)
+        if column is None:
+            raise ValueError(
+                "Column is not defined: '{}'".format(name)
+            )
+        return column
+
+    def column(self, name):
+        """Values of numeric column, or codes of string column.
+
+            :param str name:    Column name.
+            :return: numpy.ndarray if NumPy is used, array.array otherwise.
+        """
+        data = self.__column(name).data
+        if self.__use_numpy:
+            return numpy.frombuffer(data, dtype=data.typecode) \
+                if len(data) else numpy.array([], dtype=data.typecode)
+        return data
+
+    def dictionary(self, name):
+        """Distinct values of string column, indexed by code.
+
+            :param str name:    Column name.
+            :rtype: list
+        """
+        column = self.__column(name)
+        if column.kind != TUNE_COLUMN_STR:
+            raise ValueError(
+                "Column is not a string column: '{}'".format(name)
+            )
+        return column.values
+
+    def values(self, name):
+        """Values of column, string columns decoded.
+
+            :param str name:    Column name.
+            :rtype: list
+        """
+        column = self.__column(name)
+        if column.kind == TUNE_COLUMN_STR:
+            values = column.values
+            return [values[code] for code in column.data]
+        return list(column.data)
+
+    def sum(self, name):
+        """Sum of numeric column.
+
+            :param str name:    Column name.
+        """
+        column = self.__column(name)
+        if column.kind == TUNE_COLUMN_STR:
+            raise ValueError(
+                "Column is not numeric: '{}'".format(name)
+            )
+        if self.__use_numpy:
+            total = numpy.nansum(self.column(name))
+            return int(total) if column.kind == TUNE_COLUMN_INT \
+                else float(total)
+        if column.kind == TUNE_COLUMN_INT:
+            return sum(column.data)
+        return sum(value for value in column.data if value == value)
+
+    ## Sums of numeric columns grouped by values of a string column.
+    #  @param str   by      Column grouped by.
+    #  @param list  names   Numeric columns summed.
+    #  @return dict value -> list of sums
+    def aggregate(self, by, names):
+        """Sums of numeric columns grouped by distinct values of a string
+        column, vectorized with NumPy whenever used.
+
+            :param str by:      String column grouped by.
+            :param list names:  Numeric columns summed.
+            :return: {value: [sum of each column]}
+            :rtype: dict
+        """
+        group = self.__column(by)
+        if group.kind != TUNE_COLUMN_STR:
+            raise ValueError(
+                "Column is not a string column: '{}'".format(by)
+            )
+        columns = [self.__column(name) for name in names]
+        for column in columns:
+            if column.kind == TUNE_COLUMN_STR:
+                raise ValueError(
+                    "Column is not numeric: '{}'".format(column.name)
+                )
+
+        groups = len(group.values)
+        if self.__use_numpy:
+            codes = self.column(by)
+            sums = []
+            for column in columns:
+                values = self.column(column.name)
+                if column.kind == TUNE_COLUMN_INT:
+                    # Summed as integers, exact beyond 2**53.
+                    totals = numpy.zeros(groups, dtype=values.dtype)
+                    numpy.add.at(totals, codes, values)
+                else:
+                    totals = numpy.bincount(
+                        codes,
+                        weights=numpy.nan_to_num(values),
+                        minlength=groups
+                    )
+                sums.append(totals)
+        else:
+            sums = []
+            for column in columns:
+                totals = [0] * groups
+                for code, value in zip(group.data, column.data):
+                    if value == value:
+                        totals[code] += value
+                sums.append(totals)
+
+        result = {}
+        for code, value in enumerate(group.values):
+            result[value] = [
+                int(total[code]) if column.kind == TUNE_COLUMN_INT
+                else float(total[code])
+                for column, total in zip(columns, sums)
+            ]
+        return result
+
+    def pretty_print(self, limit=0):
+        """Pretty print columns of exported data.
+
+            :param int limit: Number of values printed per column.
+        """
+        print("Report REPORT_URL: {}".format(self.report_url))
+        print("Report total row count: {}".format(self.count))
+        print("------------------")
+        for name in self.__names:
+            values = self.values(name)
+            if limit > 0:
+                values = values[:limit]
+            print("{} ({}): {}".format(name, self.kind(name), values))
+        print("------------------")
@@ -44,16 +44,25 @@ import sys
 import csv
 import codecs
 
-if sys.version_info >= (3, 0, 0):
-    import urllib.request
-
+from .deadline import (
+    Deadline
+)
 from .report_reader_base import (
     ReportReaderBase
 )
-from tune_reporting.base.service import (
-    TuneServiceProxy
+from .report_projection import (
+    ReportProjection
+)
+from .report_row import (
+    row_type
 )
 from .utf8_recorder import (UTF8Recoder)
+from .csv_record_counter import (
+    CSVRecordCounter
+)
+from .report_parser_parallel import (
+    ParallelCSVParser
+)
 
 
 ## Helper class for reading reading remote CSV file
@@ -62,42 +71,161 @@ class ReportReaderCSV(ReportReaderBase):
     """Helper class for reading reading remote CSV file
     """
 
+    #  Row type of report's header, rows being read as ReportRow.
+    #  @var type
+    row_type = None
+
+    #  Records returned by next(), header included.
+    #  @var int
+    __records = 0
+
     #  The constructor
     #  @param str report_url Download report URL
     #                         of requested report to be exported.
-    def __init__(self, report_url):
+    #  @param str filepath   Spooled local file of report.
+    #  @param bool use_mmap  Read spooled file through mmap.
+    def __init__(self, report_url, filepath=None, use_mmap=False):
         """The constructor.
 
-            :param str report_url: Report URL to be downloaded.
+            :param str report_url:  Report URL to be downloaded.
+            :param str filepath:    Spooled local file of report, read
+                                    instead of downloading report URL.
+            :param bool use_mmap:   Read spooled file through mmap.
         """
-        ReportReaderBase.__init__(self, report_url)
+        ReportReaderBase.__init__(self, report_url, filepath, use_mmap)
 
     #  Using provided report download URL, extract CSV contents.
+    #  @param object deadline   Deadline or seconds bounding download.
+    #  @param list   columns    Selected column names.
+    #  @param dict   where      Tests of rows kept by column name.
+    #  @param bool   typed      Rows as ReportRow of header's fields.
     #
-    def read(self):
+    def read(self, deadline=None, columns=None, where=None, typed=False):
         """Read CSV data provided remote path report_url.
+
+            :param Deadline deadline:   Deadline, or seconds from now,
+                                        by which report must be read.
+            :param list columns:        Selected column names, all if not
+                                        provided; others are not kept.
+            :param dict where:          Tests of rows kept by column name,
+                                        as of ReportProjection.
+            :param bool typed:          Rows as compact ReportRow tuples
+                                        accessed by field name, instead of
+                                        lists; header is consumed
+                                        and kept as 'row_type'.
+            :throws: TuneSdkException once deadline has passed, including
+                while rows are iterated.
+
+        'count' holds rows kept by 'where', header excluded, whereas
+        count_rows() counts every row. A spooled or cached report read
+        without 'where' is counted right away by scanning its bytes,
+        without parsing them; otherwise 'count' is set once rows are read
+        to the end.
         """
-        if sys.version_info >= (3, 0, 0):
-            stream = urllib.request.urlopen(self.report_url)
-            self.reader = csv.reader(codecs.iterdecode(stream, 'utf-8'), dialect=csv.excel)
-        else:
-            proxy = TuneServiceProxy(self.report_url)
-            if proxy.execute():
-                utf8_report_content = UTF8Recoder(proxy.response, 'utf-8')
+        self.row_type = None
+        self.count = None
+        self.__records = 0
+        deadline = Deadline.create(deadline)
+        response = self._open(deadline)
+        if response is not None:
+            if sys.version_info >= (3, 0, 0):
+                stream = codecs.iterdecode(
+                    self._until(response, deadline), 'utf-8'
+                )
+                self.reader = csv.reader(stream, dialect=csv.excel)
+            else:
+                utf8_report_content = self._until(
+                    UTF8Recoder(response, 'utf-8'), deadline
+                )
                 self.reader = csv.reader(utf8_report_content, dialect=csv.excel)
 
-    def next(self):
+            projection = ReportProjection.create(columns, where)
+            if projection is not None:
+                self.reader = projection.apply(self.reader)
+
+            if self.filepath is not None and not where:
+                with open(self.filepath, "rb") as stream:
+                    self.count = max(
+                        CSVRecordCounter.count(stream, deadline) - 1, 0
+                    )
+
+            if typed:
+                header = self.next()
+                if header is not None:
+                    self.row_type = row_type(header)
+
+    ## Parallel parser of spooled report.
+    #  @param int processes     Worker processes.
+    #  @return object @see ParallelCSVParser
+    def parallel(self, processes=None, **kwargs):
+        """Parser of spooled report within a pool of processes.
+
+            :param int processes:   Worker processes, number of CPUs if
+                                    not provided.
+            :rtype: ParallelCSVParser
+            :throws: ValueError unless reader was provided a spooled file.
+        """
+        if self.filepath is None:
+            raise ValueError(
+                "Parallel parsing requires a spooled report, "
+                "as provided by ReportDownloader."
+            )
+        return ParallelCSVParser(self.filepath, processes, **kwargs)
+
+    ## Count rows of report without parsing them.
+    #  @param object deadline   Deadline or seconds bounding scan.
+    #  @return int
+    def count_rows(self, deadline=None):
+        """Count rows of report, header excluded, by scanning its bytes
+        instead of parsing them. Rows rejected by read()'s 'where' are
+        counted as well, as by endpoint's count().
+
+        Meant for streamed downloads, whose 'count' is only set once rows
+        are read to the end: report is scanned again, so a report neither
+        spooled nor cached is downloaded once more. Rows being iterated
+        are not consumed, nor is 'count' set.
+
+            :param Deadline deadline:   Deadline, or seconds from now, by
+                                        which report must be scanned.
+            :return: Rows, None if download failed.
+            :rtype: int
+        """
+        deadline = Deadline.create(deadline)
+        stream = self._open(deadline)
+        if stream is None:
+            return None
         try:
-            if sys.version_info >= (3, 0, 0):
-                row = self.reader.__next__()
-            else:
-                row = self.reader.next()
+            records = CSVRecordCounter.count(stream, deadline)
+        finally:
+            stream.close()
 
-            return [unicode(s, "utf-8") for s in row]
+        return max(records - 1, 0)
+
+    def next(self):
+        """Next row of report, None once read to the end, then 'count'
+        holds rows read, header excluded. Blank lines are skipped."""
+        try:
+            row = None
+            while not row:
+                if sys.version_info >= (3, 0, 0):
+                    row = self.reader.__next__()
+                else:
+                    row = [unicode(s, "utf-8") for s in self.reader.next()]
         except StopIteration:
-            pass
+            self.count = max(self.__records - 1, 0)
+            return None
+
+        self.__records += 1
+
+        if self.row_type is not None:
+            return self.row_type._make(row)
+        return row
 
-        return None
+    def __next__(self):
+        row = self.next()
+        if row is None:
+            raise StopIteration
+        return row
 
     def __iter__(self):
         return self
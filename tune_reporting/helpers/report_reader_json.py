@@ -42,11 +42,17 @@ TUNE Advertiser Report JSON Reader
 
 import json
 
+from .deadline import (
+    Deadline
+)
 from .report_reader_base import (
     ReportReaderBase
 )
-from tune_reporting.base.service import (
-    TuneServiceProxy
+from .report_projection import (
+    ReportProjection
+)
+from .report_row import (
+    rows_of_mappings
 )
 
 
@@ -58,24 +64,53 @@ class ReportReaderJSON(ReportReaderBase):
     #  The constructor
     #  @param str report_url Download report URL
     #                         of requested report to be exported.
-    def __init__(self, report_url):
+    #  @param str filepath   Spooled local file of report.
+    #  @param bool use_mmap  Read spooled file through mmap.
+    def __init__(self, report_url, filepath=None, use_mmap=False):
         """The constructor.
 
-            :param str report_url: Report URL to be downloaded.
+            :param str report_url:  Report URL to be downloaded.
+            :param str filepath:    Spooled local file of report, read
+                                    instead of downloading report URL.
+            :param bool use_mmap:   Read spooled file through mmap.
         """
-        ReportReaderBase.__init__(self, report_url)
+        ReportReaderBase.__init__(self, report_url, filepath, use_mmap)
 
     #  Using provided report download URL, extract JSON contents.
+    #  @param object deadline   Deadline or seconds bounding download.
+    #  @param list   columns    Selected column names.
+    #  @param dict   where      Tests of rows kept by column name.
+    #  @param bool   typed      Rows as ReportRow of JSON keys.
     #
-    def read(self):
-        """Read JSON data provided remote path report_url."""
+    def read(self, deadline=None, columns=None, where=None, typed=False):
+        """Read JSON data provided remote path report_url.
+
+            :param Deadline deadline:   Deadline, or seconds from now,
+                                        by which report must be read.
+            :param list columns:        Selected column names, all if not
+                                        provided; others are not kept.
+            :param dict where:          Tests of rows kept by column name,
+                                        as of ReportProjection.
+            :param bool typed:          Rows as compact ReportRow tuples
+                                        accessed by field name, instead of
+                                        dicts.
+        """
         self.data = None
+        deadline = Deadline.create(deadline)
 
-        proxy = TuneServiceProxy(self.report_url)
+        response = self._open(deadline)
 
-        if proxy.execute():
-            utf8_report_content = proxy.response.read().decode('utf-8')
+        if response is not None:
+            utf8_report_content = b"".join(
+                self._until(iter(lambda: response.read(65536), b""),
+                            deadline)
+            ).decode('utf-8')
             self.data = json.loads(utf8_report_content)
+            projection = ReportProjection.create(columns, where)
+            if projection is not None:
+                self.data = list(projection.apply_mapping(self.data))
+            if typed:
+                self.data = list(rows_of_mappings(self.data))
             self.count = len(self.data)
 
     def pretty_print(self, limit=0):
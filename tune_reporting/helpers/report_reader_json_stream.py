@@ -0,0 +1,183 @@
+"""
+TUNE Advertiser Report JSON Streaming Reader
+=============================================
+"""
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  report_reader_json_stream.py
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+
+from .deadline import (
+    Deadline
+)
+from .json_stream_parser import (
+    JsonStreamParser
+)
+from .report_reader_base import (
+    ReportReaderBase
+)
+from .report_projection import (
+    ReportProjection
+)
+from .report_row import (
+    rows_of_mappings
+)
+
+
+#  Report download checking deadline before each read.
+#
+class _DeadlineStream(object):
+    """Report download checking deadline before each read."""
+
+    def __init__(self, stream, deadline):
+        self.stream = stream
+        self.deadline = deadline
+
+    def read(self, size=-1):
+        self.deadline.check()
+        return self.stream.read(size)
+
+
+## Helper class streaming rows of remote JSON file
+#
+class ReportReaderJSONStream(ReportReaderBase):
+    """Helper class streaming rows of remote JSON file.
+
+    Rows of the report's top-level array are parsed incrementally from
+    the download as they are iterated, so memory is bounded by the
+    largest row and not by the report. Property 'count' is available
+    once iteration ends.
+    """
+
+    #  Rows of report being parsed.
+    #  @var object generator
+    __rows = None
+
+    #  The constructor
+    #  @param str report_url Download report URL
+    #                         of requested report to be exported.
+    #  @param str filepath   Spooled local file of report.
+    #  @param bool use_mmap  Read spooled file through mmap.
+    def __init__(self, report_url, filepath=None, use_mmap=False):
+        """The constructor.
+
+            :param str report_url:  Report URL to be downloaded.
+            :param str filepath:    Spooled local file of report, read
+                                    instead of downloading report URL.
+            :param bool use_mmap:   Read spooled file through mmap.
+        """
+        ReportReaderBase.__init__(self, report_url, filepath, use_mmap)
+
+    #  Using provided report download URL, start streaming JSON contents.
+    #  @param object deadline   Deadline or seconds bounding download.
+    #  @param list   columns    Selected column names.
+    #  @param dict   where      Tests of rows kept by column name.
+    #  @param bool   typed      Rows as ReportRow of JSON keys.
+    #
+    def read(self, deadline=None, columns=None, where=None, typed=False):
+        """Start download of JSON data provided remote path report_url,
+        rows are parsed while iterated.
+
+            :param Deadline deadline:   Deadline, or seconds from now,
+                                        by which report must be read.
+            :param list columns:        Selected column names, all if not
+                                        provided; others are not kept.
+            :param dict where:          Tests of rows kept by column name,
+                                        as of ReportProjection.
+            :param bool typed:          Rows as compact ReportRow tuples
+                                        accessed by field name, instead of
+                                        dicts.
+            :throws: TuneSdkException once deadline has passed, including
+                while rows are iterated.
+        """
+        self.count = None
+        self.__rows = None
+        deadline = Deadline.create(deadline)
+
+        stream = self._open(deadline)
+
+        if stream is not None:
+            if deadline is not None:
+                stream = _DeadlineStream(stream, deadline)
+            rows = JsonStreamParser(stream).iter_array()
+            projection = ReportProjection.create(columns, where)
+            if projection is not None:
+                rows = projection.apply_mapping(rows)
+            if typed:
+                rows = rows_of_mappings(rows)
+            self.__rows = self.__parse(rows)
+
+    #  Rows of report, counted once parsed to the end.
+    def __parse(self, rows):
+        count = 0
+        for row in rows:
+            count += 1
+            yield row
+        self.count = count
+
+    def next(self):
+        """Next row of report, None once read to the end."""
+        if self.__rows is None:
+            return None
+        try:
+            return next(self.__rows)
+        except StopIteration:
+            pass
+
+        return None
+
+    def __iter__(self):
+        if self.__rows is None:
+            return iter(())
+        return self.__rows
+
+    def pretty_print(self, limit=0):
+        """Pretty print exported data, consuming rows printed.
+
+            :param int limit: Number of rows to print.
+        """
+        print("Report REPORT_URL: {}".format(self.report_url))
+        print("------------------")
+        i = 0
+        for row in self:
+            i = i + 1
+            print("{}. {}".format(i, str(row)))
+            if (limit > 0) and (i >= limit):
+                break
+        if self.count is not None:
+            print("Report total row count: {}".format(self.count))
+        print("------------------")
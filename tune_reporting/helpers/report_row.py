@@ -0,0 +1,227 @@
+"""
+TUNE Advertiser Report Row Types
+=============================================
+"""
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  report_row.py
+#
+#  Copyright (c) 2015 TUNE, Inc.
+#  All rights reserved.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining
+#  a copy of this software and associated documentation files
+#  (the "Software"), to deal in the Software without restriction, including
+#  without limitation the rights to use, copy, modify, merge, publish,
+#  distribute, sublicense, and/or sell copies of the Software, and to permit
+#  persons to whom the Software is furnished to do so, subject to the
+#  following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+#  Python 2.7 and 3.0
+#
+#  @category  Tune_Reporting
+#  @package   Tune_Reporting_Python
+#  @author    Jeff Tanner <jefft@tune.com>
+#  @copyright 2015 TUNE, Inc. (http://www.tune.com)
+#  @license   http://opensource.org/licenses/MIT The MIT License (MIT)
+#  @version   $Date: 2026-10-18 13:01:44 $
+#  @link      https://developers.mobileapptracking.com @endlink
+#
+
+
+import operator
+import sys
+import threading
+
+
+## Compact report row, a tuple whose fields are accessed by name.
+#
+class ReportRow(tuple):
+    """Compact report row, a tuple whose fields are accessed by name.
+
+    Row types are generated by row_type() from a report's header or
+    JSON keys; every row of a type shares its field names and index
+    map, and rows hold no per-instance dictionary. Fields are
+    accessed as attributes, as items by name, or by position:
+    row.clicks, row["site.name"], row.site.name, row[0].
+    """
+
+    __slots__ = ()
+
+    #  Field names of row type.
+    #  @var tuple
+    _fields = ()
+
+    #  Mapping of field name to position, shared by rows of type.
+    #  @var dict
+    _index = {}
+
+    #  Prefixes of dotted field names, i.e. 'site.'.
+    #  @var frozenset
+    _prefixes = frozenset()
+
+    @classmethod
+    def _make(cls, values):
+        """Row of provided values, in order of fields."""
+        return tuple.__new__(cls, values)
+
+    @classmethod
+    def _from_mapping(cls, mapping, default=None):
+        """Row of provided mapping of field name to value."""
+        return tuple.__new__(
+            cls, [mapping.get(name, default) for name in cls._fields]
+        )
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, slice)):
+            return tuple.__getitem__(self, key)
+        try:
+            return tuple.__getitem__(self, self._index[key])
+        except KeyError:
+            raise KeyError(key)
+
+    def __getattr__(self, name):
+        # Attributes of fields not valid as identifiers, i.e. 'site.name',
+        # are reached by getattr(); related prefixes, i.e. 'site', by view.
+        index = self._index.get(name)
+        if index is not None:
+            return tuple.__getitem__(self, index)
+        if name + "." in self._prefixes:
+            return _RelatedFields(self, name + ".")
+        raise AttributeError(name)
+
+    def _get(self, name, default=None):
+        """Value of field, default if row type has no such field."""
+        index = self._index.get(name)
+        if index is None:
+            return default
+        return tuple.__getitem__(self, index)
+
+    def _asdict(self):
+        """Mapping of field name to value."""
+        return dict(zip(self._fields, self))
+
+    def __reduce__(self):
+        return (_rebuild, (self._fields, tuple(self)))
+
+    def __repr__(self):
+        return "{}({})".format(
+            type(self).__name__,
+            ", ".join(
+                "{}={!r}".format(name, value)
+                for name, value in zip(self._fields, self)
+            )
+        )
+
+
+#  View of related fields of a row sharing a dotted prefix, i.e. 'site.'.
+#
+class _RelatedFields(object):
+    __slots__ = ("_row", "_prefix")
+
+    def __init__(self, row, prefix):
+        self._row = row
+        self._prefix = prefix
+
+    def __getattr__(self, name):
+        return getattr(self._row, self._prefix + name)
+
+    def __repr__(self):
+        return "{}({})".format(self._prefix, ", ".join(
+            "{}={!r}".format(name[len(self._prefix):], value)
+            for name, value in zip(self._row._fields, self._row)
+            if name.startswith(self._prefix)
+        ))
+
+
+#  Generated row types by field names.
+#  @var dict
+__row_types__ = {}
+__row_types_lock__ = threading.Lock()
+
+
+## Row type of provided field names.
+#  @param list fields   Field names of report's header or JSON keys.
+#  @return type ReportRow subclass
+def row_type(fields):
+    """Row type of provided field names, generated once and shared by
+    every report having same fields.
+
+        :param list fields: Field names, i.e. report's CSV header.
+        :rtype: type, subclass of ReportRow
+        :throws: ValueError if field names are repeated.
+    """
+    fields = tuple(fields)
+    cls = __row_types__.get(fields)
+    if cls is not None:
+        return cls
+
+    index = dict((name, i) for i, name in enumerate(fields))
+    if len(index) != len(fields):
+        raise ValueError(
+            "Field names are not unique: {}".format(", ".join(fields))
+        )
+    prefixes = set()
+    for name in fields:
+        parts = name.split(".")
+        for i in range(1, len(parts)):
+            prefixes.add(".".join(parts[:i]) + ".")
+
+    namespace = {
+        "__slots__": (),
+        "_fields": fields,
+        "_index": index,
+        "_prefixes": frozenset(prefixes)
+    }
+    for name, i in index.items():
+        if sys.version_info < (3, 0, 0):
+            try:
+                name = str(name)
+            except UnicodeError:
+                continue
+        if name.startswith("_") or name in namespace:
+            continue
+        namespace[name] = property(operator.itemgetter(i))
+
+    with __row_types_lock__:
+        cls = __row_types__.get(fields)
+        if cls is None:
+            cls = type("ReportRow", (ReportRow,), namespace)
+            __row_types__[fields] = cls
+    return cls
+
+
+#  Unpickle row provided its fields.
+def _rebuild(fields, values):
+    return row_type(fields)._make(values)
+
+
+## Rows of provided mappings, i.e. parsed JSON objects.
+#  @param iterable mappings
+#  @return generator of ReportRow
+def rows_of_mappings(mappings):
+    """Rows of provided mappings of field name to value, sharing a row
+    type amongst mappings of same keys in same order.
+
+        :param iterable mappings:
+        :rtype: generator of ReportRow
+    """
+    types = {}
+    for mapping in mappings:
+        keys = tuple(mapping)
+        cls = types.get(keys)
+        if cls is None:
+            cls = types[keys] = row_type(keys)
+        yield cls._make(mapping.values())
@@ -98,3 +98,8 @@ class TuneServiceException(Exception):
 
         # Now for your custom code...
         self.__errors = errors
+
+    @property
+    def errors(self):
+        """Get property of error object."""
+        return self.__errors